@@ -0,0 +1,56 @@
+from pymongo import UpdateOne
+
+from extensions.authorization.models.user import User
+from extensions.authorization.repository.mongo_auth_repository import (
+    MongoAuthorizationRepository,
+)
+from extensions.module_result.models.primitives import Primitive
+from sdk.common.mongodb_migrations.base import BaseMigration
+
+SORT_KEY = MongoAuthorizationRepository.RECENT_RESULT_SORT_KEY
+BATCH_SIZE = 500
+
+
+class Migration(BaseMigration):
+    """
+    This migration stores the dates of the first primitive with each recent module
+    result, so new results are sorted against the stored ones by the same field.
+    """
+
+    def upgrade(self):
+        query = {User.RECENT_MODULE_RESULTS: {"$ne": None}}
+        projection = {User.RECENT_MODULE_RESULTS: 1}
+        updates = []
+        for user in self.db.user.find(query, projection):
+            results = user[User.RECENT_MODULE_RESULTS]
+            if not self._add_sort_keys(results):
+                continue
+            updates.append(
+                UpdateOne(
+                    {User.ID_: user[User.ID_]},
+                    {"$set": {User.RECENT_MODULE_RESULTS: results}},
+                )
+            )
+            if len(updates) == BATCH_SIZE:
+                self.db.user.bulk_write(updates)
+                updates = []
+        if updates:
+            self.db.user.bulk_write(updates)
+
+    def downgrade(self):
+        pass
+
+    @staticmethod
+    def _add_sort_keys(recent_results: dict) -> bool:
+        updated = False
+        for results in recent_results.values():
+            for result in results or []:
+                if SORT_KEY in result or not result:
+                    continue
+                first = next(iter(result.values()))
+                result[SORT_KEY] = {
+                    Primitive.START_DATE_TIME: first.get(Primitive.START_DATE_TIME),
+                    Primitive.CREATE_DATE_TIME: first.get(Primitive.CREATE_DATE_TIME),
+                }
+                updated = True
+        return updated
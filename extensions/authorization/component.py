@@ -64,6 +64,7 @@ from extensions.authorization.events.post_user_reactivation_event import (
     PostUserReactivationEvent,
 )
 from extensions.authorization.events.update_stats_event import UpdateUserStatsEvent
+from extensions.authorization.configuration_cache import configuration_cache
 from extensions.authorization.exceptions import AuthorizationErrorCodes
 from extensions.authorization.router.admin_invitation_router import (
     api as admin_invitation_router,
@@ -104,7 +105,7 @@ from sdk.auth.events.set_auth_attributes_events import (
 )
 from sdk.auth.events.token_extraction_event import TokenExtractionEvent
 from sdk.calendar.events import RequestUsersTimezonesEvent, CalendarViewUserDataEvent
-from sdk.common.adapter.event_bus_adapter import EventBusAdapter
+from sdk.common.adapter.event_bus_adapter import EventBusAdapter, Dispatch
 from sdk.common.exceptions.exceptions import ErrorCodes
 from sdk.common.utils.inject import Binder, autoparams
 from sdk.notification.events.auth_events import NotificationAuthEvent
@@ -127,8 +128,14 @@ class AuthorizationComponent(PhoenixBaseComponent):
     )
 
     @autoparams()
-    def post_setup(self, event_bus: EventBusAdapter):
+    def post_setup(
+        self, event_bus: EventBusAdapter, server_config: PhoenixServerConfig
+    ):
         self._create_indexes()
+        configuration_cache.configure(
+            self.config.configurationCache,
+            server_config.server.version,
+        )
         events_callbacks = (
             # check permissions for sending push notification request
             (NotificationAuthEvent, check_auth_notification),
@@ -140,8 +147,6 @@ class AuthorizationComponent(PhoenixBaseComponent):
             (PostCreateTagEvent, create_tag_log),
             # create label log after user label assigned
             (PostAssignLabelEvent, create_assign_label_logs),
-            # save recent module results to user profile
-            (PostCreateModuleResultBatchEvent, update_recent_module_results),
             # return user timezones for calendar periodic task
             (RequestUsersTimezonesEvent, retrieve_users_timezones),
             (PostUserProfileUpdateEvent, update_calendar_on_profile_update),
@@ -172,6 +177,13 @@ class AuthorizationComponent(PhoenixBaseComponent):
         for event, callback in events_callbacks:
             event_bus.subscribe(event, callback)
 
+        # save recent module results to user profile
+        event_bus.subscribe(
+            PostCreateModuleResultBatchEvent,
+            update_recent_module_results,
+            Dispatch.DEFERRED,
+        )
+
         if self.config.checkAdminIpAddress:
             event_bus.subscribe(PreSignUpEvent, allow_ip_callback)
             logger.info("Admin IP address has been enabled")
@@ -1,9 +1,28 @@
 from dataclasses import field
 
 from sdk import convertibleclass
+from sdk.common.utils.convertible import meta
 from sdk.phoenix.config.server_config import BasePhoenixConfig
 
 
+@convertibleclass
+class UserStatsTaskConfig:
+    chunkSize: int = field(default=500, metadata=meta(lambda n: n > 0))
+    maxWorkers: int = field(default=4, metadata=meta(lambda n: n > 0))
+
+
+@convertibleclass
+class ConfigurationCacheConfig:
+    enabled: bool = field(default=False)
+    # shorter than expiration of pre-signed urls in configuration
+    ttlSeconds: int = field(default=300, metadata=meta(lambda n: n > 0))
+    maxSize: int = field(default=1000, metadata=meta(lambda n: n > 0))
+
+
 @convertibleclass
 class AuthorizationConfig(BasePhoenixConfig):
     checkAdminIpAddress: bool = field(default=True)
+    userStats: UserStatsTaskConfig = field(default_factory=UserStatsTaskConfig)
+    configurationCache: ConfigurationCacheConfig = field(
+        default_factory=ConfigurationCacheConfig
+    )
@@ -0,0 +1,72 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+from extensions.authorization.config.config import ConfigurationCacheConfig
+
+
+def calculate_etag(*parts) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class ConfigurationCache:
+    """
+    Per-worker cache of translated deployment configurations with their
+    ETags, so clients polling configuration do not localize the deployment on
+    each request. Keys include deployment version and update time, so an
+    updated deployment is loaded again. ETags are calculated from the key and
+    server release, not from values which hold pre-signed urls signed anew
+    on each load. Cached values are shared between callers and must not be
+    modified.
+    """
+
+    def __init__(self, config: ConfigurationCacheConfig = None):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple] = OrderedDict()
+        self.configure(config or ConfigurationCacheConfig())
+
+    def configure(self, config: ConfigurationCacheConfig, release: str = None):
+        """Release is a part of ETags, so bundled localizations are sent again."""
+        self._config = config
+        self._release = release
+        self.clear()
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.enabled
+
+    def get_or_load(
+        self, key: Optional[Hashable], load: Callable[[], dict]
+    ) -> tuple[dict, Optional[str]]:
+        """Returns value without ETag when disabled or key is None."""
+        if not self.enabled or key is None:
+            return load(), None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1], entry[2]
+
+        value = load()
+        etag = calculate_etag(self._release, key)
+        with self._lock:
+            self._entries[key] = (now + self._config.ttlSeconds, value, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._config.maxSize:
+                self._entries.popitem(last=False)
+        return value, etag
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+configuration_cache = ConfigurationCache()
@@ -12,6 +12,7 @@ from extensions.authorization.services.authorization import AuthorizationService
 from extensions.organization.repository.organization_repository import (
     OrganizationRepository,
 )
+from sdk.auth.identity_cache import IdentityCache, identity_cache
 from sdk.common.exceptions.exceptions import (
     UserWithoutAnyRoleException,
     PermissionDenied,
@@ -50,7 +51,11 @@ class AuthorizationMiddleware:
 
     @staticmethod
     def _get_profile(user_id: str):
-        return AuthorizationService().retrieve_simple_user_profile(user_id)
+        return identity_cache.get_or_load(
+            IdentityCache.PROFILE,
+            user_id,
+            lambda: AuthorizationService().retrieve_simple_user_profile(user_id),
+        )
 
     @cached_property
     def deployment_id(self) -> Optional[str]:
@@ -1,19 +1,40 @@
+import logging
 from collections import defaultdict
 from datetime import datetime, timedelta
 
 from extensions.authorization.models.user import User, UserStats, TaskCompliance
 from extensions.key_action.models.key_action_log import KeyAction
+from sdk.calendar.models.calendar_event import CalendarEvent, CalendarEventLog
+from sdk.calendar.models.event_generator import EventGenerator
 from sdk.calendar.service.calendar_service import CalendarService
 
+logger = logging.getLogger(__name__)
+
 
 class UserStatsCalculator:
-    def __init__(self, user: User):
+    """
+    Calculates key action stats of the user. Events are retrieved from calendar
+    unless raw events and logs were prefetched by `UserStatsBatchCalculator`.
+    """
+
+    def __init__(
+        self,
+        user: User,
+        raw_events: list[dict] = None,
+        logs: list[CalendarEventLog] = None,
+    ):
         self.user = user
         self._calendar_service = CalendarService()
-        self.all_events = self._retrieve_events()
+        self._raw_events = raw_events
+        self._logs = logs
         self.now = datetime.utcnow()
+        self.all_events = self._retrieve_events()
 
     def _retrieve_events(self) -> list[dict]:
+        if self._raw_events is not None:
+            generator = EventGenerator(retrieve_all=True, timezone=self.user.timezone)
+            return self._generate_events(generator)
+
         return self._calendar_service.retrieve_all_calendar_events(
             timezone=self.user.timezone,
             userId=self.user.id,
@@ -21,22 +42,31 @@ class UserStatsCalculator:
             to_model=False,
         )
 
+    def _generate_events(self, generator: EventGenerator) -> list[dict]:
+        # generator modifies events in place, so prefetched events are copied
+        events = generator.generate([dict(event) for event in self._raw_events])
+        generator.disable_completed_events(events, self._logs)
+        return events
+
     def run(self):
+        completed_key_actions = self.retrieve_completed_key_actions()
+        total_key_actions = len(self.all_events)
         task_compliance = {
-            TaskCompliance.TOTAL: len(self.all_events),
-            TaskCompliance.CURRENT: self.retrieve_completed_key_actions(),
+            TaskCompliance.TOTAL: total_key_actions,
+            TaskCompliance.CURRENT: completed_key_actions,
             TaskCompliance.DUE: self.retrieve_expiring_key_actions(),
             TaskCompliance.UPDATE_DATE_TIME: datetime.utcnow(),
         }
         # Calculating  weeklyProgress
         weekly_progress_list = self.retrieve_grouped_period_key_actions()
 
+        total_compliance = 0
+        if total_key_actions:
+            total_compliance = round(completed_key_actions / total_key_actions * 100)
         study_progress = {
             TaskCompliance.CURRENT_PERIOD: len(weekly_progress_list) + 1,
-            TaskCompliance.TOTAL_PERIOD: len(self.all_events),
-            TaskCompliance.TOTAL_COMPLIANCE: round(
-                (self.retrieve_completed_key_actions() / len(self.all_events)) * 100
-            ),
+            TaskCompliance.TOTAL_PERIOD: total_key_actions,
+            TaskCompliance.TOTAL_COMPLIANCE: total_compliance,
             TaskCompliance.PERIOD_PROGRESS: weekly_progress_list,
         }
 
@@ -50,56 +80,91 @@ class UserStatsCalculator:
     def retrieve_completed_key_actions(self) -> int:
         return len([event for event in self.all_events if not event.get("enabled")])
 
-    def retrieve_grouped_period_key_actions(self) -> int:
-        study_list = self.all_events
-        weekly_progress_list = {}
-        for study in study_list:
+    def retrieve_grouped_period_key_actions(self) -> list[dict]:
+        completed_key_actions = defaultdict(int)
+        all_key_actions = defaultdict(int)
+        for study in self.all_events:
+            period = study.get(TaskCompliance.CREATE_DATE_TIME)
+            all_key_actions[period] += 1
             if not study.get("enabled"):
-                if (
-                    TaskCompliance.COMPLETED_KEY_ACTIONS
-                    in weekly_progress_list[study.get(TaskCompliance.CREATE_DATE_TIME)]
-                ):
-                    weekly_progress_list[study.get(TaskCompliance.CREATE_DATE_TIME)][
-                        TaskCompliance.COMPLETED_KEY_ACTIONS
-                    ] += 1
-                else:
-                    weekly_progress_list[study.get(TaskCompliance.CREATE_DATE_TIME)][
-                        TaskCompliance.COMPLETED_KEY_ACTIONS
-                    ] = 0
-
-            if (
-                TaskCompliance.ALL_KEY_ACTIONS
-                in weekly_progress_list[study.get(TaskCompliance.CREATE_DATE_TIME)]
-            ):
-                weekly_progress_list[study.get(TaskCompliance.CREATE_DATE_TIME)][
-                    TaskCompliance.ALL_KEY_ACTIONS
-                ] += 1
-            else:
-                weekly_progress_list[study.get(TaskCompliance.CREATE_DATE_TIME)][
-                    TaskCompliance.ALL_KEY_ACTIONS
-                ] = 0
-
-        for period in weekly_progress_list:
-            completedKeyactions = weekly_progress_list[period].pop(
-                TaskCompliance.COMPLETED_KEY_ACTIONS
+                completed_key_actions[period] += 1
+
+        return [
+            {
+                TaskCompliance.START_DATE_TIME: period,
+                TaskCompliance.TOTAL_COMPLIANCE: round(
+                    completed_key_actions[period] / count * 100
+                ),
+            }
+            for period, count in all_key_actions.items()
+        ]
+
+    def retrieve_expiring_key_actions(self) -> int:
+        if self._raw_events is not None:
+            generator = EventGenerator(
+                start=self.now,
+                end=self.now + timedelta(hours=48),
+                timezone=self.user.timezone,
+                expiring=True,
             )
-            allKeyActions = weekly_progress_list[period].pop(
-                TaskCompliance.ALL_KEY_ACTIONS
+            events = self._generate_events(generator)
+        else:
+            events = self._calendar_service.retrieve_calendar_events_between_two_dates(
+                start=self.now,
+                end=self.now + timedelta(hours=48),
+                timezone=self.user.timezone,
+                expiring=True,
+                userId=self.user.id,
+                model=KeyAction.__name__,
+                to_model=False,
             )
-            percentage = round((completedKeyactions / allKeyActions) * 100)
-            weekly_progress_list[TaskCompliance.TOTAL_COMPLIANCE] = percentage
-            weekly_progress_list[TaskCompliance.START_DATE_TIME] = period
+        return len([event for event in events if event.get("enabled")])
 
-        return weekly_progress_list
 
-    def retrieve_expiring_key_actions(self) -> int:
-        events = self._calendar_service.retrieve_calendar_events_between_two_dates(
-            start=self.now,
-            end=self.now + timedelta(hours=48),
-            timezone=self.user.timezone,
-            expiring=True,
-            userId=self.user.id,
-            model=KeyAction.__name__,
-            to_model=False,
+class UserStatsBatchCalculator:
+    """
+    Calculates stats for a page of users, loading key action events and logs
+    of all of them with one query each.
+    """
+
+    def __init__(self, users: list[User]):
+        self.users = users
+        self._calendar_service = CalendarService()
+
+    def run(self) -> dict[str, UserStats]:
+        filter_options = {
+            CalendarEvent.USER_ID: {"$in": [user.id for user in self.users]},
+            CalendarEvent.MODEL: KeyAction.__name__,
+        }
+        raw_events = self._calendar_service.retrieve_raw_events(
+            **filter_options, to_model=False
         )
-        return len([event for event in events if event.get("enabled")])
+        logs = self._calendar_service.retrieve_calendar_event_logs(**filter_options)
+
+        user_events = defaultdict(list)
+        for event in raw_events:
+            user_events[str(event.get(CalendarEvent.USER_ID))].append(event)
+        user_logs = defaultdict(list)
+        for log in logs:
+            user_logs[str(log.userId)].append(log)
+
+        users_stats = {}
+        for user in self.users:
+            try:
+                users_stats[user.id] = self._calculate_user_stats(
+                    user, user_events[user.id], user_logs[user.id]
+                )
+            except Exception as error:
+                logger.warning(
+                    f"Stats calculation failed for user {user.id} with error: [{error}]"
+                )
+        return users_stats
+
+    @staticmethod
+    def _calculate_user_stats(
+        user: User, raw_events: list[dict], logs: list[CalendarEventLog]
+    ) -> UserStats:
+        if user.timezone:
+            for log in logs:
+                log.as_timezone(user.timezone)
+        return UserStatsCalculator(user, raw_events, logs).run()
@@ -1,7 +1,7 @@
 import abc
 from abc import ABC
 from datetime import datetime
-from typing import Any, Union
+from typing import Any, Iterator, Union
 
 from pymongo.client_session import ClientSession
 
@@ -13,11 +13,13 @@ from extensions.authorization.models.tag_log import TagLog
 from extensions.authorization.models.user import (
     User,
     PersonalDocument,
+    UserStats,
 )
 from extensions.deployment.models.care_plan_group.care_plan_group import (
     CarePlanGroupLog,
 )
 from extensions.deployment.models.deployment import Label
+from extensions.module_result.models.primitives import Primitive
 
 
 class AuthorizationRepository(ABC):
@@ -29,6 +31,14 @@ class AuthorizationRepository(ABC):
     def update_user_unseen_flags(self, user_id: str, unseen_flags: dict):
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def increment_user_unseen_flags(self, user_id: str, unseen_flags: dict):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def retrieve_user_ids_with_unseen_flags(self) -> list[str]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def delete_invitation_with_session(
         self, invitation_id: str, session: ClientSession
@@ -182,6 +192,12 @@ class AuthorizationRepository(ABC):
     ):
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def retrieve_users_with_user_role_in_batches(
+        self, fields: tuple, batch_size: int
+    ) -> Iterator[list[User]]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def retrieve_user_profiles_by_ids(
         self, ids: set[str], role: str = None
@@ -192,10 +208,39 @@ class AuthorizationRepository(ABC):
     def update_user_profile(self, user: User) -> str:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def push_recent_module_result(
+        self,
+        user_id: str,
+        module_config_id: str,
+        result: dict[str, Primitive],
+        max_records: int,
+        submit_date_time: datetime = None,
+    ):
+        """
+        Adds module result to the user's recent results of module config atomically,
+        keeps the latest results only.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def update_user_recent_flags(
+        self,
+        user_id: str,
+        module_config_ids: list[str],
+        excluded_modules_ids: list[str],
+    ):
+        """Recalculates recent flags from the latest recent results stored."""
+        raise NotImplementedError
+
     @abc.abstractmethod
     def update_user_profiles(self, users: list[User]):
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def update_users_stats(self, users_stats: dict[str, UserStats]) -> int:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def update_user_onfido_verification_status(
         self, applicant_id: str, verification_status: int
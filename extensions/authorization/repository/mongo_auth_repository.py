@@ -1,7 +1,7 @@
 import logging
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Optional, Union
+from typing import Any, Iterator, Optional, Union
 
 from bson import ObjectId
 from bson.errors import InvalidId
@@ -9,7 +9,7 @@ from flask_limiter.util import get_ipaddr
 from pymongo.client_session import ClientSession
 from pymongo.database import Database
 from pymongo.errors import OperationFailure
-from pymongo import MongoClient, WriteConcern
+from pymongo import ASCENDING, DESCENDING, MongoClient, WriteConcern
 from pymongo import UpdateOne, InsertOne
 from extensions.authorization.exceptions import MaxLabelsAssigned
 
@@ -50,6 +50,7 @@ from extensions.organization.repository.organization_repository import (
     OrganizationRepository,
 )
 from extensions.utils import build_date
+from sdk.auth.identity_cache import identity_cache
 from sdk.common.adapter.mongodb.mongodb_utils import convert_kwargs, kwargs_to_obj_id
 from sdk.common.adapter.redis.redis_utils import calculate_hashed_value
 from sdk.common.exceptions.exceptions import (
@@ -72,6 +73,8 @@ class MongoAuthorizationRepository(AuthorizationRepository):
     CARE_PLAN_GROUP_LOG_COLLECTION = "careplangrouplog"
     HELPER_AGREEMENT_LOG_COLLECTION = "helperagreementlog"
     INVITATION_COLLECTION = "invitation"
+    # dates of the first primitive stored with each recent result, to sort by
+    RECENT_RESULT_SORT_KEY = "_sortKey"
     IGNORED_USER_FIELDS = (
         User.DATE_OF_BIRTH,
         User.CREATE_DATE_TIME,
@@ -139,6 +142,29 @@ class MongoAuthorizationRepository(AuthorizationRepository):
         filter_query = {User.ID_: ObjectId(user_id)}
         update_query = {"$set": {User.UNSEEN_FLAGS: unseen_flags}}
         self._db[self.USER_COLLECTION].update_one(filter_query, update_query)
+        identity_cache.invalidate(user_id)
+
+    def increment_user_unseen_flags(self, user_id: str, unseen_flags: dict):
+        filter_query = {User.ID_: ObjectId(user_id)}
+        counters = {
+            f"{User.UNSEEN_FLAGS}.{flag}": delta
+            for flag, delta in unseen_flags.items()
+            if delta
+        }
+        if not counters:
+            return
+        self._db[self.USER_COLLECTION].update_one(filter_query, {"$inc": counters})
+        identity_cache.invalidate(user_id)
+
+    def retrieve_user_ids_with_unseen_flags(self) -> list[str]:
+        query = {
+            "$or": [
+                {f"{User.UNSEEN_FLAGS}.{flag}": {"$ne": 0, "$exists": True}}
+                for flag in (UnseenFlags.RED, UnseenFlags.AMBER, UnseenFlags.GRAY)
+            ]
+        }
+        users = self._db[self.USER_COLLECTION].find(query, {User.ID_: 1})
+        return [str(user[User.ID_]) for user in users]
 
     @id_as_obj_id
     def delete_invitation_with_session(
@@ -178,6 +204,22 @@ class MongoAuthorizationRepository(AuthorizationRepository):
 
         return result
 
+    def retrieve_users_with_user_role_in_batches(
+        self, fields: tuple, batch_size: int
+    ) -> Iterator[list[User]]:
+        cursor = self.retrieve_users_with_user_role_including_only_fields(
+            fields, to_model=False
+        )
+        cursor = cursor.sort(User.ID_, ASCENDING).batch_size(batch_size)
+        batch = []
+        for user in cursor:
+            batch.append(self.build_user_from_dict(user))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     def create_tag(self, user_id: str, tags: dict, tags_author_id: str) -> str:
         user = User.from_dict(
             {User.ID: user_id, User.TAGS: tags, User.TAGS_AUTHOR_ID: tags_author_id}
@@ -195,6 +237,7 @@ class MongoAuthorizationRepository(AuthorizationRepository):
         result = self._db[self.USER_COLLECTION].update_one(
             {User.ID_: ObjectId(user_id)}, {"$set": user_dict}
         )
+        identity_cache.invalidate(user_id)
         if not result.matched_count:
             raise UserDoesNotExist
         return str(user_id)
@@ -232,6 +275,8 @@ class MongoAuthorizationRepository(AuthorizationRepository):
                 if number_of_updated_records != len(user_ids):
                     raise InternalServerErrorException
 
+        for user_id in user_ids_str:
+            identity_cache.invalidate(user_id)
         return user_ids_str
 
     @id_as_obj_id
@@ -240,6 +285,7 @@ class MongoAuthorizationRepository(AuthorizationRepository):
         update_query = {"$pull": {User.LABELS: {UserLabel.LABEL_ID: label_id}}}
 
         self._db[self.USER_COLLECTION].update_many(filter=query, update=update_query)
+        identity_cache.clear()
 
     def get_users_per_label_count(self, deployment_id: str) -> dict[str, Any]:
         pipeline = [
@@ -1005,26 +1051,133 @@ class MongoAuthorizationRepository(AuthorizationRepository):
         result = self._db[self.USER_COLLECTION].update_one(
             {User.ID_: ObjectId(user_id)}, {"$set": user_dict}
         )
+        identity_cache.invalidate(user_id)
         if not result.matched_count:
             raise UserDoesNotExist
         return str(user_id)
 
+    def push_recent_module_result(
+        self,
+        user_id: str,
+        module_config_id: str,
+        result: dict[str, Primitive],
+        max_records: int,
+        submit_date_time: datetime = None,
+    ):
+        results = self.convert_recent_results_to_dict({module_config_id: [result]})
+        sort_key = self.RECENT_RESULT_SORT_KEY
+        update_query = {
+            "$push": {
+                f"{User.RECENT_MODULE_RESULTS}.{module_config_id}": {
+                    "$each": results[module_config_id],
+                    "$sort": {
+                        f"{sort_key}.{Primitive.START_DATE_TIME}": DESCENDING,
+                        f"{sort_key}.{Primitive.CREATE_DATE_TIME}": DESCENDING,
+                    },
+                    "$slice": max_records,
+                }
+            },
+            "$set": {User.UPDATE_DATE_TIME: datetime.utcnow()},
+        }
+        if submit_date_time:
+            update_query["$max"] = {User.LAST_SUBMIT_DATE_TIME: submit_date_time}
+        result = self._db[self.USER_COLLECTION].update_one(
+            {User.ID_: ObjectId(user_id)}, update_query
+        )
+        identity_cache.invalidate(user_id)
+        if not result.matched_count:
+            raise UserDoesNotExist
+
+    def update_user_recent_flags(
+        self,
+        user_id: str,
+        module_config_ids: list[str],
+        excluded_modules_ids: list[str],
+    ):
+        recent_results = {
+            "$filter": {
+                "input": {
+                    "$objectToArray": {
+                        "$ifNull": [f"${User.RECENT_MODULE_RESULTS}", {}]
+                    }
+                },
+                "as": "results",
+                "cond": {"$in": ["$$results.k", module_config_ids]},
+            }
+        }
+        latest_primitives = {
+            "$map": {
+                "input": recent_results,
+                "as": "results",
+                "in": {
+                    "$let": {
+                        "vars": {
+                            "primitive": {
+                                "$arrayElemAt": [
+                                    {
+                                        "$filter": {
+                                            "input": {
+                                                "$objectToArray": {
+                                                    "$arrayElemAt": ["$$results.v", 0]
+                                                }
+                                            },
+                                            "as": "field",
+                                            "cond": {
+                                                "$ne": [
+                                                    "$$field.k",
+                                                    self.RECENT_RESULT_SORT_KEY,
+                                                ]
+                                            },
+                                        }
+                                    },
+                                    0,
+                                ]
+                            }
+                        },
+                        "in": "$$primitive.v",
+                    }
+                },
+            }
+        }
+        flagged_primitives = {
+            "$filter": {
+                "input": latest_primitives,
+                "as": "primitive",
+                "cond": {
+                    "$not": [{"$in": ["$$primitive.moduleId", excluded_modules_ids]}]
+                },
+            }
+        }
+        recent_flags = {
+            flag: {
+                "$sum": {
+                    "$map": {
+                        "input": "$$primitives",
+                        "as": "primitive",
+                        "in": {"$ifNull": [f"$$primitive.flags.{flag}", 0]},
+                    }
+                }
+            }
+            for flag in (RecentFlags.RED, RecentFlags.AMBER, RecentFlags.GRAY)
+        }
+        update_query = {
+            "$set": {
+                User.RECENT_FLAGS: {
+                    "$let": {
+                        "vars": {"primitives": flagged_primitives},
+                        "in": recent_flags,
+                    }
+                }
+            }
+        }
+        self._db[self.USER_COLLECTION].update_one(
+            {User.ID_: ObjectId(user_id)}, [update_query]
+        )
+        identity_cache.invalidate(user_id)
+
     def update_user_profiles(self, users: list[User]):
-        updateDateTime = datetime.utcnow()
-        update_ops = []
-        for user in users:
-            user.updateDateTime = updateDateTime
-            user.recentModuleResults = (
-                self.convert_recent_results_to_dict(user.recentModuleResults or {})
-                or None
-            )
-            user_dict = user.to_dict(ignored_fields=self.IGNORED_USER_FIELDS)
-            user_id = user_dict.pop(User.ID)
-            user_dict = remove_none_values(user_dict)
-            convert_date_to_datetime(user_dict, User)
-            update_ops.append(
-                UpdateOne({User.ID_: ObjectId(user_id)}, {"$set": user_dict})
-            )
+        update_date_time = datetime.utcnow()
+        update_ops = [self._update_user_profile_op(u, update_date_time) for u in users]
 
         with self._client.start_session() as session:
             with session.start_transaction(
@@ -1037,6 +1190,36 @@ class MongoAuthorizationRepository(AuthorizationRepository):
                 if number_of_updated_records != len(users):
                     raise InternalServerErrorException
 
+        for user in users:
+            identity_cache.invalidate(user.id)
+
+    def update_users_stats(self, users_stats: dict[str, UserStats]) -> int:
+        if not users_stats:
+            return 0
+
+        update_date_time = datetime.utcnow()
+        update_ops = [
+            self._update_user_profile_op(
+                User(id=user_id, stats=stats), update_date_time
+            )
+            for user_id, stats in users_stats.items()
+        ]
+        result = self._db[self.USER_COLLECTION].bulk_write(update_ops, ordered=False)
+        for user_id in users_stats:
+            identity_cache.invalidate(user_id)
+        return result.matched_count
+
+    def _update_user_profile_op(self, user: User, update_date_time: datetime):
+        user.updateDateTime = update_date_time
+        user.recentModuleResults = (
+            self.convert_recent_results_to_dict(user.recentModuleResults or {}) or None
+        )
+        user_dict = user.to_dict(ignored_fields=self.IGNORED_USER_FIELDS)
+        user_id = user_dict.pop(User.ID)
+        user_dict = remove_none_values(user_dict)
+        convert_date_to_datetime(user_dict, User)
+        return UpdateOne({User.ID_: ObjectId(user_id)}, {"$set": user_dict})
+
     def update_user_onfido_verification_status(
         self, applicant_id: str, verification_status: int
     ) -> str:
@@ -1045,6 +1228,7 @@ class MongoAuthorizationRepository(AuthorizationRepository):
             {User.ONFIDO_APPLICANT_ID: applicant_id},
             {"$set": {User.VERIFICATION_STATUS: verification_status}},
         )
+        identity_cache.clear()
         if not result.matched_count:
             raise UserDoesNotExist
 
@@ -1097,12 +1281,13 @@ class MongoAuthorizationRepository(AuthorizationRepository):
         if user_flags and sum(user_flags.values()):
             user_dict[User.FLAGS] = user_flags
 
-    @staticmethod
-    def _convert_recent_results_from_dict(recent_results: dict):
+    @classmethod
+    def _convert_recent_results_from_dict(cls, recent_results: dict):
         results = {}
         for key, value in recent_results.items():
             res = []
             for primitive in value:
+                primitive.pop(cls.RECENT_RESULT_SORT_KEY, None)
                 item = {}
                 for p_type, val in primitive.items():
                     if Primitive.ID in val:
@@ -1114,8 +1299,9 @@ class MongoAuthorizationRepository(AuthorizationRepository):
             results[key] = res
         return results
 
-    @staticmethod
-    def convert_recent_results_to_dict(recent_results: dict):
+    @classmethod
+    def convert_recent_results_to_dict(cls, recent_results: dict):
+        """Results are sorted by the start and create dates of the first primitive."""
         results = {}
         for key, value in recent_results.items():
             res = []
@@ -1133,6 +1319,12 @@ class MongoAuthorizationRepository(AuthorizationRepository):
                         item[p_type][Primitive.MODULE_CONFIG_ID] = ObjectId(
                             item[p_type][Primitive.MODULE_CONFIG_ID]
                         )
+                # stored after primitives, which are read in order
+                first: Primitive = next(iter(primitive.values()))
+                item[cls.RECENT_RESULT_SORT_KEY] = {
+                    Primitive.START_DATE_TIME: first.startDateTime,
+                    Primitive.CREATE_DATE_TIME: first.createDateTime,
+                }
                 res.append(item)
             results[key] = res
         return results
@@ -1306,6 +1498,7 @@ class MongoAuthorizationRepository(AuthorizationRepository):
     @id_as_obj_id
     def delete_user(self, user_id: str, session: ClientSession = None):
         self._db[self.USER_COLLECTION].delete_one({User.ID_: user_id}, session=session)
+        identity_cache.invalidate(user_id)
 
     @id_as_obj_id
     def delete_user_from_care_plan_log(
@@ -1348,6 +1541,7 @@ class MongoAuthorizationRepository(AuthorizationRepository):
             },
             upsert=True,
         )
+        identity_cache.invalidate(user_id)
 
         return str(user_id)
 
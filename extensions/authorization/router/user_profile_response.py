@@ -1,6 +1,11 @@
 from dataclasses import dataclass
 from enum import IntEnum
+from typing import Optional
 
+from extensions.authorization.configuration_cache import (
+    calculate_etag,
+    configuration_cache,
+)
 from extensions.authorization.models.user import User
 from extensions.deployment.models.deployment import Deployment
 from extensions.organization.models.organization import Organization
@@ -50,20 +55,64 @@ class RetrieveFullConfigurationResponseObject(Response):
 
         def to_dict(self, translate=True) -> dict[str, list]:
             organizations = [o.to_dict(include_none=False) for o in self.organizations]
-            deployments = []
-            for deployment in self.deployments:
-                deployment_dict = deployment.to_dict(include_none=False)
-                if translate:
-                    language = self.language or deployment.language
-                    vocabulary = deployment.get_localization(language)
-                    deployment_dict = translate_deployment(deployment_dict, vocabulary)
-
-                deployment_dict["deploymentId"] = deployment_dict.pop("id")
-                deployment_dict.pop(Deployment.LOCALIZATIONS, None)
-                deployments.append(deployment_dict)
-
+            deployments = [
+                self._deployment_to_dict(deployment, translate)[0]
+                for deployment in self.deployments
+            ]
             return {self.ORGANIZATIONS: organizations, self.DEPLOYMENTS: deployments}
 
+        def etag(self) -> Optional[str]:
+            """Strong ETag of translated dict, when configuration cache is enabled."""
+            if not configuration_cache.enabled:
+                return None
+            organizations = [
+                self._organization_etag_part(o) for o in self.organizations
+            ]
+            deployment_etags = [
+                self._deployment_to_dict(deployment, True)[1]
+                for deployment in self.deployments
+            ]
+            return calculate_etag(organizations, deployment_etags)
+
+        def _deployment_to_dict(
+            self, deployment: Deployment, translate: bool
+        ) -> tuple[dict, Optional[str]]:
+            if not translate:
+                return self._serialize(deployment, translate), None
+
+            language = self.language or deployment.language
+            key = (
+                self.__class__.__name__,
+                deployment.id,
+                deployment.version,
+                deployment.updateDateTime,
+                language,
+            )
+            return configuration_cache.get_or_load(
+                key, lambda: self._serialize(deployment, translate, language)
+            )
+
+        @staticmethod
+        def _organization_etag_part(organization: Organization) -> dict:
+            """Legal documents as stored objects, their urls are signed on each request."""
+            organization_dict = organization.to_dict(include_none=False)
+            for url_field, object_field in Organization.URL_OBJECT_FIELDS.items():
+                if object_field in organization_dict:
+                    organization_dict.pop(url_field, None)
+            return organization_dict
+
+        @staticmethod
+        def _serialize(deployment: Deployment, translate: bool, language=None):
+            deployment.preprocess_for_configuration()
+            deployment_dict = deployment.to_dict(include_none=False)
+            if translate:
+                vocabulary = deployment.get_localization(language)
+                deployment_dict = translate_deployment(deployment_dict, vocabulary)
+
+            deployment_dict["deploymentId"] = deployment_dict.pop("id")
+            deployment_dict.pop(Deployment.LOCALIZATIONS, None)
+            return deployment_dict
+
     def __init__(self, organizations, deployments, language=None):
         response = self.Response(
             organizations=organizations,
@@ -88,9 +137,10 @@ class RetrieveDeploymentConfigResponseObject(Response):
         nextOnboardingTaskId: str = default_field()
         isOffBoarded: bool = required_field()
 
-    def __init__(self, deployment_dict: dict):
+    def __init__(self, deployment_dict: dict, etag: str = None):
         deployment_dict[self.DEPLOYMENT_ID] = deployment_dict.pop(Deployment.ID)
         resp = self.Response.from_dict(deployment_dict)
+        self.etag = etag
         super().__init__(value=resp)
 
 
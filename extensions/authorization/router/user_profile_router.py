@@ -1,7 +1,8 @@
 from datetime import datetime
+from typing import Callable, Optional
 
 from flasgger import swag_from
-from flask import jsonify, request, g
+from flask import jsonify, request, g, make_response
 
 from extensions.authorization.models.action import AuthorizationAction
 from extensions.authorization.models.authorized_user import AuthorizedUser
@@ -412,7 +413,9 @@ def retrieve_deployment_config(user_id: str):
     request_object = RetrieveDeploymentConfigRequestObject.from_dict(request_data)
     use_case = RetrieveDeploymentConfigUseCase()
     response = use_case.execute(request_object)
-    return jsonify(response.value.to_dict(include_none=False)), 200
+    return _conditional_response(
+        lambda: response.value.to_dict(include_none=False), response.etag
+    )
 
 
 @api.route("/<user_id>/fullconfiguration", methods=["GET"])
@@ -423,7 +426,20 @@ def retrieve_full_configuration_for_user(user_id: str):
         {RetrieveFullConfigurationRequestObject.USER: g.authz_user}
     )
     response = RetrieveFullConfigurationUseCase().execute(request_object)
-    return jsonify(response.value.to_dict()), 200
+    return _conditional_response(response.value.to_dict, response.value.etag())
+
+
+def _conditional_response(to_dict: Callable[[], dict], etag: Optional[str]):
+    """Responds 304 without serializing the body when client has the same ETag."""
+    if etag and request.if_none_match.contains(etag):
+        response = make_response("", 304)
+        response.set_etag(etag)
+        return response
+
+    response = jsonify(to_dict())
+    if etag:
+        response.set_etag(etag)
+    return response, 200
 
 
 @api.route("/<user_id>/consent/<consent_id>/sign", methods=["POST"])
@@ -1,7 +1,7 @@
 from datetime import datetime
 import logging
 from functools import reduce
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 from pymongo.client_session import ClientSession
 
@@ -22,6 +22,7 @@ from extensions.authorization.models.user import (
     RecentFlags,
     User,
     RoleAssignment,
+    UserStats,
 )
 from extensions.authorization.repository.auth_repository import AuthorizationRepository
 from extensions.authorization.router.user_profile_request import (
@@ -94,6 +95,13 @@ class AuthorizationService:
             required_fields, to_model
         )
 
+    def retrieve_users_with_user_role_in_batches(
+        self, required_fields: tuple, batch_size: int
+    ) -> Iterator[list[User]]:
+        return self._repo.retrieve_users_with_user_role_in_batches(
+            required_fields, batch_size
+        )
+
     def retrieve_user_profile(
         self, user_id: str, is_manager_request: bool = False
     ) -> User:
@@ -160,78 +168,65 @@ class AuthorizationService:
         self._post_update_profile_event(user, previous_state)
         return user_id
 
+    def update_users_stats(self, users_stats: dict[str, UserStats]) -> int:
+        """Writes recalculated stats only, profile update events are not emitted."""
+        return self._repo.update_users_stats(users_stats)
+
     def _post_update_profile_event(self, user: User, previous_state: User = None):
         self._event_bus.emit(PostUserProfileUpdateEvent(user, previous_state))
 
     def update_recent_results(self, primitives: list[Primitive]):
-        def sort_results(results_dict: dict):
-            """Sorts primitives by startDateTime and createDateTime"""
-            primitive = next(iter(results_dict.values()))
-            return (
-                primitive.startDateTime.timestamp(),
-                primitive.createDateTime.timestamp(),
-            )
-
+        """
+        Adds primitives of one module result to the user's recent results and
+        recalculates recent flags, without rewriting the user profile.
+        """
         if not primitives:
             return
 
         ref_primitive: Primitive = primitives[0]
-        user = self._repo.retrieve_user(user_id=ref_primitive.userId)
-        module_id = ref_primitive.moduleId
-        module_config_id = ref_primitive.moduleConfigId
-
-        primitive_dict = {primitive.class_name: primitive for primitive in primitives}
-        user.recentModuleResults = user.recentModuleResults or {}
+        user_id = ref_primitive.userId
         module = self._deployment_service.retrieve_module(
-            module_id, type(ref_primitive)
+            ref_primitive.moduleId, type(ref_primitive)
+        )
+        submit_date_time = None
+        if not (
+            isinstance(ref_primitive, Questionnaire) and ref_primitive.isForManager
+        ):
+            submit_date_time = ref_primitive.createDateTime
+        self._repo.push_recent_module_result(
+            user_id=user_id,
+            module_config_id=ref_primitive.moduleConfigId,
+            result={primitive.class_name: primitive for primitive in primitives},
+            max_records=module.recent_results_number,
+            submit_date_time=submit_date_time,
         )
-        primitive_array = user.recentModuleResults.get(module_config_id, None)
-        if primitive_array:
-            primitive_array.append(primitive_dict)
-            primitive_array.sort(key=sort_results, reverse=True)
-            max_records = module.recent_results_number
-            user.recentModuleResults[module_config_id] = primitive_array[:max_records]
-        else:
-            user.recentModuleResults[module_config_id] = [primitive_dict]
-
-        last_result_dict: dict = user.recentModuleResults[module_config_id][0]
-        last_result: Primitive = last_result_dict[ref_primitive.class_name]
-        if not isinstance(last_result, Questionnaire) or not last_result.isForManager:
-            user.lastSubmitDateTime = last_result.createDateTime
-        self.update_recent_flags(user)
-        return self._repo.update_user_profile(user)
-
-    def update_recent_flags(self, user: User):
+        self.update_recent_flags(user_id)
+        return user_id
+
+    def update_recent_flags(self, user_id: str):
         excluded_modules_ids = [
             "CVDRiskScore",
             "HighFrequencyStep",
             "BodyMeasurement",
             "SurgeryDetails",
         ]
+        user = self._repo.retrieve_simple_user_profile(user_id=user_id)
         authz_user = AuthorizedUser(user)
         deployment_module_config_ids = [
             mc.id for mc in authz_user.deployment.moduleConfigs
         ]
-        reds, ambers, grays = 0, 0, 0
-        for module_config_id, primitives in user.recentModuleResults.items():
-            if not primitives or module_config_id not in deployment_module_config_ids:
-                continue
-            primitive_data = list(primitives[0].values())[0]
-            module_id = primitive_data.moduleId
-            if module_id not in excluded_modules_ids:
-                flags = primitive_data.flags or {}
-                reds += flags.get("red", 0)
-                ambers += flags.get("amber", 0)
-                grays += flags.get("gray", 0)
-        user.recentFlags = {
-            RecentFlags.RED: reds,
-            RecentFlags.AMBER: ambers,
-            RecentFlags.GRAY: grays,
-        }
+        self._repo.update_user_recent_flags(
+            user_id=user_id,
+            module_config_ids=deployment_module_config_ids,
+            excluded_modules_ids=excluded_modules_ids,
+        )
 
     def update_unseen_flags(self, user_id: str, unseen_flags: dict):
         self._repo.update_user_unseen_flags(user_id, unseen_flags)
 
+    def increment_unseen_flags(self, user_id: str, unseen_flags: dict):
+        self._repo.increment_user_unseen_flags(user_id, unseen_flags)
+
     def delete_tag(self, user_id: str, tags_author_id: str) -> str:
         return self._repo.delete_tag(user_id, tags_author_id)
 
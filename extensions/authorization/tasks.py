@@ -1,9 +1,13 @@
 import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 from celery.schedules import crontab
 
 from sdk.celery.app import celery_app
 from sdk.common.constants import SEC_IN_HOUR
+from sdk.common.utils import inject
+from sdk.phoenix.config.server_config import PhoenixServerConfig
 
 logger = logging.getLogger(__name__)
 
@@ -17,43 +21,60 @@ def setup_periodic_tasks(sender, **kwargs):
     )
 
 
-def calculate_stats_for_user(task):
-    (
-        user,
-        AuthorizationService,
-        UserStatsCalculator,
-        UpdateUserProfileRequestObject,
-    ) = task
-    service = AuthorizationService()
-    stats = UserStatsCalculator(user).run()
-    data = {
-        UpdateUserProfileRequestObject.ID: user.id,
-        UpdateUserProfileRequestObject.STATS: stats,
-    }
-    req_obj = UpdateUserProfileRequestObject.from_dict(data)
-    service.update_user_profile(req_obj)
+def calculate_stats_for_users(users: list, service) -> int:
+    """Calculates stats for a page of users and saves them with one bulk write."""
+    from extensions.authorization.models.stats_calculator import (
+        UserStatsBatchCalculator,
+    )
+
+    users_stats = UserStatsBatchCalculator(users).run()
+    return service.update_users_stats(users_stats)
+
+
+class UserStatsProgress:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.pages = 0
+        self.users = 0
+        self.updated = 0
+
+    def add_page(self, users_count: int, future: Future):
+        self.pages += 1
+        self.users += users_count
+        try:
+            self.updated += future.result()
+        except Exception as error:
+            logger.warning(f"User stats page calculation failed with error: [{error}]")
+
+        logger.info(
+            f"User stats calculation progress: {self.pages} pages, "
+            f"{self.users} users processed, {self.updated} updated, "
+            f"{self.users - self.updated} failed in "
+            f"{time.monotonic() - self.started:.1f}s"
+        )
 
 
 @celery_app.task(expires=SEC_IN_HOUR)
 def calculate_stats_per_user(*args):
-    from concurrent.futures import ThreadPoolExecutor
     from extensions.authorization.services.authorization import AuthorizationService
-    from extensions.authorization.models.stats_calculator import UserStatsCalculator
-    from extensions.authorization.router.user_profile_request import (
-        UpdateUserProfileRequestObject,
-    )
 
+    config = inject.instance(PhoenixServerConfig).server.authorization.userStats
     service = AuthorizationService()
-    users = service.retrieve_users_with_user_role_including_only_fields(("timezone",))
-
-    tasks = [
-        (
-            user,
-            AuthorizationService,
-            UserStatsCalculator,
-            UpdateUserProfileRequestObject,
-        )
-        for user in users
-    ]
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        executor.map(calculate_stats_for_user, tasks)
+    pages = service.retrieve_users_with_user_role_in_batches(
+        ("timezone",), config.chunkSize
+    )
+
+    progress = UserStatsProgress()
+    in_progress: dict[Future, int] = {}
+    with ThreadPoolExecutor(max_workers=config.maxWorkers) as executor:
+        for users in pages:
+            if len(in_progress) >= config.maxWorkers:
+                done, _ = wait(in_progress, return_when=FIRST_COMPLETED)
+                for future in done:
+                    progress.add_page(in_progress.pop(future), future)
+            future = executor.submit(calculate_stats_for_users, users, service)
+            in_progress[future] = len(users)
+
+        for future in wait(in_progress).done:
+            progress.add_page(in_progress[future], future)
+    return progress.updated
@@ -1,5 +1,9 @@
 from typing import Optional
 
+from extensions.authorization.configuration_cache import (
+    calculate_etag,
+    configuration_cache,
+)
 from extensions.authorization.router.user_profile_request import (
     RetrieveDeploymentConfigRequestObject,
 )
@@ -30,30 +34,63 @@ class RetrieveDeploymentConfigUseCase(UseCase):
         service = DeploymentService()
         deployment = service.retrieve_deployment_config(request_object.user)
         deployment.filter_static_event_module_configs(request_object.user.user)
-        service.apply_default_disclaimer_configs(deployment)
-        localization = deployment.get_localization(request_object.user.get_language())
-        deployment.localizations = None
-        deployment.preprocess_for_configuration()
-        deployment_dict = deployment.to_dict(include_none=False)
-
-        if request_object.user.is_user():
-            deployment_dict.pop(Deployment.CARE_PLAN_GROUP, None)
+        deployment_dict, etag = configuration_cache.get_or_load(
+            self._cache_key(deployment),
+            lambda: self._translate_deployment(service, deployment),
+        )
 
         args = request_object.user.id, deployment
         consent_needed = not service.is_consent_signed(*args)
         econsent_needed = not service.is_econsent_signed(*args)
         next_onboarding_task = self._retrieve_next_onboarding_task()
 
-        response_data = {
-            **deployment_dict,
+        user_data = {
             RetrieveDeploymentConfigResponseObject.CONSENT_NEEDED: consent_needed,
             RetrieveDeploymentConfigResponseObject.ECONSENT_NEEDED: econsent_needed,
             RetrieveDeploymentConfigResponseObject.NEXT_ONBOARDING_TASK_ID: next_onboarding_task,
             RetrieveDeploymentConfigResponseObject.IS_OFF_BOARDED: self._is_user_off_boarded(),
         }
+        if etag:
+            etag = calculate_etag(etag, user_data)
+        return RetrieveDeploymentConfigResponseObject(
+            {**deployment_dict, **user_data}, etag
+        )
+
+    def _translate_deployment(
+        self, service: DeploymentService, deployment: Deployment
+    ) -> dict:
+        user = self.request_object.user
+        service.apply_default_disclaimer_configs(deployment)
+        localization = deployment.get_localization(user.get_language())
+        deployment.localizations = None
+        deployment.preprocess_for_configuration()
+        deployment_dict = deployment.to_dict(include_none=False)
+
+        if user.is_user():
+            deployment_dict.pop(Deployment.CARE_PLAN_GROUP, None)
+
+        return translate_deployment(deployment_dict, localization)
+
+    def _cache_key(self, deployment: Deployment) -> Optional[tuple]:
+        user = self.request_object.user
+        features = deployment.features
+        if user.is_user() and features and features.personalizedConfig:
+            # module configs are customized for each user
+            return None
 
-        result = translate_deployment(response_data, localization)
-        return RetrieveDeploymentConfigResponseObject(result)
+        static_event_config_ids = tuple(
+            config.id for config in deployment.moduleConfigs or [] if config.staticEvent
+        )
+        return (
+            self.__class__.__name__,
+            deployment.id,
+            deployment.version,
+            deployment.updateDateTime,
+            user.get_language(),
+            user.user.carePlanGroupId,
+            user.get_role().id,
+            static_event_config_ids,
+        )
 
     def _retrieve_next_onboarding_task(self) -> Optional[str]:
         path = get_current_path_or_empty()
@@ -27,9 +27,8 @@ class RetrieveFullConfigurationUseCase(BaseAuthorizationUseCase):
                 if item.id in org_ids:
                     continue
                 organizations.append(item)
+        # deployments are preprocessed for configuration when serialized
         deployments = self.deployment_repo.retrieve_deployments_by_ids(deployment_ids)
-        for deployment in deployments:
-            deployment.preprocess_for_configuration()
         language = request_object.user.user.language
         return RetrieveFullConfigurationResponseObject(
             organizations, deployments, language
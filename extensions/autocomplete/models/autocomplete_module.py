@@ -1,11 +1,13 @@
 import json
 import logging
+import time
 from abc import ABC
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from extensions.autocomplete.models.autocomplete_metadata import AutocompleteMetadata
+from extensions.autocomplete.models.search_index import AutocompleteSearchIndex
 from extensions.autocomplete.repository.autocomplete_repository import (
     AutoCompleteRepository,
 )
@@ -27,6 +29,8 @@ class AutocompleteModule(ABC):
     fallback_json_path_per_language: dict = None
     cache_dict_per_language: dict = None
     metadata_update_cache_per_language: dict[str, datetime] = None
+    # seconds between metadata checks, updated lists are picked up within this time
+    metadata_check_interval: int = 60
 
     _assets_path = Path(__file__).parent.joinpath("./assets")
 
@@ -42,6 +46,9 @@ class AutocompleteModule(ABC):
         self.metadata_update_cache_per_language = {
             lang: None for lang in self.translations
         }
+        self._metadata_checks: dict[str, tuple[float, Optional[Exception]]] = {}
+        self._index_per_language: dict[str, AutocompleteSearchIndex] = {}
+        self._local_index_per_language: dict[str, AutocompleteSearchIndex] = {}
 
     def retrieve_search_result(
         self,
@@ -50,26 +57,38 @@ class AutocompleteModule(ABC):
         language: str = Language.EN,
         case_sensitive: bool = False,
     ) -> list[str]:
-        data = self.get_data_for_language(language)
+        index = self.get_index_for_language(language)
         if exact_word:
-            return [val for val in data if val == search_key]
+            return index.find_equal(search_key)
 
         if case_sensitive:
-            return [val for val in data if search_key in val]
+            return [val for val in index.values if search_key in val]
 
-        search_key = search_key.lower()
-        return [val for val in data if search_key in val.lower()]
+        return index.search(search_key)
 
     def get_data_for_language(self, language: str):
+        return self.get_index_for_language(language).values
+
+    def get_index_for_language(self, language: str) -> AutocompleteSearchIndex:
         language = self.replace_language_with_default_if_incorrect(language)
         if self.cache_dict_per_language:
             try:
                 self._validate_cache_and_refresh_if_invalid(language)
-                return self.cache_dict_per_language[language]
+                return self._get_cached_index(language)
             except (ObjectDoesNotExist, BucketFileDoesNotExist) as error:
                 report_exception(error)
 
-        return self.read_from_local_file(language)
+        if language not in self._local_index_per_language:
+            index = AutocompleteSearchIndex(self.read_from_local_file(language))
+            self._local_index_per_language[language] = index
+        return self._local_index_per_language[language]
+
+    def _get_cached_index(self, language: str) -> AutocompleteSearchIndex:
+        data = self.cache_dict_per_language[language]
+        index = self._index_per_language.get(language)
+        if not index or index.values is not data:
+            index = self._index_per_language[language] = AutocompleteSearchIndex(data)
+        return index
 
     def replace_language_with_default_if_incorrect(self, lang: str):
         return lang if lang in self.translations else self.fallback_language
@@ -105,7 +124,26 @@ class AutocompleteModule(ABC):
     def _retrieve_metadata(self, language: str, repo: AutoCompleteRepository):
         return repo.retrieve_autocomplete_metadata(self.moduleId, language)
 
+    def invalidate_cache(self, language: str):
+        """Makes next search check metadata, without waiting for the check interval."""
+        self._metadata_checks.pop(language, None)
+
     def _validate_cache_and_refresh_if_invalid(self, language: str):
+        checked, error = self._metadata_checks.get(language, (None, None))
+        if checked is not None:
+            if time.monotonic() - checked < self.metadata_check_interval:
+                if error:
+                    raise error
+                return
+
+        try:
+            self._refresh_cache_if_invalid(language)
+        except (ObjectDoesNotExist, BucketFileDoesNotExist) as error:
+            self._metadata_checks[language] = (time.monotonic(), error)
+            raise
+        self._metadata_checks[language] = (time.monotonic(), None)
+
+    def _refresh_cache_if_invalid(self, language: str):
         metadata = self._retrieve_metadata(language)
         if self._is_cache_valid(metadata):
             return
@@ -0,0 +1,86 @@
+import unicodedata
+from collections import defaultdict
+
+NGRAM_SIZE = 3
+
+
+def normalize_search_key(value: str) -> str:
+    """Case and accent insensitive form of the value, i.e. `Verzögert` -> `verzogert`."""
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _ngrams(key: str, size: int) -> set[str]:
+    return {key[index : index + size] for index in range(len(key) - size + 1)}
+
+
+class AutocompleteSearchIndex:
+    """
+    Index of autocomplete values built once per loaded list.
+
+    Every n-gram up to `NGRAM_SIZE` characters of normalized values maps to positions
+    of values containing it. Search keys up to `NGRAM_SIZE` characters are looked up
+    directly, longer ones by intersecting their trigram postings, so only values
+    which may contain the key are compared. Keys without accents match accented
+    values, while accents typed in the key are respected. Results are ranked: exact
+    matches first, then values starting with the key, then values containing it.
+    Values keep their list order within each group.
+    """
+
+    def __init__(self, values: list[str]):
+        self.values = values
+        self._keys = [normalize_search_key(value) for value in values]
+        self._case_folded_keys = [value.casefold() for value in values]
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        self._positions_by_value: dict[str, list[int]] = defaultdict(list)
+        self._positions_by_lower_value: dict[str, list[int]] = defaultdict(list)
+
+        for position, (value, key) in enumerate(zip(values, self._keys)):
+            self._positions_by_value[value].append(position)
+            self._positions_by_lower_value[value.lower()].append(position)
+            for size in range(1, NGRAM_SIZE + 1):
+                for ngram in _ngrams(key, size):
+                    self._postings[ngram].append(position)
+
+    def search(self, search_key: str) -> list[str]:
+        key = normalize_search_key(search_key)
+        if not key:
+            return list(self.values)
+
+        # accent folded postings give candidates for both kinds of keys
+        keys, query = self._keys, key
+        if search_key.casefold() != key:
+            keys, query = self._case_folded_keys, search_key.casefold()
+
+        exact, prefix, infix = [], [], []
+        for position in self._candidates(key):
+            value_key = keys[position]
+            if value_key == query:
+                exact.append(position)
+            elif value_key.startswith(query):
+                prefix.append(position)
+            elif query in value_key:
+                infix.append(position)
+        return [self.values[position] for position in (*exact, *prefix, *infix)]
+
+    def find_equal(self, search_key: str, case_sensitive: bool = True) -> list[str]:
+        if case_sensitive:
+            positions = self._positions_by_value.get(search_key, [])
+        else:
+            positions = self._positions_by_lower_value.get(search_key.lower(), [])
+        return [self.values[position] for position in positions]
+
+    def _candidates(self, key: str) -> list[int]:
+        if len(key) <= NGRAM_SIZE:
+            return self._postings.get(key, [])
+
+        postings = sorted(
+            (self._postings.get(ngram, []) for ngram in _ngrams(key, NGRAM_SIZE)),
+            key=len,
+        )
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        return sorted(candidates)
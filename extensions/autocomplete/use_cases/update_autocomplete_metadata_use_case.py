@@ -1,3 +1,6 @@
+from extensions.autocomplete.models.autocomplete_manager import (
+    AutocompleteModulesManager,
+)
 from extensions.autocomplete.repository.autocomplete_repository import (
     AutoCompleteRepository,
 )
@@ -11,8 +14,13 @@ from sdk.common.utils.inject import autoparams
 
 class UpdateAutoCompleteMetadataUseCase(UseCase):
     @autoparams()
-    def __init__(self, autocomplete_repo: AutoCompleteRepository):
+    def __init__(
+        self,
+        autocomplete_repo: AutoCompleteRepository,
+        manager: AutocompleteModulesManager,
+    ):
         self.autocomplete_repo = autocomplete_repo
+        self.manager = manager
 
     def process_request(
         self, request_object: UpdateAutoCompleteSearchMetadataRequestObject
@@ -20,5 +28,8 @@ class UpdateAutoCompleteMetadataUseCase(UseCase):
         ids = []
         for m in request_object.metadata:
             ids.append(str(self.autocomplete_repo.update_autocomplete_metadata(m)))
+            module = self.manager.retrieve_module(m.moduleId)
+            if module:
+                module.invalidate_cache(m.language)
 
         return Response(value=ids)
@@ -13,6 +13,11 @@ class LegalDocument:
     TERM_AND_CONDITION_OBJECT = "termAndConditionObject"
     PRIVACY_POLICY_OBJECT = "privacyPolicyObject"
     EULA_OBJECT = "eulaObject"
+    URL_OBJECT_FIELDS = {
+        PRIVACY_POLICY_URL: PRIVACY_POLICY_OBJECT,
+        TERM_AND_CONDITION_URL: TERM_AND_CONDITION_OBJECT,
+        EULA_URL: EULA_OBJECT,
+    }
 
     termAndConditionUrl: str = url_field()
     privacyPolicyUrl: str = url_field()
@@ -5,6 +5,7 @@ from extensions.authorization.config.config import AuthorizationConfig
 from extensions.authorization.config.invitation_config import (
     InvitationConfig,
 )
+from extensions.dashboard.config.config import DashboardConfig
 from extensions.deployment.config.config import DeploymentConfig
 from extensions.kardia.config.config import KardiaConfig
 from extensions.key_action.component import KeyActionConfig
@@ -30,6 +31,7 @@ class ExtensionAdapters(Adapters):
 class ExtensionServer(Server):
     appointment: AppointmentConfig = field(default_factory=AppointmentConfig)
     authorization: AuthorizationConfig = field(default_factory=AuthorizationConfig)
+    dashboard: DashboardConfig = field(default_factory=DashboardConfig)
     deployment: DeploymentConfig = field(default_factory=DeploymentConfig)
     keyAction: KeyActionConfig = field(default_factory=KeyActionConfig)
     userModuleReminder: UserModuleReminderConfig = field(
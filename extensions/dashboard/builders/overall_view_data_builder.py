@@ -1,10 +1,5 @@
 from collections import defaultdict
-from operator import itemgetter
 
-from extensions.authorization.boarding.manager import BoardingManager
-from extensions.authorization.models.authorized_user import AuthorizedUser
-from extensions.authorization.models.user import User, BoardingStatus
-from extensions.authorization.repository.auth_repository import AuthorizationRepository
 from extensions.dashboard.builders.base_data_builder import DataBuilder
 from extensions.dashboard.localization.localization_keys import (
     OverallViewGadgetLocalization,
@@ -13,10 +8,15 @@ from extensions.dashboard.models.gadgets.overall_view import (
     OverallViewGadgetConfig,
     OverallViewData,
 )
+from extensions.dashboard.service.gadget_metrics_service import (
+    GADGET_ENABLED_MODULE_NAMES,
+    MODULE_ID,
+    GadgetMetricsService,
+    get_deployment_enabled_modules,
+)
 from extensions.deployment.boarding.econsent_module import EConsentModule
 from extensions.deployment.models.deployment import Deployment
 from extensions.deployment.repository.deployment_repository import DeploymentRepository
-from extensions.deployment.repository.econsent_repository import EConsentRepository
 from extensions.identity_verification.modules import IdentityVerificationModule
 from extensions.organization.models.organization import Organization
 from extensions.organization.repository.organization_repository import (
@@ -26,9 +26,6 @@ from extensions.utils import format_text_to_bold, remove_trailing_zero_in_decima
 from sdk.common.utils.common_functions_utils import round_half_up
 from sdk.common.utils.inject import autoparams
 
-GADGET_ENABLED_MODULE_NAMES = (IdentityVerificationModule.name, EConsentModule.name)
-MODULE_ID = "module_id"
-
 
 class OverallViewDataBuilder(DataBuilder):
     config = OverallViewGadgetConfig
@@ -38,13 +35,11 @@ class OverallViewDataBuilder(DataBuilder):
         self,
         deployment_repo: DeploymentRepository,
         organization_repo: OrganizationRepository,
-        auth_repo: AuthorizationRepository,
-        econsent_repo: EConsentRepository,
+        metrics_service: GadgetMetricsService,
     ):
         self.deployment_repo = deployment_repo
         self.organization_repo = organization_repo
-        self.auth_repo = auth_repo
-        self.econsent_repo = econsent_repo
+        self.metrics_service = metrics_service
         self.overhead_values = {OverallViewGadgetLocalization.SIGNED_UP.key: 0}
 
     def build_data(self):
@@ -53,6 +48,9 @@ class OverallViewDataBuilder(DataBuilder):
             organization_id=self.config.organizationId
         )
         deployments = self._get_deployments(organization)
+        deployments_metrics = self.metrics_service.retrieve_deployments_metrics(
+            deployments
+        )
         per_deployment_signed_up = defaultdict(int)
         per_deployment_refused_consent = defaultdict(int)
         per_deployment_failed_id_verification = defaultdict(int)
@@ -64,55 +62,25 @@ class OverallViewDataBuilder(DataBuilder):
 
         enabled_modules_deployments = set()
         for deployment in deployments:
-            signed_up_users = self._get_deployment_signed_users_count(deployment.id)
-            refused_consented_users = (
-                self._get_deployment_refused_consented_users_count(deployment.id)
-            )
-            failed_id_verification = self._get_failed_identity_verification_user_count(
-                deployment.id
-            )
-            completed_users = self._get_completed_user_count(deployment.id)
-            withdraw_consent_users = self._get_withdraw_concent_user_count(
-                deployment.id
-            )
-            manual_off_boarded_users = self._get_manual_off_boarded_user_count(
-                deployment.id
-            )
-
-            per_deployment_signed_up[deployment.id] = signed_up_users
-            per_deployment_refused_consent[deployment.id] = refused_consented_users
+            metrics = deployments_metrics[deployment.id]
+            per_deployment_signed_up[deployment.id] = metrics.signedUp
+            per_deployment_refused_consent[deployment.id] = metrics.refusedConsent
             per_deployment_failed_id_verification[
                 deployment.id
-            ] = failed_id_verification
+            ] = metrics.failedIdVerification
             per_deployment_all_tasks_completed_offboarded[
                 deployment.id
-            ] = completed_users
-            per_deployment_withdraw_consent[deployment.id] = withdraw_consent_users
-            per_deployment_manual_off_boarded[deployment.id] = manual_off_boarded_users
+            ] = metrics.completedAllTasks
+            per_deployment_withdraw_consent[deployment.id] = metrics.withdrewConsent
+            per_deployment_manual_off_boarded[deployment.id] = metrics.manualOffBoarded
 
             enabled_modules = self._get_deployment_enabled_modules(deployment)
-            users = self._retrieve_users_with_filter(deployment.id, {})
             completed_count_module[deployment.id] = defaultdict(int)
             for module in enabled_modules:
                 enabled_modules_deployments.add(module[MODULE_ID])
-                if module[MODULE_ID] == EConsentModule.name:
-                    # special workaround for econsent in order not to query db for every user
-                    completed_count_module[deployment.id][
-                        module[MODULE_ID]
-                    ] = self._get_deployment_consented_users_count(deployment)
-                    continue
-
-                for user in users:
-                    authz_user = AuthorizedUser(user=user, deployment_id=deployment.id)
-                    is_module_completed = module["module_class"]().is_module_completed(
-                        authz_user
-                    )
-                    if not is_module_completed:
-                        continue
-
-                    completed_count_module[deployment.id][
-                        module[MODULE_ID]
-                    ] += is_module_completed
+                completed_count_module[deployment.id][
+                    module[MODULE_ID]
+                ] = metrics.completedModules.get(module[MODULE_ID], 0)
 
             if enabled_modules_deployments != {m[MODULE_ID] for m in enabled_modules}:
                 same_configs = False
@@ -172,21 +140,9 @@ class OverallViewDataBuilder(DataBuilder):
 
         self._set_gadget_info_fields(total_sign_ups)
 
-    def _get_deployment_enabled_modules(self, deployment: Deployment) -> list[dict]:
-        module_class_mapping = {m.name: m for m in BoardingManager.default_modules}
-        if not deployment.onboardingConfigs:
-            return []
-
-        modules = [
-            {
-                MODULE_ID: m.onboardingId,
-                "order": m.order,
-                "module_class": module_class_mapping.get(m.onboardingId),
-            }
-            for m in deployment.onboardingConfigs
-            if m.is_enabled() and m.onboardingId in GADGET_ENABLED_MODULE_NAMES
-        ]
-        return sorted(modules, key=itemgetter("order"))
+    @staticmethod
+    def _get_deployment_enabled_modules(deployment: Deployment) -> list[dict]:
+        return get_deployment_enabled_modules(deployment)
 
     def _get_deployments(self, organization: Organization) -> list[Deployment]:
         deployment_ids = self.config.deploymentIds or organization.deploymentIds
@@ -463,70 +419,3 @@ class OverallViewDataBuilder(DataBuilder):
                 "value": f"{self._round_and_format_num(have_not_consented_percentage)}%",
             },
         ]
-
-    def _get_deployment_signed_users_count(self, deployment_id) -> int:
-        return len(self.auth_repo.retrieve_user_profiles(deployment_id, "")[0])
-
-    def _get_deployment_consented_users_count(self, deployment: Deployment) -> int:
-        if not deployment.econsent:
-            return 0
-        consented = self.econsent_repo.retrieve_consented_users_count(
-            econsent_id=deployment.econsent.id
-        )
-        return sum(consented.values())
-
-    def _retrieve_users_with_filter(self, deployment_id: str, query_filter: dict):
-        users = self.auth_repo.retrieve_user_profiles(
-            deployment_id, "", filters=query_filter
-        )[0]
-        return users
-
-    def _get_users_count_with_off_boarding_reason(
-        self, deployment_id: str, reason: BoardingStatus.ReasonOffBoarded
-    ):
-        filters = {
-            f"{User.BOARDING_STATUS}.{BoardingStatus.REASON_OFF_BOARDED}": reason
-        }
-        return self._retrieve_users_with_filter(deployment_id, filters)
-
-    def _get_deployment_refused_consented_users_count(self, deployment_id) -> int:
-        return len(
-            self._get_users_count_with_off_boarding_reason(
-                deployment_id, BoardingStatus.ReasonOffBoarded.USER_UNSIGNED_EICF
-            )
-        )
-
-    def _get_failed_pre_screened_user_count(self, deployment_id):
-        return len(
-            self._get_users_count_with_off_boarding_reason(
-                deployment_id, BoardingStatus.ReasonOffBoarded.USER_FAIL_PRE_SCREENING
-            )
-        )
-
-    def _get_failed_identity_verification_user_count(self, deployment_id):
-        return len(
-            self._get_users_count_with_off_boarding_reason(
-                deployment_id, BoardingStatus.ReasonOffBoarded.USER_FAIL_ID_VERIFICATION
-            )
-        )
-
-    def _get_completed_user_count(self, deployment_id):
-        return len(
-            self._get_users_count_with_off_boarding_reason(
-                deployment_id, BoardingStatus.ReasonOffBoarded.USER_COMPLETE_ALL_TASK
-            )
-        )
-
-    def _get_manual_off_boarded_user_count(self, deployment_id):
-        return len(
-            self._get_users_count_with_off_boarding_reason(
-                deployment_id, BoardingStatus.ReasonOffBoarded.USER_MANUAL_OFF_BOARDED
-            )
-        )
-
-    def _get_withdraw_concent_user_count(self, deployment_id):
-        return len(
-            self._get_users_count_with_off_boarding_reason(
-                deployment_id, BoardingStatus.ReasonOffBoarded.USER_WITHDRAW_EICF
-            )
-        )
@@ -0,0 +1,86 @@
+import logging
+
+from extensions.authorization.di.components import PostCreateUserEvent
+from extensions.authorization.events import (
+    PostUserOffBoardEvent,
+    PostUserProfileUpdateEvent,
+    PostUserReactivationEvent,
+)
+from extensions.authorization.models.authorized_user import AuthorizedUser
+from extensions.authorization.models.user import User
+from extensions.authorization.repository.auth_repository import AuthorizationRepository
+from extensions.dashboard.models.gadget_metrics import DeploymentGadgetMetrics
+from extensions.dashboard.repository.dashobard_repository import DashboardRepository
+from extensions.identity_verification.modules import IdentityVerificationModule
+from sdk.common.utils.inject import autoparams
+
+logger = logging.getLogger(__name__)
+
+ID_VERIFICATION_SUCCEEDED = User.VerificationStatus.ID_VERIFICATION_SUCCEEDED
+
+
+def _user_deployment_id(user: User):
+    authz_user = AuthorizedUser(user)
+    return authz_user.deployment_id() if authz_user.is_user() else None
+
+
+@autoparams("repo")
+def increment_signed_up_metrics(event: PostCreateUserEvent, repo: DashboardRepository):
+    deployment_id = _user_deployment_id(event.user)
+    if deployment_id:
+        repo.increment_gadget_metrics(
+            deployment_id, {DeploymentGadgetMetrics.SIGNED_UP: 1}
+        )
+
+
+@autoparams("repo", "auth_repo")
+def increment_off_boarded_metrics(
+    event: PostUserOffBoardEvent,
+    repo: DashboardRepository,
+    auth_repo: AuthorizationRepository,
+):
+    user = auth_repo.retrieve_simple_user_profile(user_id=event.user_id)
+    deployment_id = _user_deployment_id(user)
+    if not (deployment_id and user.boardingStatus):
+        return
+
+    reason = user.boardingStatus.reasonOffBoarded
+    counter = DeploymentGadgetMetrics.OFF_BOARDED_COUNTERS.get(reason)
+    if counter:
+        repo.increment_gadget_metrics(deployment_id, {counter: 1})
+
+
+@autoparams("repo")
+def increment_id_verified_metrics(
+    event: PostUserProfileUpdateEvent, repo: DashboardRepository
+):
+    previous_state = event.previous_state
+    if event.updated_fields.verificationStatus != ID_VERIFICATION_SUCCEEDED:
+        return
+    if (
+        not previous_state
+        or previous_state.verificationStatus == ID_VERIFICATION_SUCCEEDED
+    ):
+        return
+
+    deployment_id = _user_deployment_id(previous_state)
+    if deployment_id:
+        counter = (
+            f"{DeploymentGadgetMetrics.COMPLETED_MODULES}."
+            f"{IdentityVerificationModule.name}"
+        )
+        repo.increment_gadget_metrics(deployment_id, {counter: 1})
+
+
+@autoparams("repo", "auth_repo")
+def mark_reactivated_user_metrics_stale(
+    event: PostUserReactivationEvent,
+    repo: DashboardRepository,
+    auth_repo: AuthorizationRepository,
+):
+    """Off-boarding reason is gone after reactivation, so counters are recalculated."""
+    user = auth_repo.retrieve_simple_user_profile(user_id=event.user_id)
+    deployment_id = _user_deployment_id(user)
+    if deployment_id:
+        repo.mark_gadget_metrics_stale(deployment_id)
+        logger.debug(f"Gadget metrics of deployment {deployment_id} marked stale")
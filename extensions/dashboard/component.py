@@ -3,10 +3,22 @@ from typing import Optional, Union
 
 from flask import Blueprint
 
+from extensions.authorization.di.components import PostCreateUserEvent
+from extensions.authorization.events import (
+    PostUserOffBoardEvent,
+    PostUserProfileUpdateEvent,
+    PostUserReactivationEvent,
+)
+from extensions.dashboard.callbacks.gadget_metrics_callbacks import (
+    increment_id_verified_metrics,
+    increment_off_boarded_metrics,
+    increment_signed_up_metrics,
+    mark_reactivated_user_metrics_stale,
+)
 from extensions.dashboard.router.dashboard_router import dashboard_route
 from extensions.dashboard.config.config import DashboardConfig
 from extensions.dashboard.di.components import bind_dashboard_repository
-from sdk.common.adapter.event_bus_adapter import EventBusAdapter
+from sdk.common.adapter.event_bus_adapter import EventBusAdapter, Dispatch
 from sdk.common.utils.inject import Binder, autoparams
 from sdk.phoenix.component_manager import PhoenixBaseComponent
 from sdk.phoenix.config.server_config import PhoenixServerConfig
@@ -17,6 +29,7 @@ logger = logging.getLogger(__name__)
 class DashboardComponent(PhoenixBaseComponent):
     config_class = DashboardConfig
     tag_name = "dashboard"
+    tasks = ["extensions.dashboard"]
     _ignored_error_codes = ()
 
     @property
@@ -25,6 +38,17 @@ class DashboardComponent(PhoenixBaseComponent):
 
     @autoparams()
     def post_setup(self, event_bus: EventBusAdapter):
+        if self.config.gadgetMetrics.enabled:
+            events_callbacks = (
+                (PostCreateUserEvent, increment_signed_up_metrics),
+                (PostUserOffBoardEvent, increment_off_boarded_metrics),
+                (PostUserProfileUpdateEvent, increment_id_verified_metrics),
+                (PostUserReactivationEvent, mark_reactivated_user_metrics_stale),
+            )
+            for event, callback in events_callbacks:
+                event_bus.subscribe(event, callback, Dispatch.DEFERRED)
+            logger.info("Dashboard gadget metrics have been enabled")
+
         super().post_setup()
 
     def bind(self, binder: Binder, config: PhoenixServerConfig):
@@ -1,7 +1,16 @@
+from dataclasses import field
+
 from sdk import convertibleclass
+from sdk.common.utils.convertible import meta
 from sdk.phoenix.config.server_config import BasePhoenixConfig
 
 
+@convertibleclass
+class GadgetMetricsConfig:
+    enabled: bool = field(default=False)
+    maxAgeMinutes: int = field(default=30, metadata=meta(lambda n: n > 0))
+
+
 @convertibleclass
 class DashboardConfig(BasePhoenixConfig):
-    pass
+    gadgetMetrics: GadgetMetricsConfig = field(default_factory=GadgetMetricsConfig)
@@ -0,0 +1,53 @@
+from dataclasses import field
+from datetime import datetime, timedelta
+
+from extensions.authorization.models.user import BoardingStatus
+from sdk import convertibleclass
+from sdk.common.utils.convertible import default_field, required_field
+
+ReasonOffBoarded = BoardingStatus.ReasonOffBoarded
+
+
+@convertibleclass
+class DeploymentGadgetMetrics:
+    """
+    Precomputed counters of deployment users shown in dashboard gadgets.
+    Counters are incremented by user events between periodic reconciliations,
+    `updateDateTime` is the time counters were last calculated from scratch.
+    """
+
+    DEPLOYMENT_ID = "deploymentId"
+    SIGNED_UP = "signedUp"
+    REFUSED_CONSENT = "refusedConsent"
+    FAILED_ID_VERIFICATION = "failedIdVerification"
+    COMPLETED_ALL_TASKS = "completedAllTasks"
+    WITHDREW_CONSENT = "withdrewConsent"
+    MANUAL_OFF_BOARDED = "manualOffBoarded"
+    COMPLETED_MODULES = "completedModules"
+    UPDATE_DATE_TIME = "updateDateTime"
+
+    OFF_BOARDED_COUNTERS = {
+        ReasonOffBoarded.USER_UNSIGNED_EICF: REFUSED_CONSENT,
+        ReasonOffBoarded.USER_FAIL_ID_VERIFICATION: FAILED_ID_VERIFICATION,
+        ReasonOffBoarded.USER_COMPLETE_ALL_TASK: COMPLETED_ALL_TASKS,
+        ReasonOffBoarded.USER_WITHDRAW_EICF: WITHDREW_CONSENT,
+        ReasonOffBoarded.USER_MANUAL_OFF_BOARDED: MANUAL_OFF_BOARDED,
+    }
+
+    deploymentId: str = required_field()
+    signedUp: int = field(default=0)
+    refusedConsent: int = field(default=0)
+    failedIdVerification: int = field(default=0)
+    completedAllTasks: int = field(default=0)
+    withdrewConsent: int = field(default=0)
+    manualOffBoarded: int = field(default=0)
+    completedModules: dict = field(default_factory=dict)
+    updateDateTime: datetime = default_field()
+
+    def is_fresh(self, max_age: timedelta, module_ids: list[str]) -> bool:
+        """Counters are fresh when recently reconciled for all enabled modules."""
+        if not self.updateDateTime:
+            return False
+        if datetime.utcnow() - self.updateDateTime > max_age:
+            return False
+        return all(module_id in self.completedModules for module_id in module_ids)
@@ -1,5 +1,32 @@
-from abc import ABC
+from abc import ABC, abstractmethod
+
+from extensions.dashboard.models.gadget_metrics import DeploymentGadgetMetrics
 
 
 class DashboardRepository(ABC):
-    pass
+    @abstractmethod
+    def retrieve_gadget_metrics(
+        self, deployment_ids: list[str]
+    ) -> list[DeploymentGadgetMetrics]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def retrieve_gadget_metrics_deployment_ids(self) -> list[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_gadget_metrics(self, metrics: DeploymentGadgetMetrics):
+        raise NotImplementedError
+
+    @abstractmethod
+    def increment_gadget_metrics(self, deployment_id: str, counters: dict[str, int]):
+        """Increments counters of deployments which metrics are already calculated."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_gadget_metrics_stale(self, deployment_id: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_gadget_metrics(self, deployment_ids: list[str]):
+        raise NotImplementedError
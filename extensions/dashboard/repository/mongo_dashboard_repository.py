@@ -1,14 +1,59 @@
+from bson import ObjectId
 from pymongo.database import Database
 
+from extensions.dashboard.models.gadget_metrics import DeploymentGadgetMetrics
 from extensions.dashboard.repository.dashobard_repository import DashboardRepository
 from sdk.common.utils.inject import autoparams
 
+ID_ = "_id"
+
 
 class MongoDashboardRepository(DashboardRepository):
+    """Gadget metrics documents are keyed by deployment id."""
+
     DASHBOARD_COLLECTION = "dashboard"
     GADGET_COLLECTION = "gadget"
+    GADGET_METRICS_COLLECTION = "gadgetmetrics"
     IGNORED_FIELDS = ()
 
     @autoparams()
     def __init__(self, database: Database):
         self._db = database
+
+    def retrieve_gadget_metrics(
+        self, deployment_ids: list[str]
+    ) -> list[DeploymentGadgetMetrics]:
+        query = {ID_: {"$in": [ObjectId(id_) for id_ in deployment_ids]}}
+        result = self._db[self.GADGET_METRICS_COLLECTION].find(query)
+        return [self._to_metrics(document) for document in result]
+
+    def retrieve_gadget_metrics_deployment_ids(self) -> list[str]:
+        result = self._db[self.GADGET_METRICS_COLLECTION].find({}, {ID_: 1})
+        return [str(document[ID_]) for document in result]
+
+    def update_gadget_metrics(self, metrics: DeploymentGadgetMetrics):
+        document = metrics.to_dict(include_none=False)
+        del document[DeploymentGadgetMetrics.DEPLOYMENT_ID]
+        self._db[self.GADGET_METRICS_COLLECTION].replace_one(
+            {ID_: ObjectId(metrics.deploymentId)}, document, upsert=True
+        )
+
+    def increment_gadget_metrics(self, deployment_id: str, counters: dict[str, int]):
+        self._db[self.GADGET_METRICS_COLLECTION].update_one(
+            {ID_: ObjectId(deployment_id)}, {"$inc": counters}
+        )
+
+    def mark_gadget_metrics_stale(self, deployment_id: str):
+        self._db[self.GADGET_METRICS_COLLECTION].update_one(
+            {ID_: ObjectId(deployment_id)},
+            {"$unset": {DeploymentGadgetMetrics.UPDATE_DATE_TIME: ""}},
+        )
+
+    def delete_gadget_metrics(self, deployment_ids: list[str]):
+        query = {ID_: {"$in": [ObjectId(id_) for id_ in deployment_ids]}}
+        self._db[self.GADGET_METRICS_COLLECTION].delete_many(query)
+
+    @staticmethod
+    def _to_metrics(document: dict) -> DeploymentGadgetMetrics:
+        document[DeploymentGadgetMetrics.DEPLOYMENT_ID] = str(document.pop(ID_))
+        return DeploymentGadgetMetrics.from_dict(document)
@@ -0,0 +1,165 @@
+from datetime import datetime, timedelta
+from operator import itemgetter
+
+from extensions.authorization.boarding.manager import BoardingManager
+from extensions.authorization.models.authorized_user import AuthorizedUser
+from extensions.authorization.models.user import User, BoardingStatus
+from extensions.authorization.repository.auth_repository import AuthorizationRepository
+from extensions.dashboard.config.config import DashboardConfig
+from extensions.dashboard.models.gadget_metrics import DeploymentGadgetMetrics
+from extensions.dashboard.repository.dashobard_repository import DashboardRepository
+from extensions.deployment.boarding.econsent_module import EConsentModule
+from extensions.deployment.models.deployment import Deployment
+from extensions.deployment.repository.deployment_repository import DeploymentRepository
+from extensions.deployment.repository.econsent_repository import EConsentRepository
+from extensions.identity_verification.modules import IdentityVerificationModule
+from sdk.common.utils.inject import autoparams
+from sdk.phoenix.config.server_config import PhoenixServerConfig
+
+GADGET_ENABLED_MODULE_NAMES = (IdentityVerificationModule.name, EConsentModule.name)
+MODULE_ID = "module_id"
+RECONCILIATION_CHUNK_SIZE = 50
+
+
+def get_deployment_enabled_modules(deployment: Deployment) -> list[dict]:
+    module_class_mapping = {m.name: m for m in BoardingManager.default_modules}
+    if not deployment.onboardingConfigs:
+        return []
+
+    modules = [
+        {
+            MODULE_ID: m.onboardingId,
+            "order": m.order,
+            "module_class": module_class_mapping.get(m.onboardingId),
+        }
+        for m in deployment.onboardingConfigs
+        if m.is_enabled() and m.onboardingId in GADGET_ENABLED_MODULE_NAMES
+    ]
+    return sorted(modules, key=itemgetter("order"))
+
+
+class GadgetMetricsService:
+    """
+    Provides deployment counters for dashboard gadgets.
+    When gadget metrics are enabled, counters are read from the materialized
+    collection and calculated live only for deployments with stale counters.
+    """
+
+    @autoparams()
+    def __init__(
+        self,
+        repo: DashboardRepository,
+        auth_repo: AuthorizationRepository,
+        econsent_repo: EConsentRepository,
+        deployment_repo: DeploymentRepository,
+        server_config: PhoenixServerConfig,
+    ):
+        self._repo = repo
+        self._auth_repo = auth_repo
+        self._econsent_repo = econsent_repo
+        self._deployment_repo = deployment_repo
+        dashboard_config = getattr(server_config.server, "dashboard", None)
+        self._config = (dashboard_config or DashboardConfig()).gadgetMetrics
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.enabled
+
+    def retrieve_deployments_metrics(
+        self, deployments: list[Deployment]
+    ) -> dict[str, DeploymentGadgetMetrics]:
+        if not self._config.enabled:
+            return {d.id: self.calculate_deployment_metrics(d) for d in deployments}
+
+        stored_metrics = {
+            metrics.deploymentId: metrics
+            for metrics in self._repo.retrieve_gadget_metrics(
+                [deployment.id for deployment in deployments]
+            )
+        }
+        max_age = timedelta(minutes=self._config.maxAgeMinutes)
+        deployments_metrics = {}
+        for deployment in deployments:
+            metrics = stored_metrics.get(deployment.id)
+            module_ids = [
+                module[MODULE_ID]
+                for module in get_deployment_enabled_modules(deployment)
+            ]
+            if not (metrics and metrics.is_fresh(max_age, module_ids)):
+                metrics = self.calculate_deployment_metrics(deployment)
+                self._repo.update_gadget_metrics(metrics)
+            deployments_metrics[deployment.id] = metrics
+        return deployments_metrics
+
+    def reconcile_gadget_metrics(self) -> int:
+        """Recalculates counters of all deployments with materialized metrics."""
+        deployment_ids = self._repo.retrieve_gadget_metrics_deployment_ids()
+        reconciled = 0
+        for index in range(0, len(deployment_ids), RECONCILIATION_CHUNK_SIZE):
+            chunk_ids = deployment_ids[index : index + RECONCILIATION_CHUNK_SIZE]
+            deployments = self._deployment_repo.retrieve_deployments_by_ids(chunk_ids)
+            for deployment in deployments:
+                self._repo.update_gadget_metrics(
+                    self.calculate_deployment_metrics(deployment)
+                )
+            reconciled += len(deployments)
+
+            deleted_ids = set(chunk_ids) - {deployment.id for deployment in deployments}
+            if deleted_ids:
+                self._repo.delete_gadget_metrics(list(deleted_ids))
+        return reconciled
+
+    def calculate_deployment_metrics(
+        self, deployment: Deployment
+    ) -> DeploymentGadgetMetrics:
+        metrics = DeploymentGadgetMetrics(
+            deploymentId=deployment.id, updateDateTime=datetime.utcnow()
+        )
+        users = self._retrieve_users_with_filter(deployment.id, {})
+        metrics.signedUp = len(users)
+        for reason, counter in DeploymentGadgetMetrics.OFF_BOARDED_COUNTERS.items():
+            off_boarded = self._get_users_with_off_boarding_reason(
+                deployment.id, reason
+            )
+            setattr(metrics, counter, len(off_boarded))
+
+        for module in get_deployment_enabled_modules(deployment):
+            module_id = module[MODULE_ID]
+            if module_id == EConsentModule.name:
+                # special workaround for econsent in order not to query db for every user
+                completed = self._get_deployment_consented_users_count(deployment)
+                metrics.completedModules[module_id] = completed
+                continue
+
+            module_instance = module["module_class"]()
+            metrics.completedModules[module_id] = sum(
+                bool(
+                    module_instance.is_module_completed(
+                        AuthorizedUser(user=user, deployment_id=deployment.id)
+                    )
+                )
+                for user in users
+            )
+        return metrics
+
+    def _get_deployment_consented_users_count(self, deployment: Deployment) -> int:
+        if not deployment.econsent:
+            return 0
+        consented = self._econsent_repo.retrieve_consented_users_count(
+            econsent_id=deployment.econsent.id
+        )
+        return sum(consented.values())
+
+    def _retrieve_users_with_filter(self, deployment_id: str, query_filter: dict):
+        users = self._auth_repo.retrieve_user_profiles(
+            deployment_id, "", filters=query_filter
+        )[0]
+        return users
+
+    def _get_users_with_off_boarding_reason(
+        self, deployment_id: str, reason: BoardingStatus.ReasonOffBoarded
+    ):
+        filters = {
+            f"{User.BOARDING_STATUS}.{BoardingStatus.REASON_OFF_BOARDED}": reason
+        }
+        return self._retrieve_users_with_filter(deployment_id, filters)
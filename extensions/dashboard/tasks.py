@@ -0,0 +1,36 @@
+import logging
+import time
+
+from celery.schedules import crontab
+
+from sdk.celery.app import celery_app
+from sdk.common.constants import SEC_IN_HOUR
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        crontab(minute="*/10"),
+        reconcile_gadget_metrics_task.s(),
+        name="Dashboard gadget metrics reconciliation",
+    )
+
+
+@celery_app.task(expires=SEC_IN_HOUR)
+def reconcile_gadget_metrics_task():
+    from extensions.dashboard.service.gadget_metrics_service import (
+        GadgetMetricsService,
+    )
+
+    service = GadgetMetricsService()
+    if not service.enabled:
+        return
+
+    started = time.monotonic()
+    reconciled = service.reconcile_gadget_metrics()
+    logger.info(
+        f"Gadget metrics of {reconciled} deployments reconciled in "
+        f"{time.monotonic() - started:.1f}s"
+    )
@@ -17,6 +17,7 @@ from extensions.deployment.callbacks import (
     post_deployment_update_event,
 )
 from extensions.deployment.di.components import (
+    bind_deployment_cache,
     bind_deployment_repository,
     bind_consent_repository,
     bind_modules_manager,
@@ -71,6 +72,7 @@ class DeploymentComponent(PhoenixBaseComponent):
         }
 
     def bind(self, binder: Binder, config: PhoenixServerConfig):
+        bind_deployment_cache(binder, config)
         bind_deployment_repository(binder, config)
         bind_consent_repository(binder, config)
         bind_modules_manager(binder, config)
@@ -1,10 +1,18 @@
 from dataclasses import field
 
 from sdk import convertibleclass
-from sdk.common.utils.convertible import default_field
+from sdk.common.constants import SEC_IN_HOUR
+from sdk.common.utils.convertible import default_field, meta
 from sdk.phoenix.config.server_config import BasePhoenixConfig
 
 
+@convertibleclass
+class DeploymentCacheConfig:
+    enabled: bool = field(default=False)
+    localSize: int = field(default=128, metadata=meta(lambda n: n > 0))
+    expiresIn: int = field(default=SEC_IN_HOUR, metadata=meta(lambda n: n > 0))
+
+
 @convertibleclass
 class DeploymentConfig(BasePhoenixConfig):
     encryptionSecret: str = default_field()
@@ -12,3 +20,4 @@ class DeploymentConfig(BasePhoenixConfig):
     userProfileValidation: bool = field(default=True)
     onBoarding: bool = field(default=True)
     offBoarding: bool = field(default=True)
+    cache: DeploymentCacheConfig = field(default_factory=DeploymentCacheConfig)
@@ -1,8 +1,14 @@
 import logging
 
 from extensions.module_result.modules.modules_manager import ModulesManager
+from extensions.deployment.repository.cached_deployment_repository import (
+    CachedMongoConsentRepository,
+    CachedMongoDeploymentRepository,
+    CachedMongoEConsentRepository,
+)
 from extensions.deployment.repository.consent_repository import ConsentRepository
 from extensions.deployment.repository.econsent_repository import EConsentRepository
+from extensions.deployment.repository.deployment_cache import DeploymentCache
 from extensions.deployment.repository.deployment_repository import DeploymentRepository
 from extensions.deployment.repository.mongo_consent_repository import (
     MongoConsentRepository,
@@ -13,17 +19,49 @@ from extensions.deployment.repository.mongo_econsent_repository import (
 from extensions.deployment.repository.mongo_deployment_repository import (
     MongoDeploymentRepository,
 )
+from sdk.common.caching.service import CachingService
 
 logger = logging.getLogger(__name__)
 
 
+def _is_cache_enabled(conf) -> bool:
+    deployment_config = getattr(conf.server, "deployment", None)
+    return bool(deployment_config and deployment_config.cache.enabled)
+
+
+def bind_deployment_cache(binder, conf):
+    if not _is_cache_enabled(conf):
+        return
+
+    cache_config = conf.server.deployment.cache
+    binder.bind_to_constructor(
+        DeploymentCache, lambda: DeploymentCache(cache_config, CachingService())
+    )
+
+    logger.debug(f"Deployment Cache bind to Redis backed Deployment Cache")
+
+
 def bind_deployment_repository(binder, conf):
+    if _is_cache_enabled(conf):
+        binder.bind_to_provider(
+            DeploymentRepository, lambda: CachedMongoDeploymentRepository()
+        )
+        logger.debug(f"Deployment Repository bind to Cached Deployment Repository")
+        return
+
     binder.bind_to_provider(DeploymentRepository, lambda: MongoDeploymentRepository())
 
     logger.debug(f"Deployment Repository bind to Mongo Deployment Repository")
 
 
 def bind_consent_repository(binder, conf):
+    if _is_cache_enabled(conf):
+        binder.bind_to_provider(
+            ConsentRepository, lambda: CachedMongoConsentRepository()
+        )
+        logger.debug(f"Consent Repository bind to Cached Consent Repository")
+        return
+
     binder.bind_to_provider(ConsentRepository, lambda: MongoConsentRepository())
 
     logger.debug(f"Consent Repository bind to Mongo Consent Repository")
@@ -35,6 +73,13 @@ def bind_modules_manager(binder, conf):
 
 
 def bind_econsent_repository(binder, conf):
+    if _is_cache_enabled(conf):
+        binder.bind_to_provider(
+            EConsentRepository, lambda: CachedMongoEConsentRepository()
+        )
+        logger.debug(f"EConsent Repository bind to Cached EConsent Repository")
+        return
+
     binder.bind_to_provider(EConsentRepository, lambda: MongoEConsentRepository())
 
     logger.debug(f"EConsent Repository bind to Mongo EConsent Repository")
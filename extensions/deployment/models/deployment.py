@@ -70,7 +70,6 @@ from sdk.common.utils.validators import (
     must_not_be_present,
     validate_object_ids,
     validate_no_duplicate_keys_value_in_list,
-    read_json_file,
     validate_country_code,
 )
 
@@ -1021,27 +1020,21 @@ class Deployment(
         """Loads all config bodies regard to enabled module configs from licensed
         modules folders."""
         from extensions.module_result.modules.licensed_questionnaire_module import (
-            get_licensed_questionnaires_dir_list,
-            get_licensed_questionnaires_config_path,
-            get_licensed_questionnaire_dir,
+            licensed_configs,
         )
 
-        licensed_questionnaires_dir_list = get_licensed_questionnaires_dir_list()
-
         if not self.moduleConfigs:
             return
 
+        licensed_module_ids = licensed_configs.module_ids()
         for module_config in self.moduleConfigs:
             if (
                 module_config.is_enabled()
-                and module_config.moduleId in licensed_questionnaires_dir_list
+                and module_config.moduleId in licensed_module_ids
             ):
-                config_path = get_licensed_questionnaires_config_path(
-                    module_config.moduleId
-                )
                 try:
-                    module_config_from_file = read_json_file(
-                        f"{get_licensed_questionnaire_dir()}/{config_path}", "./"
+                    module_config_from_file = licensed_configs.get_config_body(
+                        module_config.moduleId
                     )
                 except FileNotFoundError:
                     raise InvalidModuleConfiguration(
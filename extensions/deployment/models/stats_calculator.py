@@ -1,3 +1,5 @@
+import logging
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional
 
@@ -17,12 +19,20 @@ from extensions.organization.repository.organization_repository import (
     OrganizationRepository,
 )
 from sdk.calendar.models.calendar_event import CalendarEvent
+from sdk.calendar.models.event_generator import EventGenerator
 from sdk.calendar.service.calendar_service import CalendarService
 from sdk.calendar.utils import get_dt_from_str
 from sdk.common.utils.inject import autoparams
 
+logger = logging.getLogger(__name__)
+
+# completed and expired events count
+Compliance = tuple[int, int]
+
 
 class DeploymentStatsCalculator:
+    COMPLIANCE_USERS_BATCH_SIZE = 500
+
     @autoparams()
     def __init__(
         self,
@@ -105,36 +115,95 @@ class DeploymentStatsCalculator:
         )
 
     def retrieve_task_compliance_rate(self) -> float:
-        def is_expired(event):
-            return get_dt_from_str(event[CalendarEvent.END_DATE_TIME]) <= self.now
-
         users = self._retrieve_user_timezones()
         service = CalendarService()
         total_completed = 0
         total_expired = 0
-        for user_id, timezone in users.items():
-            kwargs = {
-                CalendarEvent.USER_ID: user_id,
-                CalendarEvent.MODEL: KeyAction.__name__,
-                "to_model": False,
+        user_ids = list(users)
+        for i in range(0, len(user_ids), self.COMPLIANCE_USERS_BATCH_SIZE):
+            batch = {
+                user_id: users[user_id]
+                for user_id in user_ids[i : i + self.COMPLIANCE_USERS_BATCH_SIZE]
             }
-            events = service.retrieve_calendar_events_between_two_dates(
-                start=self.deployment.createDateTime,
-                end=self.now,
-                timezone=timezone,
-                **kwargs,
-            )
-
-            key = CalendarEvent.ENABLED
-            completed = tuple(event for event in events if not event.get(key, True))
-            expired_events = sum(
-                1 for event in events if is_expired(event) or event in completed
-            )
-            total_completed += len(completed)
-            total_expired += expired_events
+            try:
+                compliance = self._retrieve_batch_task_compliance(service, batch)
+            except Exception as error:
+                logger.warning(
+                    f"Batched task compliance failed for deployment {self.deployment.id}"
+                    f" with error: [{error}]. Falling back to per user calculation."
+                )
+                compliance = [
+                    self._retrieve_user_task_compliance(service, user_id, timezone)
+                    for user_id, timezone in batch.items()
+                ]
+            for completed, expired in compliance:
+                total_completed += completed
+                total_expired += expired
 
         return total_completed / total_expired * 100 if total_expired else 0
 
+    def _retrieve_batch_task_compliance(
+        self, service: CalendarService, users: dict[str, str]
+    ) -> list[Compliance]:
+        """Loads events and logs of all users with one query each and counts them per user."""
+        filter_options = {
+            CalendarEvent.USER_ID: {"$in": list(users)},
+            CalendarEvent.MODEL: KeyAction.__name__,
+        }
+        raw_events = service.retrieve_raw_events(**filter_options, to_model=False)
+        logs = service.retrieve_calendar_event_logs(**filter_options)
+
+        user_events = defaultdict(list)
+        for event in raw_events:
+            user_events[str(event.get(CalendarEvent.USER_ID))].append(event)
+        user_logs = defaultdict(list)
+        for log in logs:
+            user_logs[str(log.userId)].append(log)
+
+        compliance = []
+        for user_id, timezone in users.items():
+            if user_id not in user_events:
+                continue
+            generator = self._compliance_event_generator(timezone)
+            events = generator.generate(user_events[user_id])
+            if timezone:
+                for log in user_logs[user_id]:
+                    log.as_timezone(timezone)
+            generator.disable_completed_events(events, user_logs[user_id])
+            compliance.append(self._count_task_compliance(events))
+        return compliance
+
+    def _retrieve_user_task_compliance(
+        self, service: CalendarService, user_id: str, timezone: str
+    ) -> Compliance:
+        kwargs = {
+            CalendarEvent.USER_ID: user_id,
+            CalendarEvent.MODEL: KeyAction.__name__,
+            "to_model": False,
+        }
+        events = service.retrieve_calendar_events_between_two_dates(
+            start=self.deployment.createDateTime,
+            end=self.now,
+            timezone=timezone,
+            **kwargs,
+        )
+        return self._count_task_compliance(events)
+
+    def _compliance_event_generator(self, timezone: str) -> EventGenerator:
+        return EventGenerator(
+            start=self.deployment.createDateTime, end=self.now, timezone=timezone
+        )
+
+    def _count_task_compliance(self, events: list[dict]) -> Compliance:
+        completed = expired = 0
+        for event in events:
+            if not event.get(CalendarEvent.ENABLED, True):
+                completed += 1
+                expired += 1
+            elif get_dt_from_str(event[CalendarEvent.END_DATE_TIME]) <= self.now:
+                expired += 1
+        return completed, expired
+
     def _retrieve_user_timezones(self) -> dict[str, str]:
         role_name = RoleName.USER
         role: RoleAssignment = RoleAssignment.create_role(role_name, self.deployment.id)
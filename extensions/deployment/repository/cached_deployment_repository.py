@@ -0,0 +1,178 @@
+import inspect
+from functools import wraps
+
+from pymongo import MongoClient
+from pymongo.database import Database
+
+from extensions.deployment.models.deployment import Deployment
+from extensions.deployment.repository.deployment_cache import DeploymentCache
+from extensions.deployment.repository.deployment_repository import DeploymentRepository
+from extensions.deployment.repository.mongo_consent_repository import (
+    MongoConsentRepository,
+)
+from extensions.deployment.repository.mongo_deployment_repository import (
+    MongoDeploymentRepository,
+)
+from extensions.deployment.repository.mongo_econsent_repository import (
+    MongoEConsentRepository,
+)
+from sdk.common.utils.inject import autoparams
+from sdk.phoenix.config.server_config import PhoenixServerConfig
+
+
+def invalidates_deployment(method):
+    """
+    Drops the cached deployment once the wrapped write has succeeded. The
+    deployment is found by `deployment_id` or `deployment` argument name.
+    """
+    signature = inspect.signature(method)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        deployment_id = arguments.get("deployment_id")
+        if deployment_id is None:
+            deployment: Deployment = arguments["deployment"]
+            deployment_id = deployment.id
+        self._deployment_cache.invalidate(str(deployment_id))
+        return result
+
+    return wrapper
+
+
+class CachedMongoDeploymentRepository(MongoDeploymentRepository):
+    """Serves `retrieve_deployment` from `DeploymentCache` and invalidates it on every write."""
+
+    @autoparams()
+    def __init__(
+        self,
+        database: Database,
+        client: MongoClient,
+        deployment_cache: DeploymentCache,
+    ):
+        super().__init__(database=database, client=client)
+        self._deployment_cache = deployment_cache
+
+    def retrieve_deployment(self, deployment_id: str) -> Deployment:
+        load = super().retrieve_deployment
+        return self._deployment_cache.retrieve(
+            str(deployment_id), lambda: load(deployment_id=deployment_id)
+        )
+
+    create_module_config = invalidates_deployment(
+        MongoDeploymentRepository.create_module_config
+    )
+    update_module_config = invalidates_deployment(
+        MongoDeploymentRepository.update_module_config
+    )
+    delete_module_config = invalidates_deployment(
+        MongoDeploymentRepository.delete_module_config
+    )
+    reorder_module_configs = invalidates_deployment(
+        MongoDeploymentRepository.reorder_module_configs
+    )
+    create_onboarding_module_config = invalidates_deployment(
+        MongoDeploymentRepository.create_onboarding_module_config
+    )
+    update_onboarding_module_config = invalidates_deployment(
+        MongoDeploymentRepository.update_onboarding_module_config
+    )
+    delete_onboarding_module_config = invalidates_deployment(
+        MongoDeploymentRepository.delete_onboarding_module_config
+    )
+    reorder_onboarding_module_configs = invalidates_deployment(
+        MongoDeploymentRepository.reorder_onboarding_module_configs
+    )
+    create_key_action = invalidates_deployment(
+        MongoDeploymentRepository.create_key_action
+    )
+    update_key_action = invalidates_deployment(
+        MongoDeploymentRepository.update_key_action
+    )
+    delete_key_action = invalidates_deployment(
+        MongoDeploymentRepository.delete_key_action
+    )
+    create_learn_section = invalidates_deployment(
+        MongoDeploymentRepository.create_learn_section
+    )
+    update_learn_section = invalidates_deployment(
+        MongoDeploymentRepository.update_learn_section
+    )
+    delete_learn_section = invalidates_deployment(
+        MongoDeploymentRepository.delete_learn_section
+    )
+    reorder_learn_sections = invalidates_deployment(
+        MongoDeploymentRepository.reorder_learn_sections
+    )
+    create_learn_article = invalidates_deployment(
+        MongoDeploymentRepository.create_learn_article
+    )
+    update_learn_article = invalidates_deployment(
+        MongoDeploymentRepository.update_learn_article
+    )
+    delete_learn_article = invalidates_deployment(
+        MongoDeploymentRepository.delete_learn_article
+    )
+    reorder_learn_articles = invalidates_deployment(
+        MongoDeploymentRepository.reorder_learn_articles
+    )
+    create_deployment_labels = invalidates_deployment(
+        MongoDeploymentRepository.create_deployment_labels
+    )
+    update_deployment_labels = invalidates_deployment(
+        MongoDeploymentRepository.update_deployment_labels
+    )
+    delete_deployment_label = invalidates_deployment(
+        MongoDeploymentRepository.delete_deployment_label
+    )
+    create_care_plan_group = invalidates_deployment(
+        MongoDeploymentRepository.create_care_plan_group
+    )
+    create_or_update_roles = invalidates_deployment(
+        MongoDeploymentRepository.create_or_update_roles
+    )
+    update_localizations = invalidates_deployment(
+        MongoDeploymentRepository.update_localizations
+    )
+    update_enrollment_counter = invalidates_deployment(
+        MongoDeploymentRepository.update_enrollment_counter
+    )
+    update_deployment = invalidates_deployment(
+        MongoDeploymentRepository.update_deployment
+    )
+    update_full_deployment = invalidates_deployment(
+        MongoDeploymentRepository.update_full_deployment
+    )
+    delete_deployment = invalidates_deployment(
+        MongoDeploymentRepository.delete_deployment
+    )
+
+
+class CachedMongoConsentRepository(MongoConsentRepository):
+    @autoparams()
+    def __init__(
+        self,
+        database: Database,
+        config: PhoenixServerConfig,
+        deployment_cache: DeploymentCache,
+    ):
+        super().__init__(database=database, config=config)
+        self._deployment_cache = deployment_cache
+
+    create_consent = invalidates_deployment(MongoConsentRepository.create_consent)
+
+
+class CachedMongoEConsentRepository(MongoEConsentRepository):
+    @autoparams()
+    def __init__(
+        self,
+        database: Database,
+        config: PhoenixServerConfig,
+        repo: DeploymentRepository,
+        deployment_cache: DeploymentCache,
+    ):
+        super().__init__(database=database, config=config, repo=repo)
+        self._deployment_cache = deployment_cache
+
+    create_econsent = invalidates_deployment(MongoEConsentRepository.create_econsent)
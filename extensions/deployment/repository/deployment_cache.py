@@ -0,0 +1,138 @@
+import logging
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Callable, Optional
+
+from redis.exceptions import RedisError
+
+from extensions.deployment.config.config import DeploymentCacheConfig
+from extensions.deployment.models.deployment import Deployment
+from sdk.common.adapter.redis.redis_utils import calculate_hashed_value
+from sdk.common.caching.service import CachingService
+from sdk.common.utils.convertible import ConvertibleClassValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class DeploymentCache:
+    """
+    Two-tier cache of deserialized deployments.
+
+    Redis keeps a small pointer per deployment with the current revision
+    (deployment version + content hash) and the serialized document under a
+    revision-specific key. Each process keeps the `Deployment` objects in a local
+    LRU, so a hot deployment is deserialized once per revision per worker and every
+    other lookup costs a single Redis read of the pointer.
+    Callers always receive a copy, as deployments are mutated after retrieval.
+    A load which overlaps an invalidation is returned but not cached, so a
+    deployment read before a write is not served after it.
+    """
+
+    KEY_PREFIX = "deployment-cache"
+
+    def __init__(self, config: DeploymentCacheConfig, caching: CachingService):
+        self._config = config
+        self._caching = caching
+        self._local: OrderedDict[str, tuple[str, Deployment]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._invalidations = 0
+
+    def retrieve(
+        self, deployment_id: str, loader: Callable[[], Deployment]
+    ) -> Deployment:
+        invalidations = self._invalidations
+        revision = self._retrieve_revision(deployment_id)
+        deployment = revision and self._retrieve_by_revision(
+            deployment_id, revision, invalidations
+        )
+        if not deployment:
+            deployment = loader()
+            self._store(deployment, invalidations)
+        return deepcopy(deployment)
+
+    def invalidate(self, deployment_id: str):
+        with self._lock:
+            self._local.pop(deployment_id, None)
+            self._invalidations += 1
+        try:
+            self._caching.delete(self._pointer_key(deployment_id))
+        except RedisError as error:
+            logger.warning(f"Deployment {deployment_id} cache not invalidated: {error}")
+
+    def _retrieve_revision(self, deployment_id: str) -> Optional[str]:
+        try:
+            pointer = self._caching.get(self._pointer_key(deployment_id))
+        except RedisError as error:
+            logger.warning(f"Deployment cache is not accessible: {error}")
+            return None
+        return pointer.contentHash if pointer else None
+
+    def _retrieve_by_revision(
+        self, deployment_id: str, revision: str, invalidations: int
+    ) -> Optional[Deployment]:
+        with self._lock:
+            cached_revision, deployment = self._local.get(deployment_id, (None, None))
+            if cached_revision == revision:
+                self._local.move_to_end(deployment_id)
+                return deployment
+
+        try:
+            cached = self._caching.get(self._document_key(deployment_id, revision))
+        except RedisError as error:
+            logger.warning(f"Deployment cache is not accessible: {error}")
+            return None
+        if not cached or not cached.content:
+            return None
+
+        try:
+            deployment = Deployment.from_dict(cached.content)
+        except ConvertibleClassValidationError as error:
+            logger.warning(f"Cached deployment {deployment_id} is invalid: {error}")
+            return None
+        self._store_local(deployment_id, revision, deployment, invalidations)
+        return deployment
+
+    def _store(self, deployment: Deployment, invalidations: int):
+        content = deployment.to_dict(include_none=False)
+        revision = f"{deployment.version}.{calculate_hashed_value(content)}"
+        if not self._store_local(deployment.id, revision, deployment, invalidations):
+            return
+        try:
+            self._caching.set(
+                self._document_key(deployment.id, revision),
+                content,
+                revision,
+                self._config.expiresIn,
+            )
+            self._caching.set(
+                self._pointer_key(deployment.id),
+                None,
+                revision,
+                self._config.expiresIn,
+            )
+        except (RedisError, TypeError) as error:
+            logger.warning(f"Deployment {deployment.id} was not cached: {error}")
+
+    def _store_local(
+        self,
+        deployment_id: str,
+        revision: str,
+        deployment: Deployment,
+        invalidations: int,
+    ) -> bool:
+        with self._lock:
+            if invalidations != self._invalidations:
+                # deployment could be updated while loading, loaded value is not cached
+                return False
+            self._local[deployment_id] = (revision, deployment)
+            self._local.move_to_end(deployment_id)
+            while len(self._local) > self._config.localSize:
+                self._local.popitem(last=False)
+        return True
+
+    def _pointer_key(self, deployment_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{deployment_id}"
+
+    def _document_key(self, deployment_id: str, revision: str) -> str:
+        return f"{self.KEY_PREFIX}:{deployment_id}:{revision}"
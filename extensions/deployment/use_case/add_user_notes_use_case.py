@@ -31,9 +31,10 @@ class AddUserNotesUseCase(UseCase):
             }
         )
         inserted_note_id = self.deployment_service.add_user_observation_note(note)
-        self.module_results_repo.flush_unseen_results(
+        self.module_result_service.flush_unseen_results(
             user_id=request_object.userId,
             start_date_time=request_object.createDateTime,
         )
-        self.module_result_service.update_unseen_flags(request_object.userId)
+        if not self.module_result_service.incremental_unseen_flags:
+            self.module_result_service.update_unseen_flags(request_object.userId)
         return {"id": inserted_note_id}
@@ -1,11 +1,18 @@
 from dataclasses import field
 
 from sdk.common.adapter.mongodb.mongodb_config import MongodbDatabaseConfig
-from sdk.common.utils.convertible import convertibleclass, default_field
+from sdk.common.utils.convertible import convertibleclass, default_field, meta
 from sdk.phoenix.config.server_config import BasePhoenixConfig
 
 
+@convertibleclass
+class StreamingExportConfig:
+    enabled: bool = field(default=False)
+    batchSize: int = field(default=1000, metadata=meta(lambda n: n > 0))
+
+
 @convertibleclass
 class ExportDeploymentConfig(BasePhoenixConfig):
     sourceMongodbDatabase: MongodbDatabaseConfig = default_field()
     summaryReportEnabled: bool = field(default=True)
+    streaming: StreamingExportConfig = field(default_factory=StreamingExportConfig)
@@ -0,0 +1,139 @@
+import csv
+import io
+import os
+import pickle
+import zipfile
+from collections import defaultdict
+from typing import Iterator, Union
+
+import ujson as json
+
+JSON_EXTENSION = ".json"
+CSV_EXTENSION = ".csv"
+INDEX_FILE_NAME = "index.txt"
+
+Group = tuple[str, ...]
+GroupTree = dict[str, Union["GroupTree", str]]
+
+
+class StreamingExportArchive:
+    """
+    Builds export zip archive without keeping exported data in memory.
+
+    Rows are appended to spool files on disk per archive entry and group, where
+    group is a path of keys the rows are nested under in JSON entries
+    (e.g. view key and module name). CSV entries are rendered as one table with
+    a header made of all keys in order of appearance, same as `write_csv_data`.
+    Entries are then written into the zip one by one, reading spool files row by row.
+    """
+
+    def __init__(self, spool_dir: str):
+        self._spool_dir = spool_dir
+        self._entries: dict[str, GroupTree] = {}
+        self._csv_keys: dict[str, dict[str, None]] = defaultdict(dict)
+        self._spool_files_count = 0
+
+    def add_rows(self, entry: str, group: Group, rows: list[dict]):
+        if not rows:
+            return
+
+        spool_file = self._get_spool_file(entry, group)
+        with open(spool_file, "ab") as spool:
+            for row in rows:
+                pickle.dump(row, spool, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if entry.endswith(CSV_EXTENSION):
+            keys = self._csv_keys[entry]
+            for row in rows:
+                for key in row:
+                    keys.setdefault(key)
+
+    def write(self, archive_path: str, extra_files_dir: str = None):
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for entry, tree in self._entries.items():
+                with archive.open(entry, "w", force_zip64=True) as raw:
+                    stream = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+                    if entry.endswith(CSV_EXTENSION):
+                        self._write_csv(stream, entry, tree)
+                    else:
+                        self._write_json(stream, tree)
+                    stream.flush()
+                    stream.detach()
+
+            for directory, file_names in self._index_files().items():
+                index_entry = os.path.join(directory, INDEX_FILE_NAME)
+                archive.writestr(index_entry, "".join(f"{n}\n" for n in file_names))
+
+            if extra_files_dir:
+                self._write_extra_files(archive, extra_files_dir)
+
+    def _get_spool_file(self, entry: str, group: Group) -> str:
+        node = self._entries.setdefault(entry, {})
+        for key in group[:-1]:
+            node = node.setdefault(key, {})
+        leaf_key = group[-1] if group else ""
+        if leaf_key not in node:
+            self._spool_files_count += 1
+            file_name = f"{self._spool_files_count}.spool"
+            node[leaf_key] = os.path.join(self._spool_dir, file_name)
+        return node[leaf_key]
+
+    @staticmethod
+    def _read_rows(spool_file: str) -> Iterator[dict]:
+        with open(spool_file, "rb") as spool:
+            while True:
+                try:
+                    yield pickle.load(spool)
+                except EOFError:
+                    return
+
+    def _iterate_spool_files(self, tree: GroupTree) -> Iterator[str]:
+        for node in tree.values():
+            if isinstance(node, dict):
+                yield from self._iterate_spool_files(node)
+            else:
+                yield node
+
+    def _write_csv(self, stream: io.TextIOWrapper, entry: str, tree: GroupTree):
+        keys = list(self._csv_keys[entry])
+        writer = csv.writer(stream)
+        writer.writerow(keys)
+        for spool_file in self._iterate_spool_files(tree):
+            for row in self._read_rows(spool_file):
+                writer.writerow([f"{row[k]}" if k in row else None for k in keys])
+
+    def _write_json(self, stream: io.TextIOWrapper, tree: GroupTree):
+        if set(tree) == {""}:
+            self._write_json_list(stream, tree[""])
+            return
+
+        stream.write("{")
+        for index, (key, node) in enumerate(tree.items()):
+            stream.write(f'{"," if index else ""}{json.dumps(key)}: ')
+            if isinstance(node, dict):
+                self._write_json(stream, node)
+            else:
+                self._write_json_list(stream, node)
+        stream.write("}")
+
+    def _write_json_list(self, stream: io.TextIOWrapper, spool_file: str):
+        stream.write("[")
+        for index, row in enumerate(self._read_rows(spool_file)):
+            if index:
+                stream.write(",")
+            stream.write(json.dumps(row, indent=4, escape_forward_slashes=False))
+        stream.write("]")
+
+    def _index_files(self) -> dict[str, list[str]]:
+        index_files = defaultdict(list)
+        for entry in self._entries:
+            directory, file_name = os.path.split(entry)
+            index_files[directory].append(file_name)
+        return index_files
+
+    @staticmethod
+    def _write_extra_files(archive: zipfile.ZipFile, directory: str):
+        for root, _, file_names in os.walk(directory):
+            for file_name in file_names:
+                path = os.path.join(root, file_name)
+                archive.write(path, os.path.relpath(path, directory))
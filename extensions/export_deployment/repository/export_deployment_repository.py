@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import date, datetime
-from typing import Optional, Type, Union
+from typing import Iterator, Optional, Type, Union
 
 from extensions.authorization.models.user import User
 from extensions.deployment.models.consent.consent_log import ConsentLog
@@ -50,6 +50,21 @@ class ExportDeploymentRepository(ABC):
     ) -> list[Primitive]:
         raise NotImplementedError
 
+    @abstractmethod
+    def retrieve_primitives_batches(
+        self,
+        primitive_class: Type[Union[Primitive, Questionnaire]],
+        module_id: str,
+        deployment_id: str,
+        start_date: date,
+        end_date: date,
+        batch_size: int,
+        user_ids: Optional[list] = None,
+        use_creation_time: Optional[bool] = None,
+    ) -> Iterator[list[Primitive]]:
+        """Same as `retrieve_primitives`, but yields lists of up to `batch_size` primitives."""
+        raise NotImplementedError
+
     @abstractmethod
     def retrieve_export_profiles(
         self, name_contains: str, deployment_id: str = None, organization_id: str = None
@@ -1,5 +1,5 @@
 from datetime import date, timedelta, datetime
-from typing import Optional
+from typing import Iterator, Optional
 
 from bson import ObjectId
 from mongoengine import NotUniqueError
@@ -105,6 +105,62 @@ class MongoExportDeploymentRepository(ExportDeploymentRepository):
         user_ids: Optional[list] = None,
         use_creation_time: Optional[bool] = None,
     ) -> list[Primitive]:
+        query = self._primitives_query(
+            primitive_class,
+            module_id,
+            deployment_id,
+            start_date,
+            end_date,
+            partly_date_range,
+            user_ids,
+            use_creation_time,
+        )
+        res = self.db[primitive_class.__name__.lower()].find(query)
+        return [self._primitive_from_document(primitive_class, p) for p in res]
+
+    def retrieve_primitives_batches(
+        self,
+        primitive_class: Primitive,
+        module_id: str,
+        deployment_id: str,
+        start_date: date,
+        end_date: date,
+        batch_size: int,
+        user_ids: Optional[list] = None,
+        use_creation_time: Optional[bool] = None,
+    ) -> Iterator[list[Primitive]]:
+        query = self._primitives_query(
+            primitive_class,
+            module_id,
+            deployment_id,
+            start_date,
+            end_date,
+            False,
+            user_ids,
+            use_creation_time,
+        )
+        collection = self.db[primitive_class.__name__.lower()]
+        cursor = collection.find(query).sort(Primitive.ID_).batch_size(batch_size)
+        batch = []
+        for document in cursor:
+            batch.append(self._primitive_from_document(primitive_class, document))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _primitives_query(
+        primitive_class: Primitive,
+        module_id: str,
+        deployment_id: str,
+        start_date: date,
+        end_date: date,
+        partly_date_range: bool,
+        user_ids: Optional[list],
+        use_creation_time: Optional[bool],
+    ) -> dict:
         deployment_obj_id = ObjectId(deployment_id)
         if user_ids:
             user_ids = [ObjectId(user_id) for user_id in user_ids]
@@ -120,16 +176,12 @@ class MongoExportDeploymentRepository(ExportDeploymentRepository):
             Primitive.MODULE_ID: module_id,
             **date_range_query,
         }
-        primitive_name = primitive_class.__name__
-        res = self.db[primitive_name.lower()].find(remove_none_values(query))
-        primitives = []
-        for primitive in res:
-            primitive[Primitive.ID] = str(primitive.pop(Primitive.ID_))
-            primitive_obj = primitive_class.from_dict(
-                primitive, use_validator_field=False
-            )
-            primitives.append(primitive_obj)
-        return primitives
+        return remove_none_values(query)
+
+    @staticmethod
+    def _primitive_from_document(primitive_class: Primitive, document: dict):
+        document[Primitive.ID] = str(document.pop(Primitive.ID_))
+        return primitive_class.from_dict(document, use_validator_field=False)
 
     @staticmethod
     def _get_query_date_range(
@@ -74,6 +74,7 @@ def run_export(
         # To prevent circular import
         from extensions.export_deployment.use_case.export_use_cases import (
             ExportDeploymentUseCase,
+            StreamingExportDeploymentUseCase,
         )
 
         # update status to PROCESSING
@@ -94,19 +95,29 @@ def run_export(
             ExportRequestObject.ORGANIZATION_ID: export_process.organizationId,
         }
         request_object = ExportRequestObject.from_dict(remove_none_values(data))
-        use_case = ExportDeploymentUseCase()
+        streaming_config = config.server.exportDeployment.streaming
+        if streaming_config.enabled:
+            use_case = StreamingExportDeploymentUseCase(
+                batch_size=streaming_config.batchSize
+            )
+        else:
+            use_case = ExportDeploymentUseCase()
         export_data_archive_response = use_case.execute(request_object)
         timestamp = datetime.utcnow().isoformat()
         filename = f"user/{export_process.requesterId}/exports/{export_process_id}/{timestamp}.zip"
 
         # take export bucket from export config or first allowed bucket
         bucket = get_export_bucket(request_object, config)
-        use_case.upload_result_to_bucket(
-            filename,
-            export_data_archive_response.value.content,
-            export_data_archive_response.value.contentType,
-            bucket,
-        )
+        export_result = export_data_archive_response.value
+        if export_result.content is None:
+            # streaming export leaves archive on disk to be uploaded by parts
+            use_case.upload_archive_to_bucket(
+                filename, export_result.filename, export_result.contentType, bucket
+            )
+        else:
+            use_case.upload_result_to_bucket(
+                filename, export_result.content, export_result.contentType, bucket
+            )
         # update status to DONE
         repo.update_export_process(
             export_process_id,
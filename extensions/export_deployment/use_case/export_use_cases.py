@@ -34,6 +34,11 @@ from extensions.export_deployment.helpers.convertion_helpers import (
     get_consents_meta_data,
     build_module_config_versions,
 )
+from extensions.export_deployment.helpers.streaming_archive import (
+    CSV_EXTENSION,
+    JSON_EXTENSION,
+    StreamingExportArchive,
+)
 from extensions.export_deployment.helpers.translation_helpers import (
     prepare_short_codes,
 )
@@ -73,6 +78,9 @@ from extensions.export_deployment.use_case.exportable.exportable_request_objects
     ExportableRequestObject,
     ExportableResponseObject,
 )
+from extensions.export_deployment.use_case.exportable.exportable_use_case import (
+    ExportableUseCase,
+)
 from extensions.export_deployment.use_case.exportable.medication_tracker_exportable_use_case import (
     MedicationTrackerModuleExportableUseCase,
 )
@@ -248,39 +256,12 @@ class ExportDeploymentUseCase(UseCase):
             request_object.translationShortCodesObjectFormat,
         )
         for deployment_id in self.retrieve_deployments():
-            deployment = self._deployment_repo.retrieve_deployment(
-                deployment_id=deployment_id
-            )
-            module_config_versions = defaultdict(
-                lambda: defaultdict(lambda: defaultdict(dict))
-            )
-            build_module_config_versions(
-                module_config_versions, deployment.moduleConfigs
-            )
             identifier = self.get_deployment_identifier(deployment_id)
-            deployment_responses = []
-            self._module_codes[deployment_id] = module_codes
-            consents_meta, econsents_meta = get_consents_meta_data(
-                deployment_id, self._export_repo, self._deployment_repo
+            req = self.build_exportable_request(
+                request_object, deployment_id, identifier, module_codes, short_codes
             )
-            deployment_export_dir = self.get_deployment_export_root_dir(identifier)
-            req_data = {
-                **request_object.to_dict(include_none=False),
-                ExportableRequestObject.CONSENTS_DATA: consents_meta,
-                ExportableRequestObject.ECONSENTS_DATA: econsents_meta,
-                ExportableRequestObject.TRANSLATION_MODULE_CODES: module_codes,
-                ExportableRequestObject.TRANSLATION_SHORT_CODES: short_codes,
-                ExportableRequestObject.EXPORT_DIR: deployment_export_dir,
-                ExportableRequestObject.DEPLOYMENT_ID: deployment_id,
-                ExportableRequestObject.DEPLOYMENT: deployment,
-            }
-            req = ExportableRequestObject.from_dict(remove_none_values(req_data))
-            req.usersData = self._users_meta
-            req.moduleConfigVersions = module_config_versions
-            for exportable_uc in self._exportable_use_cases:
-                use_case = exportable_uc(
-                    self._export_repo, self._deployment_repo, self._file_storage
-                )
+            deployment_responses = []
+            for use_case in self.get_exportable_use_cases():
                 rsp = use_case.execute(req)
                 deployment_responses.append(rsp)
             folder_or_files = self.breakdown_deployment_results(deployment_responses)
@@ -291,6 +272,47 @@ class ExportDeploymentUseCase(UseCase):
             total_results, deployment_results, request_object
         )
 
+    def build_exportable_request(
+        self,
+        request_object: ExportRequestObject,
+        deployment_id: str,
+        identifier: str,
+        module_codes: dict,
+        short_codes: dict,
+    ) -> ExportableRequestObject:
+        deployment = self._deployment_repo.retrieve_deployment(
+            deployment_id=deployment_id
+        )
+        module_config_versions = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(dict))
+        )
+        build_module_config_versions(module_config_versions, deployment.moduleConfigs)
+        self._module_codes[deployment_id] = module_codes
+        consents_meta, econsents_meta = get_consents_meta_data(
+            deployment_id, self._export_repo, self._deployment_repo
+        )
+        deployment_export_dir = self.get_deployment_export_root_dir(identifier)
+        req_data = {
+            **request_object.to_dict(include_none=False),
+            ExportableRequestObject.CONSENTS_DATA: consents_meta,
+            ExportableRequestObject.ECONSENTS_DATA: econsents_meta,
+            ExportableRequestObject.TRANSLATION_MODULE_CODES: module_codes,
+            ExportableRequestObject.TRANSLATION_SHORT_CODES: short_codes,
+            ExportableRequestObject.EXPORT_DIR: deployment_export_dir,
+            ExportableRequestObject.DEPLOYMENT_ID: deployment_id,
+            ExportableRequestObject.DEPLOYMENT: deployment,
+        }
+        req = ExportableRequestObject.from_dict(remove_none_values(req_data))
+        req.usersData = self._users_meta
+        req.moduleConfigVersions = module_config_versions
+        return req
+
+    def get_exportable_use_cases(self) -> list[ExportableUseCase]:
+        return [
+            exportable_uc(self._export_repo, self._deployment_repo, self._file_storage)
+            for exportable_uc in self._exportable_use_cases
+        ]
+
     def breakdown_total_results(self, responses: list):
         # this is to not breakdown "total" results when they are not needed
         if self.request_object.singleFileResponse or layer_is_flat(
@@ -539,6 +561,115 @@ class ExportDeploymentUseCase(UseCase):
         return self.request_object.userIds
 
 
+class StreamingExportDeploymentUseCase(ExportDeploymentUseCase):
+    """
+    Archive export with memory usage bounded by `batch_size` instead of export size.
+    Exportable use cases are executed by batches of primitives, and each batch is
+    spooled to disk right away and zipped entry by entry in the end. The archive is
+    not read into response content, `filename` points to it for upload from file.
+    Single file responses are returned in content, so they fall back to regular export.
+    """
+
+    SPOOL_DIR = "spool"
+
+    def __init__(self, batch_size: int, **kwargs):
+        super(StreamingExportDeploymentUseCase, self).__init__(**kwargs)
+        self._batch_size = batch_size
+        self._spool_directory = os.path.join(
+            self._temp_directory_object.name, self.SPOOL_DIR
+        )
+        os.mkdir(self._spool_directory)
+
+    def process_request(
+        self, request_object: ExportRequestObject
+    ) -> ExportDeploymentResponseObject:
+        if request_object.singleFileResponse:
+            return super(StreamingExportDeploymentUseCase, self).process_request(
+                request_object
+            )
+
+        module_codes, short_codes = self.get_translation_codes(
+            request_object.translationShortCodesObject,
+            request_object.translationShortCodesObjectFormat,
+        )
+        archive = StreamingExportArchive(self._spool_directory)
+        for deployment_id in self.retrieve_deployments():
+            identifier = self.get_deployment_identifier(deployment_id)
+            req = self.build_exportable_request(
+                request_object, deployment_id, identifier, module_codes, short_codes
+            )
+            root = self.get_archive_root(identifier)
+            for use_case in self.get_exportable_use_cases():
+                for rsp in use_case.execute_in_batches(req, self._batch_size):
+                    self.write_batch(archive, rsp, root)
+
+        archive_name = f"{self._temp_directory_object.name}/export_{datetime.utcnow().isoformat()}.zip"
+        archive.write(archive_name, self._temp_export_directory)
+        return ExportDeploymentResponseObject(
+            content=None,
+            filename=archive_name,
+            content_type="application/zip",
+        )
+
+    def get_archive_root(self, deployment_identifier: str) -> str:
+        # fallback to single deployment implementation
+        if layer_is_flat(self.request_object.layer) or self.request_object.deploymentId:
+            return ""
+        return deployment_identifier
+
+    def write_batch(
+        self,
+        archive: StreamingExportArchive,
+        response: ExportableResponseObject,
+        root: str,
+    ):
+        if export_format_requires_json(self.request_object.format):
+            self._add_rows(archive, response.to_json(), root, JSON_EXTENSION)
+        if export_format_requires_csv(self.request_object.format):
+            self._add_rows(archive, response.to_csv(), root, CSV_EXTENSION)
+
+    def _add_rows(
+        self,
+        archive: StreamingExportArchive,
+        data: dict[str, list],
+        root: str,
+        extension: str,
+    ):
+        rows = defaultdict(list)
+        for module_name, primitive_dicts in data.items():
+            for primitive_dict in primitive_dicts:
+                deployment_id = primitive_dict.get(Primitive.DEPLOYMENT_ID)
+                primitive_module_codes = self._module_codes.get(deployment_id, {})
+                mod_code = primitive_module_codes.get(module_name, module_name)
+                view_key = self.get_view_key(self.request_object.view, primitive_dict)
+                entry = self.get_archive_entry(root, view_key, mod_code, extension)
+                rows[entry].append(primitive_dict)
+        for (entry_name, group), entry_rows in rows.items():
+            archive.add_rows(entry_name, group, entry_rows)
+
+    def get_archive_entry(
+        self, root: str, view_key: str, module_code: str, extension: str
+    ) -> tuple[str, tuple[str, ...]]:
+        """Mirrors files layout of `fill_folders_and_files`."""
+        single_file = quantity_is_single(self.request_object.quantity)
+        if layer_is_flat(self.request_object.layer):
+            if single_file:
+                return os.path.join(root, f"data{extension}"), (view_key, module_code)
+            return os.path.join(root, f"{view_key}{extension}"), (module_code,)
+        if single_file:
+            file_name = f"{view_key}{extension}"
+            return os.path.join(root, view_key, file_name), (module_code,)
+        return os.path.join(root, view_key, f"{module_code}{extension}"), ()
+
+    def upload_archive_to_bucket(
+        self, filename: str, archive_path: str, file_type: str, bucket: str
+    ):
+        with open(archive_path, "rb") as archive:
+            self._file_storage.upload_file(
+                bucket, filename, archive, os.path.getsize(archive_path), file_type
+            )
+
+
 class RunExportTaskUseCase(UseCase):
     @autoparams()
     def __init__(self, repo: ExportDeploymentRepository):
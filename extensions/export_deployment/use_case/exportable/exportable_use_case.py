@@ -1,7 +1,7 @@
 import os
 from collections import defaultdict
 from datetime import date
-from typing import Optional
+from typing import Iterator, Optional, Type
 
 from tomlkit._utils import merge_dicts
 
@@ -81,12 +81,58 @@ class ExportableUseCase(UseCase):
         self._export_repo = export_repo
         self._deployment_repo = deployment_repo
         self._file_storage = file_storage
+        self._primitive_sources: Optional[list[tuple[Module, Type[Primitive]]]] = None
+        self._primitive_batch: Optional[tuple[str, Type[Primitive], list]] = None
 
     def process_request(
         self, request_object: ExportableRequestObject
     ) -> ExportableResponseObject:
-
         data = self.get_raw_result()
+        return self.process_raw_result(request_object, data)
+
+    def execute_in_batches(
+        self, request_object: ExportableRequestObject, batch_size: int
+    ) -> Iterator[ExportableResponseObject]:
+        """
+        Streaming alternative to `execute`.
+        First pass of `get_raw_result` only collects primitive sources it needs and
+        yields data, which is not based on primitives (e.g. consent logs). Then each
+        source is read by batches of `batch_size` primitives and `get_raw_result` is
+        re-run for every batch, so at most one batch is kept in memory.
+        """
+        self.request_object = request_object
+        self._primitive_sources = []
+        try:
+            data = self.get_raw_result()
+            sources = self._primitive_sources
+        finally:
+            self._primitive_sources = None
+        if data:
+            yield self.process_raw_result(request_object, data)
+
+        for module, primitive_cls in sources:
+            batches = self._export_repo.retrieve_primitives_batches(
+                primitive_class=primitive_cls,
+                module_id=module.moduleId,
+                deployment_id=request_object.deploymentId,
+                start_date=request_object.fromDate,
+                end_date=request_object.toDate,
+                batch_size=batch_size,
+                user_ids=request_object.userIds,
+                use_creation_time=request_object.useCreationTime,
+            )
+            for primitives in batches:
+                self._primitive_batch = (module.moduleId, primitive_cls, primitives)
+                try:
+                    data = self.get_raw_result()
+                finally:
+                    self._primitive_batch = None
+                if data:
+                    yield self.process_raw_result(request_object, data)
+
+    def process_raw_result(
+        self, request_object: ExportableRequestObject, data: ExportData
+    ) -> ExportableResponseObject:
         self.filter_data_based_on_consent(data)
         if request_object.includeUserMetaData:
             attach_users(
@@ -257,14 +303,8 @@ class ExportableUseCase(UseCase):
         module_results = []
         if module.exportable:
             for primitive_cls in module.primitives:
-                primitives = self._export_repo.retrieve_primitives(
-                    primitive_class=primitive_cls,
-                    module_id=module.moduleId,
-                    deployment_id=request_object.deploymentId,
-                    start_date=request_object.fromDate,
-                    end_date=request_object.toDate,
-                    user_ids=request_object.userIds,
-                    use_creation_time=request_object.useCreationTime,
+                primitives = self.retrieve_primitives(
+                    request_object, module, primitive_cls
                 )
                 if primitives:
                     for primitive in primitives:
@@ -277,6 +317,30 @@ class ExportableUseCase(UseCase):
                     module_results.extend(primitives)
         return module_results
 
+    def retrieve_primitives(
+        self,
+        request_object: ExportableRequestObject,
+        module: Module,
+        primitive_cls: Type[Primitive],
+    ) -> list[Primitive]:
+        if self._primitive_sources is not None:
+            self._primitive_sources.append((module, primitive_cls))
+            return []
+        if self._primitive_batch is not None:
+            module_id, batch_primitive_cls, primitives = self._primitive_batch
+            if module_id == module.moduleId and batch_primitive_cls is primitive_cls:
+                return primitives
+            return []
+        return self._export_repo.retrieve_primitives(
+            primitive_class=primitive_cls,
+            module_id=module.moduleId,
+            deployment_id=request_object.deploymentId,
+            start_date=request_object.fromDate,
+            end_date=request_object.toDate,
+            user_ids=request_object.userIds,
+            use_creation_time=request_object.useCreationTime,
+        )
+
     def get_module(
         self, request_object: ExportableRequestObject, module_name: str
     ) -> Optional[Module]:
@@ -30,14 +30,8 @@ class MedicationsModuleExportableUseCase(ExportableUseCase):
             module_primitives = module.primitives.copy()
             module_primitives.append(Medication)
             for primitive_cls in module_primitives:
-                primitives = self._export_repo.retrieve_primitives(
-                    primitive_class=primitive_cls,
-                    module_id=module.moduleId,
-                    deployment_id=request_object.deploymentId,
-                    start_date=request_object.fromDate,
-                    end_date=request_object.toDate,
-                    user_ids=request_object.userIds,
-                    use_creation_time=request_object.useCreationTime,
+                primitives = self.retrieve_primitives(
+                    request_object, module, primitive_cls
                 )
                 module_results.extend(primitives)
         return module_results
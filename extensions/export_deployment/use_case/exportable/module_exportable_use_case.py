@@ -47,7 +47,7 @@ class ModuleExportableUseCase(ExportableUseCase):
 
     def get_raw_result(self) -> ExportData:
         # get list of module results
-        excluded_modules = self.request_object.excludedModuleNames or []
+        excluded_modules = list(self.request_object.excludedModuleNames or [])
         excluded_modules.extend(self._get_excluded_module_names())
         modules = self.get_modules(self.request_object.moduleNames, excluded_modules)
 
@@ -27,7 +27,7 @@ from extensions.module_result.event_bus.post_create_primitive import (
 )
 from sdk.auth.events.delete_user_event import DeleteUserEvent
 from sdk.calendar.models.calendar_event import CalendarEvent
-from sdk.common.adapter.event_bus_adapter import EventBusAdapter
+from sdk.common.adapter.event_bus_adapter import EventBusAdapter, Dispatch
 from sdk.common.utils.inject import autoparams
 from sdk.phoenix.component_manager import PhoenixBaseComponent
 
@@ -44,16 +44,21 @@ class KeyActionComponent(PhoenixBaseComponent):
     def post_setup(self, event_bus: EventBusAdapter):
         CalendarEvent.register(KeyAction.__name__, KeyAction)
         event_subscriptions = [
-            (PostCreatePrimitiveEvent, create_log_callback),
-            (PostUserProfileUpdateEvent, create_surgery_key_action_on_user_change),
             (PostCreateUserEvent, create_key_actions_events),
             (PostCreateKeyActionConfigEvent, create_key_action_config_callback),
             (PostUpdateKeyActionConfigEvent, update_key_actions_events),
             (PostDeleteKeyActionConfigEvent, delete_key_action_config_callback),
-            (PostUserProfileUpdateEvent, update_key_actions_on_care_plan_group_change),
             (DeleteUserEvent, on_user_delete_callback),
         ]
         for event, callback in event_subscriptions:
             event_bus.subscribe(event, callback)
 
+        deferred_subscriptions = [
+            (PostCreatePrimitiveEvent, create_log_callback),
+            (PostUserProfileUpdateEvent, create_surgery_key_action_on_user_change),
+            (PostUserProfileUpdateEvent, update_key_actions_on_care_plan_group_change),
+        ]
+        for event, callback in deferred_subscriptions:
+            event_bus.subscribe(event, callback, Dispatch.DEFERRED)
+
         super().post_setup()
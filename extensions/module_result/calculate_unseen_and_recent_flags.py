@@ -160,7 +160,11 @@ class UserFlagsStats:
         for module_config_id, primitives in recent_modules.items():
             if not primitives or ObjectId(module_config_id) not in module_configs:
                 continue
-            primitive_data = list(primitives[0].values())[0]
+            primitive_data = next(
+                value
+                for key, value in primitives[0].items()
+                if key != MongoAuthorizationRepository.RECENT_RESULT_SORT_KEY
+            )
             module_id = primitive_data.get("moduleId")
             if module_id not in excluded_modules_ids:
                 flags = primitive_data.get("flags", {})
@@ -0,0 +1,199 @@
+"""
+Accessors for tables of libs/flatbuffer/schemas, reading FlatBuffer binaries
+in place without flatc or the flatbuffers runtime. Fields are declared in
+schema order, so the index of a field is its vtable slot.
+"""
+import struct
+from typing import Any, Optional
+
+UOFFSET = struct.Struct("<I")
+SOFFSET = struct.Struct("<i")
+VOFFSET = struct.Struct("<H")
+
+
+class Scalar:
+    def __init__(self, fmt: str, default=0):
+        self._struct = struct.Struct(f"<{fmt}")
+        self.size = self._struct.size
+        self.default = default
+
+    def read(self, buf: bytes, pos: int):
+        return self._struct.unpack_from(buf, pos)[0]
+
+
+class Float32(Scalar):
+    def __init__(self):
+        super().__init__("f", 0.0)
+
+    def read(self, buf: bytes, pos: int) -> float:
+        value = super().read(buf, pos)
+        # shortest decimal of float32 value, as flatc prints it
+        for precision in range(6, 9):
+            candidate = float(f"{value:.{precision}g}")
+            if self._struct.pack(candidate) == self._struct.pack(value):
+                return candidate
+        return value
+
+
+class String:
+    size = UOFFSET.size
+    default = None
+
+    @staticmethod
+    def read(buf: bytes, pos: int) -> str:
+        pos += UOFFSET.unpack_from(buf, pos)[0]
+        length = UOFFSET.unpack_from(buf, pos)[0]
+        start = pos + UOFFSET.size
+        return bytes(buf[start : start + length]).decode()
+
+
+class Table:
+    size = UOFFSET.size
+    default = None
+
+    def __init__(self, table_class: type["FlatBufferTable"]):
+        self._table_class = table_class
+
+    def read(self, buf: bytes, pos: int) -> "FlatBufferTable":
+        return self._table_class(buf, pos + UOFFSET.unpack_from(buf, pos)[0])
+
+
+class Vector:
+    size = UOFFSET.size
+    default = None
+
+    def __init__(self, element_type):
+        self._element_type = element_type
+
+    def read(self, buf: bytes, pos: int) -> list:
+        pos += UOFFSET.unpack_from(buf, pos)[0]
+        length = UOFFSET.unpack_from(buf, pos)[0]
+        start, size = pos + UOFFSET.size, self._element_type.size
+        return [
+            self._element_type.read(buf, start + index * size)
+            for index in range(length)
+        ]
+
+
+BOOL = Scalar("?", False)
+INT = Scalar("i")
+LONG = Scalar("q")
+DOUBLE = Scalar("d", 0.0)
+FLOAT = Float32()
+STRING = String()
+
+
+class FlatBufferTable:
+    FIELDS: tuple[tuple[str, Any], ...] = ()
+
+    def __init__(self, buf: bytes, pos: int):
+        self._buf = buf
+        self._pos = pos
+        self._vtable = pos - SOFFSET.unpack_from(buf, pos)[0]
+        self._vtable_size = VOFFSET.unpack_from(buf, self._vtable)[0]
+
+    @classmethod
+    def get_root(cls, buf: bytes):
+        return cls(buf, UOFFSET.unpack_from(buf, 0)[0])
+
+    def field(self, name: str):
+        """Returns schema default of the field when it is not in the buffer."""
+        field_type, offset = self._field_offset(name)
+        if not offset:
+            return field_type.default
+        return field_type.read(self._buf, self._pos + offset)
+
+    def to_dict(self) -> dict:
+        """Fields present in the buffer, the same as flatc --json output."""
+        result = {}
+        for name, field_type in self.FIELDS:
+            offset = self._field_offset(name)[1]
+            if not offset:
+                continue
+            value = field_type.read(self._buf, self._pos + offset)
+            if isinstance(value, FlatBufferTable):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [
+                    v.to_dict() if isinstance(v, FlatBufferTable) else v for v in value
+                ]
+            result[name] = value
+        return result
+
+    def _field_offset(self, name: str) -> tuple[Any, int]:
+        for slot, (field_name, field_type) in enumerate(self.FIELDS):
+            if field_name == name:
+                break
+        else:
+            raise KeyError(name)
+        vtable_offset = 4 + 2 * slot
+        if vtable_offset >= self._vtable_size:
+            return field_type, 0
+        return (
+            field_type,
+            VOFFSET.unpack_from(self._buf, self._vtable + vtable_offset)[0],
+        )
+
+
+class AdditionalDeviceInfo(FlatBufferTable):
+    FIELDS = (
+        ("osVersion", STRING),
+        ("deviceName", STRING),
+        ("deviceDetails", STRING),
+    )
+
+
+class ECGWatchVoltagesTable(FlatBufferTable):
+    FIELDS = (("mcV", FLOAT),)
+
+
+class ECGWatchSamplesTable(FlatBufferTable):
+    """Root table of ecg.fbs"""
+
+    FIELDS = (
+        ("platform", STRING),
+        ("version", INT),
+        ("timestamp", LONG),
+        ("additionalDeviceInfo", Table(AdditionalDeviceInfo)),
+        ("classification", INT),
+        ("averageHeartRate", DOUBLE),
+        ("voltages", Vector(Table(ECGWatchVoltagesTable))),
+    )
+
+    def mc_voltages(self) -> Optional[list[float]]:
+        voltages = self.field("voltages")
+        if voltages is None:
+            return None
+        return [voltage.field("mcV") for voltage in voltages]
+
+
+class HRMonitorTable(FlatBufferTable):
+    """Root table of ppg.fbs"""
+
+    FIELDS = (
+        ("version", INT),
+        ("timestamp", LONG),
+        ("additionalDeviceInfo", Table(AdditionalDeviceInfo)),
+        ("value", STRING),
+        ("finalState", STRING),
+    )
+
+
+class StepDataTable(FlatBufferTable):
+    FIELDS = (
+        ("version", INT),
+        ("deviceDetails", STRING),
+        ("isAggregated", BOOL),
+        ("startDateTime", LONG),
+        ("endDateTime", LONG),
+        ("numberOfStep", INT),
+    )
+
+
+class StepsTable(FlatBufferTable):
+    """Root table of steps.fbs"""
+
+    FIELDS = (
+        ("platform", STRING),
+        ("stepCounterData", Vector(Table(StepDataTable))),
+    )
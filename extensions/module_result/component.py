@@ -42,6 +42,7 @@ from sdk.phoenix.config.server_config import PhoenixServerConfig
 class ModuleResultComponent(PhoenixBaseComponent):
     config_class = ModuleResultConfig
     tag_name = "moduleResult"
+    tasks = ["extensions.module_result"]
     _ignored_error_codes = (
         ModuleResultErrorCodes.MODULE_NOT_CONFIGURED,
         ModuleResultErrorCodes.NOT_ALL_QUESTIONS_ANSWERED,
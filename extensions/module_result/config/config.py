@@ -9,9 +9,15 @@ from sdk.common.utils.convertible import default_field
 from sdk.phoenix.config.server_config import BasePhoenixConfig
 
 
+@convertibleclass
+class UnseenFlagsConfig:
+    incremental: bool = field(default=False)
+
+
 @convertibleclass
 class ModuleResultConfig(BasePhoenixConfig):
     applyDefaultDisclaimerConfig: bool = field(default=True)
     pamIntegration: PAMIntegrationClientConfig = default_field()
     kardia: KardiaIntegrationConfig = default_field()
     cvd: CVDIntegrationConfig = default_field()
+    unseenFlags: UnseenFlagsConfig = field(default_factory=UnseenFlagsConfig)
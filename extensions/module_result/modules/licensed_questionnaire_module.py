@@ -1,7 +1,8 @@
 import os
+import threading
 from os import listdir
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from tomlkit._utils import merge_dicts
 
@@ -56,9 +57,8 @@ class LicensedQuestionnaireModule(QuestionnaireModule):
         return ModuleConfig.from_dict(module_config, use_validator_field=False)
 
     def _get_config_json(self):
-        config_path = f"{BASE_LICENSED_QUESTIONNAIRE_DIR}/{self.moduleId}/v{self.config_version}/config_body.json"
         try:
-            return read_json_file(config_path, Path(__file__).parent)
+            return licensed_configs.get_config_body(self.moduleId, self.config_version)
         except FileNotFoundError:
             raise InvalidModuleConfiguration(
                 f"Config Body file not found for {self.moduleId}"
@@ -93,9 +93,7 @@ LICENSED_QUESTIONNAIRE_CONFIG_VERSION = "1"
 
 def get_localizations(user_language: str, module_configs: list[ModuleConfig]):
     """Loads all localizations regarding user_language from licensed questionnaire modules folders."""
-    licensed_questionnaire_dir_list = listdir(
-        Path(Path(__file__).parent).joinpath(BASE_LICENSED_QUESTIONNAIRE_DIR)
-    )
+    licensed_questionnaire_dir_list = licensed_configs.module_ids()
     localizations = {}
     if not module_configs:
         return localizations
@@ -130,5 +128,63 @@ def get_licensed_questionnaires_dir_list():
     return listdir(get_licensed_questionnaire_dir())
 
 
+def copy_json_value(value: Any) -> Any:
+    """Copies parsed JSON, faster than `deepcopy` as only dicts and lists are nested."""
+    if isinstance(value, dict):
+        return {key: copy_json_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json_value(item) for item in value]
+    return value
+
+
+class LicensedConfigRegistry:
+    """
+    Process-wide cache of licensed questionnaire config bodies.
+    Files are parsed once and reloaded only when their modification time changes,
+    so each lookup costs a single `stat` call. Callers receive a copy of the body,
+    as it is merged into module configs which are modified afterwards.
+    """
+
+    def __init__(self, base_dir: Path):
+        self._base_dir = base_dir
+        self._lock = threading.Lock()
+        self._module_ids: tuple[float, frozenset[str]] = (None, frozenset())
+        self._bodies: dict[str, tuple[float, dict]] = {}
+
+    def module_ids(self) -> frozenset[str]:
+        mtime = os.stat(self._base_dir).st_mtime
+        cached_mtime, module_ids = self._module_ids
+        if cached_mtime != mtime:
+            module_ids = frozenset(listdir(self._base_dir))
+            self._module_ids = (mtime, module_ids)
+        return module_ids
+
+    def get_config_body(
+        self, module_id: str, version: str = LICENSED_QUESTIONNAIRE_CONFIG_VERSION
+    ) -> dict:
+        path = self._base_dir.joinpath(module_id, f"v{version}", "config_body.json")
+        key = str(path)
+        try:
+            mtime = os.stat(path).st_mtime
+        except FileNotFoundError:
+            self._bodies.pop(key, None)
+            raise
+
+        cached_mtime, body = self._bodies.get(key, (None, None))
+        if cached_mtime != mtime:
+            with self._lock:
+                body = read_json_file(path, "./")
+                self._bodies[key] = (mtime, body)
+        return copy_json_value(body)
+
+    def clear(self):
+        with self._lock:
+            self._module_ids = (None, frozenset())
+            self._bodies.clear()
+
+
 def get_licensed_questionnaires_config_path(module_id: str):
     return f"/{module_id}/v{LICENSED_QUESTIONNAIRE_CONFIG_VERSION}/config_body.json"
+
+
+licensed_configs = LicensedConfigRegistry(get_licensed_questionnaire_dir())
@@ -23,6 +23,11 @@ class StepModule(Module):
     def preprocess(
         self, primitives: list[Primitive], user: User, repo: ModuleResultRepository
     ):
+        from extensions.module_result.service.module_result_service import (
+            ModuleResultService,
+        )
+
+        module_result_service = ModuleResultService(repo=repo)
         steps_in_week = dict()
         last_primitive_in_week = dict()
         primitives.sort(key=lambda p: p.startDateTime)
@@ -53,7 +58,7 @@ class StepModule(Module):
                 steps_in_week[week_number] = primitive.value + sum(
                     map(lambda p: p.value, same_week_primitives)
                 )
-                repo.reset_flags(
+                module_result_service.reset_flags(
                     user_id=primitive.userId,
                     module_id=primitive.moduleId,
                     start_date_time=week_start_date,
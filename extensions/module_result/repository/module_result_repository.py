@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 
 from pymongo.client_session import ClientSession
 
@@ -14,6 +14,19 @@ class ModuleResultRepository(ABC):
     def create_primitive(self, primitive: Primitive, save_unseen: bool = False) -> str:
         raise NotImplementedError
 
+    @abstractmethod
+    def create_primitives_bulk(
+        self,
+        primitives: list[Primitive],
+        save_unseen: list[bool] = None,
+        ordered: bool = False,
+    ) -> list[Union[str, Exception]]:
+        """
+        Inserts primitives with one write per collection.
+        Returns inserted id or an error for each primitive, in the same order.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def flush_unseen_results(
         self, user_id: str, start_date_time: datetime, module_id: str = None
@@ -52,9 +65,16 @@ class ModuleResultRepository(ABC):
         user_id: str,
         module_config_ids: list[str],
         excluded_modules_ids: list[str],
+        module_id: str = None,
+        from_date_time: datetime = None,
+        to_date_time: datetime = None,
     ) -> dict:
         raise NotImplementedError
 
+    @abstractmethod
+    def retrieve_unseen_user_ids(self) -> list[str]:
+        raise NotImplementedError
+
     @abstractmethod
     def retrieve_primitives(
         self,
@@ -94,6 +114,13 @@ class ModuleResultRepository(ABC):
     ) -> Primitive:
         raise NotImplementedError
 
+    @abstractmethod
+    def retrieve_primitives_by_ids(
+        self, primitive_name: str, primitive_ids: list[str]
+    ) -> list[Primitive]:
+        """Retrieves primitives of one collection with a single query."""
+        raise NotImplementedError
+
     @abstractmethod
     def retrieve_primitive_by_name(
         self,
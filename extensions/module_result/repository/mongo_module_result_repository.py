@@ -1,12 +1,13 @@
 from collections import defaultdict
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 
 from bson import ObjectId
 from extensions.authorization.models.user import UnseenFlags
 from pymongo import DESCENDING, ASCENDING
 from pymongo.client_session import ClientSession
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError, PyMongoError, WriteError
 
 from extensions.common.sort import SortField
 from extensions.module_result.modules import (
@@ -32,6 +33,85 @@ class MongoModuleResultRepository(ModuleResultRepository):
         self._db = database
 
     def create_primitive(self, primitive: Primitive, save_unseen: bool = False) -> str:
+        primitive_dict = self._prepare_primitive_document(primitive)
+        res = self._db[primitive.class_name.lower()].insert_one(primitive_dict)
+        if save_unseen:
+            primitive_dict[Primitive.ID_] = res.inserted_id
+            primitive_dict["primitiveName"] = primitive.class_name
+            self._db[primitive.UNSEEN_PRIMITIVES_COLLECTION].insert_one(primitive_dict)
+        primitive.id = str(res.inserted_id)
+        return primitive.id
+
+    def create_primitives_bulk(
+        self,
+        primitives: list[Primitive],
+        save_unseen: list[bool] = None,
+        ordered: bool = False,
+    ) -> list[Union[str, Exception]]:
+        save_unseen = save_unseen or [False] * len(primitives)
+        results: list[Union[str, Exception]] = [None] * len(primitives)
+        documents = [self._prepare_primitive_document(p) for p in primitives]
+        for document in documents:
+            document[Primitive.ID_] = ObjectId()
+
+        indexes_by_collection = defaultdict(list)
+        for index, primitive in enumerate(primitives):
+            indexes_by_collection[primitive.class_name.lower()].append(index)
+
+        for collection, indexes in indexes_by_collection.items():
+            errors = self._insert_many(
+                collection, [documents[i] for i in indexes], ordered
+            )
+            for position, index in enumerate(indexes):
+                results[index] = errors.get(position)
+                if not results[index]:
+                    primitives[index].id = str(documents[index][Primitive.ID_])
+                    results[index] = primitives[index].id
+
+        unseen_indexes = [
+            index
+            for index, result in enumerate(results)
+            if save_unseen[index] and isinstance(result, str)
+        ]
+        unseen_documents = [
+            {**documents[index], "primitiveName": primitives[index].class_name}
+            for index in unseen_indexes
+        ]
+
+        errors = self._insert_many(
+            Primitive.UNSEEN_PRIMITIVES_COLLECTION, unseen_documents, ordered
+        )
+        for position, error in errors.items():
+            results[unseen_indexes[position]] = error
+        return results
+
+    def _insert_many(
+        self, collection: str, documents: list[dict], ordered: bool
+    ) -> dict[int, Exception]:
+        """Inserts documents and returns errors mapped by document position."""
+        if not documents:
+            return {}
+
+        try:
+            self._db[collection].insert_many(documents, ordered=ordered)
+        except BulkWriteError as error:
+            write_errors = error.details.get("writeErrors", [])
+            errors = {
+                e["index"]: WriteError(e.get("errmsg"), e.get("code"), e)
+                for e in write_errors
+            }
+            if ordered and write_errors:
+                first_failed = min(errors)
+                skipped = WriteError("Not inserted due to a previous error")
+                for position in range(first_failed + 1, len(documents)):
+                    errors.setdefault(position, skipped)
+            return errors
+        except PyMongoError as error:
+            return {position: error for position in range(len(documents))}
+        return {}
+
+    @staticmethod
+    def _prepare_primitive_document(primitive: Primitive) -> dict:
         primitive.createDateTime = datetime.utcnow()
         if not primitive.startDateTime:
             primitive.startDateTime = primitive.createDateTime
@@ -50,13 +130,7 @@ class MongoModuleResultRepository(ModuleResultRepository):
             primitive_dict[Primitive.MODULE_CONFIG_ID] = ObjectId(
                 primitive.moduleConfigId
             )
-        res = self._db[primitive.class_name.lower()].insert_one(primitive_dict)
-        if save_unseen:
-            primitive_dict[Primitive.ID_] = res.inserted_id
-            primitive_dict["primitiveName"] = primitive.class_name
-            self._db[primitive.UNSEEN_PRIMITIVES_COLLECTION].insert_one(primitive_dict)
-        primitive.id = str(res.inserted_id)
-        return primitive.id
+        return primitive_dict
 
     def flush_unseen_results(
         self, user_id: str, start_date_time: datetime, module_id: str = None
@@ -176,18 +250,32 @@ class MongoModuleResultRepository(ModuleResultRepository):
         user_id: str,
         module_config_ids: list[str],
         excluded_modules_ids: list[str],
+        module_id: str = None,
+        from_date_time: datetime = None,
+        to_date_time: datetime = None,
     ) -> dict:
         user_id = ObjectId(user_id)
-        pipeline = [
-            {
-                "$match": {
-                    Primitive.USER_ID: user_id,
-                    Primitive.MODULE_CONFIG_ID: {
-                        "$in": [ObjectId(id) for id in module_config_ids]
-                    },
-                    Primitive.MODULE_ID: {"$nin": excluded_modules_ids},
-                }
+        match = {
+            Primitive.USER_ID: user_id,
+            Primitive.MODULE_CONFIG_ID: {
+                "$in": [ObjectId(id) for id in module_config_ids]
             },
+            Primitive.MODULE_ID: {"$nin": excluded_modules_ids},
+        }
+        if module_id:
+            match[Primitive.MODULE_ID] = {
+                "$eq": module_id,
+                **match[Primitive.MODULE_ID],
+            }
+        start_date_time = {}
+        if from_date_time:
+            start_date_time["$gte"] = from_date_time
+        if to_date_time:
+            start_date_time["$lt"] = to_date_time
+        if start_date_time:
+            match[Primitive.START_DATE_TIME] = start_date_time
+        pipeline = [
+            {"$match": match},
             {
                 "$group": {
                     "_id": "$userId",
@@ -216,6 +304,10 @@ class MongoModuleResultRepository(ModuleResultRepository):
         }
         return unseen_flags
 
+    def retrieve_unseen_user_ids(self) -> list[str]:
+        collection = self._db[Primitive.UNSEEN_PRIMITIVES_COLLECTION]
+        return [str(user_id) for user_id in collection.distinct(Primitive.USER_ID)]
+
     @id_as_obj_id
     def retrieve_first_unseen_result(
         self, deployment_id: str, user_id: str
@@ -471,6 +563,17 @@ class MongoModuleResultRepository(ModuleResultRepository):
             primitive=result, name=primitive_name, validate=False
         )
 
+    def retrieve_primitives_by_ids(
+        self, primitive_name: str, primitive_ids: list[str]
+    ) -> list[Primitive]:
+        query = {Primitive.ID_: {"$in": [ObjectId(id_) for id_ in primitive_ids]}}
+        return [
+            Primitive.create_from_dict(
+                primitive=result, name=primitive_name, validate=False
+            )
+            for result in self._db[primitive_name.lower()].find(query)
+        ]
+
     @id_as_obj_id
     def retrieve_primitive_by_name(
         self, user_id: str, primitive_name: str, **filter_options
@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime
+from typing import Union
 
 import pytz
 from pymongo.client_session import ClientSession
@@ -7,6 +8,7 @@ from pymongo.client_session import ClientSession
 from extensions.authorization.events.update_stats_event import UpdateUserStatsEvent
 from extensions.authorization.models.authorized_user import AuthorizedUser
 from extensions.authorization.models.role.role import RoleName
+from extensions.authorization.models.user import UnseenFlags, User
 from extensions.authorization.services.authorization import AuthorizationService
 from extensions.common.monitoring import report_exception
 from extensions.common.sort import SortField
@@ -50,13 +52,23 @@ from sdk.common.exceptions.exceptions import (
 from sdk.common.utils import inject
 from sdk.common.utils.inject import autoparams
 from sdk.common.utils.validators import remove_none_values
+from sdk.phoenix.config.server_config import PhoenixServerConfig
 
 log = logging.getLogger(__name__)
 
+UNSEEN_FLAGS_EXCLUDED_MODULE_IDS = [
+    "CVDRiskScore",
+    "HighFrequencyStep",
+    "BodyMeasurement",
+    "SurgeryDetails",
+]
+
 
 class ModuleResultService:
     """Service to work  with modules repo."""
 
+    BULK_CREATE_THRESHOLD = 10
+
     @autoparams()
     def __init__(self, repo: ModuleResultRepository):
         self.repo = repo
@@ -91,7 +103,7 @@ class ModuleResultService:
                 is_unseen[pid] = not is_manager_note
 
                 if is_manager_note:
-                    self.repo.flush_unseen_results(
+                    self.flush_unseen_results(
                         user_id=primitive.userId,
                         start_date_time=primitive.startDateTime,
                     )
@@ -119,21 +131,42 @@ class ModuleResultService:
                 req_obj.module.apply_overall_flags_logic(req_obj.primitives)
 
         success_primitives = list()
-        for pid, primitive in enumerate(req_obj.primitives):
-            if pid in discard:
+        unseen_primitives = list()
+        primitives_to_create = [
+            (primitive, is_unseen[pid])
+            for pid, primitive in enumerate(req_obj.primitives)
+            if pid not in discard
+        ]
+        if self._is_bulk_create_applicable(req_obj.module, primitives_to_create):
+            results = self.create_primitives_bulk(primitives_to_create)
+        else:
+            results = []
+            for primitive, save_unseen in primitives_to_create:
+                try:
+                    inserted_id = self.create_primitive(
+                        primitive, req_obj.module, save_unseen=save_unseen
+                    )
+                    results.append(inserted_id)
+                except Exception as error:
+                    results.append(error)
+
+        for (primitive, save_unseen), result in zip(primitives_to_create, results):
+            if isinstance(result, Exception):
+                errors.append(report_error(result, primitive))
                 continue
-            try:
-                inserted_id = self.create_primitive(
-                    primitive, req_obj.module, save_unseen=is_unseen[pid]
-                )
-                ids.append(inserted_id)
-                success_primitives.append(primitive)
-            except Exception as error:
-                errors.append(report_error(error, primitive))
+            ids.append(result)
+            success_primitives.append(primitive)
+            if save_unseen:
+                unseen_primitives.append(primitive)
 
         if ids:
             self._post_batch_create_event(success_primitives)
-            self.update_unseen_flags(req_obj.user.id)
+            if self.incremental_unseen_flags:
+                self.increment_unseen_flags(
+                    req_obj.user.id, self._sum_unseen_flags(unseen_primitives)
+                )
+            else:
+                self.update_unseen_flags(req_obj.user.id)
 
         return remove_none_values({"ids": ids or None, "errors": errors or None})
 
@@ -151,6 +184,48 @@ class ModuleResultService:
             self._trigger_key_actions(primitive, module, module.config.configBody)
         return inserted_id
 
+    def create_primitives_bulk(
+        self, primitives: list[tuple[Primitive, bool]]
+    ) -> list[Union[str, Exception]]:
+        """
+        Creates primitives with a single repository write per collection.
+        Returns inserted id or an error for each primitive, in the same order.
+        """
+        results: list[Union[str, Exception]] = [None] * len(primitives)
+        valid_indexes = []
+        for index, (primitive, _) in enumerate(primitives):
+            try:
+                self._pre_create(primitive)
+                valid_indexes.append(index)
+            except Exception as error:
+                results[index] = error
+
+        try:
+            inserted = self.repo.create_primitives_bulk(
+                primitives=[primitives[i][0] for i in valid_indexes],
+                save_unseen=[primitives[i][1] for i in valid_indexes],
+            )
+        except Exception as error:
+            inserted = [error] * len(valid_indexes)
+        for index, result in zip(valid_indexes, inserted):
+            results[index] = result
+
+        for index, (primitive, _) in enumerate(primitives):
+            if isinstance(results[index], Exception):
+                continue
+            try:
+                self._post_create(primitive)
+            except Exception as error:
+                results[index] = error
+        return results
+
+    def _is_bulk_create_applicable(
+        self, module: Module, primitives: list[tuple[Primitive, bool]]
+    ) -> bool:
+        if len(primitives) < self.BULK_CREATE_THRESHOLD:
+            return False
+        return not issubclass(module.__class__, KeyActionTriggerModule)
+
     @staticmethod
     def _calculate_primitive_with_flags(
         module, primitive, save_unseen: bool = False, primitives: list[Primitive] = None
@@ -400,21 +475,132 @@ class ModuleResultService:
         }
         return UnseenModulesResponse.from_dict(response)
 
+    @property
+    def incremental_unseen_flags(self) -> bool:
+        config = inject.instance(PhoenixServerConfig).server.moduleResult
+        return config.unseenFlags.incremental
+
     def update_unseen_flags(self, user_id: str):
-        excluded_modules_ids = [
-            "CVDRiskScore",
-            "HighFrequencyStep",
-            "BodyMeasurement",
-            "SurgeryDetails",
-        ]
         user = AuthorizationService().retrieve_simple_user_profile(user_id=user_id)
-        authz_user = AuthorizedUser(user)
+        unseen_flags = self.calculate_unseen_flags(user)
+        AuthorizationService().update_unseen_flags(user_id, unseen_flags)
+
+    def calculate_unseen_flags(
+        self,
+        user: User,
+        module_id: str = None,
+        from_date_time: datetime = None,
+        to_date_time: datetime = None,
+    ) -> dict:
         deployment_module_config_ids = [
-            mc.id for mc in authz_user.deployment.moduleConfigs
+            mc.id for mc in AuthorizedUser(user).deployment.moduleConfigs
         ]
-        unseen_flags = self.repo.calculate_unseen_flags(
-            user_id=user_id,
+        return self.repo.calculate_unseen_flags(
+            user_id=user.id,
             module_config_ids=deployment_module_config_ids,
-            excluded_modules_ids=excluded_modules_ids,
+            excluded_modules_ids=UNSEEN_FLAGS_EXCLUDED_MODULE_IDS,
+            module_id=module_id,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
         )
-        AuthorizationService().update_unseen_flags(user_id, unseen_flags)
+
+    @staticmethod
+    def increment_unseen_flags(user_id: str, unseen_flags: dict):
+        if any(unseen_flags.values()):
+            AuthorizationService().increment_unseen_flags(user_id, unseen_flags)
+
+    def flush_unseen_results(
+        self, user_id: str, start_date_time: datetime, module_id: str = None
+    ) -> int:
+        if not self.incremental_unseen_flags:
+            return self.repo.flush_unseen_results(
+                user_id=user_id, start_date_time=start_date_time, module_id=module_id
+            )
+
+        start_date_time = start_date_time or datetime.utcnow()
+        user = AuthorizationService().retrieve_simple_user_profile(user_id=user_id)
+        flushed_flags = self.calculate_unseen_flags(
+            user, module_id=module_id, to_date_time=start_date_time
+        )
+        deleted_count = self.repo.flush_unseen_results(
+            user_id=user_id, start_date_time=start_date_time, module_id=module_id
+        )
+        if deleted_count:
+            self.increment_unseen_flags(user_id, self._negate_flags(flushed_flags))
+        return deleted_count
+
+    def reset_flags(
+        self,
+        user_id: str,
+        module_id: str,
+        start_date_time: datetime,
+        end_date_time: datetime,
+    ):
+        reset_flags = None
+        if self.incremental_unseen_flags:
+            user = AuthorizationService().retrieve_simple_user_profile(user_id=user_id)
+            reset_flags = self.calculate_unseen_flags(
+                user,
+                module_id=module_id,
+                from_date_time=start_date_time,
+                to_date_time=end_date_time,
+            )
+        self.repo.reset_flags(
+            user_id=user_id,
+            module_id=module_id,
+            start_date_time=start_date_time,
+            end_date_time=end_date_time,
+        )
+        if reset_flags:
+            self.increment_unseen_flags(user_id, self._negate_flags(reset_flags))
+
+    def reconcile_unseen_flags(self, user_ids: list[str]) -> int:
+        """Recalculates unseen flags of users and fixes drifted counters."""
+        drifted = 0
+        for user_id in user_ids:
+            try:
+                user = AuthorizationService().retrieve_simple_user_profile(
+                    user_id=user_id
+                )
+                unseen_flags = self.calculate_unseen_flags(user)
+            except Exception as error:
+                log.warning(f"Unseen flags of user {user_id} not reconciled: {error}")
+                continue
+
+            stored_flags = user.unseenFlags.to_dict() if user.unseenFlags else {}
+            stored_flags = {flag: stored_flags.get(flag, 0) for flag in unseen_flags}
+            if stored_flags != unseen_flags:
+                log.warning(
+                    f"Unseen flags of user {user_id} drifted: "
+                    f"stored {stored_flags}, calculated {unseen_flags}"
+                )
+                AuthorizationService().update_unseen_flags(user_id, unseen_flags)
+                drifted += 1
+        return drifted
+
+    @staticmethod
+    def _sum_unseen_flags(primitives: list[Primitive]) -> dict:
+        """Sums flags the same way the unseen flags aggregation does."""
+        reds, ambers, grays = 0, 0, 0
+        for primitive in primitives:
+            if (
+                not primitive.flags
+                or not primitive.moduleConfigId
+                or primitive.moduleId in UNSEEN_FLAGS_EXCLUDED_MODULE_IDS
+            ):
+                continue
+            flags = primitive.flags
+            reds += flags.get(UnseenFlags.RED) or 0
+            ambers += flags.get(UnseenFlags.AMBER) or 0
+            grays += (flags.get(UnseenFlags.GRAY) or 0) + (
+                flags.get(UnseenFlags.GREEN) or 0
+            )
+        return {
+            UnseenFlags.RED: reds,
+            UnseenFlags.AMBER: ambers,
+            UnseenFlags.GRAY: grays,
+        }
+
+    @staticmethod
+    def _negate_flags(unseen_flags: dict) -> dict:
+        return {flag: -(count or 0) for flag, count in unseen_flags.items()}
@@ -0,0 +1,43 @@
+import logging
+import time
+
+from celery.schedules import crontab
+
+from sdk.celery.app import celery_app
+from sdk.common.constants import SEC_IN_HOUR
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        crontab(minute=30),
+        reconcile_unseen_flags_task.s(),
+        name="Unseen flags reconciliation",
+    )
+
+
+@celery_app.task(expires=SEC_IN_HOUR)
+def reconcile_unseen_flags_task():
+    from extensions.authorization.repository.auth_repository import (
+        AuthorizationRepository,
+    )
+    from extensions.module_result.service.module_result_service import (
+        ModuleResultService,
+    )
+    from sdk.common.utils import inject
+
+    service = ModuleResultService()
+    if not service.incremental_unseen_flags:
+        return
+
+    started = time.monotonic()
+    auth_repo = inject.instance(AuthorizationRepository)
+    user_ids = set(service.repo.retrieve_unseen_user_ids())
+    user_ids.update(auth_repo.retrieve_user_ids_with_unseen_flags())
+    drifted = service.reconcile_unseen_flags(sorted(user_ids))
+    logger.info(
+        f"Unseen flags of {len(user_ids)} users reconciled in "
+        f"{time.monotonic() - started:.1f}s, {drifted} drifted"
+    )
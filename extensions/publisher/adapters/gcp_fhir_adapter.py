@@ -1,5 +1,6 @@
 import logging
 import json
+import uuid
 
 from google.auth.transport import requests
 from google.oauth2 import service_account
@@ -14,6 +15,7 @@ from extensions.publisher.adapters.fhir.fhir_converter_util import (
 from extensions.publisher.adapters.publisher_adapter import (
     PublisherAdapter,
 )
+from extensions.publisher.adapters.transport_pool import transport_pool
 from extensions.publisher.adapters.utils import transform_publisher_data
 from extensions.publisher.models.publisher import Publisher
 from sdk.common.utils.inject import autoparams
@@ -58,12 +60,10 @@ class GCPFHIRAdapter(PublisherAdapter):
         }
 
     def prepare_publisher_data(self, event: dict) -> bool:
-        # Gets credentials from the config
-        credentials_data = self._publisher.target.gcp_fhir.serviceAccountData
-        info = json.loads(credentials_data)
-
         try:
-            credentials = service_account.Credentials.from_service_account_info(info)
+            self.session = transport_pool.authorized_session(
+                self._publisher, self._create_session
+            )
         except ValueError as e:
             report_exception(
                 error=Exception(e),
@@ -75,17 +75,22 @@ class GCPFHIRAdapter(PublisherAdapter):
             )
             return False
 
-        scoped_credentials = credentials.with_scopes(
-            ["https://www.googleapis.com/auth/cloud-platform"]
-        )
-        self.session = requests.AuthorizedSession(scoped_credentials)
-
         self.fhir_store_path = self._publisher.target.gcp_fhir.url
 
         self.headers = {"Content-Type": "application/fhir+json;charset=utf-8"}
 
         return True
 
+    def _create_session(self) -> requests.AuthorizedSession:
+        # Gets credentials from the config
+        credentials_data = self._publisher.target.gcp_fhir.serviceAccountData
+        info = json.loads(credentials_data)
+        credentials = service_account.Credentials.from_service_account_info(info)
+        scoped_credentials = credentials.with_scopes(
+            ["https://www.googleapis.com/auth/cloud-platform"]
+        )
+        return requests.AuthorizedSession(scoped_credentials)
+
     def send_publisher_data(self):
         if not self._message:
             return
@@ -102,6 +107,58 @@ class GCPFHIRAdapter(PublisherAdapter):
         self._message[OBSERVATION_DATA].update(subject)
         self.create_resource("Observation", self._message[OBSERVATION_DATA])
 
+    def send_batch(self, events: list[dict]) -> int:
+        """Creates patients and observations of all events with one transaction bundle."""
+        entries, patient_urls = [], {}
+        for event in events:
+            self.transform_publisher_data(event)
+            entries.extend(self._transaction_entries(self._message, patient_urls))
+        if not entries or not self.prepare_publisher_data(events[0]):
+            return 0
+
+        bundle = {"resourceType": "Bundle", "type": "transaction", "entry": entries}
+        response = self.session.post(
+            self.fhir_store_path, headers=self.headers, json=bundle
+        )
+        if response.status_code != 200:
+            logger.error(
+                f"Failed to create transaction bundle on Google fhir store with publisher name: {self._publisher.name}"
+                f" with Status: {response.status_code} - Error: {response.text}"
+            )
+            return 0
+        return len(events)
+
+    @staticmethod
+    def _transaction_entries(message: dict, patient_urls: dict) -> list[dict]:
+        """Patient is created only if it does not exist yet, once per batch."""
+        entries = []
+        patient = message[PATIENT_DATA]
+        identifier = patient["identifier"][0]["value"]
+        if identifier not in patient_urls:
+            patient_urls[identifier] = f"urn:uuid:{uuid.uuid4()}"
+            entries.append(
+                {
+                    "fullUrl": patient_urls[identifier],
+                    "resource": patient,
+                    "request": {
+                        "method": "POST",
+                        "url": "Patient",
+                        "ifNoneExist": f"identifier={identifier}",
+                    },
+                }
+            )
+        observation = {
+            **message[OBSERVATION_DATA],
+            "subject": {"reference": patient_urls[identifier]},
+        }
+        entries.append(
+            {
+                "resource": observation,
+                "request": {"method": "POST", "url": "Observation"},
+            }
+        )
+        return entries
+
     def send_ping(self):
         pass
 
@@ -13,6 +13,7 @@ from extensions.publisher.adapters.publisher_adapter import (
     MODULE_CONFIG_ID,
     PRIMITIVES,
 )
+from extensions.publisher.adapters.transport_pool import transport_pool
 from extensions.publisher.adapters.utils import transform_publisher_data
 from extensions.publisher.models.publisher import Publisher
 from sdk.common.utils.inject import autoparams
@@ -42,41 +43,66 @@ class KafkaAdapter(PublisherAdapter):
         return True
 
     def send_publisher_data(self):
+        producer = self._retrieve_producer()
+        if producer:
+            self.send_data(producer)
+
+    def send_batch(self, events: list[dict]) -> int:
+        """Produces all events and waits for their delivery once."""
+        producer = self._retrieve_producer()
+        if not producer:
+            return 0
+
+        failed = []
+        for event in events:
+            self.transform_publisher_data(event)
+            self.prepare_publisher_data(event)
+            self._produce(producer, failed)
+        producer.flush()
+        return len(events) - len(failed)
+
+    def _retrieve_producer(self):
         server_url = self._publisher.target.kafka.url
         auth_type = self._publisher.target.kafka.authType
         sasl_username = self._publisher.target.kafka.saslUsername
         sasl_password = self._publisher.target.kafka.saslPassword
 
         if sasl_username and sasl_password:
-            producer = SerializingProducer(
-                {
-                    "bootstrap.servers": server_url,
-                    "sasl.mechanism": auth_type.value,
-                    "security.protocol": "SASL_SSL",
-                    "sasl.username": sasl_username,
-                    "sasl.password": sasl_password,
-                    "delivery.timeout.ms": 5000,
-                }
-            )
-        else:
-            report_exception(
-                error=Exception("SASLUsername or SASLPassword is empty"),
-                context_name="Publisher",
-                context_content={
-                    "publisherName": self._publisher.name,
-                    "publisherType": self._publisher.target.publisherType,
-                },
+            config = {
+                "bootstrap.servers": server_url,
+                "sasl.mechanism": auth_type.value,
+                "security.protocol": "SASL_SSL",
+                "sasl.username": sasl_username,
+                "sasl.password": sasl_password,
+                "delivery.timeout.ms": 5000,
+            }
+            return transport_pool.producer(
+                self._publisher, lambda: SerializingProducer(config)
             )
-            return
 
-        self.send_data(producer)
+        report_exception(
+            error=Exception("SASLUsername or SASLPassword is empty"),
+            context_name="Publisher",
+            context_content={
+                "publisherName": self._publisher.name,
+                "publisherType": self._publisher.target.publisherType,
+            },
+        )
+        return None
 
     def send_data(self, producer):
+        self._produce(producer)
+        # producer is reused between tasks and flushed on worker shutdown
+        producer.poll(0)
+
+    def _produce(self, producer, failed: list = None):
         topic = self._publisher.target.kafka.topic
 
         def delivery_report(err, msg):
             if err:
                 logger.debug("Message delivery failed: {}".format(err))
+                if failed is not None:
+                    failed.append(err)
 
                 report_exception(
                     error=Exception(err),
@@ -98,7 +124,6 @@ class KafkaAdapter(PublisherAdapter):
             value=json.dumps(self._message).encode("utf-8"),
             on_delivery=delivery_report,
         )
-        producer.flush()
 
     def send_ping(self):
         self._headers = {"Content-Type": "application/json; charset=UTF-8"}
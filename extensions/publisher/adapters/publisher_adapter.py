@@ -36,3 +36,14 @@ class PublisherAdapter:
     @abstractmethod
     def send_publisher_data(self):
         raise NotImplementedError
+
+    def send_batch(self, events: list[dict]) -> int:
+        """Sends events one by one and returns number of sent events.
+        Adapters override it to send the whole batch with one request."""
+        sent = 0
+        for event in events:
+            self.transform_publisher_data(event)
+            if self.prepare_publisher_data(event):
+                self.send_publisher_data()
+                sent += 1
+        return sent
@@ -0,0 +1,98 @@
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import requests
+from celery.signals import worker_process_shutdown
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
+
+from extensions.publisher.models.publisher import Publisher
+
+logger = logging.getLogger(__name__)
+
+MAX_POOLED_TRANSPORTS = 64
+PRODUCER_FLUSH_TIMEOUT = 10
+
+
+class TransportPool:
+    """
+    Keeps HTTP sessions and Kafka producers of publishers alive between tasks,
+    so connections are not established for every published event.
+    Transports are keyed by publisher target, so updated publishers get new ones.
+    """
+
+    def __init__(self, max_size: int = MAX_POOLED_TRANSPORTS):
+        self._max_size = max_size
+        self._transports: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def session(self, publisher: Publisher, retry: int) -> requests.Session:
+        def create_session():
+            session = requests.session()
+            retries = Retry(
+                total=retry,
+                backoff_factor=2,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=False,
+            )
+            retries.BACKOFF_MAX = 600
+            session.mount("https://", HTTPAdapter(max_retries=retries))
+            return session
+
+        key = ("session", retry, self._target_key(publisher))
+        return self._get(key, create_session)
+
+    def producer(self, publisher: Publisher, create_producer: Callable):
+        return self._get(("producer", self._target_key(publisher)), create_producer)
+
+    def authorized_session(self, publisher: Publisher, create_session: Callable):
+        key = ("authorized_session", self._target_key(publisher))
+        return self._get(key, create_session)
+
+    def close(self):
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+        for transport in transports:
+            self._close_transport(transport)
+
+    def _get(self, key: Hashable, create: Callable):
+        with self._lock:
+            transport = self._transports.get(key)
+            if transport is not None:
+                self._transports.move_to_end(key)
+                return transport
+
+            transport = self._transports[key] = create()
+            evicted = []
+            while len(self._transports) > self._max_size:
+                evicted.append(self._transports.popitem(last=False)[1])
+        for old_transport in evicted:
+            self._close_transport(old_transport)
+        return transport
+
+    @staticmethod
+    def _close_transport(transport):
+        try:
+            if isinstance(transport, requests.Session):
+                transport.close()
+            else:
+                transport.flush(PRODUCER_FLUSH_TIMEOUT)
+        except Exception as error:
+            logger.warning(f"Publisher transport was not closed properly: {error}")
+
+    @staticmethod
+    def _target_key(publisher: Publisher) -> tuple[str, str]:
+        target = json.dumps(publisher.target.to_dict(), sort_keys=True, default=str)
+        return publisher.id, target
+
+
+transport_pool = TransportPool()
+
+
+@worker_process_shutdown.connect
+def close_transports(**kwargs):
+    transport_pool.close()
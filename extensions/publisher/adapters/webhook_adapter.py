@@ -1,10 +1,7 @@
 import json
 import logging
 
-import requests
-from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-from urllib3 import Retry
 
 from extensions.common.monitoring import report_exception
 from extensions.publisher.adapters.publisher_adapter import (
@@ -15,6 +12,7 @@ from extensions.publisher.adapters.publisher_adapter import (
     MODULE_ID,
     PRIMITIVES,
 )
+from extensions.publisher.adapters.transport_pool import transport_pool
 from extensions.publisher.adapters.utils import transform_publisher_data
 from extensions.publisher.models.publisher import Publisher
 from extensions.publisher.models.webhook import Webhook
@@ -49,21 +47,25 @@ class WebhookAdapter(PublisherAdapter):
 
         self.send_data(url, retry)
 
-    def send_data(self, url, retry):
+    def send_batch(self, events: list[dict]) -> int:
+        """Sends all events as one array body."""
+        messages = []
+        for event in events:
+            self.transform_publisher_data(event)
+            self.prepare_publisher_data(event)
+            messages.append(self._message)
+        self._message = messages
+
+        url = self._publisher.target.webhook.endpoint
+        sent = self.send_data(url, self._publisher.target.retry)
+        return len(messages) if sent else 0
+
+    def send_data(self, url, retry) -> bool:
         username = self._publisher.target.webhook.username
         password = self._publisher.target.webhook.password
         auth_type = self._publisher.target.webhook.authType
 
-        session = requests.session()
-        retries = Retry(
-            total=retry,
-            backoff_factor=2,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=False,
-        )
-        retries.BACKOFF_MAX = 600
-
-        session.mount("https://", HTTPAdapter(max_retries=retries))
+        session = transport_pool.session(self._publisher, retry)
 
         try:
             if username and password and auth_type is Webhook.WebhookAuthType.BASIC:
@@ -95,15 +97,18 @@ class WebhookAdapter(PublisherAdapter):
                         "publisherType": self._publisher.target.publisherType,
                     },
                 )
+                return False
             else:
                 logger.debug(
                     f"Successfully published event to webhook with publisher name: {self._publisher.name}"
                 )
+                return True
         except Exception as error:
             logger.error(
                 f"Failed to publish event to webhook with publisher name:"
                 f" {self._publisher.name}  with error [{error}]"
             )
+            return False
 
     def send_ping(self):
         self._headers = {"Content-Type": "application/json; charset=UTF-8"}
@@ -7,13 +7,22 @@ from extensions.module_result.event_bus.post_create_module_results_batch_event i
     PostCreateModuleResultBatchEvent,
 )
 from extensions.publisher.callbacks.publisher_callback import publisher_callback
+from extensions.organization.repository.organization_repository import (
+    OrganizationRepository,
+)
 from extensions.publisher.config.config import PublisherConfig
 from extensions.publisher.repository.mongo_publisher_repository import (
     MongoPublisherRepository,
 )
+from extensions.publisher.repository.publisher_index import (
+    IndexedMongoPublisherRepository,
+    PublisherIndex,
+)
 from extensions.publisher.repository.publisher_repository import PublisherRepository
 from extensions.publisher.router.publisher_router import publisher_route
 from sdk.common.adapter.event_bus_adapter import EventBusAdapter
+from sdk.common.caching.service import CachingService
+from sdk.common.utils import inject
 from sdk.common.utils.inject import Binder, autoparams
 from sdk.phoenix.component_manager import PhoenixBaseComponent
 from sdk.phoenix.config.server_config import PhoenixServerConfig
@@ -26,6 +35,26 @@ class PublisherComponent(PhoenixBaseComponent):
     tag_name = "publisher"
 
     def bind(self, binder: Binder, config: PhoenixServerConfig):
+        routing_config = config.server.publisher.routing
+        if routing_config.enabled:
+            binder.bind_to_constructor(
+                PublisherIndex,
+                lambda: PublisherIndex(
+                    routing_config,
+                    MongoPublisherRepository(),
+                    inject.instance(OrganizationRepository),
+                    CachingService(),
+                ),
+            )
+            binder.bind_to_provider(
+                PublisherRepository,
+                lambda: IndexedMongoPublisherRepository(
+                    inject.instance(PublisherIndex)
+                ),
+            )
+            logger.debug("PublisherRepository bind to IndexedMongoPublisherRepository")
+            return
+
         binder.bind_to_provider(PublisherRepository, lambda: MongoPublisherRepository())
         logger.debug("PublisherRepository bind to MongoPublisherRepository")
 
@@ -1,9 +1,25 @@
 from dataclasses import field
 
 from sdk import convertibleclass
+from sdk.common.utils.convertible import meta
 from sdk.phoenix.config.server_config import BasePhoenixConfig
 
 
+@convertibleclass
+class PublisherRoutingConfig:
+    enabled: bool = field(default=False)
+    refreshInterval: int = field(default=60, metadata=meta(lambda n: n > 0))
+
+
+@convertibleclass
+class PublisherBatchingConfig:
+    enabled: bool = field(default=False)
+    maxSize: int = field(default=100, metadata=meta(lambda n: n > 0))
+    windowSeconds: int = field(default=10, metadata=meta(lambda n: n > 0))
+
+
 @convertibleclass
 class PublisherConfig(BasePhoenixConfig):
     enable: bool = field(default=False)
+    routing: PublisherRoutingConfig = field(default_factory=PublisherRoutingConfig)
+    batching: PublisherBatchingConfig = field(default_factory=PublisherBatchingConfig)
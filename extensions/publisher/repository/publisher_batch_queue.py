@@ -0,0 +1,41 @@
+import json
+from typing import Iterator
+
+from redis import Redis
+
+from sdk.common.utils.inject import autoparams
+
+
+class PublisherBatchQueue:
+    """
+    Redis lists of events waiting to be sent to a publisher in one batch.
+    Lists are shared by all workers, so events of different tasks are batched together.
+    """
+
+    KEY_PREFIX = "publisher-batch"
+
+    @autoparams()
+    def __init__(self, redis: Redis):
+        self._redis = redis
+
+    def push(self, publisher_id: str, event: dict) -> int:
+        """Adds event to publisher batch and returns batch size."""
+        return self._redis.rpush(self._key(publisher_id), json.dumps(event))
+
+    def pop(self, publisher_id: str, size: int) -> list[dict]:
+        key = self._key(publisher_id)
+        pipeline = self._redis.pipeline(transaction=True)
+        pipeline.lrange(key, 0, size - 1)
+        pipeline.ltrim(key, size, -1)
+        items, _ = pipeline.execute()
+        return [json.loads(item) for item in items]
+
+    def pending_publisher_ids(self) -> Iterator[str]:
+        prefix_length = len(self.KEY_PREFIX) + 1
+        for key in self._redis.scan_iter(match=f"{self.KEY_PREFIX}:*"):
+            if isinstance(key, bytes):
+                key = key.decode()
+            yield key[prefix_length:]
+
+    def _key(self, publisher_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{publisher_id}"
@@ -0,0 +1,167 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Optional
+
+from bson import ObjectId
+from redis.exceptions import RedisError
+
+from extensions.organization.repository.organization_repository import (
+    OrganizationRepository,
+)
+from extensions.publisher.config.config import PublisherRoutingConfig
+from extensions.publisher.models.publisher import Publisher
+from extensions.publisher.repository.mongo_publisher_repository import (
+    MongoPublisherRepository,
+)
+from extensions.publisher.repository.publisher_repository import PublisherRepository
+from sdk.common.caching.service import CachingService
+
+logger = logging.getLogger(__name__)
+
+PUBLISHERS_PAGE_SIZE = 100
+
+
+def match_publisher_module(publisher: Publisher, module_id: str) -> bool:
+    """Checks publisher module filters, deployment filters are checked by caller."""
+    module_names = publisher.filter.moduleNames
+    if module_names and module_id not in module_names:
+        return False
+    excluded_module_names = publisher.filter.excludedModuleNames
+    return not (excluded_module_names and module_id in excluded_module_names)
+
+
+class PublisherIndex:
+    """
+    In-worker routing index of enabled publishers by deployment id.
+
+    Organization filters are expanded to deployment ids when the index is built,
+    so matching an event only checks publishers of its deployment and global ones.
+    Publisher writes bump a revision stored in Redis, which makes every worker rebuild
+    its index on the next lookup. The index is also rebuilt after `refreshInterval`
+    seconds to pick up deployments added to organizations.
+    """
+
+    REVISION_KEY = "publisher-index:revision"
+
+    def __init__(
+        self,
+        config: PublisherRoutingConfig,
+        repo: PublisherRepository,
+        org_repo: OrganizationRepository,
+        caching: CachingService,
+    ):
+        self._config = config
+        self._repo = repo
+        self._org_repo = org_repo
+        self._caching = caching
+        self._lock = threading.Lock()
+        self._revision: Optional[str] = None
+        self._built_at: Optional[float] = None
+        self._by_deployment: dict[str, list[Publisher]] = {}
+        self._global: list[Publisher] = []
+
+    def retrieve_publishers(self, deployment_id: str, module_id: str) -> list:
+        self._refresh()
+        candidates = [*self._by_deployment.get(deployment_id, []), *self._global]
+        return [p for p in candidates if match_publisher_module(p, module_id)]
+
+    def invalidate(self):
+        try:
+            revision = str(ObjectId())
+            self._caching.set(self.REVISION_KEY, None, revision)
+        except RedisError as error:
+            logger.warning(f"Publisher index revision was not updated: {error}")
+        with self._lock:
+            self._built_at = None
+
+    def _refresh(self):
+        revision = self._retrieve_revision()
+        with self._lock:
+            if self._is_up_to_date(revision):
+                return
+            self._build()
+            self._revision = revision
+            self._built_at = time.monotonic()
+
+    def _is_up_to_date(self, revision: Optional[str]) -> bool:
+        if self._built_at is None or revision != self._revision:
+            return False
+        return time.monotonic() - self._built_at < self._config.refreshInterval
+
+    def _retrieve_revision(self) -> Optional[str]:
+        try:
+            cached = self._caching.get(self.REVISION_KEY)
+        except RedisError as error:
+            logger.warning(f"Publisher index revision is not accessible: {error}")
+            return self._revision
+        return cached.contentHash if cached else None
+
+    def _build(self):
+        by_deployment, global_publishers = defaultdict(list), []
+        organizations_deployments: dict[str, list[str]] = {}
+        for publisher in self._retrieve_all_publishers():
+            if not publisher.enabled:
+                continue
+
+            listener_type = publisher.filter.listenerType
+            if listener_type == Publisher.Filter.ListenerType.GLOBAL:
+                global_publishers.append(publisher)
+                continue
+
+            deployment_ids = set(publisher.filter.deploymentIds or [])
+            if listener_type == Publisher.Filter.ListenerType.ORGANIZATION_IDS:
+                deployment_ids = set()
+                for organization_id in publisher.filter.organizationIds or []:
+                    if organization_id not in organizations_deployments:
+                        organization = self._org_repo.retrieve_organization(
+                            organization_id=organization_id
+                        )
+                        organizations_deployments[organization_id] = [
+                            str(deployment_id)
+                            for deployment_id in organization.deploymentIds or []
+                        ]
+                    deployment_ids.update(organizations_deployments[organization_id])
+            elif listener_type != Publisher.Filter.ListenerType.DEPLOYMENT_IDS:
+                continue
+
+            for deployment_id in deployment_ids:
+                by_deployment[str(deployment_id)].append(publisher)
+
+        self._by_deployment = dict(by_deployment)
+        self._global = global_publishers
+        logger.debug(f"Publisher index built for {len(by_deployment)} deployments")
+
+    def _retrieve_all_publishers(self) -> list[Publisher]:
+        skip, total, publishers = 0, None, []
+        while total is None or skip < total:
+            page, total = self._repo.retrieve_publishers(
+                skip=skip, limit=PUBLISHERS_PAGE_SIZE
+            )
+            if not page:
+                break
+            publishers.extend(page)
+            skip += PUBLISHERS_PAGE_SIZE
+        return publishers
+
+
+class IndexedMongoPublisherRepository(MongoPublisherRepository):
+    """Invalidates publisher index of all workers on every publisher write."""
+
+    def __init__(self, index: PublisherIndex):
+        self._index = index
+
+    def create_publisher(self, publisher: Publisher) -> str:
+        publisher_id = super().create_publisher(publisher)
+        self._index.invalidate()
+        return publisher_id
+
+    def update_publisher(self, publisher: Publisher) -> str:
+        publisher_id = super().update_publisher(publisher)
+        self._index.invalidate()
+        return publisher_id
+
+    def delete_publisher(self, publisher_id: str):
+        super().delete_publisher(publisher_id)
+        self._index.invalidate()
@@ -1,9 +1,15 @@
 import copy
 import logging
+import time
+from collections import defaultdict
+from typing import Iterator, Optional
+
+from celery.schedules import crontab
 
 from extensions.export_deployment.helpers.convertion_helpers import (
     get_primitive_dict,
 )
+from extensions.module_result.models.primitives import Primitive
 from extensions.module_result.repository.module_result_repository import (
     ModuleResultRepository,
 )
@@ -12,13 +18,22 @@ from extensions.organization.repository.organization_repository import (
 )
 from extensions.publisher.adapters.gcp_fhir_adapter import GCPFHIRAdapter
 from extensions.publisher.adapters.kafka_adapter import KafkaAdapter
+from extensions.publisher.adapters.publisher_adapter import PublisherAdapter
 from extensions.publisher.adapters.webhook_adapter import WebhookAdapter
 from extensions.publisher.models.primitive_data import PrimitiveData
+from extensions.publisher.config.config import PublisherConfig
 from extensions.publisher.models.publisher import Publisher
+from extensions.publisher.repository.publisher_batch_queue import PublisherBatchQueue
+from extensions.publisher.repository.publisher_index import (
+    PublisherIndex,
+    match_publisher_module,
+)
 from extensions.publisher.repository.publisher_repository import PublisherRepository
 from sdk.celery.app import celery_app
+from sdk.common.exceptions.exceptions import ObjectDoesNotExist
 from sdk.common.utils import inject
 from sdk.common.utils.inject import autoparams
+from sdk.phoenix.config.server_config import PhoenixServerConfig
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +44,19 @@ DEVICE_NAME = "deviceName"
 PRIMITIVES = "primitives"
 
 
+PrimitiveKey = tuple[str, str]
+
+
+@celery_app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    # Sends batches left behind by workers which stopped before their window ended
+    sender.add_periodic_task(
+        crontab(minute="*"),
+        flush_publisher_batches_task.s(),
+        name="Publisher batches sender",
+    )
+
+
 @celery_app.task
 def publish_data_task(
     primitive_data: list[dict],
@@ -38,11 +66,108 @@ def publish_data_task(
     deployment_id: str,
 ):
     """celery task to publish the event if there exists a registered publisher for it"""
-    primitive_data = [PrimitiveData(**kwargs) for kwargs in primitive_data]
-    event = recreate_event(
-        primitive_data, module_id, device_name, module_config_id, deployment_id
+    batching = _publisher_config().batching
+    event = {DEPLOYMENT_ID: deployment_id, MODULE_ID: module_id}
+    full_event = None
+
+    for publisher in retrieve_matching_publishers(event):
+        logger.debug(f"Publisher Matched for deployment: {event['deploymentId']}")
+
+        is_ping = publisher.filter.eventType == Publisher.Filter.EventType.PING
+        if batching.enabled and not is_ping:
+            batch_event = {
+                **event,
+                PRIMITIVES: primitive_data,
+                DEVICE_NAME: device_name,
+                MODULE_CONFIG_ID: module_config_id,
+            }
+            add_event_to_batch(publisher.id, batch_event)
+            continue
+
+        adapter = create_adapter(publisher)
+        if is_ping:
+            adapter.send_ping()
+            continue
+
+        if full_event is None:
+            full_event = recreate_event(
+                [PrimitiveData(**kwargs) for kwargs in primitive_data],
+                module_id,
+                device_name,
+                module_config_id,
+                deployment_id,
+            )
+        event_copy = copy.deepcopy(full_event)
+        adapter.transform_publisher_data(event_copy)
+
+        if adapter.prepare_publisher_data(event_copy):
+            adapter.send_publisher_data()
+
+
+def create_adapter(publisher: Publisher) -> Optional[PublisherAdapter]:
+    if publisher.target.publisherType == Publisher.Target.Type.WEBHOOK:
+        return WebhookAdapter(publisher=publisher)
+    elif publisher.target.publisherType == Publisher.Target.Type.KAFKA:
+        return KafkaAdapter(publisher=publisher)
+    elif publisher.target.publisherType == Publisher.Target.Type.GCPFHIR:
+        return GCPFHIRAdapter(publisher=publisher)
+    return None
+
+
+def _publisher_config() -> PublisherConfig:
+    return inject.instance(PhoenixServerConfig).server.publisher
+
+
+def add_event_to_batch(publisher_id: str, event: dict):
+    """Batch is sent when it is full or when its window ends."""
+    batching = _publisher_config().batching
+    batch_size = PublisherBatchQueue().push(publisher_id, event)
+    if batch_size >= batching.maxSize:
+        flush_publisher_batch_task.delay(publisher_id)
+    elif batch_size == 1:
+        flush_publisher_batch_task.apply_async(
+            (publisher_id,), countdown=batching.windowSeconds
+        )
+
+
+@celery_app.task
+def flush_publisher_batches_task():
+    for publisher_id in PublisherBatchQueue().pending_publisher_ids():
+        flush_publisher_batch_task.delay(publisher_id)
+
+
+@celery_app.task
+def flush_publisher_batch_task(publisher_id: str):
+    batching = _publisher_config().batching
+    batch = PublisherBatchQueue().pop(publisher_id, batching.maxSize)
+    if not batch:
+        return
+
+    publisher_repo: PublisherRepository = inject.instance(PublisherRepository)
+    try:
+        publisher = publisher_repo.retrieve_publisher(publisher_id)
+    except ObjectDoesNotExist:
+        logger.warning(f"Batch of deleted publisher {publisher_id} is dropped")
+        return
+
+    started = time.monotonic()
+    events = recreate_events(batch)
+    sent = create_adapter(publisher).send_batch(events) if events else 0
+    logger.info(
+        f"Publisher {publisher.name} batch delivery: {sent} sent, "
+        f"{len(batch) - sent} failed of {len(batch)} events in "
+        f"{time.monotonic() - started:.2f}s"
     )
 
+
+def retrieve_matching_publishers(event: dict) -> Iterator[Publisher]:
+    """Uses routing index when enabled, otherwise checks every publisher."""
+    config = inject.instance(PhoenixServerConfig).server.publisher
+    if config and config.routing.enabled:
+        index = inject.instance(PublisherIndex)
+        yield from index.retrieve_publishers(event[DEPLOYMENT_ID], event[MODULE_ID])
+        return
+
     skip = 0
     total = 0
     batch_size = 10
@@ -61,31 +186,8 @@ def publish_data_task(
 
             # check list of registered publisher and see if it matches
             # if it does send the result to the endpoint specified
-            matched = match_publisher_and_event(publisher, event)
-
-            if not matched:
-                continue
-
-            logger.debug(f"Publisher Matched for deployment: {event['deploymentId']}")
-
-            adapter = None
-
-            if publisher.target.publisherType == Publisher.Target.Type.WEBHOOK:
-                adapter = WebhookAdapter(publisher=publisher)
-            elif publisher.target.publisherType == Publisher.Target.Type.KAFKA:
-                adapter = KafkaAdapter(publisher=publisher)
-            elif publisher.target.publisherType == Publisher.Target.Type.GCPFHIR:
-                adapter = GCPFHIRAdapter(publisher=publisher)
-
-            if publisher.filter.eventType == Publisher.Filter.EventType.PING:
-                adapter.send_ping()
-                continue
-
-            event_copy = copy.deepcopy(event)
-            adapter.transform_publisher_data(event_copy)
-
-            if adapter.prepare_publisher_data(event_copy):
-                adapter.send_publisher_data()
+            if match_publisher_and_event(publisher, event):
+                yield publisher
 
         if not total:
             break
@@ -115,19 +217,8 @@ def match_publisher_and_event(
     if not matched:
         return False
 
-    matched = False
-
     # also match if we have the module result we want to publish
-    if publisher.filter.moduleNames:
-        if event[MODULE_ID] in publisher.filter.moduleNames:
-            matched = True
-    if not publisher.filter.moduleNames:
-        matched = True
-
-    if publisher.filter.excludedModuleNames:
-        if event[MODULE_ID] in publisher.filter.excludedModuleNames:
-            matched = False
-    return matched
+    return match_publisher_module(publisher, event[MODULE_ID])
 
 
 @autoparams("repo")
@@ -142,10 +233,13 @@ def recreate_event(
     event = {}
 
     # create the event here
-    primitives = [
-        get_primitive_dict(repo.retrieve_primitive(p.user_id, p.name, p.id))
-        for p in primitive_data
-    ]
+    retrieved_primitives = retrieve_primitives(primitive_data, repo)
+    primitives = []
+    for p in primitive_data:
+        primitive = retrieved_primitives.get((p.name, p.id))
+        if not primitive:
+            raise ObjectDoesNotExist
+        primitives.append(get_primitive_dict(primitive))
 
     event[DEVICE_NAME] = device_name
     event[MODULE_ID] = module_id
@@ -156,6 +250,52 @@ def recreate_event(
     return event
 
 
+@autoparams("repo")
+def recreate_events(batch: list[dict], repo: ModuleResultRepository) -> list[dict]:
+    """Recreates batched events, primitives of all events are retrieved together.
+    Events with removed primitives are skipped."""
+    batch_primitive_data = [
+        [PrimitiveData(**kwargs) for kwargs in event[PRIMITIVES]] for event in batch
+    ]
+    all_primitive_data = [p for data in batch_primitive_data for p in data]
+    retrieved_primitives = retrieve_primitives(all_primitive_data, repo)
+
+    events = []
+    for event, primitive_data in zip(batch, batch_primitive_data):
+        primitives = [retrieved_primitives.get((p.name, p.id)) for p in primitive_data]
+        if not all(primitives):
+            logger.warning(f"Primitives of {event[MODULE_ID]} event were not found")
+            continue
+        events.append(
+            {
+                DEVICE_NAME: event[DEVICE_NAME],
+                MODULE_ID: event[MODULE_ID],
+                PRIMITIVES: [get_primitive_dict(p) for p in primitives],
+                MODULE_CONFIG_ID: event[MODULE_CONFIG_ID],
+                DEPLOYMENT_ID: event[DEPLOYMENT_ID],
+            }
+        )
+    return events
+
+
+def retrieve_primitives(
+    primitive_data: list[PrimitiveData], repo: ModuleResultRepository
+) -> dict[PrimitiveKey, Primitive]:
+    """Retrieves primitives with one query per collection."""
+    ids_by_name = defaultdict(set)
+    for p in primitive_data:
+        ids_by_name[p.name].add(p.id)
+
+    user_ids = {(p.name, p.id): p.user_id for p in primitive_data}
+    primitives = {}
+    for name, ids in ids_by_name.items():
+        for primitive in repo.retrieve_primitives_by_ids(name, list(ids)):
+            key = (name, primitive.id)
+            if str(primitive.userId) == user_ids.get(key):
+                primitives[key] = primitive
+    return primitives
+
+
 def match_publisher_and_event_org(
     organization_ids: list[str], event: dict, org_repo: OrganizationRepository
 ) -> bool:
@@ -10,7 +10,7 @@ from extensions.reminder.callbacks.callbacks import (
 from extensions.reminder.models.reminder import UserModuleReminder
 from extensions.reminder.router.user_module_reminder_router import api
 from sdk.calendar.models.calendar_event import CalendarEvent
-from sdk.common.adapter.event_bus_adapter import EventBusAdapter
+from sdk.common.adapter.event_bus_adapter import EventBusAdapter, Dispatch
 from sdk.common.utils.inject import autoparams
 from sdk.phoenix.component_manager import PhoenixBaseComponent
 
@@ -27,6 +27,8 @@ class UserModuleReminderComponent(PhoenixBaseComponent):
     def post_setup(self, event_bus: EventBusAdapter):
         CalendarEvent.register(UserModuleReminder.__name__, UserModuleReminder)
         event_bus.subscribe(
-            PostUserProfileUpdateEvent, update_reminders_language_localization
+            PostUserProfileUpdateEvent,
+            update_reminders_language_localization,
+            Dispatch.DEFERRED,
         )
         super().post_setup()
@@ -9,15 +9,19 @@ from dateutil import rrule
 from extensions.authorization.models.authorized_user import AuthorizedUser
 from extensions.authorization.services.authorization import AuthorizationService
 from extensions.deployment.service.deployment_service import DeploymentService
+from extensions.exceptions import UserDoesNotExist
 from extensions.module_result.models.module_config import NotificationData
 from sdk.calendar.models.calendar_event import CalendarEvent
 from sdk.common.push_notifications.push_notifications_utils import (
     prepare_and_send_push_notification,
+    prepare_user_push,
 )
 from sdk.common.utils.common_functions_utils import deprecated
 from sdk.common.utils.convertible import default_field, meta, required_field
 from sdk.common.utils.date_utils import get_time_from_duration_iso
+from sdk.notification.services.notification_service import NotificationService
 from sdk.common.utils.validators import (
+    datetime_now,
     not_empty,
     validate_min_max_month_days_list,
     validate_time_duration,
@@ -302,20 +306,73 @@ class UserModuleReminder(CalendarEvent):
             locale = user.get_language()
             self.set_default_title_and_description(locale)
 
-        notification_template = {"title": self.title, "body": self.description}
-        notification_data = {
-            "action": self.REMINDER_ACTION,
-            "moduleId": self.moduleId,
-            "moduleConfigId": self.moduleConfigId,
-        }
         prepare_and_send_push_notification(
             user_id=self.userId,
             action=self.REMINDER_ACTION,
-            notification_template=notification_template,
-            notification_data=remove_none_values(notification_data),
+            notification_template=self._notification_template(),
+            notification_data=self._notification_data(),
             run_async=run_async,
         )
 
+    @classmethod
+    def execute_many(cls, events: list["UserModuleReminder"], run_async=True):
+        """Reminders with the same content are pushed to all their users at once."""
+        languages = cls._retrieve_languages(
+            {
+                event.userId
+                for event in events
+                if not event.title or not event.description
+            }
+        )
+        sent_date_time = datetime_now()
+        pushes = []
+        for event in events:
+            try:
+                if not event.title or not event.description:
+                    event.set_default_title_and_description(languages[event.userId])
+                push = prepare_user_push(
+                    user_id=event.userId,
+                    action=cls.REMINDER_ACTION,
+                    notification_template=event._notification_template(),
+                    notification_data=event._notification_data(),
+                    sent_date_time=sent_date_time,
+                )
+                pushes.append(push)
+            except Exception as error:
+                logger.error(f"Sending reminder error: {error}")
+
+        if pushes:
+            NotificationService().push_for_users(pushes, run_async=run_async)
+
+    @staticmethod
+    def _retrieve_languages(user_ids: set[str]) -> dict[str, str]:
+        if not user_ids:
+            return {}
+
+        service = AuthorizationService()
+        try:
+            users = service.retrieve_simple_user_profiles_by_ids(user_ids)
+        except UserDoesNotExist:
+            # reminders of removed users are not sent
+            users = []
+            for user_id in user_ids:
+                try:
+                    users.append(service.retrieve_simple_user_profile(user_id=user_id))
+                except UserDoesNotExist:
+                    logger.warning(f"Reminder user {user_id} does not exist")
+        return {user.id: AuthorizedUser(user).get_language() for user in users}
+
+    def _notification_template(self) -> dict:
+        return {"title": self.title, "body": self.description}
+
+    def _notification_data(self) -> dict:
+        notification_data = {
+            "action": self.REMINDER_ACTION,
+            "moduleId": self.moduleId,
+            "moduleConfigId": self.moduleConfigId,
+        }
+        return remove_none_values(notification_data)
+
     def __str__(self):
         return f"UserModuleReminder[{self.moduleId}] at {self.durationIso}"
 
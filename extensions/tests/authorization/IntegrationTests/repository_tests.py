@@ -1,10 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+from extensions.authorization.models.user import User
 from extensions.authorization.repository.auth_repository import AuthorizationRepository
+from extensions.module_result.models.primitives import Height, Primitive, Weight
 from extensions.tests.authorization.IntegrationTests.abstract_permission_test_case import (
     AbstractPermissionTestCase,
 )
 from sdk.common.utils import inject
 
 VALID_USER_ID = "5e8f0c74b50aa9656c34789c"
+MODULE_CONFIG_ID = "5f1824ba504787d8d89ebecb"
 
 
 class BaseRepositoryTestCase(AbstractPermissionTestCase):
@@ -29,3 +37,90 @@ class AuthorizationRepositoryTestCase(BaseRepositoryTestCase):
         self.assertIsNone(user.recentModuleResults)
         self.assertIsNone(user.tags)
         self.assertIsNone(user.tagsAuthorId)
+
+
+class RecentModuleResultsTestCase(BaseRepositoryTestCase):
+    @staticmethod
+    def _weight_result(start_date_time: datetime, flags: dict = None) -> dict:
+        weight = Weight.from_dict(
+            {
+                Primitive.USER_ID: VALID_USER_ID,
+                Primitive.MODULE_ID: Weight.__name__,
+                Primitive.MODULE_CONFIG_ID: MODULE_CONFIG_ID,
+                Primitive.DEPLOYMENT_ID: "5d386cc6ff885918d96edb2c",
+                Primitive.DEVICE_NAME: "iOS",
+                Primitive.START_DATE_TIME: start_date_time,
+                Primitive.FLAGS: flags,
+                Weight.VALUE: 80,
+            }
+        )
+        weight.createDateTime = datetime.utcnow()
+        return {Weight.__name__: weight}
+
+    def _push_concurrently(self, results: list[dict], max_records: int):
+        def push(result: dict):
+            self.repo.push_recent_module_result(
+                VALID_USER_ID, MODULE_CONFIG_ID, result, max_records
+            )
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(push, results))
+
+    def _stored_start_date_times(self) -> list[datetime]:
+        user = self.mongo_database.user.find_one({User.ID_: ObjectId(VALID_USER_ID)})
+        stored = user[User.RECENT_MODULE_RESULTS][MODULE_CONFIG_ID]
+        return [result[Weight.__name__][Primitive.START_DATE_TIME] for result in stored]
+
+    def test_concurrent_recent_results_not_lost(self):
+        start = datetime(2021, 1, 1)
+        results = [self._weight_result(start + timedelta(hours=i)) for i in range(30)]
+
+        self._push_concurrently(results, max_records=len(results))
+
+        start_date_times = self._stored_start_date_times()
+        self.assertEqual(len(results), len(start_date_times))
+        self.assertEqual(sorted(start_date_times, reverse=True), start_date_times)
+
+    def test_concurrent_recent_results_trimmed_to_latest(self):
+        start = datetime(2021, 1, 1)
+        results = [self._weight_result(start + timedelta(hours=i)) for i in range(30)]
+
+        self._push_concurrently(results, max_records=2)
+
+        expected = [start + timedelta(hours=29), start + timedelta(hours=28)]
+        self.assertEqual(expected, self._stored_start_date_times())
+
+    def test_recent_results_with_other_first_primitive_trimmed_to_latest(self):
+        start = datetime(2021, 1, 1)
+        results = []
+        for i in range(10):
+            result = self._weight_result(start + timedelta(hours=i))
+            if i % 2:
+                weight = result[Weight.__name__]
+                height = Height.from_dict(
+                    {**weight.to_dict(include_none=False), "value": 180}
+                )
+                result = {Height.__name__: height, Weight.__name__: weight}
+            results.append(result)
+
+        self._push_concurrently(results, max_records=3)
+
+        expected = [start + timedelta(hours=i) for i in (9, 8, 7)]
+        self.assertEqual(expected, self._stored_start_date_times())
+
+    def test_recent_flags_from_latest_results(self):
+        start = datetime(2021, 1, 1)
+        self._push_concurrently(
+            [
+                self._weight_result(start, {"red": 1, "amber": 0, "gray": 0}),
+                self._weight_result(
+                    start + timedelta(hours=1), {"red": 0, "amber": 1, "gray": 0}
+                ),
+            ],
+            max_records=2,
+        )
+
+        self.repo.update_user_recent_flags(VALID_USER_ID, [MODULE_CONFIG_ID], [])
+
+        user = self.mongo_database.user.find_one({User.ID_: ObjectId(VALID_USER_ID)})
+        self.assertEqual({"red": 0, "amber": 1, "gray": 0}, user[User.RECENT_FLAGS])
@@ -3,6 +3,8 @@ from unittest.mock import MagicMock
 
 from extensions.authorization.callbacks import check_valid_client_used
 from extensions.authorization.component import AuthorizationComponent
+from extensions.authorization.config.config import ConfigurationCacheConfig
+from extensions.authorization.configuration_cache import configuration_cache
 from extensions.authorization.events.post_create_authorization_event import (
     PostCreateAuthorizationEvent,
 )
@@ -56,6 +58,7 @@ class EventBinderTestCase(unittest.TestCase):
         inject.clear_and_configure(bind_and_configure)
         auth_component = AuthorizationComponent()
         auth_component.config = MagicMock()
+        self.addCleanup(configuration_cache.configure, ConfigurationCacheConfig())
         auth_component.post_setup()
         self.assertIn(PreRequestPasswordResetEvent, adapter._handlers)
         callbacks = adapter._handlers.get(PreRequestPasswordResetEvent)
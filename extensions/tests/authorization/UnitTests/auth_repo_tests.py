@@ -18,6 +18,8 @@ from extensions.authorization.models.user import (
     PersonalDocument,
     RoleAssignment,
     UserLabel,
+    UserStats,
+    TaskCompliance,
 )
 from extensions.authorization.repository.mongo_auth_repository import (
     MongoAuthorizationRepository,
@@ -30,7 +32,7 @@ from extensions.tests.authorization.IntegrationTests.test_helpers import (
     get_sample_labels,
 )
 from extensions.deployment.models.deployment import Label
-from extensions.module_result.models.primitives import Primitive
+from extensions.module_result.models.primitives import Primitive, Weight
 from sdk.common.exceptions.exceptions import InvalidRequestException
 from sdk.common.utils.validators import remove_none_values
 
@@ -108,6 +110,75 @@ class AuthRepoTestCase(unittest.TestCase):
             {User.ID_: user_id}, session=db_session
         )
 
+    def test_increment_user_unseen_flags_skips_zero_deltas(self):
+        db_mock = MagicMock()
+        repo = MongoAuthorizationRepository(database=db_mock, config=MockConfig())
+        repo.increment_user_unseen_flags(SAMPLE_ID, {"red": 2, "amber": 0, "gray": -1})
+        db_mock[repo.USER_COLLECTION].update_one.assert_called_once_with(
+            {User.ID_: ObjectId(SAMPLE_ID)},
+            {"$inc": {"unseenFlags.red": 2, "unseenFlags.gray": -1}},
+        )
+
+        db_mock.reset_mock()
+        repo.increment_user_unseen_flags(SAMPLE_ID, {"red": 0, "amber": 0, "gray": 0})
+        db_mock[repo.USER_COLLECTION].update_one.assert_not_called()
+
+    def test_push_recent_module_result_sorts_and_trims_in_one_update(self):
+        db_mock = MagicMock()
+        repo = MongoAuthorizationRepository(database=db_mock, config=MockConfig())
+        primitive = Primitive.from_dict(
+            {
+                Primitive.USER_ID: SAMPLE_ID,
+                Primitive.MODULE_ID: "Weight",
+                Primitive.MODULE_CONFIG_ID: SAMPLE_ID,
+                Primitive.DEPLOYMENT_ID: SAMPLE_ID,
+                Primitive.START_DATE_TIME: "2021-01-01T10:00:00.000Z",
+                Primitive.DEVICE_NAME: "iOS",
+            }
+        )
+        submitted = datetime.utcnow()
+
+        repo.push_recent_module_result(
+            SAMPLE_ID, SAMPLE_ID, {"Weight": primitive}, 2, submitted
+        )
+
+        db_mock[repo.USER_COLLECTION].find_one.assert_not_called()
+        query, update = db_mock[repo.USER_COLLECTION].update_one.call_args.args
+        self.assertEqual({User.ID_: ObjectId(SAMPLE_ID)}, query)
+        push = update["$push"][f"{User.RECENT_MODULE_RESULTS}.{SAMPLE_ID}"]
+        self.assertEqual(
+            {"_sortKey.startDateTime": -1, "_sortKey.createDateTime": -1},
+            push["$sort"],
+        )
+        self.assertEqual(2, push["$slice"])
+        pushed = push["$each"][0]
+        self.assertEqual(ObjectId(SAMPLE_ID), pushed["Weight"]["moduleConfigId"])
+        self.assertEqual(
+            primitive.startDateTime,
+            pushed[repo.RECENT_RESULT_SORT_KEY][Primitive.START_DATE_TIME],
+        )
+        self.assertEqual({User.LAST_SUBMIT_DATE_TIME: submitted}, update["$max"])
+
+    def test_recent_results_sort_key_not_read_back(self):
+        weight = Weight.from_dict(
+            {
+                Primitive.USER_ID: SAMPLE_ID,
+                Primitive.MODULE_ID: "Weight",
+                Primitive.MODULE_CONFIG_ID: SAMPLE_ID,
+                Primitive.DEPLOYMENT_ID: SAMPLE_ID,
+                Primitive.START_DATE_TIME: "2021-01-01T10:00:00.000Z",
+                Primitive.DEVICE_NAME: "iOS",
+                Weight.VALUE: 80,
+            }
+        )
+        repo = MongoAuthorizationRepository
+        stored = repo.convert_recent_results_to_dict({SAMPLE_ID: [{"Weight": weight}]})
+        stored = remove_none_values(stored)
+
+        results = repo._convert_recent_results_from_dict(stored)
+
+        self.assertEqual(["Weight"], list(results[SAMPLE_ID][0]))
+
     def test_success_delete_user_care_plan_group_log_within_session(self):
         db_mock = MagicMock()
         db_session = MagicMock()
@@ -382,6 +453,54 @@ class AuthRepoTestCase(unittest.TestCase):
             {User.EMAIL: 1},
         )
 
+    def test_success_retrieve_users_with_user_role_in_batches(self):
+        db = MagicMock()
+        repo = MongoAuthorizationRepository(database=db, config=MockConfig())
+        collection = MongoAuthorizationRepository.USER_COLLECTION
+        cursor = db[collection].find().sort().batch_size()
+        cursor.__iter__.return_value = [
+            {User.ID_: ObjectId(), User.TIMEZONE: "UTC"} for _ in range(3)
+        ]
+
+        batches = repo.retrieve_users_with_user_role_in_batches(("timezone",), 2)
+
+        self.assertEqual([2, 1], [len(batch) for batch in batches])
+        db[collection].find().sort.assert_called_with(User.ID_, 1)
+        db[collection].find().sort().batch_size.assert_called_with(2)
+
+    def test_success_update_users_stats(self):
+        db = MagicMock()
+        repo = MongoAuthorizationRepository(database=db, config=MockConfig())
+        update_date_time = datetime.utcnow()
+        stats = UserStats.from_dict(
+            {
+                UserStats.TASK_COMPLIANCE: {
+                    TaskCompliance.CURRENT: 1,
+                    TaskCompliance.TOTAL: 2,
+                    TaskCompliance.UPDATE_DATE_TIME: update_date_time,
+                }
+            }
+        )
+
+        repo.update_users_stats({SAMPLE_ID: stats})
+
+        collection = MongoAuthorizationRepository.USER_COLLECTION
+        (update_ops,), kwargs = db[collection].bulk_write.call_args
+        self.assertFalse(kwargs["ordered"])
+        self.assertEqual({User.ID_: ObjectId(SAMPLE_ID)}, update_ops[0]._filter)
+        user_set = update_ops[0]._doc["$set"]
+        self.assertEqual({User.STATS, User.UPDATE_DATE_TIME}, set(user_set))
+        task_compliance = user_set[User.STATS][UserStats.TASK_COMPLIANCE]
+        self.assertEqual(
+            update_date_time, task_compliance[TaskCompliance.UPDATE_DATE_TIME]
+        )
+
+    def test_update_users_stats_skipped_without_stats(self):
+        db = MagicMock()
+        repo = MongoAuthorizationRepository(database=db, config=MockConfig())
+        self.assertEqual(0, repo.update_users_stats({}))
+        db[MongoAuthorizationRepository.USER_COLLECTION].bulk_write.assert_not_called()
+
     def test_success_retrieve_users_count(self):
         db = MagicMock()
         repo = MongoAuthorizationRepository(database=db, config=MockConfig())
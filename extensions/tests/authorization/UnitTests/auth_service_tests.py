@@ -284,19 +284,20 @@ class AuthorizationServiceTests(TestCase):
         now = datetime.utcnow()
         primitive = PrimitiveMock()
         primitive.createDateTime = now
+        module = self.service._deployment_service.retrieve_module.return_value
 
-        test_user = sample_user()
-        self.repo.retrieve_user.return_value = test_user
         self.service.update_recent_results([primitive])
-        self.repo.retrieve_user.assert_called_with(user_id=primitive.userId)
-        self.repo.update_user_profile.assert_called_with(test_user)
-
-        results = test_user.recentModuleResults
-        saved_primitive = results[primitive.moduleConfigId][0][primitive.class_name]
-        self.assertEqual(primitive.id, saved_primitive.id)
-        self.assertEqual(primitive.createDateTime, saved_primitive.createDateTime)
-        self.assertEqual(now, test_user.lastSubmitDateTime)
-        update_recent_flags.assert_called_with(test_user)
+
+        self.repo.retrieve_user.assert_not_called()
+        self.repo.update_user_profile.assert_not_called()
+        self.repo.push_recent_module_result.assert_called_once_with(
+            user_id=primitive.userId,
+            module_config_id=primitive.moduleConfigId,
+            result={primitive.class_name: primitive},
+            max_records=module.recent_results_number,
+            submit_date_time=now,
+        )
+        update_recent_flags.assert_called_with(primitive.userId)
 
     def test_update_recent_results_with_empty_primitives(self):
         self.service.update_recent_results([])
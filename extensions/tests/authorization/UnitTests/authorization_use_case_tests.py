@@ -10,6 +10,8 @@ from dateutil.relativedelta import relativedelta
 from freezegun import freeze_time
 from redis import Redis
 
+from extensions.authorization.config.config import ConfigurationCacheConfig
+from extensions.authorization.configuration_cache import configuration_cache
 from extensions.authorization.models.authorized_user import AuthorizedUser
 from extensions.authorization.models.role.default_roles import DefaultRoles
 from extensions.authorization.models.role.role import Role, RoleName
@@ -683,6 +685,25 @@ class TestRetrieveConfigurationUseCase(TestCase):
             resp = use_case.execute(request_object).value
         self.assertEqual(0, len(resp.moduleConfigs))
 
+    def test_cached_configuration_translated_once(self):
+        static_event = StaticEvent(enabled=True, title="test", description="test")
+        self.configure(static_event)
+        configuration_cache.configure(ConfigurationCacheConfig(enabled=True))
+        self.addCleanup(configuration_cache.configure, ConfigurationCacheConfig())
+
+        request_data = {
+            RetrieveDeploymentConfigRequestObject.USER: self.authorized_user
+        }
+        request_object = RetrieveDeploymentConfigRequestObject.from_dict(request_data)
+        with patch.object(Deployment, "get_localization", return_value={}) as get:
+            first = RetrieveDeploymentConfigUseCase().execute(request_object)
+            second = RetrieveDeploymentConfigUseCase().execute(request_object)
+
+        get.assert_called_once()
+        self.assertIsNotNone(first.etag)
+        self.assertEqual(first.etag, second.etag)
+        self.assertEqual(first.value, second.value)
+
 
 class TestRetrieveStaffUseCase(TestCase):
     def test_success_retrieve_staff(self):
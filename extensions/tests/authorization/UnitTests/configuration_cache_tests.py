@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from extensions.authorization.config.config import ConfigurationCacheConfig
+from extensions.authorization.configuration_cache import (
+    ConfigurationCache,
+    calculate_etag,
+)
+
+CONFIGURATION_CACHE_PATH = "extensions.authorization.configuration_cache"
+KEY = ("deploymentId", 1, "en")
+
+
+class ConfigurationCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        config = ConfigurationCacheConfig(enabled=True, ttlSeconds=300)
+        self.cache = ConfigurationCache(config)
+        self.load = MagicMock(return_value={"name": "Deployment"})
+
+    def test_cached_configuration_loaded_once(self):
+        first = self.cache.get_or_load(KEY, self.load)
+        second = self.cache.get_or_load(KEY, self.load)
+
+        self.assertEqual(({"name": "Deployment"}, calculate_etag(None, KEY)), first)
+        self.assertEqual(first, second)
+        self.load.assert_called_once()
+
+    def test_expired_configuration_loaded_again(self):
+        with patch(f"{CONFIGURATION_CACHE_PATH}.time.monotonic") as monotonic:
+            monotonic.return_value = 100
+            self.cache.get_or_load(KEY, self.load)
+            monotonic.return_value = 401
+            self.cache.get_or_load(KEY, self.load)
+        self.assertEqual(2, self.load.call_count)
+
+    def test_etag_kept_when_configuration_reloaded(self):
+        self.load.side_effect = [{"url": "signed-1"}, {"url": "signed-2"}]
+        first_etag = self.cache.get_or_load(KEY, self.load)[1]
+        self.cache.clear()
+
+        self.assertEqual(first_etag, self.cache.get_or_load(KEY, self.load)[1])
+
+    def test_etag_changes_with_release(self):
+        first_etag = self.cache.get_or_load(KEY, self.load)[1]
+        self.cache.configure(ConfigurationCacheConfig(enabled=True), "1.1.0")
+
+        self.assertNotEqual(first_etag, self.cache.get_or_load(KEY, self.load)[1])
+
+    def test_configuration_cached_per_key(self):
+        self.cache.get_or_load(KEY, self.load)
+        self.cache.get_or_load(("deploymentId", 2, "en"), self.load)
+        self.assertEqual(2, self.load.call_count)
+
+    def test_configuration_without_key_not_cached(self):
+        self.assertEqual(({"name": "Deployment"}, None), self._get_without_key())
+        self._get_without_key()
+        self.assertEqual(2, self.load.call_count)
+
+    def test_least_recently_used_configuration_evicted(self):
+        self.cache.configure(ConfigurationCacheConfig(enabled=True, maxSize=1))
+        self.cache.get_or_load(KEY, self.load)
+        self.cache.get_or_load(("other",), MagicMock(return_value={}))
+        self.cache.get_or_load(KEY, self.load)
+        self.assertEqual(2, self.load.call_count)
+
+    def test_disabled_cache_loads_every_time_without_etag(self):
+        self.cache.configure(ConfigurationCacheConfig())
+        self.assertIsNone(self.cache.get_or_load(KEY, self.load)[1])
+        self.cache.get_or_load(KEY, self.load)
+        self.assertEqual(2, self.load.call_count)
+
+    def test_etag_changes_with_content(self):
+        self.assertEqual(
+            calculate_etag({"a": 1, "b": 2}), calculate_etag({"b": 2, "a": 1})
+        )
+        self.assertNotEqual(calculate_etag({"a": 1}), calculate_etag({"a": 2}))
+
+    def _get_without_key(self):
+        return self.cache.get_or_load(None, self.load)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,20 @@
 import unittest
+from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 
-from extensions.authorization.models.stats_calculator import UserStatsCalculator
+from bson import ObjectId
+
+from extensions.authorization.models.stats_calculator import (
+    UserStatsBatchCalculator,
+    UserStatsCalculator,
+)
+from extensions.authorization.models.user import User
+from sdk.calendar.models.calendar_event import CalendarEvent, CalendarEventLog
+from sdk.common.utils.validators import utc_str_field_to_val
 
 STATS_CALC_PATH = "extensions.authorization.models.stats_calculator"
+USER_ID = "5e8f0c74b50aa9656c34789b"
+OTHER_USER_ID = "5e8f0c74b50aa9656c34789c"
 
 
 class MockCalendarService:
@@ -11,6 +22,34 @@ class MockCalendarService:
     retrieve_all_calendar_events = MagicMock()
 
 
+def sample_event(user_id: str, start: datetime) -> dict:
+    return {
+        CalendarEvent.ID: str(ObjectId()),
+        CalendarEvent.USER_ID: user_id,
+        CalendarEvent.MODEL: "KeyAction",
+        CalendarEvent.ENABLED: True,
+        CalendarEvent.IS_RECURRING: True,
+        CalendarEvent.RECURRENCE_PATTERN: (
+            f"DTSTART:{start:%Y%m%dT%H%M%S}\nRRULE:FREQ=DAILY;INTERVAL=2"
+        ),
+        CalendarEvent.INSTANCE_EXPIRES_IN: "P1D",
+        CalendarEvent.END_DATE_TIME: utc_str_field_to_val(start + timedelta(days=5)),
+    }
+
+
+def sample_log(event: dict, start: datetime) -> CalendarEventLog:
+    return CalendarEventLog.from_dict(
+        {
+            CalendarEventLog.MODEL: "KeyAction",
+            CalendarEventLog.USER_ID: event[CalendarEvent.USER_ID],
+            CalendarEventLog.PARENT_ID: event[CalendarEvent.ID],
+            CalendarEventLog.START_DATE_TIME: utc_str_field_to_val(start),
+            CalendarEventLog.END_DATE_TIME: utc_str_field_to_val(start),
+            CalendarEventLog.CREATE_DATE_TIME: utc_str_field_to_val(start),
+        }
+    )
+
+
 class UserStatsCalculatorTestCase(unittest.TestCase):
     @patch(f"{STATS_CALC_PATH}.CalendarService", MockCalendarService)
     def setUp(self) -> None:
@@ -24,5 +63,57 @@ class UserStatsCalculatorTestCase(unittest.TestCase):
         MockCalendarService.retrieve_calendar_events_between_two_dates.assert_called_once()
 
 
+class UserStatsBatchCalculatorTestCase(unittest.TestCase):
+    @patch(f"{STATS_CALC_PATH}.CalendarService")
+    def test_stats_calculated_from_prefetched_events(self, calendar_service):
+        start = datetime.utcnow().replace(second=0, microsecond=0) - timedelta(days=4)
+        event = sample_event(USER_ID, start)
+        other_event = sample_event(OTHER_USER_ID, start)
+        service = calendar_service()
+        service.retrieve_raw_events.return_value = [event, other_event]
+        service.retrieve_calendar_event_logs.return_value = [
+            sample_log(event, start),
+            sample_log(other_event, start),
+            sample_log(other_event, start + timedelta(days=2)),
+        ]
+        users = [
+            User(id=USER_ID, timezone="Europe/London"),
+            User(id=OTHER_USER_ID),
+        ]
+
+        stats = UserStatsBatchCalculator(users).run()
+
+        service.retrieve_raw_events.assert_called_once()
+        filter_options = service.retrieve_raw_events.call_args.kwargs
+        user_ids = {"$in": [USER_ID, OTHER_USER_ID]}
+        self.assertEqual(user_ids, filter_options[CalendarEvent.USER_ID])
+        service.retrieve_all_calendar_events.assert_not_called()
+        service.retrieve_calendar_events_between_two_dates.assert_not_called()
+        compliance = stats[USER_ID].taskCompliance
+        other_compliance = stats[OTHER_USER_ID].taskCompliance
+        self.assertEqual(
+            (3, 1, 1), (compliance.total, compliance.current, compliance.due)
+        )
+        self.assertEqual((3, 2), (other_compliance.total, other_compliance.current))
+        # prefetched events are left untouched for timezone conversion
+        self.assertIn(
+            f"DTSTART:{start:%Y%m%dT%H%M%S}", event[CalendarEvent.RECURRENCE_PATTERN]
+        )
+
+    @patch(f"{STATS_CALC_PATH}.CalendarService")
+    def test_failed_user_skipped(self, calendar_service):
+        service = calendar_service()
+        service.retrieve_raw_events.return_value = [
+            {CalendarEvent.USER_ID: USER_ID, CalendarEvent.IS_RECURRING: True}
+        ]
+        service.retrieve_calendar_event_logs.return_value = []
+        users = [User(id=USER_ID), User(id=OTHER_USER_ID)]
+
+        stats = UserStatsBatchCalculator(users).run()
+
+        self.assertEqual([OTHER_USER_ID], list(stats))
+        self.assertEqual(0, stats[OTHER_USER_ID].taskCompliance.total)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,16 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from extensions.authorization.tasks import calculate_stats_for_user
+from extensions.authorization.config.config import UserStatsTaskConfig
+from extensions.authorization.tasks import (
+    calculate_stats_for_users,
+    calculate_stats_per_user,
+)
 
 SAMPLE_ID = "6172725949407a22f04b182f"
+TASKS_PATH = "extensions.authorization.tasks"
+STATS_CALC_PATH = "extensions.authorization.models.stats_calculator"
+AUTH_SERVICE_PATH = "extensions.authorization.services.authorization"
 
 
 class MockUser:
@@ -12,18 +19,39 @@ class MockUser:
 
 
 class TasksTestCase(unittest.TestCase):
-    def test_success_calculate_stats_for_user(self):
-        user = MockUser()
-        auth_service = MagicMock()
-        stats_calc = MagicMock()
-        req_obj = MagicMock()
-        task = user, auth_service, stats_calc, req_obj
-        calculate_stats_for_user(task)
-        stats_calc().run.assert_called_once()
-        req_obj.from_dict.assert_called_with(
-            {req_obj.ID: SAMPLE_ID, req_obj.STATS: stats_calc().run()}
+    @patch(f"{STATS_CALC_PATH}.UserStatsBatchCalculator")
+    def test_success_calculate_stats_for_users(self, batch_calculator):
+        users = [MockUser()]
+        service = MagicMock()
+        service.update_users_stats.return_value = 1
+
+        updated = calculate_stats_for_users(users, service)
+
+        batch_calculator.assert_called_once_with(users)
+        stats = batch_calculator().run()
+        service.update_users_stats.assert_called_once_with(stats)
+        self.assertEqual(1, updated)
+
+    @patch(f"{TASKS_PATH}.calculate_stats_for_users")
+    @patch(f"{AUTH_SERVICE_PATH}.AuthorizationService")
+    @patch(f"{TASKS_PATH}.inject")
+    def test_success_calculate_stats_per_user_by_pages(
+        self, inject, auth_service, calculate_stats_for_users
+    ):
+        config = UserStatsTaskConfig.from_dict({"chunkSize": 2, "maxWorkers": 2})
+        inject.instance().server.authorization.userStats = config
+        pages = [[MockUser(), MockUser()], [MockUser(), MockUser()], [MockUser()]]
+        service = auth_service()
+        service.retrieve_users_with_user_role_in_batches.return_value = iter(pages)
+        calculate_stats_for_users.side_effect = [2, Exception("Failed"), 1]
+
+        updated = calculate_stats_per_user()
+
+        service.retrieve_users_with_user_role_in_batches.assert_called_once_with(
+            ("timezone",), 2
         )
-        auth_service().update_user_profile.assert_called_with(req_obj.from_dict())
+        self.assertEqual(3, calculate_stats_for_users.call_count)
+        self.assertEqual(3, updated)
 
 
 if __name__ == "__main__":
@@ -508,6 +508,22 @@ class UserProfileRouterTestCase(unittest.TestCase):
             use_case().execute.assert_called_with(req_obj.from_dict())
             jsonify.assert_called_with(use_case().execute().value.to_dict())
 
+    @patch(f"{USER_PROFILE_ROUTER_PATH}.jsonify")
+    @patch(f"{USER_PROFILE_ROUTER_PATH}.RetrieveDeploymentConfigUseCase")
+    @patch(f"{USER_PROFILE_ROUTER_PATH}.RetrieveDeploymentConfigRequestObject")
+    @patch(f"{USER_PROFILE_ROUTER_PATH}.g")
+    def test_retrieve_deployment_config_not_modified(
+        self, g_mock, req_obj, use_case, jsonify
+    ):
+        use_case().execute().etag = "etag"
+        headers = {"If-None-Match": '"etag"'}
+        with testapp.test_request_context("/", method="GET", headers=headers):
+            response = retrieve_deployment_config(SAMPLE_ID)
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(("etag", False), response.get_etag())
+        jsonify.assert_not_called()
+
     @patch(f"{USER_PROFILE_ROUTER_PATH}.jsonify")
     @patch(f"{USER_PROFILE_ROUTER_PATH}.RemoveRolesUseCase")
     @patch(f"{USER_PROFILE_ROUTER_PATH}.RemoveRolesRequestObject")
@@ -1,7 +1,7 @@
 import json
 from pathlib import Path
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from extensions.autocomplete.models.modules.az_vaccine_batch_number_autocomplete import (
     AZVaccineBatchNumberModule,
@@ -12,7 +12,12 @@ from extensions.autocomplete.models.modules.medications_autocomplete import (
 from extensions.autocomplete.models.modules.symptoms_autocomplete import (
     SymptomsAutocompleteModule,
 )
-from sdk.common.exceptions.exceptions import InvalidRequestException
+from sdk.common.exceptions.exceptions import (
+    InvalidRequestException,
+    ObjectDoesNotExist,
+)
+
+AUTOCOMPLETE_MODULE_PATH = "extensions.autocomplete.models.autocomplete_module"
 
 
 def get_file_cache() -> dict:
@@ -46,7 +51,6 @@ class SymptomsAutocompleteTests(TestCase):
     def test_success_retrieve_search_result_with_en(self):
         self.assertEqual(
             [
-                "Discomfort in joints",
                 "Joint ache",
                 "Joint dislocation",
                 "Joint infection",
@@ -58,6 +62,7 @@ class SymptomsAutocompleteTests(TestCase):
                 "Joint stiffness",
                 "Joint swelling",
                 "Joint warmth",
+                "Discomfort in joints",
                 "Vaccination site joint discomfort",
                 "Vaccination site joint erythema",
                 "Vaccination site joint infection",
@@ -108,6 +113,30 @@ class MedicationAutocompleteTests(TestCase):
         self.assertEqual([], self.module.retrieve_search_result("notexist"))
 
 
+@patch(f"{AUTOCOMPLETE_MODULE_PATH}.report_exception", MagicMock())
+class AutocompleteMetadataCheckTests(TestCase):
+    def setUp(self) -> None:
+        self.module = SymptomsAutocompleteModule()
+
+    @patch.object(SymptomsAutocompleteModule, "_retrieve_metadata")
+    def test_metadata_checked_once_per_interval(self, retrieve_metadata):
+        retrieve_metadata.side_effect = ObjectDoesNotExist
+        for _ in range(3):
+            result = self.module.retrieve_search_result("joint pain")
+            self.assertEqual(["Joint pain", "Vaccination site joint pain"], result)
+
+        retrieve_metadata.assert_called_once()
+
+    @patch.object(SymptomsAutocompleteModule, "_retrieve_metadata")
+    def test_metadata_checked_after_invalidation(self, retrieve_metadata):
+        retrieve_metadata.side_effect = ObjectDoesNotExist
+        self.module.retrieve_search_result("joint")
+        self.module.invalidate_cache("en")
+        self.module.retrieve_search_result("joint")
+
+        self.assertEqual(2, retrieve_metadata.call_count)
+
+
 class AZVaccineAutocompleteTests(TestCase):
     def setUp(self) -> None:
         self.module = AZVaccineBatchNumberModule()
@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+from extensions.autocomplete.models.search_index import AutocompleteSearchIndex
+
+VALUES = ["Bone pain", "Pain", "Back pain", "Painful joints", "Verzögerung", "Progerie"]
+
+
+class AutocompleteSearchIndexTestCase(TestCase):
+    def setUp(self) -> None:
+        self.index = AutocompleteSearchIndex(VALUES)
+
+    def test_results_ranked_exact_prefix_infix(self):
+        self.assertEqual(
+            ["Pain", "Painful joints", "Bone pain", "Back pain"],
+            self.index.search("PAIN"),
+        )
+
+    def test_short_search_key(self):
+        self.assertEqual(["Back pain"], self.index.search("ck"))
+
+    def test_key_without_accents_matches_accented_values(self):
+        self.assertEqual(["Verzögerung", "Progerie"], self.index.search("oger"))
+
+    def test_accents_in_key_respected(self):
+        self.assertEqual(["Verzögerung"], self.index.search("öger"))
+
+    def test_empty_key_returns_all_values(self):
+        self.assertEqual(VALUES, self.index.search(""))
+
+    def test_no_match(self):
+        self.assertEqual([], self.index.search("pains"))
+
+    def test_find_equal(self):
+        self.assertEqual(["Pain"], self.index.find_equal("Pain"))
+        self.assertEqual([], self.index.find_equal("pain"))
+        self.assertEqual(["Pain"], self.index.find_equal("pain", case_sensitive=False))
@@ -0,0 +1,179 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from extensions.authorization.events import PostUserOffBoardEvent
+from extensions.authorization.models.role.default_roles import DefaultRoles
+from extensions.authorization.models.user import BoardingStatus, User
+from extensions.dashboard.callbacks.gadget_metrics_callbacks import (
+    increment_off_boarded_metrics,
+)
+from extensions.dashboard.config.config import DashboardConfig
+from extensions.dashboard.models.gadget_metrics import DeploymentGadgetMetrics
+from extensions.dashboard.repository.mongo_dashboard_repository import (
+    MongoDashboardRepository,
+)
+from extensions.dashboard.service.gadget_metrics_service import GadgetMetricsService
+from extensions.deployment.models.deployment import Deployment
+from extensions.identity_verification.modules import IdentityVerificationModule
+from sdk.common.utils import inject
+
+DEPLOYMENT_ID = "5d386cc6ff885918d96edb2c"
+USER_ID = "5e8f0c74b50aa9656c34789c"
+ID_VERIFICATION = IdentityVerificationModule.name
+
+
+def sample_deployment() -> Deployment:
+    return Deployment.from_dict(
+        {
+            Deployment.ID: DEPLOYMENT_ID,
+            Deployment.ONBOARDING_CONFIGS: [
+                {"onboardingId": ID_VERIFICATION, "order": 1, "status": "ENABLED"}
+            ],
+        }
+    )
+
+
+def sample_user(**fields) -> User:
+    return User.from_dict(
+        {
+            User.ID: USER_ID,
+            User.ROLES: [{"roleId": "User", "resource": f"deployment/{DEPLOYMENT_ID}"}],
+            **fields,
+        }
+    )
+
+
+class GadgetMetricsServiceTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        inject.clear_and_configure(
+            lambda binder: binder.bind(DefaultRoles, DefaultRoles())
+        )
+        self.repo = MagicMock()
+        self.auth_repo = MagicMock()
+        self.auth_repo.retrieve_user_profiles.return_value = ([], None)
+        self.server_config = MagicMock()
+        self.server_config.server.dashboard = DashboardConfig.from_dict(
+            {"gadgetMetrics": {"enabled": True, "maxAgeMinutes": 30}}
+        )
+
+    def _service(self) -> GadgetMetricsService:
+        return GadgetMetricsService(
+            repo=self.repo,
+            auth_repo=self.auth_repo,
+            econsent_repo=MagicMock(),
+            deployment_repo=MagicMock(),
+            server_config=self.server_config,
+        )
+
+    def _stored_metrics(self, age: timedelta) -> DeploymentGadgetMetrics:
+        return DeploymentGadgetMetrics(
+            deploymentId=DEPLOYMENT_ID,
+            signedUp=10,
+            completedModules={ID_VERIFICATION: 4},
+            updateDateTime=datetime.utcnow() - age,
+        )
+
+    def test_fresh_metrics_read_without_user_queries(self):
+        stored = self._stored_metrics(timedelta(minutes=5))
+        self.repo.retrieve_gadget_metrics.return_value = [stored]
+
+        metrics = self._service().retrieve_deployments_metrics([sample_deployment()])
+
+        self.assertIs(stored, metrics[DEPLOYMENT_ID])
+        self.auth_repo.retrieve_user_profiles.assert_not_called()
+        self.repo.update_gadget_metrics.assert_not_called()
+
+    def test_stale_metrics_calculated_live_and_stored(self):
+        stale = self._stored_metrics(timedelta(hours=1))
+        self.repo.retrieve_gadget_metrics.return_value = [stale]
+        verified = sample_user(
+            verificationStatus=User.VerificationStatus.ID_VERIFICATION_SUCCEEDED
+        )
+        self.auth_repo.retrieve_user_profiles.return_value = (
+            [verified, sample_user()],
+            None,
+        )
+
+        metrics = self._service().retrieve_deployments_metrics([sample_deployment()])
+
+        calculated = metrics[DEPLOYMENT_ID]
+        self.assertEqual(2, calculated.signedUp)
+        self.assertEqual({ID_VERIFICATION: 1}, calculated.completedModules)
+        self.repo.update_gadget_metrics.assert_called_once_with(calculated)
+
+    def test_metrics_without_enabled_module_are_stale(self):
+        stored = self._stored_metrics(timedelta(minutes=5))
+        stored.completedModules = {}
+
+        self.assertFalse(stored.is_fresh(timedelta(minutes=30), [ID_VERIFICATION]))
+        self.assertTrue(stored.is_fresh(timedelta(minutes=30), []))
+
+    def test_disabled_metrics_not_materialized(self):
+        self.server_config.server.dashboard = DashboardConfig()
+
+        self._service().retrieve_deployments_metrics([sample_deployment()])
+
+        self.repo.retrieve_gadget_metrics.assert_not_called()
+        self.repo.update_gadget_metrics.assert_not_called()
+
+    def test_reconciliation_removes_metrics_of_deleted_deployments(self):
+        deleted_id = "5d386cc6ff885918d96edb2d"
+        self.repo.retrieve_gadget_metrics_deployment_ids.return_value = [
+            DEPLOYMENT_ID,
+            deleted_id,
+        ]
+        service = self._service()
+        service._deployment_repo.retrieve_deployments_by_ids.return_value = [
+            sample_deployment()
+        ]
+
+        self.assertEqual(1, service.reconcile_gadget_metrics())
+        self.repo.update_gadget_metrics.assert_called_once()
+        self.repo.delete_gadget_metrics.assert_called_once_with([deleted_id])
+
+
+class GadgetMetricsCallbacksTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        inject.clear_and_configure(
+            lambda binder: binder.bind(DefaultRoles, DefaultRoles())
+        )
+
+    def test_off_boarded_counter_incremented(self):
+        repo, auth_repo = MagicMock(), MagicMock()
+        reason = BoardingStatus.ReasonOffBoarded.USER_WITHDRAW_EICF
+        auth_repo.retrieve_simple_user_profile.return_value = sample_user(
+            boardingStatus={"status": 1, "reasonOffBoarded": reason.value}
+        )
+
+        increment_off_boarded_metrics(
+            PostUserOffBoardEvent(USER_ID, "detail"), repo=repo, auth_repo=auth_repo
+        )
+
+        repo.increment_gadget_metrics.assert_called_once_with(
+            DEPLOYMENT_ID, {DeploymentGadgetMetrics.WITHDREW_CONSENT: 1}
+        )
+
+
+class MongoGadgetMetricsTestCase(unittest.TestCase):
+    def test_metrics_round_trip(self):
+        db = MagicMock()
+        repo = MongoDashboardRepository(database=db)
+        metrics = DeploymentGadgetMetrics(
+            deploymentId=DEPLOYMENT_ID,
+            signedUp=3,
+            completedModules={ID_VERIFICATION: 2},
+            updateDateTime=datetime.utcnow(),
+        )
+
+        repo.update_gadget_metrics(metrics)
+
+        collection = db[MongoDashboardRepository.GADGET_METRICS_COLLECTION]
+        query, document = collection.replace_one.call_args.args
+        self.assertNotIn(DeploymentGadgetMetrics.DEPLOYMENT_ID, document)
+        collection.find.return_value = [{**document, **query}]
+        self.assertEqual([metrics], repo.retrieve_gadget_metrics([DEPLOYMENT_ID]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+from unittest.mock import MagicMock
+
+from extensions.deployment.config.config import DeploymentCacheConfig
+from extensions.deployment.models.deployment import Deployment
+from extensions.deployment.repository.cached_deployment_repository import (
+    invalidates_deployment,
+)
+from extensions.deployment.repository.deployment_cache import DeploymentCache
+from sdk.common.caching.repo.caching_repo import CachingRepository
+from sdk.common.caching.service import CachingService
+from sdk.versioning.models.version import Version
+
+DEPLOYMENT_ID = "5ded7cfa844317000162d5e7"
+
+
+class InMemoryCachingRepository(CachingRepository):
+    def __init__(self):
+        self.storage = {}
+
+    def get(self, key: str):
+        return self.storage.get(key)
+
+    def set(self, cached_object, expires_in: int):
+        self.storage[cached_object.key] = cached_object
+
+    def delete(self, key: str):
+        self.storage.pop(key, None)
+
+
+def get_deployment(version: int = 0, name: str = "Deployment") -> Deployment:
+    return Deployment.from_dict({"id": DEPLOYMENT_ID, "name": name, "version": version})
+
+
+class DeploymentCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.redis = InMemoryCachingRepository()
+        version = Version.from_dict({"server": "1.0.0", "api": "v1"})
+        caching = CachingService(repo=self.redis, version=version)
+        self.cache = DeploymentCache(DeploymentCacheConfig(), caching)
+        self.loader = MagicMock(return_value=get_deployment())
+
+    def test_deployment_loaded_once_per_revision(self):
+        first = self.cache.retrieve(DEPLOYMENT_ID, self.loader)
+        second = self.cache.retrieve(DEPLOYMENT_ID, self.loader)
+
+        self.loader.assert_called_once()
+        self.assertEqual(first.to_dict(), second.to_dict())
+
+    def test_retrieve_returns_copy(self):
+        first = self.cache.retrieve(DEPLOYMENT_ID, self.loader)
+        first.name = "Changed"
+
+        second = self.cache.retrieve(DEPLOYMENT_ID, self.loader)
+        self.assertEqual("Deployment", second.name)
+
+    def test_retrieved_deployments_independent(self):
+        self.loader.return_value.keyActions = []
+        self.loader.return_value.localizations = {"en": {"key": "value"}}
+        first = self.cache.retrieve(DEPLOYMENT_ID, self.loader)
+        first.keyActions.append(None)
+        first.to_dict()["localizations"]["en"]["key"] = "changed"
+
+        second = self.cache.retrieve(DEPLOYMENT_ID, self.loader)
+        self.assertIs(Deployment, type(second))
+        self.assertEqual([], second.keyActions)
+        self.assertEqual({"en": {"key": "value"}}, second.localizations)
+
+    def test_deployment_loaded_during_invalidation_not_cached(self):
+        def load_before_write():
+            self.cache.invalidate(DEPLOYMENT_ID)
+            return get_deployment(name="Stale")
+
+        self.loader.side_effect = load_before_write
+        stale = self.cache.retrieve(DEPLOYMENT_ID, self.loader)
+        self.assertEqual({}, self.redis.storage)
+
+        self.loader.side_effect = None
+        self.loader.return_value = get_deployment(version=1, name="Updated")
+        deployment = self.cache.retrieve(DEPLOYMENT_ID, self.loader)
+
+        self.assertEqual("Stale", stale.name)
+        self.assertEqual("Updated", deployment.name)
+        self.assertEqual(2, self.loader.call_count)
+
+    def test_deployment_restored_from_redis_in_other_worker(self):
+        self.cache.retrieve(DEPLOYMENT_ID, self.loader)
+        other_worker = DeploymentCache(DeploymentCacheConfig(), self.cache._caching)
+
+        deployment = other_worker.retrieve(DEPLOYMENT_ID, self.loader)
+
+        self.loader.assert_called_once()
+        self.assertEqual(DEPLOYMENT_ID, deployment.id)
+
+    def test_invalidate_reloads_deployment(self):
+        self.cache.retrieve(DEPLOYMENT_ID, self.loader)
+        self.loader.return_value = get_deployment(version=1, name="Updated")
+
+        self.cache.invalidate(DEPLOYMENT_ID)
+        deployment = self.cache.retrieve(DEPLOYMENT_ID, self.loader)
+
+        self.assertEqual(2, self.loader.call_count)
+        self.assertEqual("Updated", deployment.name)
+
+    def test_local_entries_evicted_over_size(self):
+        config = DeploymentCacheConfig.from_dict({"localSize": 1})
+        cache = DeploymentCache(config, MagicMock(get=MagicMock(return_value=None)))
+        cache.retrieve(DEPLOYMENT_ID, self.loader)
+        other = Deployment.from_dict({"id": "5ded7cfa844317000162d5e8"})
+        cache.retrieve(other.id, MagicMock(return_value=other))
+
+        self.assertEqual([other.id], list(cache._local))
+
+    def test_write_invalidates_deployment(self):
+        class Repo:
+            _deployment_cache = MagicMock()
+
+            @invalidates_deployment
+            def update_module_config(self, deployment_id: str, config):
+                return config
+
+            @invalidates_deployment
+            def update_deployment(self, deployment: Deployment):
+                return deployment.id
+
+        repo = Repo()
+        repo.update_module_config(deployment_id=DEPLOYMENT_ID, config=None)
+        repo._deployment_cache.invalidate.assert_called_with(DEPLOYMENT_ID)
+
+        repo._deployment_cache.reset_mock()
+        repo.update_deployment(get_deployment())
+        repo._deployment_cache.invalidate.assert_called_with(DEPLOYMENT_ID)
+
+        repo._deployment_cache.reset_mock()
+        repo.update_module_config(DEPLOYMENT_ID, None)
+        repo._deployment_cache.invalidate.assert_called_with(DEPLOYMENT_ID)
+
+        repo._deployment_cache.reset_mock()
+        repo.update_deployment(deployment=get_deployment())
+        repo._deployment_cache.invalidate.assert_called_with(DEPLOYMENT_ID)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,50 @@
 import unittest
+from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 
+from bson import ObjectId
+
 from extensions.authorization.models.role.role import RoleName
 from extensions.authorization.models.user import User, TaskCompliance
 from extensions.deployment.models.stats_calculator import DeploymentStatsCalculator
+from sdk.calendar.models.calendar_event import CalendarEvent, CalendarEventLog
+from sdk.common.utils.validators import utc_str_field_to_val
 
 STATS_CALC_PATH = "extensions.deployment.models.stats_calculator"
+USER_ID = "5e8f0c74b50aa9656c34789b"
+OTHER_USER_ID = "5e8f0c74b50aa9656c34789c"
+
+
+def sample_event(user_id: str, days_ago: int) -> dict:
+    start = datetime.utcnow().replace(second=0, microsecond=0) - timedelta(
+        days=days_ago
+    )
+    return {
+        CalendarEvent.ID: str(ObjectId()),
+        CalendarEvent.USER_ID: user_id,
+        CalendarEvent.MODEL: "KeyAction",
+        CalendarEvent.IS_RECURRING: True,
+        CalendarEvent.RECURRENCE_PATTERN: (
+            f"DTSTART:{start:%Y%m%dT%H%M%S}\nRRULE:FREQ=YEARLY"
+        ),
+        CalendarEvent.INSTANCE_EXPIRES_IN: "P2D",
+    }
+
+
+def sample_log(event: dict, days_ago: int) -> CalendarEventLog:
+    start = datetime.utcnow().replace(second=0, microsecond=0) - timedelta(
+        days=days_ago
+    )
+    return CalendarEventLog.from_dict(
+        {
+            CalendarEventLog.MODEL: "KeyAction",
+            CalendarEventLog.USER_ID: event[CalendarEvent.USER_ID],
+            CalendarEventLog.PARENT_ID: event[CalendarEvent.ID],
+            CalendarEventLog.START_DATE_TIME: utc_str_field_to_val(start),
+            CalendarEventLog.END_DATE_TIME: utc_str_field_to_val(start),
+            CalendarEventLog.CREATE_DATE_TIME: utc_str_field_to_val(start),
+        }
+    )
 
 
 class DeploymentStatsCalculatorTestCase(unittest.TestCase):
@@ -128,6 +167,61 @@ class DeploymentStatsCalculatorTestCase(unittest.TestCase):
         sample = TaskCompliance.from_dict(task_dict)
         self.assertIsNone(sample.percentage)
 
+    @patch(f"{STATS_CALC_PATH}.DeploymentStatsCalculator._retrieve_user_timezones")
+    @patch(f"{STATS_CALC_PATH}.CalendarService")
+    def test_task_compliance_rate_calculated_in_batch(
+        self, calendar_service, user_timezones
+    ):
+        self.deployment.createDateTime = datetime.utcnow() - timedelta(days=10)
+        user_timezones.return_value = {
+            USER_ID: "UTC",
+            OTHER_USER_ID: "Europe/London",
+        }
+        completed = sample_event(USER_ID, days_ago=5)
+        other_completed = sample_event(OTHER_USER_ID, days_ago=5)
+        events = [
+            completed,
+            sample_event(USER_ID, days_ago=4),
+            sample_event(USER_ID, days_ago=1),
+            other_completed,
+        ]
+        service = calendar_service()
+        service.retrieve_raw_events.return_value = events
+        service.retrieve_calendar_event_logs.return_value = [
+            sample_log(completed, days_ago=5),
+            sample_log(other_completed, days_ago=5),
+        ]
+
+        rate = self.calculator.retrieve_task_compliance_rate()
+
+        self.assertAlmostEqual(2 / 3 * 100, rate)
+        service.retrieve_raw_events.assert_called_once()
+        user_ids = service.retrieve_raw_events.call_args.kwargs[CalendarEvent.USER_ID]
+        self.assertEqual({"$in": [USER_ID, OTHER_USER_ID]}, user_ids)
+        service.retrieve_calendar_events_between_two_dates.assert_not_called()
+
+    @patch(f"{STATS_CALC_PATH}.DeploymentStatsCalculator._retrieve_user_timezones")
+    @patch(f"{STATS_CALC_PATH}.CalendarService")
+    def test_task_compliance_rate_falls_back_to_per_user(
+        self, calendar_service, user_timezones
+    ):
+        user_timezones.return_value = {
+            USER_ID: "UTC",
+            OTHER_USER_ID: "UTC",
+        }
+        service = calendar_service()
+        service.retrieve_raw_events.side_effect = Exception("Query failed")
+        events = service.retrieve_calendar_events_between_two_dates
+        events.return_value = [
+            {CalendarEvent.ENABLED: False},
+            {CalendarEvent.END_DATE_TIME: "2020-01-01T10:00:00.000Z"},
+        ]
+
+        rate = self.calculator.retrieve_task_compliance_rate()
+
+        self.assertEqual(50, rate)
+        self.assertEqual(2, events.call_count)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -310,7 +310,7 @@ class ExportDeploymentsTestCase(ExportTestCase):
 
     @patch("os.remove")
     def test_convert_flatbuffer_to_json(self, mock_remove):
-        # this test is used to check if "flatc" is working and can convert flatbuffer file to json
+        # this test is used to check that flatbuffer file is decoded to json
         with tempfile.TemporaryDirectory() as tmp_dir:
             sample_file_name = "flatbuffer_sample"
             sample_file_dir = Path(__file__).parent.joinpath("fixtures")
@@ -1,11 +1,14 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from bson import ObjectId
+
 from extensions.authorization.models.user import User
 from extensions.export_deployment.models.export_deployment_models import ExportProcess
 from extensions.export_deployment.repository.mongo_export_deployment_repository import (
     MongoExportDeploymentRepository,
 )
+from extensions.module_result.models.primitives import Weight
 
 
 MONGO_REPO_PATH = (
@@ -40,6 +43,30 @@ class ExportDeploymentRepoTestCase(unittest.TestCase):
         repo.retrieve_unseen_export_process_count(user_id)
         model.objects.assert_called_with(**expected_call)
 
+    def test_retrieve_primitives_batches(self):
+        deployment_id = "601a7761b2a1b1d3bfc24b0f"
+        documents = [
+            {
+                Weight.ID_: ObjectId(),
+                Weight.USER_ID: "601a77fa06c1cba10050b16b",
+                Weight.MODULE_ID: "Weight",
+                Weight.DEPLOYMENT_ID: deployment_id,
+                Weight.VALUE: 80,
+            }
+            for _ in range(5)
+        ]
+        mockdb = MagicMock()
+        cursor = mockdb["weight"].find.return_value.sort.return_value
+        cursor.batch_size.return_value = documents
+        repo = MongoExportDeploymentRepository(mockdb)
+
+        batches = repo.retrieve_primitives_batches(
+            Weight, "Weight", deployment_id, None, None, batch_size=2
+        )
+
+        self.assertEqual([2, 2, 1], [len(batch) for batch in batches])
+        cursor.batch_size.assert_called_with(2)
+
 
 if __name__ == "__main__":
     unittest.main()
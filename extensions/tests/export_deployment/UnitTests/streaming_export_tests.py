@@ -0,0 +1,173 @@
+import csv
+import io
+import json
+import tempfile
+import zipfile
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from extensions.deployment.models.deployment import Deployment
+from extensions.export_deployment.helpers.streaming_archive import (
+    StreamingExportArchive,
+)
+from extensions.export_deployment.use_case.export_request_objects import (
+    ExportRequestObject,
+)
+from extensions.export_deployment.use_case.export_use_cases import (
+    StreamingExportDeploymentUseCase,
+)
+from extensions.export_deployment.use_case.exportable.exportable_request_objects import (
+    ExportableRequestObject,
+)
+from extensions.export_deployment.use_case.exportable.module_exportable_use_case import (
+    ModuleExportableUseCase,
+)
+from extensions.module_result.models.primitives import Primitive, Weight
+from extensions.module_result.modules.modules_manager import ModulesManager
+
+SAMPLE_DEPLOYMENT_ID = "5fe0b3bb2896c6d525461086"
+USER_ID = "5fe0b3bb2896c6d525461087"
+OTHER_USER_ID = "5fe0b3bb2896c6d525461088"
+
+
+def sample_weight(user_id: str = USER_ID) -> Weight:
+    return Weight.from_dict(
+        {
+            Primitive.USER_ID: user_id,
+            Primitive.MODULE_ID: "Weight",
+            Primitive.DEPLOYMENT_ID: SAMPLE_DEPLOYMENT_ID,
+            Primitive.DEVICE_NAME: "iOS",
+            Primitive.START_DATE_TIME: datetime.utcnow(),
+            Weight.VALUE: 80,
+        }
+    )
+
+
+def sample_raw_data(_):
+    return {
+        "Weight": [
+            {Primitive.USER_ID: USER_ID, Primitive.MODULE_ID: "Weight", "value": 1},
+            {Primitive.USER_ID: OTHER_USER_ID, Primitive.MODULE_ID: "Weight"},
+        ]
+    }
+
+
+class StreamingExportArchiveTestCase(TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.archive = StreamingExportArchive(self.temp_dir.name)
+        self.archive_path = f"{self.temp_dir.name}/export.zip"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_json_entries_are_grouped_in_order_of_appearance(self):
+        self.archive.add_rows("data.json", ("user1", "Weight"), [{"a": 1}])
+        self.archive.add_rows("data.json", ("user2", "Weight"), [{"a": 2}])
+        self.archive.add_rows("data.json", ("user1", "Weight"), [{"a": 3}])
+        self.archive.add_rows("user1/Weight.json", (), [{"a": 1}, {"a": 3}])
+        self.archive.write(self.archive_path)
+
+        with zipfile.ZipFile(self.archive_path) as archive:
+            data = json.loads(archive.read("data.json"))
+            module_data = json.loads(archive.read("user1/Weight.json"))
+            index = archive.read("index.txt").decode()
+
+        expected = {
+            "user1": {"Weight": [{"a": 1}, {"a": 3}]},
+            "user2": {"Weight": [{"a": 2}]},
+        }
+        self.assertEqual(expected, data)
+        self.assertEqual([{"a": 1}, {"a": 3}], module_data)
+        self.assertEqual("data.json\n", index)
+
+    def test_csv_entry_header_contains_all_keys(self):
+        self.archive.add_rows("Weight.csv", ("Weight",), [{"a": 1}])
+        self.archive.add_rows("Weight.csv", ("Weight",), [{"b": "x", "a": 2}])
+        self.archive.write(self.archive_path)
+
+        with zipfile.ZipFile(self.archive_path) as archive:
+            content = archive.read("Weight.csv").decode()
+
+        rows = list(csv.reader(io.StringIO(content)))
+        self.assertEqual([["a", "b"], ["1", ""], ["2", "x"]], rows)
+
+
+class ExecuteInBatchesTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # to initiate modules so they were available in __subclasses__()
+        ModulesManager().default_modules
+
+    def test_primitives_processed_by_batches(self):
+        export_repo = MagicMock()
+        batches = [[sample_weight(), sample_weight()], [sample_weight(OTHER_USER_ID)]]
+
+        def retrieve_batches(primitive_class, **kwargs):
+            return iter(batches) if primitive_class is Weight else iter([])
+
+        export_repo.retrieve_primitives_batches.side_effect = retrieve_batches
+        deployment_repo = MagicMock()
+        revision_method = (
+            deployment_repo.retrieve_deployment_revision_by_module_config_version
+        )
+        revision_method.return_value = None
+        use_case = ModuleExportableUseCase(export_repo, deployment_repo, MagicMock())
+        request_object = ExportableRequestObject.from_dict(
+            {
+                ExportableRequestObject.DEPLOYMENT_ID: SAMPLE_DEPLOYMENT_ID,
+                ExportableRequestObject.MODULE_NAMES: ["Weight"],
+                ExportableRequestObject.INCLUDE_USER_META_DATA: False,
+            }
+        )
+        request_object.moduleConfigVersions = {}
+
+        responses = list(use_case.execute_in_batches(request_object, batch_size=2))
+
+        self.assertEqual([2, 1], [len(r.to_json()["Weight"]) for r in responses])
+        export_repo.retrieve_primitives.assert_not_called()
+        self.assertEqual(
+            2, export_repo.retrieve_primitives_batches.call_args.kwargs["batch_size"]
+        )
+
+
+class StreamingExportDeploymentUseCaseTestCase(TestCase):
+    @patch.object(ModuleExportableUseCase, "get_raw_result", sample_raw_data)
+    def test_archive_written_to_disk_without_content(self):
+        deployment_repo = MagicMock()
+        deployment_repo.retrieve_deployment.return_value = Deployment(
+            id=SAMPLE_DEPLOYMENT_ID
+        )
+        export_repo = MagicMock()
+        export_repo.retrieve_consent_logs.return_value = []
+        use_case = StreamingExportDeploymentUseCase(
+            batch_size=10,
+            export_repo=export_repo,
+            deployment_repo=deployment_repo,
+            file_storage=MagicMock(),
+            organization_repo=MagicMock(),
+            auth_repo=MagicMock(),
+        )
+        request_object = ExportRequestObject.from_dict(
+            {
+                ExportRequestObject.DEPLOYMENT_ID: SAMPLE_DEPLOYMENT_ID,
+                ExportRequestObject.INCLUDE_USER_META_DATA: False,
+                ExportRequestObject.USE_EXPORT_PROFILE: False,
+            }
+        )
+
+        response = use_case.execute(request_object)
+
+        self.assertIsNone(response.value.content)
+        with zipfile.ZipFile(response.value.filename) as archive:
+            names = set(archive.namelist())
+            data = json.loads(archive.read(f"{USER_ID}/Weight.json"))
+        expected_names = {
+            f"{USER_ID}/Weight.json",
+            f"{USER_ID}/index.txt",
+            f"{OTHER_USER_ID}/Weight.json",
+            f"{OTHER_USER_ID}/index.txt",
+        }
+        self.assertEqual(expected_names, names)
+        self.assertEqual(1, data[0]["value"])
@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import MagicMock
+
+from bson import ObjectId
+
+from extensions.authorization.models.user import User
+from extensions.authorization.repository.mongo_auth_repository import (
+    MongoAuthorizationRepository,
+)
+from extensions.module_result.calculate_unseen_and_recent_flags import UserFlagsStats
+from extensions.module_result.models.primitives import Primitive, Weight
+from sdk.common.utils.validators import remove_none_values
+
+MODULE_CONFIG_ID = "5f1824ba504787d8d89ebecb"
+SAMPLE_ID = "5e8f0c74b50aa9656c34789c"
+
+
+class CalculateRecentFlagsTestCase(unittest.TestCase):
+    @staticmethod
+    def _stored_recent_results() -> dict:
+        weight = Weight.from_dict(
+            {
+                Primitive.USER_ID: SAMPLE_ID,
+                Primitive.MODULE_ID: Weight.__name__,
+                Primitive.MODULE_CONFIG_ID: MODULE_CONFIG_ID,
+                Primitive.DEPLOYMENT_ID: SAMPLE_ID,
+                Primitive.DEVICE_NAME: "iOS",
+                Primitive.START_DATE_TIME: "2021-01-01T10:00:00.000Z",
+                Primitive.FLAGS: {"red": 1, "amber": 2, "gray": 3},
+                Weight.VALUE: 80,
+            }
+        )
+        results = {MODULE_CONFIG_ID: [{Weight.__name__: weight}]}
+        results = MongoAuthorizationRepository.convert_recent_results_to_dict(results)
+        return remove_none_values(results)
+
+    def _calculate(self, recent_results: dict) -> dict:
+        user = {User.RECENT_MODULE_RESULTS: recent_results}
+        stats = UserFlagsStats(MagicMock())
+        return stats.calculate_recent_flags(user, [ObjectId(MODULE_CONFIG_ID)])
+
+    def test_recent_flags_from_stored_result(self):
+        flags = self._calculate(self._stored_recent_results())
+
+        self.assertEqual({"red": 1, "amber": 2, "gray": 3}, flags)
+
+    def test_recent_flags_sort_key_skipped_when_first(self):
+        recent_results = self._stored_recent_results()
+        (result,) = recent_results[MODULE_CONFIG_ID]
+        sort_key = MongoAuthorizationRepository.RECENT_RESULT_SORT_KEY
+        recent_results[MODULE_CONFIG_ID] = [{sort_key: result.pop(sort_key), **result}]
+
+        flags = self._calculate(recent_results)
+
+        self.assertEqual({"red": 1, "amber": 2, "gray": 3}, flags)
+
+
+if __name__ == "__main__":
+    unittest.main()
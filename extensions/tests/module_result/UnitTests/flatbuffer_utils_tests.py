@@ -1,22 +1,33 @@
+import struct
 import unittest
+from io import BytesIO
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from freezegun.api import FakeDatetime
 
+from extensions.common.s3object import FlatBufferS3Object
+from extensions.module_result.common.flatbuffer_tables import (
+    ECGWatchSamplesTable,
+    StepsTable,
+)
 from extensions.module_result.common.flatbuffer_utils import (
     ecg_data_points_to_array,
     process_steps_flatbuffer_file,
-    _convert_flatbuffer_to_json,
+    _download_ecg_voltages,
 )
+from sdk.common.adapter.file_storage_adapter import FileStorageAdapter
+from sdk.common.utils import inject
 
 PATH = "extensions.module_result.common.flatbuffer_utils"
 TEST_FILE_DIR = "test_file_dir"
 TEST_FILE_NAME = "test_file_name"
 TEST_FILE_PATH = f"{TEST_FILE_DIR}/{TEST_FILE_NAME}.json"
-
-
-class MockObjectToFolder(MagicMock):
-    return_value = (TEST_FILE_DIR, TEST_FILE_NAME)
+STEPS_SAMPLE_PATH = (
+    Path(__file__)
+    .parents[2]
+    .joinpath("export_deployment/IntegrationTests/fixtures/flatbuffer_sample")
+)
 
 
 data = {
@@ -25,63 +36,86 @@ data = {
 }
 
 
-class FlatBufferUtilsTestCase(unittest.TestCase):
-    @patch(f"{PATH}.json", MagicMock(return_value={}))
-    @patch(f"{PATH}.os")
-    @patch(f"{PATH}.subprocess")
-    def test___convert_flatbuffer_to_json(self, subprocess, os):
-        schema_filename = "test_schema_filename"
-        os.path.join.return_value = schema_filename
-        _convert_flatbuffer_to_json(
-            file_dir=TEST_FILE_DIR,
-            filename=TEST_FILE_NAME,
-            schema_filename=schema_filename,
+def ecg_buffer(voltages: list[float]) -> bytes:
+    """Root table with voltages only, voltage tables share one vtable"""
+    vector_pos = 32
+    voltage_vtable_pos = vector_pos + 4 + 4 * len(voltages)
+    buffer = struct.pack("<I", 24)
+    buffer += struct.pack("<9H", 18, 8, 0, 0, 0, 0, 0, 0, 4) + bytes(2)
+    buffer += struct.pack("<iI", 20, vector_pos - 28)
+    buffer += struct.pack("<I", len(voltages))
+    for index in range(len(voltages)):
+        element_pos = vector_pos + 4 + 4 * index
+        table_pos = voltage_vtable_pos + 8 + 8 * index
+        buffer += struct.pack("<I", table_pos - element_pos)
+    buffer += struct.pack("<3H", 6, 8, 4) + bytes(2)
+    for index, voltage in enumerate(voltages):
+        table_pos = voltage_vtable_pos + 8 + 8 * index
+        buffer += struct.pack("<if", table_pos - voltage_vtable_pos, voltage)
+    return buffer
+
+
+class FlatBufferTablesTestCase(unittest.TestCase):
+    def test_ecg_voltages(self):
+        root = ECGWatchSamplesTable.get_root(ecg_buffer([0.1, -25.5, 1e-3]))
+
+        self.assertEqual([0.1, -25.5, 0.001], root.mc_voltages())
+        self.assertIsNone(root.field("platform"))
+        self.assertEqual(0, root.field("classification"))
+        self.assertEqual(
+            {"voltages": [{"mcV": 0.1}]},
+            ECGWatchSamplesTable.get_root(ecg_buffer([0.1])).to_dict(),
         )
-        subprocess.run.assert_called_with(
-            [
-                schema_filename,
-                "--json",
-                "--raw-binary",
-                schema_filename,
-                "--",
-                TEST_FILE_NAME,
-                "--strict-json",
-            ],
-            capture_output=True,
-            cwd=TEST_FILE_DIR,
+
+    def test_steps_sample(self):
+        with open(STEPS_SAMPLE_PATH, "rb") as sample:
+            data = StepsTable.get_root(sample.read()).to_dict()
+
+        self.assertEqual("android", data["platform"])
+        self.assertEqual(28, len(data["stepCounterData"]))
+        self.assertEqual(
+            {
+                "deviceDetails": "null null",
+                "startDateTime": 1597911504,
+                "endDateTime": 1597911554,
+                "numberOfStep": 1,
+            },
+            data["stepCounterData"][0],
         )
-        os.remove.assert_called_with(f"{TEST_FILE_DIR}/{TEST_FILE_NAME}")
 
-    @patch(f"{PATH}.json", MagicMock(return_value={}))
-    @patch(f"{PATH}.os")
-    @patch(f"{PATH}.open")
-    @patch(f"{PATH}.download_object_to_folder", MockObjectToFolder())
-    @patch(f"{PATH}._convert_flatbuffer_to_json")
-    def test_ecg_data_points_to_array(self, flatbuffer_to_json, open, os):
-        schema_file = "ecg.fbs"
-        flatbuffer_to_json.return_value = {}
-        s3_obj = MagicMock()
-        ecg_data_points_to_array(s3_obj)
-        flatbuffer_to_json.assert_called_with(
-            TEST_FILE_DIR, TEST_FILE_NAME, schema_file
+
+class FlatBufferUtilsTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.file_storage = MagicMock()
+        inject.clear_and_configure(
+            lambda binder: binder.bind(FileStorageAdapter, self.file_storage)
+        )
+        _download_ecg_voltages.cache_clear()
+
+    def test_ecg_data_points_to_array(self):
+        self.file_storage.download_file.side_effect = lambda *_: (
+            BytesIO(ecg_buffer([1.5, 2.5])),
+            0,
+            "",
         )
-        open.assert_called_with(TEST_FILE_PATH, "rb")
-        os.remove.assert_called_with(TEST_FILE_PATH)
+        s3_obj = FlatBufferS3Object(bucket="bucket", key="key")
+
+        self.assertEqual([1.5, 2.5], ecg_data_points_to_array(s3_obj))
+        self.assertEqual([1.5, 2.5], ecg_data_points_to_array(s3_obj))
+        self.file_storage.download_file.assert_called_once_with("bucket", "key")
 
     @patch(f"{PATH}.json")
     @patch(f"{PATH}.open")
-    @patch(f"{PATH}._convert_flatbuffer_to_json")
-    def test_process_steps_flatbuffer_file(self, flatbuffer_to_json, open, json):
-        json.loads.return_value = data
-        schema_file = "steps.fbs"
-        flatbuffer_to_json.return_value = {}
+    @patch(f"{PATH}._read_flatbuffer_file")
+    def test_process_steps_flatbuffer_file(self, read_flatbuffer_file, open, json):
+        read_flatbuffer_file.return_value = data
         process_steps_flatbuffer_file(
             file_dir=TEST_FILE_DIR,
             filename=TEST_FILE_NAME,
             from_date=FakeDatetime(2012, 1, 1, 0, 0),
             to_date=FakeDatetime(2012, 2, 1, 0, 0),
         )
-        flatbuffer_to_json.assert_called_with(
-            TEST_FILE_DIR, TEST_FILE_NAME, schema_file
+        read_flatbuffer_file.assert_called_with(
+            TEST_FILE_DIR, TEST_FILE_NAME, StepsTable
         )
         open.assert_called_with(TEST_FILE_PATH, "w")
@@ -1,7 +1,12 @@
+import json
+import os
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from extensions.module_result.modules.licensed_questionnaire_module import (
+    LicensedConfigRegistry,
     LicensedQuestionnaireModule,
 )
 from extensions.tests.deployment.UnitTests.test_helpers import LICENSED_SAMPLE_KEY
@@ -49,5 +54,56 @@ class LicencedQuestionnaireModuleTestCase(unittest.TestCase):
         self.assertEqual(expected_res, result_translation)
 
 
+class LicensedConfigRegistryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.temp_dir.name)
+        self.registry = LicensedConfigRegistry(self.base_dir)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _write_body(self, module_id: str, body: dict, mtime: int = 1):
+        body_dir = self.base_dir.joinpath(module_id, "v1")
+        body_dir.mkdir(parents=True, exist_ok=True)
+        path = body_dir.joinpath("config_body.json")
+        path.write_text(json.dumps(body))
+        os.utime(path, (mtime, mtime))
+
+    def test_config_body_parsed_once(self):
+        self._write_body("sample", {"configBody": {"pages": [1]}})
+        with patch(f"{LICENSED_QUESTIONNAIRE_PATH}.read_json_file") as read:
+            read.return_value = {"configBody": {"pages": [1]}}
+            for _ in range(3):
+                body = self.registry.get_config_body("sample")
+
+        read.assert_called_once()
+        self.assertEqual({"configBody": {"pages": [1]}}, body)
+
+    def test_config_body_reloaded_on_mtime_change(self):
+        self._write_body("sample", {"version": 1}, mtime=1)
+        self.assertEqual({"version": 1}, self.registry.get_config_body("sample"))
+
+        self._write_body("sample", {"version": 2}, mtime=2)
+        self.assertEqual({"version": 2}, self.registry.get_config_body("sample"))
+
+    def test_config_body_copy_returned(self):
+        self._write_body("sample", {"configBody": {"pages": []}})
+        body = self.registry.get_config_body("sample")
+        body["configBody"]["pages"].append(1)
+
+        self.assertEqual(
+            {"configBody": {"pages": []}}, self.registry.get_config_body("sample")
+        )
+
+    def test_config_body_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            self.registry.get_config_body("missing")
+
+    def test_module_ids(self):
+        self._write_body("sample", {})
+        self.assertEqual(frozenset({"sample"}), self.registry.module_ids())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,11 @@
 import unittest
+from collections import defaultdict
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 from bson import ObjectId
 from freezegun import freeze_time
+from pymongo.errors import AutoReconnect, BulkWriteError, WriteError
 
 from extensions.common.sort import SortField
 from extensions.module_result.models.primitives import Primitive
@@ -72,6 +74,92 @@ class ModuleResultsTestCase(unittest.TestCase):
         repo.create_primitive(primitive)
         db["primitive"].insert_one.assert_called_with(primitive_dict)
 
+    def test_create_primitives_bulk_single_write_per_collection(self):
+        collections = defaultdict(MagicMock)
+        db = MagicMock()
+        db.__getitem__.side_effect = collections.__getitem__
+        repo = MongoModuleResultRepository(db)
+        primitives = [self._sample_primitive() for _ in range(3)]
+
+        ids = repo.create_primitives_bulk(primitives, save_unseen=[True, False, True])
+
+        self.assertEqual([p.id for p in primitives], ids)
+        db["primitive"].insert_many.assert_called_once()
+        documents = db["primitive"].insert_many.call_args.args[0]
+        self.assertEqual(3, len(documents))
+        unseen = Primitive.UNSEEN_PRIMITIVES_COLLECTION
+        unseen_documents = db[unseen].insert_many.call_args.args[0]
+        self.assertEqual(
+            [ids[0], ids[2]], [str(d[Primitive.ID_]) for d in unseen_documents]
+        )
+
+    def test_calculate_unseen_flags_within_range(self):
+        db = MagicMock()
+        unseen = Primitive.UNSEEN_PRIMITIVES_COLLECTION
+        db[unseen].aggregate.return_value = [
+            {
+                "_id": ObjectId(SAMPLE_ID),
+                "reds": 1,
+                "ambers": 2,
+                "grays": 1,
+                "greens": 2,
+            }
+        ]
+        repo = MongoModuleResultRepository(db)
+        start, end = datetime(2021, 1, 4), datetime(2021, 1, 11)
+
+        flags = repo.calculate_unseen_flags(
+            user_id=SAMPLE_ID,
+            module_config_ids=[SAMPLE_ID],
+            excluded_modules_ids=["CVDRiskScore"],
+            module_id="Step",
+            from_date_time=start,
+            to_date_time=end,
+        )
+
+        self.assertEqual({"red": 1, "amber": 2, "gray": 3}, flags)
+        match = db[unseen].aggregate.call_args.args[0][0]["$match"]
+        self.assertEqual(
+            {"$eq": "Step", "$nin": ["CVDRiskScore"]}, match[Primitive.MODULE_ID]
+        )
+        self.assertEqual({"$gte": start, "$lt": end}, match[Primitive.START_DATE_TIME])
+
+    def test_create_primitives_bulk_reports_errors_per_primitive(self):
+        db = MagicMock()
+        details = {"writeErrors": [{"index": 1, "code": 11000, "errmsg": "dup"}]}
+        db["primitive"].insert_many.side_effect = BulkWriteError(details)
+        repo = MongoModuleResultRepository(db)
+        primitives = [self._sample_primitive() for _ in range(3)]
+
+        results = repo.create_primitives_bulk(primitives)
+
+        self.assertIsInstance(results[1], WriteError)
+        self.assertEqual([primitives[0].id, primitives[2].id], [results[0], results[2]])
+
+    def test_create_primitives_bulk_reports_write_failure_per_primitive(self):
+        db = MagicMock()
+        error = AutoReconnect("connection lost")
+        db["primitive"].insert_many.side_effect = error
+        repo = MongoModuleResultRepository(db)
+        primitives = [self._sample_primitive() for _ in range(2)]
+
+        results = repo.create_primitives_bulk(primitives, save_unseen=[True, True])
+
+        self.assertEqual([error, error], results)
+        # unseen results are not written for failed primitives
+        db["primitive"].insert_many.assert_called_once()
+
+    @staticmethod
+    def _sample_primitive() -> Primitive:
+        return Primitive.from_dict(
+            {
+                Primitive.USER_ID: SAMPLE_ID,
+                Primitive.MODULE_ID: "Test Module Id",
+                Primitive.DEPLOYMENT_ID: SAMPLE_ID,
+                Primitive.DEVICE_NAME: "Sample device name",
+            }
+        )
+
     def test_success_retrieve_primitives(self):
         db = MagicMock()
         repo = MongoModuleResultRepository(db)
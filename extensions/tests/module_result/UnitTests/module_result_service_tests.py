@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 
 from extensions.authorization.models.user import UnseenFlags
 from extensions.common.sort import SortField
+from extensions.module_result.config.config import ModuleResultConfig, UnseenFlagsConfig
 from extensions.module_result.models.primitives import Questionnaire, Primitive
 from extensions.module_result.module_result_utils import AggregateFunc, AggregateMode
 from extensions.module_result.modules import QuestionnaireModule
@@ -10,7 +11,10 @@ from extensions.module_result.modules.module import Module
 from extensions.module_result.router.module_result_requests import (
     RetrieveUnseenModuleResultRequestObject,
 )
-from extensions.module_result.service.module_result_service import ModuleResultService
+from extensions.module_result.service.module_result_service import (
+    ModuleResultService,
+    UNSEEN_FLAGS_EXCLUDED_MODULE_IDS,
+)
 from sdk.common.constants import VALUE_IN
 from sdk.common.utils import inject
 from sdk.phoenix.config.server_config import PhoenixServerConfig
@@ -56,8 +60,11 @@ class ModuleResultServiceTestCase(unittest.TestCase):
         self.service = ModuleResultService(self.repo)
         self.deployment_service = deployment_service
 
+        self.server_config = MagicMock()
+        self.server_config.server.moduleResult = ModuleResultConfig()
+
         def configure_with_binder(binder: inject.Binder):
-            binder.bind(PhoenixServerConfig, MagicMock())
+            binder.bind(PhoenixServerConfig, self.server_config)
 
         inject.clear_and_configure(config=configure_with_binder)
         RequestObjectMock.module.apply_overall_flags_logic.reset_mock()
@@ -239,6 +246,78 @@ class ModuleResultServiceTestCase(unittest.TestCase):
         _post_create.assert_called_with(primitive)
         self.repo.create_primitive.assert_called_with(primitive, False)
 
+    @patch(f"{PATH}.ModuleResultService._post_create")
+    @patch(f"{PATH}.ModuleResultService._pre_create")
+    def test_create_primitives_bulk(self, _pre_create, _post_create):
+        primitives = [(MagicMock(), True), (MagicMock(), False), (MagicMock(), True)]
+        error = Exception()
+        _pre_create.side_effect = [None, error, None]
+        self.repo.create_primitives_bulk.return_value = ["id_1", "id_3"]
+
+        results = self.service.create_primitives_bulk(primitives)
+
+        self.assertEqual(["id_1", error, "id_3"], results)
+        self.repo.create_primitives_bulk.assert_called_once_with(
+            primitives=[primitives[0][0], primitives[2][0]],
+            save_unseen=[True, True],
+        )
+        self.assertEqual(2, _post_create.call_count)
+
+    @patch(f"{PATH}.ModuleResultService._post_create")
+    @patch(f"{PATH}.ModuleResultService._pre_create")
+    def test_create_primitives_bulk_reports_post_create_errors(
+        self, _pre_create, _post_create
+    ):
+        primitives = [(MagicMock(), True), (MagicMock(), False)]
+        error = Exception()
+        _post_create.side_effect = [error, None]
+        self.repo.create_primitives_bulk.return_value = ["id_1", "id_2"]
+
+        results = self.service.create_primitives_bulk(primitives)
+
+        self.assertEqual([error, "id_2"], results)
+
+    @patch(f"{PATH}.ModuleResultService._post_create")
+    @patch(f"{PATH}.ModuleResultService._pre_create")
+    def test_create_primitives_bulk_reports_repo_error_per_primitive(
+        self, _pre_create, _post_create
+    ):
+        primitives = [(MagicMock(), True), (MagicMock(), False)]
+        error = Exception()
+        self.repo.create_primitives_bulk.side_effect = error
+
+        results = self.service.create_primitives_bulk(primitives)
+
+        self.assertEqual([error, error], results)
+        _post_create.assert_not_called()
+
+    @patch(f"{PATH}.AuthorizationService")
+    @patch(f"{PATH}.ModuleResultService.create_primitives_bulk")
+    @patch(f"{PATH}.ModuleResultService.create_primitive")
+    @patch(f"{PATH}.ModuleResultService._post_batch_create_event")
+    @patch(f"{PATH}.ModuleResultService.update_unseen_flags")
+    def test_create_module_result_uses_bulk_for_large_batches(
+        self,
+        update_unseen_flags,
+        _post_batch_create_event,
+        create_primitive,
+        create_primitives_bulk,
+        auth_service,
+    ):
+        req_obj = RequestObjectMock()
+        req_obj.primitives = [
+            PrimitiveMock() for _ in range(ModuleResultService.BULK_CREATE_THRESHOLD)
+        ]
+        req_obj.module.calculate_rag_flags.return_value = (dict(), PrimitiveMock.flags)
+        create_primitives_bulk.return_value = [SAMPLE_ID] * len(req_obj.primitives)
+
+        result = self.service.create_module_result(req_obj)
+
+        create_primitive.assert_not_called()
+        create_primitives_bulk.assert_called_once()
+        self.assertEqual(len(req_obj.primitives), len(result["ids"]))
+        _post_batch_create_event.assert_called_with(req_obj.primitives)
+
     def test_retrieve_module_results(self):
         user_id = module_id = deployment_id = SAMPLE_ID
         skip = limit = 0
@@ -385,5 +464,105 @@ class ModuleResultServiceTestCase(unittest.TestCase):
         self.assertEqual(2, len(result.flags))
 
 
+class IncrementalUnseenFlagsTestCase(unittest.TestCase):
+    @patch(f"{PATH}.DeploymentService")
+    def setUp(self, deployment_service) -> None:
+        self.repo = MagicMock()
+        self.service = ModuleResultService(self.repo)
+        server_config = MagicMock()
+        server_config.server.moduleResult = ModuleResultConfig(
+            unseenFlags=UnseenFlagsConfig(incremental=True)
+        )
+        inject.clear_and_configure(
+            lambda binder: binder.bind(PhoenixServerConfig, server_config)
+        )
+
+    @patch(f"{PATH}.AuthorizationService")
+    @patch(f"{PATH}.ModuleResultService.create_primitive")
+    @patch(f"{PATH}.ModuleResultService._post_batch_create_event")
+    @patch(f"{PATH}.ModuleResultService.update_unseen_flags")
+    def test_created_primitives_flags_incremented(
+        self,
+        update_unseen_flags,
+        _post_batch_create_event,
+        create_primitive,
+        auth_service,
+    ):
+        req_obj = RequestObjectMock()
+        req_obj.module = MagicMock()
+        flags = {"red": 1, "amber": 2, "gray": 1, "green": 1}
+        req_obj.primitives = [PrimitiveMock(flags=flags), PrimitiveMock(flags=flags)]
+        req_obj.module.calculate_rag_flags.return_value = (dict(), flags)
+        create_primitive.side_effect = [SAMPLE_ID, Exception("Not created")]
+
+        self.service.create_module_result(req_obj)
+
+        update_unseen_flags.assert_not_called()
+        self.repo.calculate_unseen_flags.assert_not_called()
+        auth_service().increment_unseen_flags.assert_called_once_with(
+            req_obj.user.id, ModuleResultServiceTestCase.unseen_flags(1, 2, 2)
+        )
+
+    @patch(f"{PATH}.AuthorizedUser")
+    @patch(f"{PATH}.AuthorizationService")
+    def test_flushed_results_flags_decremented(self, auth_service, authz_user):
+        authz_user().deployment = DeploymentMock()
+        self.repo.calculate_unseen_flags.return_value = (
+            ModuleResultServiceTestCase.unseen_flags(2, 0, 1)
+        )
+        self.repo.flush_unseen_results.return_value = 3
+
+        self.service.flush_unseen_results(SAMPLE_ID, None)
+
+        to_date_time = self.repo.calculate_unseen_flags.call_args.kwargs["to_date_time"]
+        self.repo.flush_unseen_results.assert_called_once_with(
+            user_id=SAMPLE_ID, start_date_time=to_date_time, module_id=None
+        )
+        auth_service().increment_unseen_flags.assert_called_once_with(
+            SAMPLE_ID, ModuleResultServiceTestCase.unseen_flags(-2, 0, -1)
+        )
+
+    @patch(f"{PATH}.AuthorizedUser")
+    @patch(f"{PATH}.AuthorizationService")
+    def test_reset_flags_decremented(self, auth_service, authz_user):
+        authz_user().deployment = DeploymentMock()
+        self.repo.calculate_unseen_flags.return_value = (
+            ModuleResultServiceTestCase.unseen_flags(0, 1, 0)
+        )
+        start, end = MagicMock(), MagicMock()
+
+        self.service.reset_flags(SAMPLE_ID, "Step", start, end)
+
+        self.repo.calculate_unseen_flags.assert_called_once_with(
+            user_id=auth_service().retrieve_simple_user_profile().id,
+            module_config_ids=[ConfigMock.id],
+            excluded_modules_ids=UNSEEN_FLAGS_EXCLUDED_MODULE_IDS,
+            module_id="Step",
+            from_date_time=start,
+            to_date_time=end,
+        )
+        auth_service().increment_unseen_flags.assert_called_once_with(
+            SAMPLE_ID, ModuleResultServiceTestCase.unseen_flags(0, -1, 0)
+        )
+
+    @patch(f"{PATH}.AuthorizedUser")
+    @patch(f"{PATH}.AuthorizationService")
+    def test_reconciliation_fixes_drifted_flags(self, auth_service, authz_user):
+        authz_user().deployment = DeploymentMock()
+        user = MagicMock(unseenFlags=UnseenFlags(red=1, amber=0, gray=0))
+        auth_service().retrieve_simple_user_profile.return_value = user
+        self.repo.calculate_unseen_flags.side_effect = [
+            ModuleResultServiceTestCase.unseen_flags(1, 0, 0),
+            ModuleResultServiceTestCase.unseen_flags(2, 0, 0),
+        ]
+
+        drifted = self.service.reconcile_unseen_flags([SAMPLE_ID, "other_id"])
+
+        self.assertEqual(1, drifted)
+        auth_service().update_unseen_flags.assert_called_once_with(
+            "other_id", ModuleResultServiceTestCase.unseen_flags(2, 0, 0)
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
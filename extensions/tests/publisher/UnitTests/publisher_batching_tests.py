@@ -0,0 +1,141 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from extensions.publisher.adapters.gcp_fhir_adapter import (
+    GCPFHIRAdapter,
+    OBSERVATION_DATA,
+    PATIENT_DATA,
+)
+from extensions.publisher.adapters.webhook_adapter import WebhookAdapter
+from extensions.publisher.config.config import PublisherConfig
+from extensions.publisher.models.publisher import Publisher
+from extensions.publisher.tasks import (
+    DEPLOYMENT_ID,
+    MODULE_ID,
+    PRIMITIVES,
+    publish_data_task,
+    recreate_events,
+)
+from extensions.tests.publisher.UnitTests.UnitTests.sample_data import (
+    sample_blood_pressure,
+    sample_publishers,
+)
+
+TASKS_PATH = "extensions.publisher.tasks"
+BLOOD_PRESSURE = "BloodPressure"
+
+
+def sample_primitive_data(primitive_id: str = sample_blood_pressure.id) -> list:
+    return [
+        {
+            "id": primitive_id,
+            "name": BLOOD_PRESSURE,
+            "user_id": sample_blood_pressure.userId,
+        }
+    ]
+
+
+def sample_batch_event(primitive_id: str = sample_blood_pressure.id) -> dict:
+    return {
+        PRIMITIVES: sample_primitive_data(primitive_id),
+        MODULE_ID: BLOOD_PRESSURE,
+        DEPLOYMENT_ID: sample_blood_pressure.deploymentId,
+        "deviceName": "iOS",
+        "moduleConfigId": sample_blood_pressure.moduleConfigId,
+    }
+
+
+class RecreateEventsTestCase(unittest.TestCase):
+    def test_primitives_retrieved_with_one_query_per_collection(self):
+        repo = MagicMock()
+        repo.retrieve_primitives_by_ids.return_value = [sample_blood_pressure]
+        missing_id = "618a8595a57e07e2de456e34"
+        batch = [sample_batch_event(), sample_batch_event(missing_id)]
+
+        events = recreate_events(batch, repo=repo)
+
+        repo.retrieve_primitives_by_ids.assert_called_once()
+        name, ids = repo.retrieve_primitives_by_ids.call_args.args
+        self.assertEqual(BLOOD_PRESSURE, name)
+        self.assertEqual({sample_blood_pressure.id, missing_id}, set(ids))
+        self.assertEqual(1, len(events))
+        self.assertEqual(
+            sample_blood_pressure.id, events[0][PRIMITIVES][0][Publisher.ID]
+        )
+
+
+class PublishDataTaskBatchingTestCase(unittest.TestCase):
+    @patch(f"{TASKS_PATH}.flush_publisher_batch_task")
+    @patch(f"{TASKS_PATH}.PublisherBatchQueue")
+    @patch(f"{TASKS_PATH}.recreate_event")
+    @patch(f"{TASKS_PATH}.retrieve_matching_publishers")
+    @patch(f"{TASKS_PATH}._publisher_config")
+    def test_event_added_to_batch(
+        self, config, retrieve_publishers, recreate_event, queue, flush_task
+    ):
+        config.return_value = PublisherConfig.from_dict(
+            {"batching": {"enabled": True, "windowSeconds": 5}}
+        )
+        retrieve_publishers.return_value = [sample_publishers[0]]
+        queue().push.return_value = 1
+
+        publish_data_task(
+            sample_primitive_data(),
+            BLOOD_PRESSURE,
+            "iOS",
+            sample_blood_pressure.moduleConfigId,
+            sample_blood_pressure.deploymentId,
+        )
+
+        recreate_event.assert_not_called()
+        publisher_id, event = queue().push.call_args.args
+        self.assertEqual(sample_publishers[0].id, publisher_id)
+        self.assertEqual(sample_primitive_data(), event[PRIMITIVES])
+        flush_task.apply_async.assert_called_once_with((publisher_id,), countdown=5)
+
+
+class SendBatchTestCase(unittest.TestCase):
+    def test_webhook_batch_sent_as_array(self):
+        adapter = WebhookAdapter(publisher=sample_publishers[0])
+        adapter.transform_publisher_data = MagicMock()
+        events = [
+            {**sample_batch_event(), PRIMITIVES: [{"value": index}]}
+            for index in range(3)
+        ]
+
+        with patch(
+            "extensions.publisher.adapters.webhook_adapter.transport_pool"
+        ) as pool:
+            pool.session().request.return_value.status_code = 200
+            sent = adapter.send_batch(events)
+
+        self.assertEqual(3, sent)
+        body = json.loads(pool.session().request.call_args.kwargs["data"])
+        self.assertEqual(
+            [[{"value": i}] for i in range(3)], [m[PRIMITIVES] for m in body]
+        )
+
+    def test_fhir_transaction_creates_patient_once(self):
+        patient = {"resourceType": "Patient", "identifier": [{"value": "user"}]}
+        message = {
+            OBSERVATION_DATA: {"resourceType": "Observation"},
+            PATIENT_DATA: patient,
+        }
+        patient_urls = {}
+
+        entries = [
+            *GCPFHIRAdapter._transaction_entries(message, patient_urls),
+            *GCPFHIRAdapter._transaction_entries(message, patient_urls),
+        ]
+
+        urls = [entry["request"]["url"] for entry in entries]
+        self.assertEqual(["Patient", "Observation", "Observation"], urls)
+        self.assertEqual("identifier=user", entries[0]["request"]["ifNoneExist"])
+        patient_url = entries[0]["fullUrl"]
+        for entry in entries[1:]:
+            self.assertEqual(patient_url, entry["resource"]["subject"]["reference"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+from unittest.mock import MagicMock
+
+from extensions.organization.models.organization import Organization
+from extensions.publisher.adapters.transport_pool import TransportPool
+from extensions.publisher.config.config import PublisherRoutingConfig
+from extensions.publisher.models.publisher import Publisher
+from extensions.publisher.repository.publisher_index import PublisherIndex
+from sdk.common.caching.models import CachedObject
+
+DEPLOYMENT_ID = "5f652a9661c37dd829c8d23a"
+OTHER_DEPLOYMENT_ID = "617a6ade2ad9606b933e3d8e"
+ORGANIZATION_ID = "606c50a113dbea3656ff1bb0"
+
+
+def sample_publisher(name: str, listener_type: str, **filter_fields) -> Publisher:
+    return Publisher.from_dict(
+        {
+            Publisher.ID: "618a5ba0945fc88ee209214a",
+            Publisher.PUBLISHER_NAME: name,
+            Publisher.PUBLISHER_TARGET: {
+                Publisher.PUBLISHER_TYPE: Publisher.Target.Type.WEBHOOK.value,
+                Publisher.WEBHOOK: {
+                    "endpoint": "https://hook.io/a",
+                    "authType": "NONE",
+                },
+            },
+            Publisher.PUBLISHER_FILTER: {
+                Publisher.EVENT_TYPE: Publisher.Filter.EventType.MODULE_RESULT.value,
+                Publisher.LISTENER_TYPE: listener_type,
+                **filter_fields,
+            },
+            Publisher.PUBLISHER_TRANSFORM: {},
+        }
+    )
+
+
+class PublisherIndexTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.publishers = [
+            sample_publisher(
+                "deployment", "DEPLOYMENT_IDS", deploymentIds=[DEPLOYMENT_ID]
+            ),
+            sample_publisher(
+                "organization", "ORGANIZATION_IDS", organizationIds=[ORGANIZATION_ID]
+            ),
+            sample_publisher("global", "GLOBAL", excludedModuleNames=["Weight"]),
+            sample_publisher(
+                "modules",
+                "DEPLOYMENT_IDS",
+                deploymentIds=[DEPLOYMENT_ID],
+                moduleNames=["Weight"],
+            ),
+        ]
+        self.repo = MagicMock()
+        self.repo.retrieve_publishers.return_value = (self.publishers, 4)
+        self.org_repo = MagicMock()
+        self.org_repo.retrieve_organization.return_value = Organization(
+            deploymentIds=[OTHER_DEPLOYMENT_ID]
+        )
+        self.caching = MagicMock()
+        self.caching.get.return_value = None
+        self.index = PublisherIndex(
+            PublisherRoutingConfig(), self.repo, self.org_repo, self.caching
+        )
+
+    def _names(self, deployment_id: str, module_id: str) -> list[str]:
+        publishers = self.index.retrieve_publishers(deployment_id, module_id)
+        return [publisher.name for publisher in publishers]
+
+    def test_publishers_matched_by_deployment_and_module(self):
+        self.assertEqual(
+            ["deployment", "modules"], self._names(DEPLOYMENT_ID, "Weight")
+        )
+        self.assertEqual(
+            ["deployment", "global"], self._names(DEPLOYMENT_ID, "BloodPressure")
+        )
+        self.assertEqual(
+            ["organization", "global"],
+            self._names(OTHER_DEPLOYMENT_ID, "BloodPressure"),
+        )
+
+    def test_index_built_once(self):
+        for _ in range(3):
+            self._names(DEPLOYMENT_ID, "Weight")
+
+        self.repo.retrieve_publishers.assert_called_once()
+        self.org_repo.retrieve_organization.assert_called_once()
+
+    def test_index_rebuilt_on_revision_change(self):
+        self._names(DEPLOYMENT_ID, "Weight")
+        self.caching.get.return_value = CachedObject(key="key", contentHash="2")
+        self._names(DEPLOYMENT_ID, "Weight")
+        self._names(DEPLOYMENT_ID, "Weight")
+
+        self.assertEqual(2, self.repo.retrieve_publishers.call_count)
+
+    def test_invalidate_updates_revision(self):
+        self.index.invalidate()
+
+        key, content, revision = self.caching.set.call_args.args
+        self.assertEqual(PublisherIndex.REVISION_KEY, key)
+        self.assertTrue(revision)
+
+
+class TransportPoolTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = TransportPool(max_size=1)
+        self.publisher = sample_publisher(
+            "deployment", "DEPLOYMENT_IDS", deploymentIds=[DEPLOYMENT_ID]
+        )
+
+    def test_transport_reused(self):
+        create = MagicMock()
+
+        first = self.pool.producer(self.publisher, create)
+        second = self.pool.producer(self.publisher, create)
+
+        self.assertIs(first, second)
+        create.assert_called_once()
+
+    def test_evicted_and_closed_transports_flushed(self):
+        producer = self.pool.producer(self.publisher, MagicMock())
+        self.publisher.target.retry = 5
+        other_producer = self.pool.producer(self.publisher, MagicMock())
+        producer.flush.assert_called_once()
+
+        self.pool.close()
+        other_producer.flush.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
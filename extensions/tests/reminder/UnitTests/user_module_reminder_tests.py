@@ -114,6 +114,53 @@ class UserModuleReminderToDictTestCase(unittest.TestCase):
         set_title.assert_called_with(authz_user().get_language())
         auth_service().retrieve_simple_user_profile.assert_called_with(user_id=user_id)
 
+    @patch(f"{REMINDER_PATH}.NotificationService")
+    @patch(f"{REMINDER_PATH}.AuthorizationService")
+    def test_execute_many_pushes_reminders_at_once(self, auth_service, notifications):
+        user_ids = ["611a463797ed5e9bfd8a2ae0", "611a463797ed5e9bfd8a2ae1"]
+        reminders = [
+            UserModuleReminder(
+                moduleId="HeartRate",
+                moduleConfigId="some_config_id",
+                userId=user_id,
+                title="title",
+                description="description",
+            )
+            for user_id in user_ids
+        ]
+
+        UserModuleReminder.execute_many(reminders, run_async=False)
+
+        auth_service().retrieve_simple_user_profiles_by_ids.assert_not_called()
+        (pushes,), kwargs = notifications().push_for_users.call_args
+        self.assertEqual(user_ids, [push.userId for push in pushes])
+        self.assertEqual(pushes[0].android, pushes[1].android)
+        self.assertFalse(kwargs["run_async"])
+
+    @patch(f"{REMINDER_PATH}.AuthorizedUser")
+    @patch(f"{REMINDER_PATH}.NotificationService", MagicMock())
+    @patch(f"{REMINDER_PATH}.UserModuleReminder.set_default_title_and_description")
+    @patch(f"{REMINDER_PATH}.AuthorizationService")
+    def test_execute_many_retrieves_languages_at_once(
+        self, auth_service, set_title, authz_user
+    ):
+        user_id = "611a463797ed5e9bfd8a2ae0"
+        auth_service().retrieve_simple_user_profiles_by_ids.return_value = [
+            MagicMock(id=user_id)
+        ]
+        reminders = [
+            UserModuleReminder(moduleId=module_id, userId=user_id)
+            for module_id in ("HeartRate", "Weight")
+        ]
+
+        UserModuleReminder.execute_many(reminders)
+
+        auth_service().retrieve_simple_user_profiles_by_ids.assert_called_once_with(
+            {user_id}
+        )
+        set_title.assert_called_with(authz_user().get_language())
+        self.assertEqual(2, set_title.call_count)
+
     @patch(f"{REMINDER_PATH}.DeploymentService")
     def test_success_get_config_notification_data(self, deployment_service):
         duration_iso = "P1DT9H2M"
@@ -1,3 +1,6 @@
+from sdk.audit_logger.adapter.buffered_audit_log_writer import (
+    BufferedAuditLogWriter,
+)
 from sdk.common.adapter.audit_adapter import AuditAdapter
 from sdk.audit_logger.repo.audit_log_repository import AuditLogRepository
 from sdk.common.utils import inject
@@ -5,8 +8,11 @@ from sdk.phoenix.config.server_config import AuditLogger
 
 
 class AuditLogAdapter(AuditAdapter):
-    def __init__(self, audit_logger: AuditLogger):
+    def __init__(
+        self, audit_logger: AuditLogger, writer: BufferedAuditLogWriter = None
+    ):
         self.enable = audit_logger.enable
+        self.writer = writer
 
     def error(self, msg: str, label: str = None, *args, **kwargs):
         self._emit("ERROR", msg, label, args, kwargs)
@@ -20,7 +26,10 @@ class AuditLogAdapter(AuditAdapter):
     def _emit(self, level: str, msg: str, label: str, args, kwargs):
         message = msg.format(args=args)
         if self.enable:
+            log = {"label": label, "level": level, "message": message, **kwargs}
+            if self.writer:
+                self.writer.write(log)
+                return
+
             repo = inject.instance(AuditLogRepository)
-            repo.create_log(
-                {"label": label, "level": level, "message": message, **kwargs}
-            )
+            repo.create_log(log)
@@ -0,0 +1,189 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Callable, Optional
+
+from sdk.audit_logger.repo.audit_log_repository import AuditLogRepository
+from sdk.common.utils import inject
+from sdk.phoenix.config.server_config import AuditLogBufferConfig
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = AuditLogBufferConfig.OverflowPolicy
+FailurePolicy = AuditLogBufferConfig.FailurePolicy
+DROPPED_LOG_INTERVAL = 1000
+
+
+class BufferedAuditLogWriter:
+    """
+    Writes audit logs from a bounded in-process queue in batches, so requests
+    do not wait for the database. A background thread inserts a batch when it
+    is full or when the flush interval ends. When the queue is full, the
+    overflow policy either blocks the caller and writes on its thread, or drops
+    the log. Logs left in the queue are written on interpreter shutdown.
+    A batch which fails is retried with exponential backoff, then handled by
+    the failure policy, so audit logs are not lost silently.
+    """
+
+    def __init__(
+        self,
+        config: AuditLogBufferConfig,
+        repo_provider: Callable[[], AuditLogRepository] = None,
+    ):
+        self._config = config
+        self._repo_provider = repo_provider or (
+            lambda: inject.instance(AuditLogRepository)
+        )
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=config.maxQueueSize)
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self.written = 0
+        self.failed = 0
+        self.dropped = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queueDepth": self.queue_depth,
+            "written": self.written,
+            "failed": self.failed,
+            "dropped": self.dropped,
+        }
+
+    def write(self, log: dict):
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(log)
+            return
+        except queue.Full:
+            pass
+
+        if self._config.overflowPolicy == OverflowPolicy.DROP:
+            self._count_dropped()
+            return
+
+        try:
+            self._queue.put(log, timeout=self._config.blockTimeoutMs / 1000)
+        except queue.Full:
+            self._write_batch([log])
+
+    def flush(self):
+        """Writes all queued logs on the calling thread."""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+            if len(batch) >= self._config.batchSize:
+                self._write_batch(batch)
+                batch = []
+        if batch:
+            self._write_batch(batch)
+
+    def close(self):
+        self._stopped.set()
+        thread = self._thread
+        if thread and thread.is_alive():
+            thread.join(timeout=self._config.flushIntervalMs * 2 / 1000)
+        self.flush()
+        logger.info(f"Audit log writer closed: {self.stats()}")
+
+    def _ensure_started(self):
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+
+        with self._lock:
+            if self._pid == pid:
+                return
+            if self._pid is not None:
+                # forked process, queued logs are written by the parent process
+                self._queue = queue.Queue(maxsize=self._config.maxQueueSize)
+            else:
+                atexit.register(self.close)
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="audit-log-writer", daemon=True
+            )
+            self._thread.start()
+            self._pid = pid
+
+    def _run(self):
+        while not self._stopped.is_set():
+            batch = self._next_batch()
+            if batch:
+                self._write_batch(batch)
+
+    def _next_batch(self) -> list[dict]:
+        batch = []
+        deadline = time.monotonic() + self._config.flushIntervalMs / 1000
+        while len(batch) < self._config.batchSize:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: list[dict]):
+        repo = self._repo_provider()
+        attempts = self._config.writeRetries + 1
+        for attempt in range(attempts):
+            if attempt:
+                time.sleep(self._config.retryBackoffMs * 2 ** (attempt - 1) / 1000)
+            try:
+                written = repo.create_logs(batch)
+                break
+            except Exception as error:
+                last_error = error
+        else:
+            logger.warning(
+                f"Audit logs batch of {len(batch)} not written after {attempts} "
+                f"attempts: {last_error}"
+            )
+            self._write_failed_batch(repo, batch)
+            return
+
+        if written < len(batch):
+            logger.warning(f"{len(batch) - written} audit logs of batch not written")
+        with self._lock:
+            self.written += written
+            self.failed += len(batch) - written
+
+    def _write_failed_batch(self, repo: AuditLogRepository, batch: list[dict]):
+        policy = self._config.failurePolicy
+        written = 0
+        for log in batch:
+            if policy == FailurePolicy.INSERT_EACH:
+                try:
+                    repo.create_log(log)
+                    written += 1
+                    continue
+                except Exception as error:
+                    logger.error(f"Audit log not written: {error}. Log: {log}")
+            elif policy == FailurePolicy.LOG:
+                logger.error(f"Audit log not written. Log: {log}")
+
+        with self._lock:
+            self.written += written
+            self.failed += len(batch) - written
+
+    def _count_dropped(self):
+        with self._lock:
+            self.dropped += 1
+            dropped = self.dropped
+        if dropped % DROPPED_LOG_INTERVAL == 1:
+            logger.warning(
+                f"Audit log queue is full, {dropped} logs dropped: {self.stats()}"
+            )
@@ -1,6 +1,9 @@
 import logging
 
 from sdk.audit_logger.adapter.audit_log_adapter import AuditLogAdapter
+from sdk.audit_logger.adapter.buffered_audit_log_writer import (
+    BufferedAuditLogWriter,
+)
 from sdk.audit_logger.repo.audit_log_repository import AuditLogRepository
 from sdk.audit_logger.repo.mongo_audit_log_repository import MongoAuditLogRepository
 from sdk.common.adapter.audit_adapter import AuditAdapter
@@ -17,7 +20,13 @@ def bind_audit_logger_repository(binder, conf):
 
 
 def bind_audit_adapter(binder, config):
-    audit_adapter = AuditLogAdapter(config.server.auditLogger)
+    audit_logger = config.server.auditLogger
+    writer = None
+    if audit_logger.buffer.enabled:
+        writer = BufferedAuditLogWriter(audit_logger.buffer)
+        logger.debug("Audit logs are written in batches by BufferedAuditLogWriter")
+
+    audit_adapter = AuditLogAdapter(audit_logger, writer)
     binder.bind(AuditAdapter, audit_adapter)
 
     logger.debug(f"AuditAdapter is configured")
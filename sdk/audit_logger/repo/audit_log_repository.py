@@ -5,3 +5,8 @@ class AuditLogRepository(ABC):  # pragma: no cover
     @abstractmethod
     def create_log(self, data: dict) -> str:
         raise NotImplementedError
+
+    @abstractmethod
+    def create_logs(self, logs: list[dict]) -> int:
+        """Inserts logs in one batch and returns the number of inserted logs."""
+        raise NotImplementedError
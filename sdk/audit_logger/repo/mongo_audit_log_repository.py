@@ -1,4 +1,5 @@
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError
 
 from sdk.audit_logger.repo.audit_log_repository import AuditLogRepository
 from sdk.common.utils.inject import autoparams
@@ -14,3 +15,10 @@ class MongoAuditLogRepository(AuditLogRepository):
     def create_log(self, data: dict) -> str:
         result = self.db[self.AUDIT_LOG_COLLECTION].insert_one(data)
         return str(result.inserted_id)
+
+    def create_logs(self, logs: list[dict]) -> int:
+        try:
+            result = self.db[self.AUDIT_LOG_COLLECTION].insert_many(logs, ordered=False)
+        except BulkWriteError as error:
+            return error.details["nInserted"]
+        return len(result.inserted_ids)
@@ -13,6 +13,7 @@ from sdk.auth.di.components import bind_auth_repository
 from sdk.auth.events.set_auth_attributes_events import PostSetAuthAttributesEvent
 from sdk.auth.router.auth_router import api, api_v1, sign_up, check_auth_attributes
 from sdk.auth.events.sign_out_event import SignOutEventV1
+from sdk.auth.identity_cache import identity_cache
 from sdk.auth.router.deeplink_router import deeplink_api
 from sdk.common.adapter.event_bus_adapter import EventBusAdapter
 from sdk.common.utils.inject import Binder, autoparams
@@ -41,6 +42,8 @@ class AuthComponent(PhoenixBaseComponent):
 
     def bind(self, binder: Binder, config: PhoenixServerConfig):
         bind_auth_repository(binder, config)
+        auth_config = config.server.auth or AuthConfig()
+        identity_cache.configure(auth_config.identityCache)
 
     @property
     def blueprint(self) -> Optional[Union[Blueprint, list[Blueprint]]]:
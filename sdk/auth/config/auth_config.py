@@ -1,9 +1,16 @@
 from dataclasses import field
 
-from sdk.common.utils.convertible import convertibleclass, default_field
+from sdk.common.utils.convertible import convertibleclass, default_field, meta
 from sdk.limiter.config.limiter import AuthLimiterConfig
 
 
+@convertibleclass
+class IdentityCacheConfig:
+    enabled: bool = field(default=False)
+    ttlSeconds: int = field(default=5, metadata=meta(lambda n: n > 0))
+    maxSize: int = field(default=10000, metadata=meta(lambda n: n > 0))
+
+
 @convertibleclass
 class AuthConfig:
     enable: bool = field(default=True)
@@ -13,3 +20,4 @@ class AuthConfig:
     database: str = default_field()
     rateLimit: AuthLimiterConfig = default_field()
     signedUrlSecret: str = default_field()
+    identityCache: IdentityCacheConfig = field(default_factory=IdentityCacheConfig)
@@ -7,6 +7,7 @@ from sentry_sdk import set_user
 
 from sdk.auth.enums import AuthStage, Method
 from sdk.auth.events.token_extraction_event import TokenExtractionEvent
+from sdk.auth.identity_cache import IdentityCache, identity_cache
 from sdk.auth.model.auth_user import AuthUser
 from sdk.auth.repository.auth_repository import AuthRepository
 from sdk.auth.use_case.auth_use_cases import (
@@ -64,10 +65,15 @@ def mfa_check(client: Client, user: AuthUser, decoded_token: dict):
         check_token_valid_for_mfa(decoded_token)
 
 
-def get_auth_user(user_id: str) -> AuthUser:
+def get_auth_user(user_id: str, token_issued_at: int = None) -> AuthUser:
     set_user({SentryAdapter.USER_ID: user_id})
     auth_repo = inject.instance(AuthRepository)
-    auth_user = auth_repo.get_user(uid=user_id)
+    auth_user = identity_cache.get_or_load(
+        IdentityCache.AUTH_USER,
+        user_id,
+        lambda: auth_repo.get_user(uid=user_id),
+        version=token_issued_at,
+    )
     if not auth_user:
         logger.warning(f"An identity {user_id} without user in db tried to access")
         raise DetailedException(InvalidRequestException, "Unauthorised User", 401)
@@ -101,8 +107,9 @@ def check_auth(extract_auth_user=True, extract_extras=True):
         client_id = decoded_token[USER_CLAIMS_KEY]["clientId"]
         check_project(server_config.server.project, project_id)
         client: Client = get_client(server_config.server.project, client_id)
-        auth_user = get_auth_user(uid)
-        check_token_issued_after_password_update(auth_user, decoded_token.get("iat"))
+        issued_at = decoded_token.get("iat")
+        auth_user = get_auth_user(uid, issued_at)
+        check_token_issued_after_password_update(auth_user, issued_at)
         if extract_auth_user:
             mfa_check(client, auth_user, decoded_token)
     elif auth_type == AuthMethod.HAWK_TOKEN:
@@ -0,0 +1,79 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from sdk.auth.config.auth_config import IdentityCacheConfig
+
+
+class IdentityCache:
+    """
+    Per-worker cache of identities resolved for authenticated requests, so a
+    burst of calls from one client loads the user once. Entries expire after
+    a short TTL, writes to a user in this worker invalidate the user at once.
+    Callers get their own copies of cached objects, so they may modify them.
+    """
+
+    AUTH_USER = "authUser"
+    PROFILE = "profile"
+    HAWK_AUTH_KEY = "hawkAuthKey"
+
+    def __init__(self, config: IdentityCacheConfig = None):
+        self._lock = threading.Lock()
+        self._users: OrderedDict[str, dict] = OrderedDict()
+        self._invalidations = 0
+        self.configure(config or IdentityCacheConfig())
+
+    def configure(self, config: IdentityCacheConfig):
+        self._config = config
+        self.clear()
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.enabled
+
+    def get_or_load(
+        self, kind: str, user_id: str, load: Callable[[], Any], version: Hashable = None
+    ):
+        """Version is a part of the key, i.e. token issue time."""
+        if not self.enabled or not user_id:
+            return load()
+
+        key = (kind, version)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._users.get(user_id, {}).get(key)
+            if entry and entry[0] > now:
+                self._users.move_to_end(user_id)
+                return copy.deepcopy(entry[1])
+            invalidations = self._invalidations
+
+        value = load()
+        expires_at = now + self._config.ttlSeconds
+        with self._lock:
+            if invalidations != self._invalidations:
+                # user could be updated while loading, loaded value is not cached
+                return value
+            self._users.setdefault(user_id, {})[key] = (
+                expires_at,
+                copy.deepcopy(value),
+            )
+            self._users.move_to_end(user_id)
+            while len(self._users) > self._config.maxSize:
+                self._users.popitem(last=False)
+        return value
+
+    def invalidate(self, user_id) -> None:
+        if user_id:
+            with self._lock:
+                self._users.pop(str(user_id), None)
+                self._invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._users.clear()
+            self._invalidations += 1
+
+
+identity_cache = IdentityCache()
@@ -5,6 +5,7 @@ from pymongo import WriteConcern, MongoClient
 from pymongo.errors import DuplicateKeyError
 from pymongo.read_concern import ReadConcern
 
+from sdk.auth.identity_cache import identity_cache
 from sdk.auth.model.auth_user import (
     AuthUser,
     AuthIdentifier,
@@ -192,6 +193,7 @@ class MongoAuthRepository(AuthRepository):
         if not result.modified_count:
             raise UserAlreadySignedOutException
 
+        identity_cache.invalidate(session.userId)
         result = self._db[self.SESSION_COLLECTION].find_one(session_dict)
         return str(result[DeviceSession.ID_])
 
@@ -207,6 +209,7 @@ class MongoAuthRepository(AuthRepository):
         if not result.modified_count:
             raise UserAlreadySignedOutException
 
+        identity_cache.invalidate(session.userId)
         result = self._db[self.SESSION_COLLECTION].find_one(
             {**session_dict, DeviceSessionV1.IS_ACTIVE: False}
         )
@@ -235,6 +238,10 @@ class MongoAuthRepository(AuthRepository):
         res = self._db[self.USER_COLLECTION].update_one(
             query, {"$set": new_data}, session=self.session
         )
+        if uid:
+            identity_cache.invalidate(uid)
+        else:
+            identity_cache.clear()
         if not res:
             raise UnauthorizedException
 
@@ -245,6 +252,7 @@ class MongoAuthRepository(AuthRepository):
             AuthUser.PHONE_NUMBER_VERIFIED: True,
         }
         res = self._db[self.USER_COLLECTION].update_one(query, {"$set": new_data})
+        identity_cache.clear()
         if not res:
             raise UnauthorizedException
 
@@ -257,6 +265,7 @@ class MongoAuthRepository(AuthRepository):
             AuthUser.PREVIOUS_PASSWORDS: previous_passwords,
         }
         res = self._db[self.USER_COLLECTION].update_one(query, {"$set": new_data})
+        identity_cache.clear()
         if not res:
             raise UnauthorizedException
 
@@ -291,6 +300,7 @@ class MongoAuthRepository(AuthRepository):
                 raise DuplicatedPhoneNumberException
             else:
                 raise UserAlreadyExistsException
+        identity_cache.invalidate(uid)
         if not res:
             raise UnauthorizedException
 
@@ -322,6 +332,7 @@ class MongoAuthRepository(AuthRepository):
         self._db[self.SESSION_COLLECTION].delete_many(
             {DeviceSession.USER_ID: user_id}, session=self.session
         )
+        identity_cache.invalidate(user_id)
 
     @id_as_obj_id
     def create_auth_keys(
@@ -347,6 +358,7 @@ class MongoAuthRepository(AuthRepository):
         result = self._db[self.USER_COLLECTION].update_one(
             {AuthUser.ID_: user_id}, query
         )
+        identity_cache.invalidate(user_id)
         if not result:
             raise UnauthorizedException
 
@@ -1,3 +1,4 @@
+import logging
 from copy import deepcopy
 from dataclasses import field, dataclass
 from datetime import datetime
@@ -22,6 +23,8 @@ from sdk.common.utils.validators import (
     validate_datetime,
 )
 
+logger = logging.getLogger(__name__)
+
 _cls = {}
 
 
@@ -116,6 +119,15 @@ class CalendarEvent:
     def execute(self, run_async=True):
         raise NotImplementedError
 
+    @classmethod
+    def execute_many(cls, events: list["CalendarEvent"], run_async=True):
+        """Executes events of this type, override to execute them in bulk."""
+        for event in events:
+            try:
+                event.execute(run_async=run_async)
+            except Exception as error:
+                logger.error(f"Sending reminder error: {error}")
+
     def pack_extra_fields(self):
         raise NotImplementedError
 
@@ -1,7 +1,8 @@
 import logging
 from dataclasses import field, dataclass
 from datetime import datetime, timedelta
-from typing import Union
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Union
 
 import isodate
 import pytz
@@ -16,6 +17,31 @@ from sdk.common.utils.validators import must_be_present, utc_str_field_to_val
 
 logger = logging.getLogger(__name__)
 
+LogsIndex = dict[tuple[str, datetime], CalendarEventLog]
+# start, end and whether snoozing field is kept in generated event
+Occurrence = tuple[datetime, datetime, bool]
+
+RRULE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=RRULE_CACHE_SIZE)
+def compile_rrule(pattern: str, until: datetime = None) -> rrule.rrule:
+    """Parses recurrence pattern once, `until` is set only if pattern has no end."""
+    rule = rrule.rrulestr(pattern)
+    if until and not rule._until:
+        rule = rule.replace(until=until)
+    return rule
+
+
+@lru_cache(maxsize=RRULE_CACHE_SIZE)
+def localize_rrule(pattern: str, timezone: pytz.timezone, end_dt: datetime) -> str:
+    return rrule_replace_timezone(pattern, timezone, end_dt)
+
+
+@lru_cache(maxsize=RRULE_CACHE_SIZE)
+def parse_duration(duration: str) -> timedelta:
+    return isodate.parse_duration(duration)
+
 
 @dataclass
 class EventGenerator:
@@ -30,6 +56,7 @@ class EventGenerator:
 
     def __post_init__(self):
         self.timezone = to_timezone(self.timezone)
+        self._logs_index = None
 
         if self.retrieve_all:
             return
@@ -47,7 +74,7 @@ class EventGenerator:
         end_dt = event.get(Event.END_DATE_TIME)
         end_dt = get_dt_from_str(end_dt) if end_dt else None
         r_rule = event.get(Event.RECURRENCE_PATTERN)
-        r_rule = rrule_replace_timezone(r_rule, self.timezone, end_dt)
+        r_rule = localize_rrule(r_rule, self.timezone, end_dt)
         event[Event.RECURRENCE_PATTERN] = r_rule
         return event
 
@@ -116,67 +143,76 @@ class EventGenerator:
             return [event] if self.is_valid_date(start, end) else []
 
     def extract_events_from_recurring_event(self, event: dict, include_snoozing=False):
+        generated_events = []
+        for start, end, keep_snoozing in self.iterate_occurrences(
+            event, include_snoozing
+        ):
+            simple_event = self.complex_event_to_simple_event(event, start, end)
+            if not keep_snoozing:
+                simple_event.pop(Event.SNOOZING, None)
+            generated_events.append(simple_event)
+        return generated_events
+
+    def iterate_occurrences(
+        self, event: dict, include_snoozing=False
+    ) -> Iterator[Occurrence]:
+        """
+        Yields occurrences of recurring event that are valid for generator window.
+        Only recurrences starting close enough to the window to intersect it are expanded.
+        """
         default_expiration = Event.DEFAULT_INSTANCE_EXPIRATION_DURATION
         instance_expires_in = event.get(Event.INSTANCE_EXPIRES_IN) or default_expiration
         pattern = event.get(Event.RECURRENCE_PATTERN)
         rule = self.safe_rrule(pattern, instance_expires_in)
-        base_event_duration = isodate.parse_duration(instance_expires_in)
+        base_event_duration = parse_duration(instance_expires_in)
         event_end = event.get(Event.END_DATE_TIME)
         if event_end:
             event_end = get_dt_from_str(event_end)
         event_duration = base_event_duration - timedelta(minutes=1)
+        snoozing_deltas = []
+        if include_snoozing and event.get(Event.SNOOZING):
+            snoozing_deltas = [parse_duration(s) for s in event[Event.SNOOZING]]
 
-        generated_events = []
-        for start in rule:
+        for start in self._window_starts(rule, base_event_duration):
             end = start + event_duration
             if event_end and event_end < end:
                 end = event_end
 
-            simple_event = None
             if self.is_valid_date(start, end):
-                simple_event = self.complex_event_to_simple_event(event, start, end)
-                generated_events.append(simple_event)
+                yield start, end, not snoozing_deltas
             elif end is event_end:
                 break
-            if include_snoozing and event.get(Event.SNOOZING):
-                snoozing_events = self.extract_valid_snoozing_events(event, start, end)
-                generated_events.extend(snoozing_events)
-                if not simple_event:
-                    continue
-                # remove snoozing from initial event
-                simple_event.pop(Event.SNOOZING, None)
-
-        return generated_events
-
-    def extract_valid_snoozing_events(
-        self, event: dict, start: datetime, end: datetime
-    ):
-        events = []
-        for snoozing in event.get(Event.SNOOZING, []):
-            delta = isodate.parse_duration(snoozing)
-            snoozing_start = start + delta
-            if not self.is_valid_date(snoozing_start, end):
-                continue
-            simple_event = self.complex_event_to_simple_event(
-                event, snoozing_start, end
-            )
-            simple_event.pop(Event.SNOOZING, None)
-            events.append(simple_event)
-        return events
+            for delta in snoozing_deltas:
+                snoozing_start = start + delta
+                if self.is_valid_date(snoozing_start, end):
+                    yield snoozing_start, end, False
+
+    def _window_starts(
+        self, rule: rrule.rrule, event_duration: timedelta
+    ) -> Iterable[datetime]:
+        """
+        Recurrence starts which may produce valid events. Every valid event ends
+        after window start, so recurrences starting earlier than one event duration
+        before the window are skipped. Exact validation is still done by `is_valid_date`.
+        """
+        if self.retrieve_all:
+            return rule
+        if self.start and self.end:
+            return rule.between(self.start - event_duration, self.end, inc=True)
+        return rule.between(self.now - event_duration, self.now, inc=True)
 
-    def safe_rrule(self, r_rule: str, instance_exp_in: str):
+    def safe_rrule(self, r_rule: str, instance_exp_in: str) -> Optional[rrule.rrule]:
         """Prevents infinite loops by adding until date if not present."""
         if not r_rule:
             return None
-        rule = rrule.rrulestr(r_rule)
-        if not rule._until:
-            until = self.end
-            if not until:
-                default_duration = isodate.parse_duration(instance_exp_in)
-                now = self.now or datetime.utcnow()
-                until = now + default_duration
-            rule = rule.replace(until=until)
-        return rule
+        rule = compile_rrule(r_rule)
+        if rule._until:
+            return rule
+        if self.end:
+            return compile_rrule(r_rule, self.end)
+        # "now" based until differs on every call, so it is not cached
+        now = self.now or datetime.utcnow()
+        return rule.replace(until=now + parse_duration(instance_exp_in))
 
     @staticmethod
     def complex_event_to_simple_event(
@@ -212,13 +248,16 @@ class EventGenerator:
     def disable_completed_events(
         self, events: list[dict], logs: list[CalendarEventLog] = None
     ):
+        logs_index = self._get_logs_index(logs)
         for event in events:
-            self.disable_completed_event(event, logs)
+            self._disable_completed_event(event, logs_index)
 
     def disable_completed_event(self, event: dict, logs: list[CalendarEventLog] = None):
-        logs = logs or self.logs or []
+        self._disable_completed_event(event, self._get_logs_index(logs))
+
+    def _disable_completed_event(self, event: dict, logs_index: LogsIndex):
         event_start = event.get(Event.START_DATE_TIME)
-        log = self.find_log_match(event.get(Event.ID), event_start, logs)
+        log = self.find_log_match(event.get(Event.ID), event_start, logs_index)
         if not log:
             return
         new_data = {
@@ -228,10 +267,23 @@ class EventGenerator:
         }
         event.update(new_data)
 
+    def _get_logs_index(self, logs: list[CalendarEventLog] = None) -> LogsIndex:
+        if logs:
+            return self.build_logs_index(logs)
+        if self._logs_index is None:
+            self._logs_index = self.build_logs_index(self.logs or [])
+        return self._logs_index
+
     @staticmethod
-    def find_log_match(event_id, event_start, logs: list[CalendarEventLog]):
-        def log_match(item: CalendarEventLog):
-            match = item.parentId == event_id
-            return match and item.startDateTime == get_dt_from_str(event_start)
+    def build_logs_index(logs: list[CalendarEventLog]) -> LogsIndex:
+        """Maps (parentId, startDateTime) to the first matching log."""
+        logs_index = {}
+        for log in logs:
+            logs_index.setdefault((log.parentId, log.startDateTime), log)
+        return logs_index
 
-        return next((log for log in logs if log_match(log)), None)
+    @staticmethod
+    def find_log_match(event_id, event_start, logs_index: LogsIndex):
+        if not logs_index or not event_start:
+            return None
+        return logs_index.get((event_id, get_dt_from_str(event_start)))
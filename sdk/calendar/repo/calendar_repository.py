@@ -74,6 +74,20 @@ class CalendarRepository(ABC):
     def clear_cached_events(self):
         raise NotImplementedError
 
+    @abstractmethod
+    def replace_next_day_events_for_users(
+        self, user_ids: list[str], events: list[CalendarEvent]
+    ) -> int:
+        """
+        Upserts next-day events of the users and removes their other next-day events.
+        @return: number of upserted events
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def retrieve_calendar_event_user_ids(self) -> list[str]:
+        raise NotImplementedError
+
     @abstractmethod
     def delete_user_events(self, user_id: str, session: ClientSession = None):
         raise NotImplementedError
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 
 from bson.errors import InvalidId
@@ -5,6 +6,7 @@ from typing import Optional, Union
 
 from bson import ObjectId
 from mongoengine.context_managers import switch_collection
+from pymongo import ReplaceOne
 from pymongo.client_session import ClientSession
 from pymongo.database import Database
 
@@ -43,6 +45,12 @@ def to_mongo_calendar_event(event: CalendarEvent) -> MongoCalendarEvent:
     return MongoCalendarEvent(**event_dict)
 
 
+def next_day_event_id(event: CalendarEvent) -> ObjectId:
+    """Same id for the same occurrence, so next-day events can be upserted."""
+    key = f"{event.parentId}:{event.model}:{event.startDateTime}"
+    return ObjectId(hashlib.sha1(key.encode()).digest()[:12])
+
+
 def to_primary_event(event: CalendarEvent):
     cls_ = CalendarEvent.child(event.model)
     if cls_ != type(event):
@@ -230,6 +238,32 @@ class MongoCalendarRepository(CalendarRepository):
         options = {"_id": {"$ne": None}}
         return self.batch_delete_next_day_event_raw(options)
 
+    def replace_next_day_events_for_users(
+        self, user_ids: list[str], events: list[CalendarEvent]
+    ) -> int:
+        collection = self.db[self.CACHE_CALENDAR_COLLECTION]
+        requests = {}
+        for event in events:
+            document = to_mongo_calendar_event(event).to_mongo().to_dict()
+            document["_id"] = next_day_event_id(event)
+            requests[document["_id"]] = ReplaceOne(
+                {"_id": document["_id"]}, document, upsert=True
+            )
+        if requests:
+            collection.bulk_write(list(requests.values()), ordered=False)
+
+        collection.delete_many(
+            {
+                CalendarEvent.USER_ID: {"$in": [ObjectId(id_) for id_ in user_ids]},
+                "_id": {"$nin": list(requests)},
+            }
+        )
+        return len(requests)
+
+    def retrieve_calendar_event_user_ids(self) -> list[str]:
+        user_ids = self.db[self.CALENDAR_COLLECTION].distinct(CalendarEvent.USER_ID)
+        return [str(user_id) for user_id in user_ids]
+
     @id_as_obj_id
     def delete_user_events(self, user_id: str, session: ClientSession = None):
         self.db[self.CALENDAR_COLLECTION].delete_many(
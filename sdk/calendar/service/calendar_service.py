@@ -253,6 +253,56 @@ class CalendarService:
             return self.save_next_day_events(new_events)
         return None
 
+    def calculate_and_save_next_day_events_in_chunks(
+        self, user_timezones: dict, users_chunk_size: int
+    ) -> int:
+        """
+        Calculates next-day events of the users chunk by chunk, so memory does not
+        grow with the number of users. Next-day events of each chunk are upserted
+        and other next-day events of the chunk users are removed.
+        @return: number of saved events
+        """
+        start, end = get_start_end_for_today()
+        generator = EventGenerator(start=start, end=end, allow_past_events=False)
+        # users of the same timezone are processed together
+        user_ids = sorted(
+            user_timezones, key=lambda id_: (user_timezones[id_] or "", id_)
+        )
+        saved = 0
+        for i in range(0, len(user_ids), users_chunk_size):
+            chunk = user_ids[i : i + users_chunk_size]
+            events = self.retrieve_raw_events(
+                mute_errors=True,
+                **{
+                    CalendarEvent.USER_ID: {"$in": chunk},
+                    CalendarEvent.START_DATE_TIME: {LESS_OR_EQUAL_TO: end},
+                },
+            )
+            for event in events:
+                user_tz = user_timezones[event.userId]
+                if user_tz and user_tz != pytz.UTC.zone:
+                    event.as_timezone(pytz.timezone(user_tz))
+
+            new_events = generator.generate(
+                events, include_snoozing=True, to_model=True, mute_errors=True
+            )
+            for event in new_events:
+                event.parentId = event.parentId or event.id
+                event.id = None
+            saved += self._repo.replace_next_day_events_for_users(chunk, new_events)
+        return saved
+
+    def clean_up_next_day_events(self, user_timezones: dict):
+        """Removes past next-day events and events of users that no longer exist."""
+        start, _ = get_start_end_for_today()
+        self._repo.batch_delete_next_day_event_raw(
+            {CalendarEvent.START_DATE_TIME: {"$lt": start}}
+        )
+        for user_id in self._repo.retrieve_calendar_event_user_ids():
+            if user_id not in user_timezones:
+                logger.warning(f"No user found for events of user {user_id}. Deleting.")
+                self._repo.delete_user_events(user_id=user_id)
+
     def calculate_and_save_next_day_events_for_user(self, user_id, timezone):
         start, end = get_start_end_for_today()
         events = self.retrieve_raw_events(
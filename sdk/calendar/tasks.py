@@ -1,15 +1,22 @@
 import logging
+from collections import defaultdict
+from datetime import datetime
 
 from celery.schedules import crontab
 
 from sdk.calendar.events import RequestUsersTimezonesEvent
 from sdk.calendar.models.calendar_event import CalendarEvent
 from sdk.calendar.service.calendar_service import CalendarService
-from sdk.calendar.utils import now_no_seconds
+from sdk.calendar.utils import now_no_seconds, get_dt_from_str
 from sdk.celery.app import celery_app
 from sdk.common.adapter.event_bus_adapter import EventBusAdapter
 from sdk.common.exceptions.exceptions import ClassNotRegisteredException
 from sdk.common.utils import inject
+from sdk.phoenix.config.server_config import (
+    CalendarConfig,
+    NextDayEventsConfig,
+    PhoenixServerConfig,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,24 +39,67 @@ def setup_periodic_tasks(sender, **kwargs):
 
 @celery_app.task(expires=24 * 60 * 60)
 def prepare_events_for_next_day():
-    CalendarService().calculate_and_save_next_day_events(get_timezones())
+    user_timezones = get_timezones()
+    config = _next_day_events_config()
+    if not config.streaming:
+        CalendarService().calculate_and_save_next_day_events(user_timezones)
+        return
+
+    CalendarService().clean_up_next_day_events(user_timezones)
+    for shard in split_users_into_shards(user_timezones, config.shards):
+        prepare_events_for_next_day_for_users.delay(shard)
+
+
+@celery_app.task(expires=24 * 60 * 60)
+def prepare_events_for_next_day_for_users(user_timezones: dict):
+    config = _next_day_events_config()
+    saved = CalendarService().calculate_and_save_next_day_events_in_chunks(
+        user_timezones, config.usersChunkSize
+    )
+    logger.info(f"{saved} next day events saved for {len(user_timezones)} users")
+
+
+def split_users_into_shards(user_timezones: dict, shards: int) -> list[dict]:
+    """Users of the same timezone are kept together where possible."""
+    user_ids = sorted(user_timezones, key=lambda id_: (user_timezones[id_] or "", id_))
+    shard_size = -(-len(user_ids) // shards)
+    return [
+        {user_id: user_timezones[user_id] for user_id in user_ids[i : i + shard_size]}
+        for i in range(0, len(user_ids), shard_size or 1)
+    ]
+
+
+def _calendar_config() -> CalendarConfig:
+    return inject.instance(PhoenixServerConfig).server.calendar or CalendarConfig()
+
+
+def _next_day_events_config() -> NextDayEventsConfig:
+    return _calendar_config().nextDayEvents or NextDayEventsConfig()
 
 
 @celery_app.task(expires=60)
 def prepare_events_and_execute():
     """
-    Query events that needs execution and execute them in batches by 10 items.
-    Removes successfully executed events from the db.
+    Query events that needs execution and execute them in chunks of events of the
+    same type. Removes successfully executed events from the db.
     """
     service = CalendarService()
     now = now_no_seconds()
     events = service.retrieve_next_day_events({CalendarEvent.START_DATE_TIME: now})
-    event_dicts = [event_to_typed_dict(e) for e in events]
+    event_dicts_by_type = defaultdict(list)
+    for event in events:
+        event_dicts_by_type[event.model].append(event_to_typed_dict(event))
 
-    for i in range(0, len(event_dicts), 10):
-        execute_events.delay(event_dicts[i : i + 10])
+    chunk_size = _calendar_config().executionChunkSize
+    for event_dicts in event_dicts_by_type.values():
+        for i in range(0, len(event_dicts), chunk_size):
+            execute_events.delay(event_dicts[i : i + chunk_size])
 
     service.batch_delete_next_day_events([e.id for e in events])
+    logger.info(
+        f"SCHEDULER: {len(events)} events of {len(event_dicts_by_type)} types "
+        f"scheduled at {now} dispatched"
+    )
 
 
 def event_to_typed_dict(event: CalendarEvent) -> dict:
@@ -61,19 +111,36 @@ def event_to_typed_dict(event: CalendarEvent) -> dict:
 
 @celery_app.task
 def execute_events(events: list[dict]):
-    user_id = None
+    events_by_type = defaultdict(list)
     for event_dict in events:
         try:
-            user_id = user_id or event_dict["userId"]
             event_class = CalendarEvent.child(event_dict["type"])
-            event = event_class.from_dict(event_dict)
-            event.execute(run_async=False)
-            logger.debug(f"SCHEDULER: Event.execute finished for user {event.userId}.")
+            events_by_type[event_class].append(event_class.from_dict(event_dict))
         except ClassNotRegisteredException:
             logger.warning(f"{event_dict['type']} is not a registered reminder.")
         except Exception as error:
             logger.error(f"Sending reminder error: {error}")
 
+    for event_class, typed_events in events_by_type.items():
+        try:
+            event_class.execute_many(typed_events, run_async=False)
+        except Exception as error:
+            logger.error(f"Sending reminder error: {error}")
+        _log_execution_lag(event_class, typed_events)
+
+
+def _log_execution_lag(event_class, events: list[CalendarEvent]):
+    starts = [get_dt_from_str(e.startDateTime) for e in events if e.startDateTime]
+    if not starts:
+        return
+
+    scheduled = min(starts)
+    lag = datetime.utcnow() - scheduled.replace(tzinfo=None)
+    logger.info(
+        f"SCHEDULER: {len(events)} {event_class.__name__} events scheduled at "
+        f"{scheduled} executed with lag {lag.total_seconds():.1f}s"
+    )
+
 
 def get_timezones() -> dict:
     """
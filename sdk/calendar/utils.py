@@ -22,7 +22,7 @@ def now_no_seconds():
     return no_seconds(datetime.utcnow())
 
 
-@functools.lru_cache(maxsize=60)
+@functools.lru_cache(maxsize=1024)
 def get_dt_from_str(value: str):
     return utc_str_val_to_field(value)
 
@@ -1,30 +1,78 @@
+import atexit
 import functools
+import importlib
 import logging
+import os
+import queue
+import threading
+import time
 import traceback
 from abc import ABC
 from collections import defaultdict
-from typing import Union, Callable
+from enum import Enum
+from typing import Union, Callable, Optional
 
+from sdk.celery.app import celery_app
+from sdk.common.adapter.event_bus_config import EventBusConfig
 from sdk.common.utils import inject
+from sdk.common.utils.convertible import Convertible
 
 logger = logging.getLogger(__name__)
 
+OverflowPolicy = EventBusConfig.OverflowPolicy
+WORKER_POLL_INTERVAL = 0.5
+CLOSE_TIMEOUT = 5
+OVERFLOWED_LOG_INTERVAL = 1000
+
 
 class BaseEvent(ABC):
     pass
 
 
+class Dispatch(Enum):
+    INLINE = "INLINE"  # on the emitting thread, before emit() returns
+    DEFERRED = "DEFERRED"  # on a worker thread of this process
+    CELERY = "CELERY"  # by a celery worker, Convertible events only
+
+
 class EventBusAdapter:
-    def __init__(self):
+    """
+    Runs handlers subscribed to events, on the emitting thread by default.
+    With async dispatch enabled, handlers subscribed as deferred run on a
+    bounded pool of worker threads after emit() returns. Events of one type
+    go to the same worker, so they are handled in the order they were emitted.
+    When the worker queue is full, the overflow policy either makes the caller
+    wait for free space or runs the handlers on the emitting thread.
+    Deferred handlers run without request context, their errors are logged.
+    """
+
+    def __init__(self, config: EventBusConfig = None):
+        self._config = config or EventBusConfig()
         self._handlers = defaultdict(list)
+        self._dispatch: dict[tuple[type, Callable], Dispatch] = {}
+        self._lock = threading.Lock()
+        self._queues: list[queue.Queue] = []
+        self._threads: list[threading.Thread] = []
+        self._stopped = threading.Event()
+        self._pid: Optional[int] = None
+        self._handler_stats: dict[str, dict] = {}
+        self.deferred = 0
+        self.overflowed = 0
 
-    def subscribe(self, event: type, handler: Union[tuple[Callable], Callable]) -> None:
+    def subscribe(
+        self,
+        event: type,
+        handler: Union[tuple[Callable], Callable],
+        dispatch: Dispatch = Dispatch.INLINE,
+    ) -> None:
         if isinstance(handler, (tuple, list)):
-            [self._subscribe(event, func) for func in handler]
+            [self._subscribe(event, func, dispatch) for func in handler]
         else:
-            self._subscribe(event, handler)
+            self._subscribe(event, handler, dispatch)
 
-    def _subscribe(self, event: type, handler: Callable) -> None:
+    def _subscribe(
+        self, event: type, handler: Callable, dispatch: Dispatch = Dispatch.INLINE
+    ) -> None:
         if not isinstance(event, type):
             raise Exception(
                 f"subscribe() first argument must be a type, got '{type(event)}"
@@ -33,34 +81,62 @@ class EventBusAdapter:
             raise Exception(
                 f"subscribe() second argument must be a callable, got '{type(handler)}"
             )
+        if dispatch == Dispatch.CELERY:
+            if not issubclass(event, Convertible):
+                raise Exception(
+                    f"Celery dispatch requires Convertible event, got '{event.__name__}'"
+                )
+            if not _is_importable(handler):
+                raise Exception(
+                    f"Celery dispatch requires module level handler, got '{handler}'"
+                )
         self._handlers[event].append(handler)
+        self._dispatch[(event, handler)] = dispatch
 
     def emit(
         self, event: BaseEvent, raise_error: bool = False, async_: bool = False
     ) -> list:
+        """
+        Returns results of the handlers run inline. With async_, handlers
+        subscribed inline are deferred too, when async dispatch is enabled.
+        """
         if not isinstance(event, BaseEvent):
             raise Exception("Can not emit event not of type BaseEvent")
         _cls = event.__class__
         if not self.has_subscribers_for(_cls):
             return []
-        if async_:
-            result = self._emit_async(event, raise_error)
-        else:
-            result = []
-            for handler in self._get_handler_chain_for(_cls):
-                try:
-                    result.append(handler(event))
-                except Exception as error:
-                    logger.warning(
-                        f"Event handler error for class {_cls}. Error: {error}.\n"
-                        f"More details {traceback.format_exc()}"
-                    )
-                    if raise_error:
-                        raise error
+
+        result = []
+        deferred_handlers = []
+        for handler in self._get_handler_chain_for(_cls):
+            dispatch = self._get_dispatch(_cls, handler, async_)
+            if dispatch != Dispatch.INLINE:
+                deferred_handlers.append((handler, dispatch))
+                continue
+            try:
+                result.append(self._run_handler(handler, event))
+            except Exception as error:
+                logger.warning(
+                    f"Event handler error for class {_cls}. Error: {error}.\n"
+                    f"More details {traceback.format_exc()}"
+                )
+                if raise_error:
+                    raise error
+
+        if deferred_handlers:
+            self._emit_async(event, deferred_handlers)
         return result
 
-    def _emit_async(self, event: BaseEvent, raise_error: bool = False):
-        raise NotImplementedError
+    def _emit_async(
+        self, event: BaseEvent, handlers: list[tuple[Callable, Dispatch]]
+    ) -> None:
+        local_handlers = []
+        for handler, dispatch in handlers:
+            if dispatch == Dispatch.CELERY and self._send_to_celery(event, handler):
+                continue
+            local_handlers.append(handler)
+        if local_handlers:
+            self._enqueue(event, local_handlers)
 
     def has_subscribers_for(self, message_class):
         return message_class in self._handlers
@@ -68,6 +144,192 @@ class EventBusAdapter:
     def _get_handler_chain_for(self, message_class: type):
         return self._handlers[message_class]
 
+    def _get_dispatch(self, event_type: type, handler: Callable, async_: bool):
+        if not self._config.asyncEnabled:
+            return Dispatch.INLINE
+        dispatch = self._dispatch.get((event_type, handler), Dispatch.INLINE)
+        if async_ and dispatch == Dispatch.INLINE:
+            return Dispatch.DEFERRED
+        return dispatch
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "queueDepth": sum(q.qsize() for q in self._queues),
+                "deferred": self.deferred,
+                "overflowed": self.overflowed,
+                "handlers": {
+                    name: dict(stats) for name, stats in self._handler_stats.items()
+                },
+            }
+
+    def join(self):
+        """Waits until all deferred events queued in this process are handled."""
+        for worker_queue in self._queues:
+            worker_queue.join()
+
+    def close(self):
+        self._stopped.set()
+        for thread in self._threads:
+            if thread.is_alive():
+                thread.join(timeout=CLOSE_TIMEOUT)
+        # events left in queues are handled on the calling thread, in order
+        for worker_queue in self._queues:
+            while True:
+                try:
+                    item = worker_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._handle(item)
+                worker_queue.task_done()
+        logger.info(f"Event bus closed: {self.stats()}")
+
+    def _send_to_celery(self, event: BaseEvent, handler: Callable) -> bool:
+        try:
+            handle_event_task.delay(
+                _get_path(handler), _get_path(type(event)), event.to_dict()
+            )
+        except Exception as error:
+            logger.warning(
+                f"Event {type(event).__name__} not sent to celery, "
+                f"handling in process: {error}"
+            )
+            return False
+        return True
+
+    def _enqueue(self, event: BaseEvent, handlers: list[Callable]):
+        self._ensure_started()
+        worker_queue = self._queues[hash(type(event)) % len(self._queues)]
+        item = (event, handlers)
+        try:
+            worker_queue.put_nowait(item)
+            self._count_deferred()
+            return
+        except queue.Full:
+            pass
+
+        if self._config.overflowPolicy == OverflowPolicy.BLOCK:
+            try:
+                worker_queue.put(item, timeout=self._config.blockTimeoutMs / 1000)
+                self._count_deferred()
+                return
+            except queue.Full:
+                pass
+
+        self._count_overflowed()
+        self._handle(item)
+
+    def _ensure_started(self):
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+
+        with self._lock:
+            if self._pid == pid:
+                return
+            if self._pid is None:
+                atexit.register(self.close)
+            # in a forked process, events queued by the parent are handled by the parent
+            self._stopped.clear()
+            self._queues = [
+                queue.Queue(maxsize=self._config.maxQueueSize)
+                for _ in range(self._config.workers)
+            ]
+            self._threads = [
+                threading.Thread(
+                    target=self._run,
+                    args=(worker_queue,),
+                    name=f"event-bus-worker-{index}",
+                    daemon=True,
+                )
+                for index, worker_queue in enumerate(self._queues)
+            ]
+            for thread in self._threads:
+                thread.start()
+            self._pid = pid
+
+    def _run(self, worker_queue: queue.Queue):
+        while not self._stopped.is_set():
+            try:
+                item = worker_queue.get(timeout=WORKER_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            self._handle(item)
+            worker_queue.task_done()
+
+    def _handle(self, item: tuple[BaseEvent, list[Callable]]):
+        event, handlers = item
+        for handler in handlers:
+            try:
+                self._run_handler(handler, event)
+            except Exception as error:
+                logger.warning(
+                    f"Deferred event handler error for class {type(event)}. "
+                    f"Error: {error}.\nMore details {traceback.format_exc()}"
+                )
+
+    def _run_handler(self, handler: Callable, event: BaseEvent):
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = handler(event)
+            failed = False
+            return result
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            self._record_handler_time(handler, duration_ms, failed)
+
+    def _record_handler_time(self, handler: Callable, duration_ms: float, failed: bool):
+        name = _get_path(handler)
+        with self._lock:
+            stats = self._handler_stats.setdefault(
+                name, {"count": 0, "errors": 0, "totalMs": 0.0, "maxMs": 0.0}
+            )
+            stats["count"] += 1
+            stats["errors"] += failed
+            stats["totalMs"] += duration_ms
+            stats["maxMs"] = max(stats["maxMs"], duration_ms)
+        if duration_ms > self._config.slowHandlerMs:
+            logger.warning(f"Event handler {name} took {duration_ms:.0f}ms")
+
+    def _count_deferred(self):
+        with self._lock:
+            self.deferred += 1
+
+    def _count_overflowed(self):
+        with self._lock:
+            self.overflowed += 1
+            overflowed = self.overflowed
+        if overflowed % OVERFLOWED_LOG_INTERVAL == 1:
+            logger.warning(
+                f"Event bus queue is full, {overflowed} events handled inline: "
+                f"{self.stats()}"
+            )
+
+
+def _get_path(obj) -> str:
+    name = getattr(obj, "__qualname__", None) or type(obj).__name__
+    module = getattr(obj, "__module__", None)
+    return f"{module}.{name}" if module else name
+
+
+def _is_importable(obj) -> bool:
+    name = getattr(obj, "__qualname__", "")
+    return bool(name) and "." not in name and "<" not in name
+
+
+def _import_by_path(path: str):
+    module_name, name = path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), name)
+
+
+@celery_app.task
+def handle_event_task(handler_path: str, event_path: str, event_dict: dict):
+    handler = _import_by_path(handler_path)
+    event_class = _import_by_path(event_path)
+    event_bus = inject.instance(EventBusAdapter)
+    event_bus._run_handler(handler, event_class.from_dict(event_dict))
+
 
 def emit_event(event_type: type):
     def wrapper(f):
@@ -0,0 +1,18 @@
+from dataclasses import field
+from enum import Enum
+
+from sdk.common.utils.convertible import convertibleclass, meta
+
+
+@convertibleclass
+class EventBusConfig:
+    class OverflowPolicy(Enum):
+        BLOCK = "BLOCK"  # wait for free space, then run on the emitting thread
+        INLINE = "INLINE"  # run on the emitting thread at once
+
+    asyncEnabled: bool = field(default=False)
+    workers: int = field(default=4, metadata=meta(lambda n: n > 0))
+    maxQueueSize: int = field(default=1000, metadata=meta(lambda n: n > 0))
+    overflowPolicy: OverflowPolicy = field(default=OverflowPolicy.BLOCK)
+    blockTimeoutMs: int = field(default=1000, metadata=meta(lambda n: n >= 0))
+    slowHandlerMs: int = field(default=500, metadata=meta(lambda n: n >= 0))
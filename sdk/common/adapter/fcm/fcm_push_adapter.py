@@ -28,6 +28,9 @@ class FCMPushAdapter(PushAdapter):
     > send.send_push_to_identities(device, "Hello, world")
     """
 
+    # messaging.send_all accepts up to 500 messages
+    MAX_BATCH_SIZE = 500
+
     def __init__(self, config: FCMPushConfig):
         credentials = Certificate(config.serviceAccountKeyFilePath)
         firebase_admin.initialize_app(credential=credentials)
@@ -50,33 +53,44 @@ class FCMPushAdapter(PushAdapter):
                 if e.http_response.status_code in [400, 404]:
                     return identities
                 raise e
-        else:
-            try:
-                messages = []
-                for identity in identities:
-                    msg_to_send = FCMPushAdapter._build_message(identity, message, ttl)
-                    messages.append(msg_to_send)
-
-                batch_rsp = messaging.send_all(messages)
 
-                i = 0
-                failed_ids = []
-                for rsp in batch_rsp.responses:
-                    if rsp.exception:
-                        if rsp.exception.http_response.status_code in [404, 400]:
-                            logger.debug(f"FCM single message failed [{identities[i]}]")
-                            failed_ids.append(identities[i])
-                        else:
-                            logger.warning(
-                                f"failed fcm batch send: {identities[i]} due to [{rsp.exception}]"
-                            )
+        failed_ids = []
+        error = None
+        sent_batches = 0
+        for i in range(0, len(identities), self.MAX_BATCH_SIZE):
+            batch = identities[i : i + self.MAX_BATCH_SIZE]
+            try:
+                failed_ids.extend(self._send_batch(batch, message, ttl))
+                sent_batches += 1
+            except FirebaseError as e:
+                logger.warning(f"FCM batch of {len(batch)} messages failed [{e}]")
+                error = error or e
+        if error and not sent_batches:
+            raise error
+        return failed_ids
 
-                    i += 1
-                return failed_ids
+    @staticmethod
+    def _send_batch(
+        identities: list[str], message: AndroidMessage, ttl: Optional[int]
+    ) -> list[str]:
+        messages = [
+            FCMPushAdapter._build_message(identity, message, ttl)
+            for identity in identities
+        ]
+        batch_rsp = messaging.send_all(messages)
 
-            except FirebaseError as e:
-                logger.debug(f"FCM single message exception [{str(e)}]")
-                raise e
+        failed_ids = []
+        for identity, rsp in zip(identities, batch_rsp.responses):
+            if not rsp.exception:
+                continue
+            if rsp.exception.http_response.status_code in [404, 400]:
+                logger.debug(f"FCM single message failed [{identity}]")
+                failed_ids.append(identity)
+            else:
+                logger.warning(
+                    f"failed fcm batch send: {identity} due to [{rsp.exception}]"
+                )
+        return failed_ids
 
     @staticmethod
     def _build_message(
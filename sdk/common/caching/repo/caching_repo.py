@@ -12,3 +12,7 @@ class CachingRepository(abc.ABC):
     @abc.abstractmethod
     def set(self, cached_object: CachedObject, expires_in: int):
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, key: str):
+        raise NotImplementedError
@@ -26,3 +26,6 @@ class RedisCachingRepository(CachingRepository):
     def set(self, cached_object: CachedObject, expires_in: int):
         data = cached_object.to_dict(include_none=False)
         self._redis.set(cached_object.key, json.dumps(data), ex=expires_in)
+
+    def delete(self, key: str):
+        self._redis.delete(key)
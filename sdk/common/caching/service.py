@@ -30,3 +30,6 @@ class CachingService:
         }
         cached_object = CachedObject.from_dict(remove_none_values(data))
         self.repo.set(cached_object, expires_in)
+
+    def delete(self, key: str):
+        self.repo.delete(key)
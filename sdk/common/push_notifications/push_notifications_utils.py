@@ -5,7 +5,10 @@ from sdk.common.adapter.push_notification_adapter import (
     VoipApnsMessage,
 )
 from sdk.common.utils.validators import datetime_now
-from sdk.notification.services.notification_service import NotificationService
+from sdk.notification.services.notification_service import (
+    NotificationService,
+    UserPush,
+)
 
 
 def prepare_and_send_push_notification(
@@ -16,7 +19,29 @@ def prepare_and_send_push_notification(
     unread: int = None,
     run_async: bool = False,
 ):
-    notification_data = _set_notification_data(action, notification_data)
+    push = prepare_user_push(
+        user_id, action, notification_template, notification_data, unread
+    )
+    NotificationService().push_for_user(
+        user_id, android=push.android, ios=push.ios, run_async=run_async
+    )
+
+
+def prepare_user_push(
+    user_id: str,
+    action: str,
+    notification_template: dict,
+    notification_data: dict = None,
+    unread: int = None,
+    sent_date_time: str = None,
+) -> UserPush:
+    """
+    Builds push for NotificationService.push_for_users. Pushes prepared with the
+    same sentDateTime and content are sent together.
+    """
+    notification_data = _set_notification_data(
+        action, notification_data, sent_date_time
+    )
 
     android_message_data = {
         "click_action": action,
@@ -31,9 +56,7 @@ def prepare_and_send_push_notification(
     if unread is not None:
         ios_message_data.update({"badge": unread})
     ios_message = ApnsMessage(**ios_message_data)
-    NotificationService().push_for_user(
-        user_id, android=android_message, ios=ios_message, run_async=run_async
-    )
+    return UserPush(userId=user_id, android=android_message, ios=ios_message)
 
 
 def prepare_and_send_push_notification_for_voip_user(
@@ -59,9 +82,15 @@ def prepare_and_send_push_notification_for_voip_user(
     )
 
 
-def _set_notification_data(action: str, notification_data: dict) -> dict:
+def _set_notification_data(
+    action: str, notification_data: dict, sent_date_time: str = None
+) -> dict:
     notification_data = notification_data or {}
     for key, val in notification_data.items():
         if type(val) is bool:
             notification_data[key] = str(val).lower()
-    return {**notification_data, "action": action, "sentDateTime": datetime_now()}
+    return {
+        **notification_data,
+        "action": action,
+        "sentDateTime": sent_date_time or datetime_now(),
+    }
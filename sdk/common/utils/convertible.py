@@ -3,10 +3,11 @@ import logging
 import os
 import re
 from collections import defaultdict
-from dataclasses import dataclass, fields, field, MISSING, Field
+from dataclasses import dataclass, fields, field, is_dataclass, MISSING, Field
 from datetime import datetime
 from decimal import Decimal
 from enum import EnumMeta, Enum
+from functools import lru_cache
 from typing import Union, Optional, Any, Iterable
 
 import aenum
@@ -21,6 +22,7 @@ from sdk.common.utils.json_utils import decamelize, camelize, replace_env_variab
 
 logger = logging.getLogger(__name__)
 __FIELDS = "_____CONVERTIBLE______"
+_PLAN = "_____CONVERTIBLE_PLAN______"
 
 
 def _is_convertible(_cls):
@@ -159,6 +161,95 @@ def _get_field_type(f) -> Optional[type]:
     return field_type
 
 
+class _FieldPlan:
+    """
+    Field data needed to (de)serialize value, extracted once per class.
+    Type is resolved on first use as string annotations may point to classes
+    registered later.
+    """
+
+    __slots__ = (
+        "field",
+        "name",
+        "validator",
+        "required",
+        "value_to_field",
+        "field_to_value",
+        "field_type",
+        "is_list_type",
+        "is_generic_list",
+        "type_is_list",
+        "list_instance_type",
+        "_resolved",
+    )
+
+    def __init__(self, f: Field):
+        self.field = f
+        self.name = f.name
+        self.validator = _extract_metadata_callable(f, VALIDATOR)
+        self.required = _extract_metadata_boolean(f, REQUIRED)
+        self.value_to_field = _extract_metadata_callable(f, VAL_TO_FIELD)
+        self.field_to_value = _extract_metadata_callable(f, FIELD_TO_VAL)
+        self._resolved = False
+
+    def resolve(self) -> "_FieldPlan":
+        if self._resolved:
+            return self
+
+        field_type = _get_field_type(self.field)
+        is_generic_list = is_from_generic_list(field_type)
+        type_is_list = isinstance(field_type, list) or field_type == list
+        instance_type = None
+        resolved = True
+        if is_generic_list or type_is_list:
+            instance_type = _calculate_list_field_instance_type(field_type)
+            if isinstance(instance_type, str):
+                # If str, check if it's a known registered Platform Play class
+                instance_type = registered_class.get(instance_type, instance_type)
+                resolved = not isinstance(instance_type, str)
+
+        self.field_type = field_type
+        self.is_generic_list = is_generic_list
+        self.is_list_type = isinstance(field_type, list) or is_generic_list
+        self.type_is_list = type_is_list
+        self.list_instance_type = instance_type
+        self._resolved = resolved
+        return self
+
+
+class _ClassPlan:
+    __slots__ = ("fields", "by_name", "field_to_value")
+
+    def __init__(self, cls):
+        plans = [_FieldPlan(f) for f in fields(cls)]
+        self.fields = [
+            plan
+            for plan in plans
+            if not plan.name.startswith("_") and not plan.name[0].isupper()
+        ]
+        self.by_name = {plan.name: plan for plan in plans}
+        self.field_to_value = {
+            f.name: _extract_metadata_callable(f, FIELD_TO_VAL)
+            for f in cls.__dataclass_fields__.values()
+        }
+
+
+def _get_class_plan(cls) -> _ClassPlan:
+    # looked up in class own namespace, so not decorated subclasses get their own plan
+    plan = cls.__dict__.get(_PLAN)
+    if plan is None:
+        plan = _ClassPlan(cls)
+        setattr(cls, _PLAN, plan)
+    return plan
+
+
+def _get_field_plan(cls, f: Field) -> _FieldPlan:
+    plan = _get_class_plan(cls).by_name.get(f.name)
+    if plan is None or plan.field is not f:
+        return _FieldPlan(f)
+    return plan
+
+
 def set_field_value(
     self,
     field: Union[str, Field],
@@ -171,40 +262,38 @@ def set_field_value(
     NOTE: this method is intended to be a class method!
     """
     cls = type(self)
-    f = field
-    if not isinstance(field, Field):
-        f = get_field(self, field)
-        if not f:
+    if isinstance(field, Field):
+        plan = _get_field_plan(cls, field)
+    else:
+        plan = _get_class_plan(cls).by_name.get(field)
+        if not plan:
             raise ConvertibleClassValidationError(
                 "No field [{}] in class [{}]".format(cls.__name__, field)
             )
 
-    field_required = _extract_metadata_boolean(f, REQUIRED)
     if field_value is MISSING:
-        if field_required and use_validator_field:
+        if plan.required and use_validator_field:
             raise ConvertibleClassValidationError(
-                "Field [{}.{}] is mandatory".format(cls.__name__, f.name)
+                "Field [{}.{}] is mandatory".format(cls.__name__, plan.name)
             )
         return
 
     return _serialize_and_set_field_value(
-        self, f, field_value, use_validator_field, field_ignored_list
+        self, plan, field_value, use_validator_field, field_ignored_list
     )
 
 
 def _serialize_and_set_field_value(
     self,
-    f: Field,
+    plan: _FieldPlan,
     field_value: Any,
     use_validator_field=True,
     field_ignored_list: list[str] = None,
 ):
     cls = type(self)
-    field_validator = _extract_metadata_callable(f, VALIDATOR)
-    field_required = _extract_metadata_boolean(f, REQUIRED)
-    value_to_field = _extract_metadata_callable(f, VAL_TO_FIELD)
-
-    field_type = _get_field_type(f)
+    field_validator = plan.validator
+    plan.resolve()
+    field_type = plan.field_type
     try:
         if field_validator is not None and use_validator_field:
             try:
@@ -212,34 +301,34 @@ def _serialize_and_set_field_value(
             except Exception as e:
                 raise ConvertibleClassValidationError(
                     "Validation function error for [{}.{}] field with error [{}]".format(
-                        cls.__name__, f.name, e.args
+                        cls.__name__, plan.name, e.args
                     )
                 )
 
             if type(field_validator) is not type and not validated_ok:
                 # If the validator is a simple type e.g. bool, int, field_validator will return the value, and
                 # we must allow False/0/empty string.
-                logger.warning("Field error [{}.{}]".format(cls.__name__, f.name))
+                logger.warning("Field error [{}.{}]".format(cls.__name__, plan.name))
                 raise DetailedException(
-                    400, "Field error [{}.{}]".format(cls.__name__, f.name)
+                    400, "Field error [{}.{}]".format(cls.__name__, plan.name)
                 )
 
-        is_list_type = isinstance(field_type, list) or is_from_generic_list(field_type)
-        if is_list_type and not isinstance(field_value, list):
+        value_is_list = isinstance(field_value, list)
+        if plan.is_list_type and not value_is_list:
             raise ConvertibleClassValidationError(
-                f"[{field_value}] Field type is list but field value {f.name} is not"
+                f"[{field_value}] Field type is list but field value {plan.name} is not"
             )
 
-        if is_list_field(field_type, field_value):
+        if (value_is_list and plan.type_is_list) or plan.is_generic_list:
             _handle_list_values(
                 cls,
-                f.name,
-                field_type,
+                plan.name,
+                plan.list_instance_type,
                 field_validator,
                 field_value,
                 self,
                 use_validator_field,
-                value_to_field,
+                plan.value_to_field,
                 field_ignored_list,
             )
         elif not isinstance(field_type, list):
@@ -248,15 +337,15 @@ def _serialize_and_set_field_value(
                 field_validator,
                 field_value,
                 use_validator_field,
-                field_required,
-                value_to_field,
+                plan.required,
+                plan.value_to_field,
                 field_ignored_list,
             )
-            setattr(self, f.name, val)
+            setattr(self, plan.name, val)
     except CreateSingleValueWrongTypeError:
         raise ConvertibleClassValidationError(
             "Field [{}.{}] with value [{}] is not type of [{}]".format(
-                cls.__name__, f.name, field_value, field_type.__name__
+                cls.__name__, plan.name, field_value, field_type.__name__
             )
         )
 
@@ -265,7 +354,7 @@ def _serialize_and_set_field_value(
     except Exception as e:
         raise ConvertibleClassValidationError(
             "Field [{}.{}] with value [{}] has error [{}]".format(
-                cls.__name__, f.name, field_value, e.args
+                cls.__name__, plan.name, field_value, e.args
             )
         )
 
@@ -290,26 +379,27 @@ def from_dict(
     new_instance = cls()
     # Generating {field: [field_nested_ignore_value_1, field_nested_ignore_value_2]} dictionary to ignore nested fields
     nested_ignore_dict = convert_ignored_fields_to_dict(ignored_fields)
+    has_ignored_fields = isinstance(ignored_fields, (list, tuple))
 
-    for f in fields(cls):
-        field_name = f.name
-        if field_name.startswith("_"):
-            continue
-
-        if field_name[0].isupper():
+    for plan in _get_class_plan(cls).fields:
+        field_name = plan.name
+        if has_ignored_fields and field_name in ignored_fields:
+            setattr(new_instance, field_name, d[field_name])
             continue
 
-        if isinstance(ignored_fields, (list, tuple)) and field_name in ignored_fields:
-            setattr(new_instance, field_name, d[field_name])
+        if field_name not in d:
+            if plan.required and use_validator_field:
+                raise ConvertibleClassValidationError(
+                    "Field [{}.{}] is mandatory".format(cls.__name__, field_name)
+                )
             continue
 
-        field_ignored_list = nested_ignore_dict.get(f.name)
-        set_field_value(
+        _serialize_and_set_field_value(
             new_instance,
-            f,
-            d[f.name] if f.name in d else MISSING,
+            plan,
+            d[field_name],
             use_validator_field,
-            field_ignored_list,
+            nested_ignore_dict.get(field_name),
         )
 
     if hasattr(cls, "validate") and use_validator_field:
@@ -394,7 +484,7 @@ def _from_single_value(
 def _handle_list_values(
     cls,
     field_name,
-    field_type,
+    field_instance_type,
     field_validator,
     field_value,
     new_instance,
@@ -404,13 +494,6 @@ def _handle_list_values(
 ):
     if value_to_field:
         field_value = value_to_field(field_value)
-    field_instance_type = _calculate_list_field_instance_type(field_type)
-    if isinstance(field_instance_type, str):
-        # If str, check if it's a known registered Platform Play class
-        # and convert field_instance_type from str to class type
-        pp_class = globals().get("registered_class", {}).get(field_instance_type)
-        if pp_class:
-            field_instance_type = pp_class
     if _is_convertible(field_instance_type):
         elements = [
             item
@@ -489,18 +572,26 @@ def to_dict(self, include_none=True, ignored_fields: Union[list, tuple] = None):
     result = {}
     # Generating {field: [field_nested_ignore_value_1, field_nested_ignore_value_2]} dictionary to ignore nested fields
     nested_ignore_dict = convert_ignored_fields_to_dict(ignored_fields)
+    has_ignored_fields = isinstance(ignored_fields, (list, tuple))
+    cls = type(self)
+    field_converters = None
+    if is_dataclass(cls):
+        field_converters = _get_class_plan(cls).field_to_value
 
     for key, val in self.__dict__.items():
         key_ignore_fields = nested_ignore_dict.get(key)
         if key.startswith("_") or key[0].isupper():
             continue
 
-        if isinstance(ignored_fields, (list, tuple)) and key in ignored_fields:
+        if has_ignored_fields and key in ignored_fields:
             result[key] = val
             continue
 
-        field = self.__dataclass_fields__.get(key)
-        field_to_value = _extract_metadata_callable(field, FIELD_TO_VAL)
+        if field_converters is None:
+            field = self.__dataclass_fields__.get(key)
+            field_to_value = _extract_metadata_callable(field, FIELD_TO_VAL)
+        else:
+            field_to_value = field_converters.get(key)
 
         if field_to_value and val:
             val = field_to_value(val)
@@ -519,12 +610,16 @@ def to_dict(self, include_none=True, ignored_fields: Union[list, tuple] = None):
     return result
 
 
+@lru_cache(maxsize=None)
+def _is_int_enum(enum_cls: EnumMeta) -> bool:
+    return isinstance(next(iter(enum_cls)), int)
+
+
 def _to_single_value(
     val, include_none: bool, ignored_fields: Union[list, tuple] = None
 ):
     if isinstance(val, Enum):
-        first_enum = [item for item in val.__class__][0]
-        if isinstance(first_enum, int):
+        if _is_int_enum(val.__class__):
             return int(val)
 
         return val.name
@@ -681,6 +776,7 @@ def convertibleclass(_cls):
     _cls.to_yaml = to_yaml
     _cls.reset_attributes = reset_attributes
     _cls.set_field_value = set_field_value
+    setattr(_cls, _PLAN, _ClassPlan(_cls))
     return _cls
 
 
@@ -78,6 +78,7 @@ __author__ = "Ivan Korobkov <ivan.korobkov@gmail.com>"
 __license__ = "Apache License 2.0"
 __url__ = "https://github.com/ivan-korobkov/python-inject"
 
+from collections import Counter
 from functools import wraps
 import inspect
 import logging
@@ -89,6 +90,7 @@ logger = logging.getLogger("inject")
 _INJECTOR = None  # Shared injector instance.
 _INJECTOR_LOCK = threading.RLock()  # Guards injector initialization.
 _BINDING_LOCK = threading.RLock()  # Guards runtime bindings.
+_INJECTION_COUNTS = Counter()  # Calls with injected params per function.
 T = TypeVar("T")
 Binding = Union[Type[T], Hashable]
 Constructor = Provider = Callable[[], T]
@@ -213,6 +215,17 @@ def autoparams(*selected_args):
     return autoparams_decorator
 
 
+def injection_counts():
+    # type: () -> dict[str, int]
+    """Return number of calls with injected params per decorated function, e.g. `Service.__init__`."""
+    return dict(_INJECTION_COUNTS)
+
+
+def reset_injection_counts():
+    # type: () -> None
+    _INJECTION_COUNTS.clear()
+
+
 def get_injector():
     # type: () -> Injector
     """Return the current injector or None."""
@@ -243,7 +256,7 @@ class Binder(object):
         # type: (Binding, T) -> Binder
         """Bind a class to an instance."""
         self._check_class(cls)
-        self._bindings[cls] = lambda: instance
+        self._bindings[cls] = _InstanceBinding(instance)
         logger.debug("Bound %s to an instance %s", cls, instance)
         return self
 
@@ -317,17 +330,40 @@ class Injector(object):
                 )
 
             instance = cls()
-            self._bindings[cls] = lambda: instance
+            self._bindings[cls] = _InstanceBinding(instance)
             logger.debug(
                 "Created a runtime binding for key=%s, instance=%s", cls, instance
             )
             return instance
 
+    def get_singleton_binding(self, cls):
+        # type: (Binding) -> Optional[Callable]
+        """Return binding of the class if it gives the same instance for every injection."""
+        binding = self._bindings.get(cls)
+        if isinstance(binding, (_InstanceBinding, _ConstructorBinding)):
+            return binding
+        return None
+
+    def is_bound_to(self, cls, binding):
+        # type: (Binding, Callable) -> bool
+        """Return true if the class binding was not replaced, i.e. by rebind()."""
+        return self._bindings.get(cls) is binding
+
 
 class InjectorException(Exception):
     pass
 
 
+class _InstanceBinding(object):
+    __slots__ = ("_instance",)
+
+    def __init__(self, instance):
+        self._instance = instance
+
+    def __call__(self):
+        return self._instance
+
+
 class _ConstructorBinding(object):
     def __init__(self, constructor):
         self._constructor = constructor
@@ -372,6 +408,26 @@ class _ParameterInjection(object):
         return injection_wrapper
 
 
+class _ResolvedInstances(object):
+    """
+    Singleton instances injected into one function with their bindings, valid for
+    one injector. An instance is used while its class binding is not replaced.
+    """
+
+    __slots__ = ("_state",)
+
+    def __init__(self):
+        self._state = (None, {})
+
+    def get(self, injector):
+        # type: (Injector) -> dict
+        cached_injector, instances = self._state
+        if cached_injector is not injector:
+            instances = {}
+            self._state = (injector, instances)
+        return instances
+
+
 class _ParametersInjection(object):
     __slots__ = ("_params",)
 
@@ -383,16 +439,38 @@ class _ParametersInjection(object):
             arg_names = inspect.getargspec(func).args
         else:
             arg_names = inspect.getfullargspec(func).args
-        params_to_provide = self._params
+        # Param is provided positionally when its index is lower than number of args
+        positions = {name: index for index, name in enumerate(arg_names)}
+        params_to_provide = tuple(
+            (param, cls, positions.get(param, sys.maxsize))
+            for param, cls in self._params.items()
+        )
+        resolved_instances = _ResolvedInstances()
+        counter_key = getattr(func, "__qualname__", func.__name__)
 
         @wraps(func)
         def injection_wrapper(*args, **kwargs):
-            provided_params = frozenset(arg_names[: len(args)]) | frozenset(
-                kwargs.keys()
-            )
-            for param, cls in params_to_provide.items():
-                if param not in provided_params:
-                    kwargs[param] = instance(cls)
+            args_count = len(args)
+            instances = None
+            for param, cls, position in params_to_provide:
+                if position < args_count or param in kwargs:
+                    continue
+
+                if instances is None:
+                    injector = get_injector_or_die()
+                    instances = resolved_instances.get(injector)
+                cached = instances.get(cls)
+                if cached and injector.is_bound_to(cls, cached[0]):
+                    kwargs[param] = cached[1]
+                    continue
+
+                kwargs[param] = injector.get_instance(cls)
+                binding = injector.get_singleton_binding(cls)
+                if binding:
+                    instances[cls] = (binding, kwargs[param])
+
+            if instances is not None:
+                _INJECTION_COUNTS[counter_key] += 1
             return func(*args, **kwargs)
 
         return injection_wrapper
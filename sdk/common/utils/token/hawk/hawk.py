@@ -14,6 +14,7 @@ from mohawk.exc import (
 from redis import Redis
 
 from sdk import convertibleclass
+from sdk.auth.identity_cache import IdentityCache, identity_cache
 from sdk.auth.model.auth_user import AuthKey
 from sdk.auth.repository.auth_repository import AuthRepository
 from sdk.common.exceptions.exceptions import PermissionDenied, InvalidRequestException
@@ -55,12 +56,20 @@ class UserKey:
 
 
 def lookup_user_factory(hashing_algorithm: str) -> typing.Callable[[str], dict]:
-    def lookup_user(compound_user_key: str) -> dict:
-        user_key = UserKey.from_string(compound_user_key)
+    def retrieve_auth_key(user_key: UserKey) -> dict:
         auth_repo = inject.instance(AuthRepository)
-        auth_key = auth_repo.retrieve_auth_key(
+        return auth_repo.retrieve_auth_key(
             user_id=user_key.userId, auth_identifier=user_key.authIdentifier
         )
+
+    def lookup_user(compound_user_key: str) -> dict:
+        user_key = UserKey.from_string(compound_user_key)
+        auth_key = identity_cache.get_or_load(
+            IdentityCache.HAWK_AUTH_KEY,
+            user_key.userId,
+            lambda: retrieve_auth_key(user_key),
+            version=user_key.authIdentifier,
+        )
         return {
             "id": user_key.userId,
             "key": auth_key[AuthKey.AUTH_KEY],
@@ -74,11 +83,9 @@ def seen_nonce_factory(timestamp_skew: int):
     def seen_nonce(user_key: str, nonce: str, timestamp: int) -> bool:
         redis = inject.instance(Redis)
         key = f"hawk:{user_key}:{nonce}:{timestamp}"
-        if redis.get(key):
-            return True
-        else:
-            redis.set(key, 1, ex=timestamp_skew)
-            return False
+        # key is set only if it does not exist yet, in one atomic command
+        is_new = redis.set(key, 1, ex=timestamp_skew, nx=True)
+        return not is_new
 
     return seen_nonce
 
@@ -4,6 +4,7 @@ import json
 import logging
 import re
 from datetime import datetime, timezone, date
+from functools import wraps
 from pathlib import Path
 from typing import Pattern, Any, Union, Callable
 
@@ -257,6 +258,7 @@ def default_email_meta() -> dict[str, Any]:
 def id_as_obj_id(func):
     """Used to convert string ids, passing to function into ObjectID. Keyword arguments should be used."""
 
+    @wraps(func)
     def wrapper(instance, **kwargs):
         for key in kwargs:
             if (
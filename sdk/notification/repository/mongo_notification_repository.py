@@ -52,6 +52,12 @@ class MongoNotificationRepository(NotificationRepository):
         devices = [Device.from_dict(device_doc.to_dict()) for device_doc in device_docs]
         return devices
 
+    def retrieve_users_devices(self, user_ids: list[str]) -> list[Device]:
+        if not user_ids:
+            return []
+        device_docs = MongoDeviceDocument.objects(userId__in=user_ids)
+        return [Device.from_dict(device_doc.to_dict()) for device_doc in device_docs]
+
     def delete_device(self, device_push_id: str) -> None:
         """
         called when push id not valid anymore
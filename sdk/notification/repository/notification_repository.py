@@ -32,6 +32,14 @@ class NotificationRepository(ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def retrieve_users_devices(self, user_ids: list[str]) -> list[Device]:
+        """
+        @param user_ids: ids of users
+        @return: list of devices of all users
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def delete_device(self, device_push_id: str) -> None:
         """
@@ -1,3 +1,4 @@
+import json
 import logging
 from datetime import datetime
 from typing import Optional, NamedTuple
@@ -21,6 +22,16 @@ from sdk.phoenix.config.server_config import PhoenixServerConfig
 
 logger = logging.getLogger(__name__)
 
+MAX_USERS_PER_TASK = 1000
+
+
+class UserPush(NamedTuple):
+    userId: str
+    android: AndroidMessage = None
+    ios: ApnsMessage = None
+    aliCloud: AliCloudMessage = None
+    ttl: Optional[int] = None
+
 
 class NotificationService:
     @autoparams()
@@ -61,6 +72,34 @@ class NotificationService:
         else:
             async_push_for_user(*args)
 
+    def push_for_users(self, pushes: list[UserPush], run_async=True):
+        """
+        Pushes with identical messages are sent together: devices of all their
+        users are retrieved at once and messaged in provider batches.
+        """
+        groups: dict[str, tuple[list, list[str]]] = {}
+        for push in pushes:
+            args = [
+                push.android.to_dict(include_none=False) if push.android else None,
+                push.ios.to_dict(include_none=False) if push.ios else None,
+                push.aliCloud.to_dict(include_none=False) if push.aliCloud else None,
+                push.ttl,
+            ]
+            key = json.dumps(args, sort_keys=True, default=str)
+            groups.setdefault(key, (args, []))[1].append(push.userId)
+
+        logger.info(
+            f"Push notification in service for {len(pushes)} users "
+            f"in {len(groups)} groups"
+        )
+        for args, user_ids in groups.values():
+            for i in range(0, len(user_ids), MAX_USERS_PER_TASK):
+                task_args = [user_ids[i : i + MAX_USERS_PER_TASK], *args]
+                if run_async:
+                    async_push_for_users.delay(*task_args)
+                else:
+                    async_push_for_users(*task_args)
+
     def push_for_voip_user(
         self,
         user_id: str,
@@ -103,7 +142,29 @@ def async_push_for_user(
         _init_ali_group(ali_cloud_dict, config, ttl, devices),
     ]
     for group in groups_by_device:
-        _push_for_device(repo, user_id, group)
+        _push_for_device(repo, f"user#{user_id}", group)
+
+
+@celery_app.task
+def async_push_for_users(
+    user_ids: list[str],
+    android_dict: dict = None,
+    ios_dict: dict = None,
+    ali_cloud_dict: dict = None,
+    ttl: Optional[int] = None,
+):
+    logger.info(f"Push notification in task for {len(user_ids)} users")
+    repo = inject.instance(NotificationRepository)
+    config = inject.instance(PhoenixServerConfig)
+    devices = repo.retrieve_users_devices(user_ids)
+    logger.info(f"{len(devices)} devices retrieved for {len(user_ids)} users")
+    groups_by_device = [
+        _init_android_group(android_dict, config, ttl, devices),
+        _init_ios_group(ios_dict, config, ttl, devices),
+        _init_ali_group(ali_cloud_dict, config, ttl, devices),
+    ]
+    for group in groups_by_device:
+        _push_for_device(repo, f"{len(user_ids)} users", group)
 
 
 @celery_app.task
@@ -123,7 +184,7 @@ def async_push_for_voip_user_task(
         _init_ios_voip_group(ios_voip_dict, config, ttl, devices),
     ]
     for group in groups_by_device:
-        _push_for_device(repo, user_id, group)
+        _push_for_device(repo, f"user#{user_id}", group)
 
 
 def _init_android_group(android_dict, config, ttl, user_devices):
@@ -194,15 +255,17 @@ def _init_ali_group(ali_cloud_dict, config, ttl, user_devices):
     )
 
 
-def _push_for_device(repo, user_id, device_specs):
+def _push_for_device(repo, recipients: str, device_specs):
     if not device_specs:
         return
     if not device_specs.devices:
-        logger.info(f"No {type(device_specs.push).__name__} devices for user#{user_id}")
+        logger.info(f"No {type(device_specs.push).__name__} devices for {recipients}")
         return
+    # a device can be registered for a few users, it is messaged once
+    push_ids = list(dict.fromkeys(d.devicePushId for d in device_specs.devices))
     try:
         ids_to_remove = device_specs.push.send_message_to_identities(
-            [device.devicePushId for device in device_specs.devices],
+            push_ids,
             message=device_specs.device_msg,
             ttl=device_specs.ttl,
         )
@@ -210,7 +273,7 @@ def _push_for_device(repo, user_id, device_specs):
             return
         repo.delete_devices(ids_to_remove)
         logger.info(
-            f"{len(ids_to_remove)} {type(device_specs.push).__name__} devices were removed for user#{user_id}"
+            f"{len(ids_to_remove)} {type(device_specs.push).__name__} devices were removed for {recipients}"
         )
     except Exception as e:
-        logger.warning(f"Message failure for user#{user_id} due to {e}")
+        logger.warning(f"Message failure for {recipients} due to {e}")
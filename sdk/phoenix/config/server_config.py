@@ -9,6 +9,7 @@ from sdk.common.adapter.alibaba.oss_config import OSSConfig
 from sdk.common.adapter.apns.apns_push_config import APNSPushConfig
 from sdk.common.adapter.azure.azure_blob_storage_config import AzureBlobStorageConfig
 from sdk.common.adapter.email.mailgun_config import MailgunConfig
+from sdk.common.adapter.event_bus_config import EventBusConfig
 from sdk.common.adapter.fcm.fcm_push_config import FCMPushConfig
 from sdk.common.adapter.gcp.gcs_config import GCSConfig
 from sdk.common.adapter.minio.minio_config import MinioConfig
@@ -136,14 +137,45 @@ class VideoConfig(BasePhoenixConfig):
     pass
 
 
+@convertibleclass
+class AuditLogBufferConfig:
+    class OverflowPolicy(Enum):
+        BLOCK = "BLOCK"  # wait for free space, then write on the caller thread
+        DROP = "DROP"  # drop the log and count it
+
+    class FailurePolicy(Enum):
+        INSERT_EACH = "INSERT_EACH"  # insert logs one by one, log the failed ones
+        LOG = "LOG"  # write logs of the failed batch to the error log
+        DROP = "DROP"  # drop logs of the failed batch and count them
+
+    enabled: bool = field(default=False)
+    maxQueueSize: int = field(default=10000, metadata=meta(lambda n: n > 0))
+    batchSize: int = field(default=100, metadata=meta(lambda n: n > 0))
+    flushIntervalMs: int = field(default=1000, metadata=meta(lambda n: n > 0))
+    overflowPolicy: OverflowPolicy = field(default=OverflowPolicy.BLOCK)
+    blockTimeoutMs: int = field(default=1000, metadata=meta(lambda n: n >= 0))
+    writeRetries: int = field(default=3, metadata=meta(lambda n: n >= 0))
+    retryBackoffMs: int = field(default=100, metadata=meta(lambda n: n >= 0))
+    failurePolicy: FailurePolicy = field(default=FailurePolicy.INSERT_EACH)
+
+
 @convertibleclass
 class AuditLogger(BasePhoenixConfig):
-    pass
+    buffer: AuditLogBufferConfig = field(default_factory=AuditLogBufferConfig)
+
+
+@convertibleclass
+class NextDayEventsConfig:
+    streaming: bool = field(default=False)
+    usersChunkSize: int = field(default=500, metadata=meta(lambda n: n > 0))
+    shards: int = field(default=1, metadata=meta(lambda n: n > 0))
 
 
 @convertibleclass
 class CalendarConfig(BasePhoenixConfig):
     prefetchDays: int = field(default=7, metadata=meta(lambda n: n >= 0))
+    nextDayEvents: NextDayEventsConfig = field(default_factory=NextDayEventsConfig)
+    executionChunkSize: int = field(default=10, metadata=meta(lambda n: n > 0))
 
 
 @convertibleclass
@@ -257,6 +289,7 @@ class Server(SubscriptableConfig):
     AUTH = "auth"
     INBOX = "inbox"
     COUNTRY_CODE = "countryCode"
+    EVENT_BUS = "eventBus"
 
     host: str = field(default="0.0.0.0")
     port: int = field(default=5000)
@@ -283,6 +316,7 @@ class Server(SubscriptableConfig):
     storage: StorageConfig = default_field()
     auth: AuthConfig = default_field()
     inbox: InboxConfig = default_field()
+    eventBus: EventBusConfig = field(default_factory=EventBusConfig)
 
 
 @convertibleclass
@@ -565,8 +565,8 @@ def bind_email_confirmation_adapter(binder: Binder):
 
 
 def bind_event_bus_adapter(binder: Binder, config: PhoenixServerConfig):
-    binder.bind(EventBusAdapter, EventBusAdapter())
-    logger.debug("EventBusAdapter bind to EventBusAdapter()")
+    binder.bind(EventBusAdapter, EventBusAdapter(config.server.eventBus))
+    logger.debug("EventBusAdapter bind to EventBusAdapter")
 
 
 def bind_localization_data(binder: Binder, localization_path: str):
@@ -1,7 +1,9 @@
+import threading
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from sdk.common.adapter.event_bus_adapter import BaseEvent, EventBusAdapter
+from sdk.common.adapter.event_bus_adapter import BaseEvent, EventBusAdapter, Dispatch
+from sdk.common.adapter.event_bus_config import EventBusConfig
 
 
 class TestEvent(BaseEvent):
@@ -12,6 +14,11 @@ class AnotherTestEvent(BaseEvent):
     pass
 
 
+class OrderedTestEvent(BaseEvent):
+    def __init__(self, number: int):
+        self.number = number
+
+
 class TestException(Exception):
     pass
 
@@ -122,3 +129,90 @@ class EventBusAdapterTestCase(TestCase):
 
         self.assertTrue(event_bus.has_subscribers_for(TestEvent))
         self.assertFalse(event_bus.has_subscribers_for(AnotherTestEvent))
+
+
+class AsyncEventBusAdapterTestCase(TestCase):
+    def _event_bus(self, **config) -> EventBusAdapter:
+        event_bus = EventBusAdapter(
+            EventBusConfig.from_dict({"asyncEnabled": True, **config})
+        )
+        self.addCleanup(event_bus.close)
+        return event_bus
+
+    def test_deferred_handler_runs_inline_when_async_disabled(self):
+        test_func = MagicMock()
+        event_bus = EventBusAdapter()
+        event_bus.subscribe(TestEvent, test_func, Dispatch.DEFERRED)
+
+        event_bus.emit(TestEvent())
+
+        test_func.assert_called_once()
+        self.assertEqual(0, event_bus.stats()["deferred"])
+
+    def test_deferred_handlers_keep_event_order(self):
+        handled = []
+        inline_func = MagicMock(return_value="inline")
+        event_bus = self._event_bus(workers=2)
+        event_bus.subscribe(OrderedTestEvent, inline_func)
+        event_bus.subscribe(
+            OrderedTestEvent, lambda e: handled.append(e.number), Dispatch.DEFERRED
+        )
+
+        results = [event_bus.emit(OrderedTestEvent(n)) for n in range(100)]
+        event_bus.join()
+
+        self.assertEqual([["inline"]] * 100, results)
+        self.assertEqual(list(range(100)), handled)
+        self.assertEqual(100, event_bus.stats()["deferred"])
+
+    def test_async_emit_defers_inline_handlers(self):
+        test_func = MagicMock()
+        event_bus = self._event_bus()
+        event_bus.subscribe(TestEvent, test_func)
+
+        self.assertEqual([], event_bus.emit(TestEvent(), async_=True))
+        event_bus.join()
+
+        test_func.assert_called_once()
+
+    def test_full_queue_handled_inline(self):
+        started, release = threading.Event(), threading.Event()
+        handled = []
+
+        def handler(event):
+            if event.number == 0:
+                started.set()
+                release.wait(5)
+            handled.append(event.number)
+
+        event_bus = self._event_bus(workers=1, maxQueueSize=1, overflowPolicy="INLINE")
+        event_bus.subscribe(OrderedTestEvent, handler, Dispatch.DEFERRED)
+
+        event_bus.emit(OrderedTestEvent(0))
+        started.wait(5)
+        event_bus.emit(OrderedTestEvent(1))
+        event_bus.emit(OrderedTestEvent(2))
+
+        self.assertEqual([2], handled)
+        release.set()
+        event_bus.join()
+        self.assertEqual([2, 0, 1], handled)
+        self.assertEqual(1, event_bus.stats()["overflowed"])
+
+    def test_handler_stats(self):
+        test_func = MagicMock(side_effect=[None, TestException])
+        event_bus = self._event_bus()
+        event_bus.subscribe(TestEvent, test_func, Dispatch.DEFERRED)
+
+        event_bus.emit(TestEvent())
+        event_bus.emit(TestEvent())
+        event_bus.join()
+
+        (handler_stats,) = event_bus.stats()["handlers"].values()
+        self.assertEqual(2, handler_stats["count"])
+        self.assertEqual(1, handler_stats["errors"])
+
+    def test_celery_dispatch_requires_convertible_event(self):
+        event_bus = EventBusAdapter()
+        with self.assertRaises(Exception):
+            event_bus.subscribe(TestEvent, MagicMock(), Dispatch.CELERY)
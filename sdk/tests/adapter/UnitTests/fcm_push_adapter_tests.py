@@ -93,6 +93,28 @@ class FCMPushAdapterTestCase(unittest.TestCase):
                 identities=identities, message=android_message
             )
 
+    @patch(f"{FCM_PUSH_ADAPTER_PATH}.Certificate", MagicMock())
+    @patch(f"{FCM_PUSH_ADAPTER_PATH}.firebase_admin.initialize_app", MagicMock())
+    @patch(f"{FCM_PUSH_ADAPTER_PATH}.messaging")
+    def test_send_message_to_identities_in_batches(self, mock_messaging):
+        fcm_push_adapter = FCMPushAdapter(config=MagicMock())
+        failed = MagicMock()
+        failed.exception.http_response.status_code = 404
+        mock_messaging.send_all.side_effect = [
+            FirebaseError(message="error", code="code"),
+            MagicMock(responses=[MagicMock(exception=None)] * 499 + [failed]),
+            MagicMock(responses=[MagicMock(exception=None)]),
+        ]
+        identities = [str(i) for i in range(1001)]
+
+        output = fcm_push_adapter.send_message_to_identities(
+            identities=identities, message=ANDROID_MESSAGE
+        )
+
+        self.assertEqual(["999"], output)
+        batch_sizes = [len(c.args[0]) for c in mock_messaging.send_all.call_args_list]
+        self.assertEqual([500, 500, 1], batch_sizes)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,18 @@ class AuditLogMongoRepoTestCase(unittest.TestCase):
         repo.create_log(data)
         db[repo.AUDIT_LOG_COLLECTION].insert_one.assert_called_with(data)
 
+    def test_success_create_audit_logs(self):
+        logs = [{"a": "b"}, {"c": "d"}]
+        db = MagicMock()
+        db[
+            MongoAuditLogRepository.AUDIT_LOG_COLLECTION
+        ].insert_many.return_value = MagicMock(inserted_ids=[1, 2])
+        repo = MongoAuditLogRepository(db)
+        self.assertEqual(2, repo.create_logs(logs))
+        db[repo.AUDIT_LOG_COLLECTION].insert_many.assert_called_with(
+            logs, ordered=False
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
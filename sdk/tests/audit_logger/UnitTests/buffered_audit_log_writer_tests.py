@@ -0,0 +1,125 @@
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from sdk.audit_logger.adapter.audit_log_adapter import AuditLogAdapter
+from sdk.audit_logger.adapter.buffered_audit_log_writer import (
+    BufferedAuditLogWriter,
+)
+from sdk.phoenix.config.server_config import AuditLogBufferConfig
+
+WRITER_PATH = "sdk.audit_logger.adapter.buffered_audit_log_writer"
+
+
+def buffer_config(**fields) -> AuditLogBufferConfig:
+    return AuditLogBufferConfig.from_dict({"enabled": True, **fields})
+
+
+class BufferedAuditLogWriterTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = MagicMock()
+        self.repo.create_logs.side_effect = lambda logs: len(logs)
+
+    def _writer(self, **fields) -> BufferedAuditLogWriter:
+        writer = BufferedAuditLogWriter(buffer_config(**fields), lambda: self.repo)
+        self.addCleanup(writer.close)
+        return writer
+
+    def _written_logs(self) -> list[dict]:
+        return [log for c in self.repo.create_logs.call_args_list for log in c.args[0]]
+
+    def test_logs_written_in_batches(self):
+        writer = self._writer(batchSize=2, flushIntervalMs=50)
+        logs = [{"message": str(index)} for index in range(5)]
+        for log in logs:
+            writer.write(log)
+
+        writer.close()
+
+        self.assertEqual(logs, self._written_logs())
+        for create_call in self.repo.create_logs.call_args_list:
+            self.assertLessEqual(len(create_call.args[0]), 2)
+        self.assertEqual(5, writer.stats()["written"])
+        self.assertEqual(0, writer.queue_depth)
+
+    def test_overflow_dropped_with_drop_policy(self):
+        writer = self._writer(maxQueueSize=1, overflowPolicy="DROP")
+        writer._ensure_started = MagicMock()  # keeps logs in the queue
+
+        for index in range(3):
+            writer.write({"message": str(index)})
+
+        self.assertEqual(1, writer.queue_depth)
+        self.assertEqual(2, writer.dropped)
+        self.repo.create_logs.assert_not_called()
+
+    def test_overflow_written_on_caller_thread_with_block_policy(self):
+        writer = self._writer(maxQueueSize=1, blockTimeoutMs=0)
+        writer._ensure_started = MagicMock()
+
+        writer.write({"message": "queued"})
+        writer.write({"message": "overflow"})
+
+        self.repo.create_logs.assert_called_once_with([{"message": "overflow"}])
+        self.assertEqual(0, writer.dropped)
+
+    def _flush_failing_batch(self, **fields) -> BufferedAuditLogWriter:
+        self.repo.create_logs.side_effect = Exception("database is down")
+        writer = self._writer(writeRetries=2, retryBackoffMs=0, **fields)
+        writer._ensure_started = MagicMock()
+        writer.write({"message": "first"})
+        writer.write({"message": "second"})
+        writer.flush()
+        return writer
+
+    def test_failed_batch_retried_then_counted_with_drop_policy(self):
+        writer = self._flush_failing_batch(failurePolicy="DROP")
+
+        self.assertEqual(3, self.repo.create_logs.call_count)
+        self.repo.create_log.assert_not_called()
+        self.assertEqual(2, writer.failed)
+
+    @patch(f"{WRITER_PATH}.time.sleep")
+    def test_failed_batch_retried_with_backoff(self, sleep):
+        self.repo.create_logs.side_effect = [Exception("timeout"), Exception(), 1]
+        writer = self._writer(writeRetries=3, retryBackoffMs=100)
+        writer._ensure_started = MagicMock()
+        writer.write({"message": "log"})
+
+        writer.flush()
+
+        self.assertEqual([call(0.1), call(0.2)], sleep.call_args_list)
+        self.assertEqual(1, writer.written)
+        self.assertEqual(0, writer.failed)
+
+    def test_failed_batch_inserted_one_by_one(self):
+        self.repo.create_log.side_effect = [None, Exception("invalid log")]
+
+        with self.assertLogs(WRITER_PATH, "ERROR") as logs:
+            writer = self._flush_failing_batch()
+
+        self.assertEqual(2, self.repo.create_log.call_count)
+        self.assertEqual(1, writer.written)
+        self.assertEqual(1, writer.failed)
+        self.assertIn("'second'", logs.output[0])
+
+    def test_failed_batch_written_to_error_log(self):
+        with self.assertLogs(WRITER_PATH, "ERROR") as logs:
+            writer = self._flush_failing_batch(failurePolicy="LOG")
+
+        self.repo.create_log.assert_not_called()
+        self.assertEqual(2, writer.failed)
+        self.assertEqual(2, len(logs.output))
+
+    def test_adapter_hands_logs_to_writer(self):
+        writer = MagicMock()
+        adapter = AuditLogAdapter(MagicMock(enable=True), writer)
+
+        adapter.info("message", label="audit", action="Login")
+
+        writer.write.assert_called_once_with(
+            {"label": "audit", "level": "INFO", "message": "message", "action": "Login"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
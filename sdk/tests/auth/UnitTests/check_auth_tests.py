@@ -3,7 +3,9 @@ from unittest.mock import patch, MagicMock
 
 from flask import Flask
 
+from sdk.auth.config.auth_config import IdentityCacheConfig
 from sdk.auth.decorators import check_auth
+from sdk.auth.identity_cache import identity_cache
 from sdk.auth.model.auth_user import AuthUser
 from sdk.auth.repository.auth_repository import AuthRepository
 from sdk.auth.use_case.auth_request_objects import BaseAuthRequestObject
@@ -53,3 +55,12 @@ class CheckAuthTestCase(unittest.TestCase):
         with patch("sdk.auth.decorators.set_user") as mock_set:
             check_auth()
         mock_set.assert_called_once_with(SAMPLE_USER_DATA)
+
+    def test_check_auth_loads_cached_user_once(self):
+        identity_cache.configure(IdentityCacheConfig(enabled=True))
+        try:
+            check_auth()
+            check_auth()
+        finally:
+            identity_cache.configure(IdentityCacheConfig())
+        inject.instance(AuthRepository).get_user.assert_called_once_with(uid=USER_ID)
@@ -0,0 +1,128 @@
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from flask import Flask
+from mohawk import Sender
+from redis import Redis
+
+from sdk.auth.config.auth_config import IdentityCacheConfig
+from sdk.auth.identity_cache import identity_cache
+from sdk.auth.model.auth_user import AuthKey
+from sdk.auth.repository.auth_repository import AuthRepository
+from sdk.common.utils import inject
+from sdk.common.utils.token.hawk.exceptions import HawkRequestAlreadyProcessed
+from sdk.common.utils.token.hawk.hawk import (
+    UserKey,
+    get_hawk_receiver,
+    seen_nonce_factory,
+)
+from sdk.phoenix.config.server_config import HawkTokenConfig, PhoenixServerConfig
+from sdk.tests.auth.test_helpers import USER_ID
+
+AUTH_IDENTIFIER = "5e8f0c74b50aa9656c34789d"
+AUTH_KEY = "a" * 64
+USER_KEY = UserKey(userId=USER_ID, authIdentifier=AUTH_IDENTIFIER).to_string()
+URL = "http://localhost/api/extensions/v1beta/user/data"
+REQUESTS_COUNT = 200
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.commands = 0
+
+    def set(self, key, value, ex=None, nx=False):
+        self.commands += 1
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+
+class HawkTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+        self.redis = FakeRedis()
+        self.auth_repo = MagicMock()
+        self.auth_repo.retrieve_auth_key.return_value = {
+            AuthKey.AUTH_KEY: AUTH_KEY,
+            AuthKey.AUTH_IDENTIFIER: AUTH_IDENTIFIER,
+        }
+        server_config = MagicMock()
+        server_config.server.adapters.hawk = HawkTokenConfig()
+
+        def bind(binder):
+            binder.bind(PhoenixServerConfig, server_config)
+            binder.bind(AuthRepository, self.auth_repo)
+            binder.bind(Redis, self.redis)
+
+        inject.clear_and_configure(bind)
+        identity_cache.configure(IdentityCacheConfig(enabled=True))
+
+    def tearDown(self) -> None:
+        identity_cache.configure(IdentityCacheConfig())
+
+    def _receive(self, content: str, header: str = None):
+        header = header or self._sign(content)
+        with self.app.test_request_context(
+            URL,
+            method="POST",
+            data=content,
+            content_type="application/json",
+            headers={"Authorization": header},
+        ):
+            return get_hawk_receiver()
+
+    @staticmethod
+    def _sign(content: str) -> str:
+        credentials = {"id": USER_KEY, "key": AUTH_KEY, "algorithm": "sha256"}
+        sender = Sender(
+            credentials,
+            url=URL,
+            method="POST",
+            content=content,
+            content_type="application/json",
+        )
+        return sender.request_header
+
+    def test_nonce_checked_with_one_command(self):
+        seen_nonce = seen_nonce_factory(timestamp_skew=60)
+
+        self.assertFalse(seen_nonce(USER_KEY, "nonce", 1))
+        self.assertTrue(seen_nonce(USER_KEY, "nonce", 1))
+        self.assertEqual(2, self.redis.commands)
+
+    def test_replayed_request_rejected(self):
+        header = self._sign("{}")
+        self._receive("{}", header)
+
+        with self.assertRaises(HawkRequestAlreadyProcessed):
+            self._receive("{}", header)
+
+    def test_invalidated_user_credentials_loaded_again(self):
+        self._receive("{}")
+        identity_cache.invalidate(USER_ID)
+        self._receive("{}")
+
+        self.assertEqual(2, self.auth_repo.retrieve_auth_key.call_count)
+
+    def test_hawk_path_round_trips(self):
+        """Signed device uploads: credentials loaded once, one redis command each."""
+        contents = [json.dumps({"value": i}) for i in range(REQUESTS_COUNT)]
+        headers = [self._sign(content) for content in contents]
+
+        for content, header in zip(contents, headers):
+            self._receive(content, header)
+
+        self.auth_repo.retrieve_auth_key.assert_called_once()
+        self.assertEqual(REQUESTS_COUNT, self.redis.commands)
+        self.assertEqual(REQUESTS_COUNT, len(self.redis.values))
+
+        with self.assertRaises(HawkRequestAlreadyProcessed):
+            self._receive(contents[0], headers[0])
+        self.auth_repo.retrieve_auth_key.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
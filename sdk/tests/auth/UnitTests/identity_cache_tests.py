@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sdk.auth.config.auth_config import IdentityCacheConfig
+from sdk.auth.identity_cache import IdentityCache
+from sdk.auth.model.auth_user import AuthUser
+from sdk.tests.auth.test_helpers import USER_ID
+
+IDENTITY_CACHE_PATH = "sdk.auth.identity_cache"
+
+
+class IdentityCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = IdentityCache(IdentityCacheConfig(enabled=True, ttlSeconds=5))
+        self.load = MagicMock(return_value=AuthUser(id=USER_ID))
+
+    def _get(self, version=None):
+        return self.cache.get_or_load(
+            IdentityCache.AUTH_USER, USER_ID, self.load, version
+        )
+
+    def test_cached_user_loaded_once(self):
+        self.assertEqual(self._get(), self._get())
+        self.load.assert_called_once()
+
+    def test_cached_user_returned_as_copy(self):
+        self._get().email = "changed@huma.com"
+        self.assertIsNone(self._get().email)
+
+    def test_expired_user_loaded_again(self):
+        with patch(f"{IDENTITY_CACHE_PATH}.time.monotonic") as monotonic:
+            monotonic.return_value = 100
+            self._get()
+            monotonic.return_value = 106
+            self._get()
+        self.assertEqual(2, self.load.call_count)
+
+    def test_invalidated_user_loaded_again(self):
+        self._get()
+        self.cache.invalidate(USER_ID)
+        self._get()
+        self.assertEqual(2, self.load.call_count)
+
+    def test_user_cached_per_token_version(self):
+        self._get(version=1)
+        self._get(version=2)
+        self._get(version=1)
+        self.assertEqual(2, self.load.call_count)
+
+    def test_user_invalidated_during_load_not_cached(self):
+        def load():
+            self.cache.invalidate(USER_ID)
+            return AuthUser(id=USER_ID)
+
+        self.cache.get_or_load(IdentityCache.AUTH_USER, USER_ID, load)
+        self._get()
+        self.load.assert_called_once()
+
+    def test_least_recently_used_user_evicted(self):
+        self.cache.configure(IdentityCacheConfig(enabled=True, maxSize=1))
+        self._get()
+        self.cache.get_or_load(IdentityCache.AUTH_USER, "other", MagicMock())
+        self._get()
+        self.assertEqual(2, self.load.call_count)
+
+    def test_disabled_cache_loads_every_time(self):
+        self.cache.configure(IdentityCacheConfig())
+        self._get()
+        self._get()
+        self.assertEqual(2, self.load.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -372,6 +372,26 @@ class MongoAuthRepositoryTestCase(unittest.TestCase):
 
         self._db[USER_COLLECTION].update_one.assert_called_once()
 
+    @patch(f"{MONGO_AUTH_REPO_PATH}.identity_cache")
+    @patch(f"{MONGO_AUTH_REPO_PATH}.inject", MagicMock())
+    def test_set_auth_attributes_invalidates_cached_user(self, identity_cache):
+        auth_repo = MongoAuthRepository(client=self._client)
+        self._db[USER_COLLECTION].update_one.return_value = MagicMock()
+
+        auth_repo.set_auth_attributes(uid=SAMPLE_ID, mfa_enabled=True)
+
+        identity_cache.invalidate.assert_called_once_with(SAMPLE_ID)
+
+    @patch(f"{MONGO_AUTH_REPO_PATH}.identity_cache")
+    @patch(f"{MONGO_AUTH_REPO_PATH}.inject", MagicMock())
+    def test_change_password_clears_cached_users(self, identity_cache):
+        auth_repo = MongoAuthRepository(client=self._client)
+        self._db[USER_COLLECTION].update_one.return_value = MagicMock()
+
+        auth_repo.change_password(SAMPLE_PASSWORD, SAMPLE_EMAIL, [])
+
+        identity_cache.clear.assert_called_once()
+
     @patch(f"{MONGO_AUTH_REPO_PATH}.inject", MagicMock())
     def test_check_phone_number_exists(self):
         auth_repo = MongoAuthRepository(client=self._client)
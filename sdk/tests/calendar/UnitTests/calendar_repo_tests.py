@@ -7,6 +7,7 @@ from pymongo.database import Database
 from sdk.calendar.models.calendar_event import CalendarEvent
 from sdk.calendar.repo.mongo_calendar_repository import (
     MongoCalendarRepository,
+    next_day_event_id,
     to_mongo_calendar_event,
 )
 from sdk.common.exceptions.exceptions import InvalidRequestException
@@ -63,6 +64,33 @@ class CalendarRepoTestCase(unittest.TestCase):
         with self.assertRaises(InvalidRequestException):
             repo.update_calendar_event("invalid_id", event)
 
+    def test_next_day_events_upserted_by_occurrence(self):
+        CalendarEvent.register(self.TestEvent.__name__, self.TestEvent)
+        repo = MongoCalendarRepository()
+        event = CalendarEvent.from_dict(
+            {
+                CalendarEvent.MODEL: "TestEvent",
+                CalendarEvent.USER_ID: USER_ID,
+                CalendarEvent.PARENT_ID: str(ObjectId()),
+                CalendarEvent.START_DATE_TIME: "2020-10-20T20:20:00.000Z",
+            }
+        )
+
+        self.assertEqual(1, repo.replace_next_day_events_for_users([USER_ID], [event]))
+
+        collection = self.db[repo.CACHE_CALENDAR_COLLECTION]
+        (request,) = collection.bulk_write.call_args.args[0]
+        event_id = next_day_event_id(event)
+        self.assertEqual({"_id": event_id}, request._filter)
+        self.assertTrue(request._upsert)
+        self.assertEqual(event_id, next_day_event_id(event))
+        collection.delete_many.assert_called_once_with(
+            {
+                CalendarEvent.USER_ID: {"$in": [ObjectId(USER_ID)]},
+                "_id": {"$nin": [event_id]},
+            }
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -152,6 +152,51 @@ class CalendarServiceTestCase(unittest.TestCase):
         )
         service.save_next_day_events.assert_called_with([expected_value])
 
+    @freeze_time("2021-01-05T10:00:00.000Z")
+    def test_calculate_and_save_next_day_events_in_chunks(self):
+        repo = MagicMock()
+        event = TestEvent(
+            id=SAMPLE_ID,
+            userId=SAMPLE_ID,
+            model=TestEvent.__name__,
+            isRecurring=True,
+            startDateTime="2021-01-01T12:00:00.000000Z",
+            recurrencePattern=TEST_PATTERN,
+        )
+        repo.retrieve_calendar_events.side_effect = [[event], []]
+        repo.replace_next_day_events_for_users.side_effect = lambda _, e: len(e)
+        service = CalendarService(repo, None)
+        other_users = ["61c56b6b64d0f5b742c4b898", "61c56b6b64d0f5b742c4b899"]
+        user_timezones = {SAMPLE_ID: "UTC", **{id_: "UTC" for id_ in other_users}}
+
+        saved = service.calculate_and_save_next_day_events_in_chunks(
+            user_timezones, users_chunk_size=2
+        )
+
+        self.assertEqual(1, saved)
+        chunks = [
+            c.args[0] for c in repo.replace_next_day_events_for_users.call_args_list
+        ]
+        self.assertEqual([[SAMPLE_ID, other_users[0]], [other_users[1]]], chunks)
+        query = repo.retrieve_calendar_events.call_args_list[0].kwargs
+        self.assertEqual({"$in": chunks[0]}, query[Event.USER_ID])
+        (saved_event,) = repo.replace_next_day_events_for_users.call_args_list[0].args[
+            1
+        ]
+        self.assertEqual(SAMPLE_ID, saved_event.parentId)
+        self.assertIsNone(saved_event.id)
+        repo.clear_cached_events.assert_not_called()
+
+    def test_clean_up_next_day_events_removes_events_without_user(self):
+        repo = MagicMock()
+        repo.retrieve_calendar_event_user_ids.return_value = [SAMPLE_ID, "removed"]
+        service = CalendarService(repo, None)
+
+        service.clean_up_next_day_events({SAMPLE_ID: "UTC"})
+
+        repo.delete_user_events.assert_called_once_with(user_id="removed")
+        repo.batch_delete_next_day_event_raw.assert_called_once()
+
     @freeze_time("2021-01-05T10:00:00.000Z")
     @patch(
         "sdk.calendar.service.calendar_service.CalendarService.batch_delete_calendar_events_by_ids"
@@ -8,7 +8,10 @@ from sdk.calendar.tasks import (
     prepare_events_for_next_day,
     prepare_events_and_execute,
     event_to_typed_dict,
+    execute_events,
+    split_users_into_shards,
 )
+from sdk.phoenix.config.server_config import CalendarConfig, NextDayEventsConfig
 
 CALENDAR_TASKS_PATH = "sdk.calendar.tasks"
 
@@ -23,12 +26,37 @@ class CalendarTasksTestCase(unittest.TestCase):
             crontab(hour=3, minute=0), prepare_events.s(), name="New users handler"
         )
 
+    @patch(f"{CALENDAR_TASKS_PATH}._next_day_events_config", NextDayEventsConfig)
     @patch(f"{CALENDAR_TASKS_PATH}.CalendarService")
     @patch(f"{CALENDAR_TASKS_PATH}.get_timezones")
     def test_success_prepare_events_for_next_day(self, get_timezones, service):
         prepare_events_for_next_day()
         service().calculate_and_save_next_day_events.assert_called_with(get_timezones())
 
+    @patch(f"{CALENDAR_TASKS_PATH}._next_day_events_config")
+    @patch(f"{CALENDAR_TASKS_PATH}.prepare_events_for_next_day_for_users")
+    @patch(f"{CALENDAR_TASKS_PATH}.CalendarService")
+    @patch(f"{CALENDAR_TASKS_PATH}.get_timezones")
+    def test_prepare_events_for_next_day_in_shards(
+        self, get_timezones, service, shard_task, config
+    ):
+        config.return_value = NextDayEventsConfig(streaming=True, shards=2)
+        get_timezones.return_value = {"a": "UTC", "b": "UTC", "c": "Europe/London"}
+
+        prepare_events_for_next_day()
+
+        service().clean_up_next_day_events.assert_called_once()
+        service().calculate_and_save_next_day_events.assert_not_called()
+        shard_task.delay.assert_any_call({"c": "Europe/London", "a": "UTC"})
+        shard_task.delay.assert_any_call({"b": "UTC"})
+
+    def test_split_users_into_shards(self):
+        user_timezones = {str(i): "UTC" for i in range(5)}
+        shards = split_users_into_shards(user_timezones, 3)
+        self.assertEqual([2, 2, 1], [len(shard) for shard in shards])
+        self.assertEqual([], split_users_into_shards({}, 3))
+
+    @patch(f"{CALENDAR_TASKS_PATH}._calendar_config", CalendarConfig)
     @patch(f"{CALENDAR_TASKS_PATH}.CalendarService")
     @patch(f"{CALENDAR_TASKS_PATH}.now_no_seconds")
     def test_success_prepare_events_and_execute(self, now_no_seconds, service):
@@ -38,6 +66,34 @@ class CalendarTasksTestCase(unittest.TestCase):
         )
         service().batch_delete_next_day_events.assert_called_with([])
 
+    @patch(f"{CALENDAR_TASKS_PATH}._calendar_config")
+    @patch(f"{CALENDAR_TASKS_PATH}.execute_events")
+    @patch(f"{CALENDAR_TASKS_PATH}.event_to_typed_dict", lambda e: e.model)
+    @patch(f"{CALENDAR_TASKS_PATH}.CalendarService")
+    def test_prepare_events_and_execute_in_chunks_by_type(
+        self, service, execute, config
+    ):
+        config.return_value = CalendarConfig(executionChunkSize=2)
+        events = [MagicMock(model=model) for model in ("A", "B", "A", "A")]
+        service().retrieve_next_day_events.return_value = events
+
+        prepare_events_and_execute()
+
+        chunks = [c.args[0] for c in execute.delay.call_args_list]
+        self.assertEqual([["A", "A"], ["A"], ["B"]], chunks)
+
+    @patch(f"{CALENDAR_TASKS_PATH}.CalendarEvent")
+    def test_execute_events_executes_events_of_type_at_once(self, calendar_event):
+        event_class = calendar_event.child.return_value
+        event_class.__name__ = "A"
+        event_class.from_dict.return_value.startDateTime = "2021-01-05T10:00:00Z"
+
+        execute_events([{"type": "A"}, {"type": "A"}])
+
+        (events,), kwargs = event_class.execute_many.call_args
+        self.assertEqual(2, len(events))
+        self.assertFalse(kwargs["run_async"])
+
     def test_success_event_to_typed_dict(self):
         event = MagicMock()
         res = event_to_typed_dict(event)
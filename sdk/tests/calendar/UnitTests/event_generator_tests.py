@@ -0,0 +1,165 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from bson import ObjectId
+
+from sdk.calendar.models.calendar_event import CalendarEvent as Event, CalendarEventLog
+from sdk.calendar.models.event_generator import EventGenerator, compile_rrule
+from sdk.calendar.utils import get_dt_from_str
+from sdk.common.utils.validators import utc_str_field_to_val
+
+START = datetime(2021, 1, 1, 10)
+EVENT_GENERATOR_PATH = "sdk.calendar.models.event_generator"
+
+
+def generate_events_and_logs(parents: int, days: int):
+    events, logs = [], []
+    for _ in range(parents):
+        parent_id = str(ObjectId())
+        for day in range(days):
+            start = START + timedelta(days=day)
+            events.append(
+                {
+                    Event.ID: parent_id,
+                    Event.START_DATE_TIME: utc_str_field_to_val(start),
+                    Event.ENABLED: True,
+                }
+            )
+            log = CalendarEventLog(
+                id=str(ObjectId()),
+                parentId=parent_id,
+                startDateTime=start,
+                createDateTime=start,
+            )
+            logs.append(log)
+    return events, logs
+
+
+class EventGeneratorTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.generator = EventGenerator(retrieve_all=True)
+
+    def test_disable_completed_events(self):
+        events, logs = generate_events_and_logs(parents=2, days=3)
+        completed_log = logs.pop(1)
+        logs = [completed_log]
+
+        self.generator.disable_completed_events(events, logs)
+
+        completed = [event for event in events if not event[Event.ENABLED]]
+        self.assertEqual(1, len(completed))
+        self.assertEqual(completed_log.id, completed[0][Event.ID])
+        self.assertEqual(
+            utc_str_field_to_val(completed_log.createDateTime),
+            completed[0][Event.COMPLETE_DATE_TIME],
+        )
+
+    def test_disable_completed_events_first_log_matches(self):
+        events, logs = generate_events_and_logs(parents=1, days=1)
+        duplicate = CalendarEventLog(
+            id=str(ObjectId()),
+            parentId=logs[0].parentId,
+            startDateTime=logs[0].startDateTime,
+            createDateTime=START,
+        )
+
+        self.generator.disable_completed_events(events, [logs[0], duplicate])
+
+        self.assertEqual(logs[0].id, events[0][Event.ID])
+
+    def test_disable_completed_events_uses_generator_logs(self):
+        events, logs = generate_events_and_logs(parents=1, days=2)
+        generator = EventGenerator(retrieve_all=True, logs=logs[:1])
+
+        generator.disable_completed_events(events)
+
+        self.assertEqual([False, True], [e[Event.ENABLED] for e in events])
+
+    def test_disable_completed_events_indexes_logs_once(self):
+        events, logs = generate_events_and_logs(parents=10, days=20)
+        build_logs_index = EventGenerator.build_logs_index
+        with patch.object(
+            EventGenerator, "build_logs_index", side_effect=build_logs_index
+        ) as build_index, patch(
+            f"{EVENT_GENERATOR_PATH}.get_dt_from_str", wraps=get_dt_from_str
+        ) as parse_start:
+            self.generator.disable_completed_events(events, logs)
+
+        build_index.assert_called_once_with(logs)
+        self.assertEqual(len(events), parse_start.call_count)
+        self.assertFalse(any(event[Event.ENABLED] for event in events))
+
+    def test_generator_logs_index_reused_between_calls(self):
+        events, logs = generate_events_and_logs(parents=2, days=3)
+        generator = EventGenerator(retrieve_all=True, logs=logs)
+        build_logs_index = EventGenerator.build_logs_index
+        with patch.object(
+            EventGenerator, "build_logs_index", side_effect=build_logs_index
+        ) as build_index:
+            generator.disable_completed_events(events[:3])
+            generator.disable_completed_events(events[3:])
+
+        build_index.assert_called_once_with(logs)
+
+
+class FullExpansionEventGenerator(EventGenerator):
+    def _window_starts(self, rule, event_duration):
+        return rule
+
+
+def recurring_event(**kwargs) -> dict:
+    return {
+        Event.ID: str(ObjectId()),
+        Event.IS_RECURRING: True,
+        Event.RECURRENCE_PATTERN: "DTSTART:20200101T080000\nRRULE:FREQ=DAILY",
+        Event.INSTANCE_EXPIRES_IN: "PT10H",
+        Event.SNOOZING: ["PT1H", "PT3H"],
+        **kwargs,
+    }
+
+
+class RecurringEventExpansionTestCase(unittest.TestCase):
+    def test_window_expansion_matches_full_expansion(self):
+        window = {"start": datetime(2021, 3, 1, 12), "end": datetime(2021, 3, 4, 9)}
+        generators_kwargs = [
+            window,
+            {**window, "allow_past_events": False},
+            {**window, "expiring": True},
+            {"now": datetime(2021, 3, 2, 17)},
+        ]
+        events = [
+            recurring_event(),
+            recurring_event(**{Event.END_DATE_TIME: "2021-03-03T08:30:00.000000Z"}),
+        ]
+        for kwargs in generators_kwargs:
+            for include_snoozing in (False, True):
+                with self.subTest(**kwargs, include_snoozing=include_snoozing):
+                    expected = FullExpansionEventGenerator(**kwargs).generate(
+                        [dict(e) for e in events], include_snoozing
+                    )
+                    generated = EventGenerator(**kwargs).generate(
+                        [dict(e) for e in events], include_snoozing
+                    )
+                    self.assertTrue(generated)
+                    self.assertEqual(expected, generated)
+
+    def test_snoozing_removed_from_base_event_only_when_included(self):
+        generator = EventGenerator(now=datetime(2021, 3, 2, 10))
+
+        (event,) = generator.generate([recurring_event()])
+        events = generator.generate([recurring_event()], include_snoozing=True)
+
+        self.assertIn(Event.SNOOZING, event)
+        self.assertEqual(2, len(events))
+        self.assertTrue(all(Event.SNOOZING not in e for e in events))
+
+    def test_compiled_rule_reused_between_calls(self):
+        generator = EventGenerator(start=datetime(2021, 3, 1), end=datetime(2021, 3, 2))
+        pattern = "DTSTART:20210101T090000\nRRULE:FREQ=DAILY"
+        compile_rrule.cache_clear()
+        with patch(f"{EVENT_GENERATOR_PATH}.rrule.rrulestr") as rrulestr:
+            for _ in range(3):
+                generator.safe_rrule(pattern, "PT10H")
+
+        rrulestr.assert_called_once_with(pattern)
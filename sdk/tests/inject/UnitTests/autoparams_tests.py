@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock, patch
+
 from sdk.common.utils import inject
 from sdk.tests.inject import BaseTestInject
 
@@ -153,3 +155,62 @@ class TestInjectAutoparams(BaseTestInject):
 
         inject.configure(config)
         assert test_func() == "bazinga"
+
+    def test_autoparams_reuses_singleton_instances(self):
+        @inject.autoparams()
+        def test_func(a: "A"):
+            return a
+
+        inject.configure(lambda binder: binder.bind("A", 1))
+        injector = inject.get_injector()
+        with patch.object(injector, "get_instance", wraps=injector.get_instance) as get:
+            assert [test_func() for _ in range(3)] == [1, 1, 1]
+        get.assert_called_once_with("A")
+
+    def test_autoparams_calls_provider_on_every_call(self):
+        @inject.autoparams()
+        def test_func(a: "A"):
+            return a
+
+        provider = MagicMock(side_effect=[1, 2])
+        inject.configure(lambda binder: binder.bind_to_provider("A", provider))
+        assert test_func() == 1
+        assert test_func() == 2
+
+    def test_autoparams_cache_invalidated_on_reconfigure(self):
+        @inject.autoparams()
+        def test_func(a: "A"):
+            return a
+
+        inject.configure(lambda binder: binder.bind("A", 1))
+        assert test_func() == 1
+        inject.clear_and_configure(lambda binder: binder.bind("A", 2))
+        assert test_func() == 2
+        inject.get_injector().rebind(lambda binder: binder.bind("A", 3))
+        assert test_func() == 3
+
+    def test_autoparams_cache_kept_for_unrelated_rebind(self):
+        @inject.autoparams()
+        def test_func(a: "A", b: "B"):
+            return a, b
+
+        inject.configure(lambda binder: binder.bind("A", 1).bind("B", 1))
+        assert test_func() == (1, 1)
+        injector = inject.get_injector()
+        injector.rebind(lambda binder: binder.bind("B", 2))
+        with patch.object(injector, "get_instance", wraps=injector.get_instance) as get:
+            assert test_func() == (1, 2)
+        get.assert_called_once_with("B")
+
+    def test_autoparams_counts_injections(self):
+        @inject.autoparams()
+        def test_func(a: "A"):
+            return a
+
+        inject.configure(lambda binder: binder.bind("A", 1))
+        inject.reset_injection_counts()
+        test_func()
+        test_func()
+        test_func(a=2)
+        counts = inject.injection_counts()
+        self.assertEqual(2, counts[test_func.__qualname__])
@@ -39,6 +39,13 @@ class MongoNotificationRepositoryTestCase(unittest.TestCase):
         repo.retrieve_devices(user_id)
         mongo_doc.objects.assert_called_with(userId=user_id)
 
+    @patch(f"{NOTIFICATION_REPO_PATH}.MongoDeviceDocument")
+    @patch(f"{NOTIFICATION_REPO_PATH}.Device")
+    def test_success_retrieve_users_devices(self, device, mongo_doc):
+        repo = MongoNotificationRepository()
+        repo.retrieve_users_devices([SAMPLE_ID])
+        mongo_doc.objects.assert_called_with(userId__in=[SAMPLE_ID])
+
     @patch(f"{NOTIFICATION_REPO_PATH}.MongoDeviceDocument")
     def test_success_delete_device(self, mongo_doc):
         repo = MongoNotificationRepository()
@@ -2,14 +2,18 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 from sdk.notification.model.device import PushIdType
+from sdk.common.adapter.push_notification_adapter import AndroidMessage
 from sdk.notification.services.notification_service import (
     NotificationService,
+    UserPush,
     async_push_for_user,
+    async_push_for_users,
     async_push_for_voip_user_task,
 )
 
 NOTIFICATION_SERVICE_PATH = "sdk.notification.services.notification_service"
 SAMPLE_ID = "600a8476a961574fb38157d5"
+SAMPLE_ID_2 = "600a8476a961574fb38157d6"
 
 
 class NotificationServiceTestCase(unittest.TestCase):
@@ -76,6 +80,32 @@ class NotificationServiceTestCase(unittest.TestCase):
             user_id, android.to_dict(), ios.to_dict(), ali_cloud.to_dict(), ttl
         )
 
+    @patch(f"{NOTIFICATION_SERVICE_PATH}.NotificationRepository")
+    @patch(f"{NOTIFICATION_SERVICE_PATH}.async_push_for_users")
+    def test_push_for_users_groups_identical_messages(self, push_for_users, repo):
+        service = NotificationService(repo)
+        reminder = AndroidMessage(data={"action": "reminder"})
+        other = AndroidMessage(data={"action": "other"})
+        pushes = [
+            UserPush(userId=SAMPLE_ID, android=reminder),
+            UserPush(userId=SAMPLE_ID_2, android=AndroidMessage(data=reminder.data)),
+            UserPush(userId=SAMPLE_ID, android=other),
+        ]
+
+        service.push_for_users(pushes)
+
+        push_for_users.delay.assert_any_call(
+            [SAMPLE_ID, SAMPLE_ID_2],
+            reminder.to_dict(include_none=False),
+            None,
+            None,
+            None,
+        )
+        push_for_users.delay.assert_any_call(
+            [SAMPLE_ID], other.to_dict(include_none=False), None, None, None
+        )
+        self.assertEqual(2, push_for_users.delay.call_count)
+
     @patch(f"{NOTIFICATION_SERVICE_PATH}.VoipApnsMessage")
     @patch(f"{NOTIFICATION_SERVICE_PATH}.AndroidMessage")
     @patch(f"{NOTIFICATION_SERVICE_PATH}.NotificationRepository")
@@ -168,6 +198,29 @@ class NotificationServiceTestCase(unittest.TestCase):
         mock_inject.instance().send_message_to_identities.assert_called()
         assert mock_inject.instance().delete_devices.call_count == 0
 
+    @patch(f"{NOTIFICATION_SERVICE_PATH}.AndroidMessage")
+    @patch(f"{NOTIFICATION_SERVICE_PATH}.inject")
+    def test_async_push_for_users(self, mock_inject, mock_android_msg):
+        devices = [
+            MagicMock(devicePushIdType=PushIdType.ANDROID_FCM, devicePushId="one"),
+            MagicMock(devicePushIdType=PushIdType.ANDROID_FCM, devicePushId="two"),
+            MagicMock(devicePushIdType=PushIdType.ANDROID_FCM, devicePushId="one"),
+        ]
+        mock_inject.instance().retrieve_users_devices.return_value = devices
+        mock_inject.instance().send_message_to_identities.return_value = ["two"]
+
+        async_push_for_users([SAMPLE_ID, SAMPLE_ID_2], MagicMock())
+
+        mock_inject.instance().retrieve_users_devices.assert_called_once_with(
+            [SAMPLE_ID, SAMPLE_ID_2]
+        )
+        mock_inject.instance().send_message_to_identities.assert_called_once_with(
+            ["one", "two"],
+            message=mock_android_msg.from_dict(),
+            ttl=None,
+        )
+        mock_inject.instance().delete_devices.assert_called_once_with(["two"])
+
     @patch(f"{NOTIFICATION_SERVICE_PATH}.logger")
     @patch(f"{NOTIFICATION_SERVICE_PATH}.VoipApnsMessage")
     @patch(f"{NOTIFICATION_SERVICE_PATH}.AndroidMessage")
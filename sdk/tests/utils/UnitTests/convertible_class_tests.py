@@ -1,9 +1,11 @@
 import unittest
-from dataclasses import field
+from unittest.mock import patch
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, IntEnum
 from typing import Any
 
+from sdk.common.utils import convertible
 from sdk.common.utils.convertible import (
     convertibleclass,
     meta,
@@ -723,5 +725,64 @@ class ResetAttributesTestCase(unittest.TestCase):
         self.assertEqual("ActualName", cls.name)
 
 
+class FieldPlanTestCase(unittest.TestCase):
+    def test_plan_compiled_on_decoration(self):
+        @convertibleclass
+        class TestClass:
+            f1: int = default_field(metadata=meta(lambda x: x > 0, required=True))
+            _private: str = None
+            CONSTANT: str = None
+
+        plan = TestClass.__dict__[convertible._PLAN]
+        self.assertEqual(["f1"], [field_plan.name for field_plan in plan.fields])
+        self.assertTrue(plan.by_name["f1"].required)
+        with patch.object(convertible, "fields") as fields:
+            self.assertEqual(1, TestClass.from_dict({"f1": 1}).f1)
+        fields.assert_not_called()
+
+    def test_not_decorated_subclass_has_own_plan(self):
+        @convertibleclass
+        class Parent:
+            f1: int = None
+
+        @dataclass
+        class Child(Parent):
+            f2: str = None
+
+        Parent.from_dict({"f1": 1})
+        child = Child.from_dict({"f1": 1, "f2": "value"})
+
+        self.assertEqual("value", child.f2)
+        self.assertEqual({"f1": 1, "f2": "value"}, child.to_dict())
+        self.assertEqual(
+            ["f1"], [f.name for f in Parent.__dict__[convertible._PLAN].fields]
+        )
+
+    def test_list_type_registered_after_decoration_is_resolved(self):
+        @convertibleclass
+        class Container:
+            items: list["LaterRegisteredItem"] = default_field()
+
+        @convertibleclass
+        class LaterRegisteredItem:
+            name: str = None
+
+        container = Container.from_dict({"items": [{"name": "item"}]})
+
+        self.assertIsInstance(container.items[0], LaterRegisteredItem)
+
+    def test_int_enum_converted_to_int(self):
+        class Level(IntEnum):
+            LOW = 1
+            HIGH = 2
+
+        @convertibleclass
+        class TestClass:
+            level: Level = None
+
+        self.assertEqual({"level": 2}, TestClass(level=Level.HIGH).to_dict())
+        self.assertEqual(Level.LOW, TestClass.from_dict({"level": 1}).level)
+
+
 if __name__ == "__main__":
     unittest.main()
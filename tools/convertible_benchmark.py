@@ -0,0 +1,162 @@
+"""
+Benchmark of convertibleclass (de)serialization against a previous implementation.
+
+The previous `sdk/common/utils/convertible.py` is loaded from a git revision or
+a file and its `from_dict`/`to_dict` are patched onto every registered class, so
+both implementations convert the same payloads. Results of both are checked to
+be equal before timing.
+
+Run with: python -m tools.convertible_benchmark <git revision or path>
+"""
+import argparse
+import logging
+import subprocess
+import timeit
+import types
+from contextlib import contextmanager
+from pathlib import Path
+
+from extensions.authorization.models.user import User
+from extensions.deployment.models.deployment import Deployment
+from extensions.module_result.models.primitives import Questionnaire
+from extensions.module_result.modules.modules_manager import ModulesManager
+from extensions.tests.module_result.IntegrationTests.test_samples import (
+    sample_questionnaire,
+)
+from extensions.tests.shared.test_helpers import get_module_config, simple_deployment
+from sdk.common.utils import convertible, inject
+
+logger = logging.getLogger(__name__)
+
+CONVERTIBLE_PATH = "sdk/common/utils/convertible.py"
+OBJECT_ID = "5e8f0c74b50aa9656c34789c"
+ITERATIONS = 2000
+REPEAT = 5
+
+
+def deployment_payload() -> dict:
+    module_configs = [
+        {**get_module_config(), "id": f"5e8f0c74b50aa9656c3478{index:02d}"}
+        for index in range(10)
+    ]
+    return {
+        **simple_deployment(),
+        Deployment.ID: OBJECT_ID,
+        Deployment.MODULE_CONFIGS: module_configs,
+    }
+
+
+def user_payload() -> dict:
+    return {
+        User.ID: OBJECT_ID,
+        User.GIVEN_NAME: "John",
+        User.FAMILY_NAME: "Smith",
+        User.EMAIL: "john.smith@example.com",
+        User.TIMEZONE: "Europe/London",
+        User.LANGUAGE: "en",
+        User.TAGS: {"flag": "red"},
+        User.ROLES: [{"roleId": "User", "resource": f"deployment/{OBJECT_ID}"}],
+    }
+
+
+def questionnaire_payload() -> dict:
+    return {
+        **sample_questionnaire(),
+        Questionnaire.USER_ID: OBJECT_ID,
+        Questionnaire.DEPLOYMENT_ID: OBJECT_ID,
+        Questionnaire.MODULE_ID: "Questionnaire",
+        Questionnaire.CREATE_DATE_TIME: "2021-01-01T10:00:00.000000Z",
+    }
+
+
+def load_baseline(baseline: str) -> types.ModuleType:
+    """Loads convertible module from a file path or a git revision."""
+    if Path(baseline).is_file():
+        source = Path(baseline).read_text()
+    else:
+        source = subprocess.run(
+            ["git", "show", f"{baseline}:{CONVERTIBLE_PATH}"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    module = types.ModuleType("convertible_baseline")
+    module.__file__ = CONVERTIBLE_PATH
+    exec(compile(source, CONVERTIBLE_PATH, "exec"), module.__dict__)
+    # string annotations are resolved through registered classes
+    module.registered_class = convertible.registered_class
+    return module
+
+
+@contextmanager
+def implementation(module: types.ModuleType):
+    """Replaces conversion methods which @convertibleclass set on classes."""
+    patched = []
+    for cls in convertible.registered_class.values():
+        namespace = cls.__dict__
+        if namespace.get("to_dict") is convertible.to_dict:
+            patched.append((cls, "to_dict", module.to_dict))
+        from_dict = namespace.get("from_dict")
+        if getattr(from_dict, "__func__", None) is convertible.from_dict:
+            patched.append((cls, "from_dict", classmethod(module.from_dict)))
+    originals = [(cls, name, cls.__dict__[name]) for cls, name, _ in patched]
+    for cls, name, method in patched:
+        setattr(cls, name, method)
+    try:
+        yield
+    finally:
+        for cls, name, method in originals:
+            setattr(cls, name, method)
+
+
+def measure(statement) -> float:
+    """Best time per call in microseconds."""
+    timings = timeit.repeat(statement, number=ITERATIONS, repeat=REPEAT)
+    return min(timings) / ITERATIONS * 1_000_000
+
+
+def run(baseline: types.ModuleType):
+    payloads = (
+        (Deployment, deployment_payload()),
+        (User, user_payload()),
+        (Questionnaire, questionnaire_payload()),
+    )
+    row = "%-28s%16s%14s%9s"
+    logger.info(row, "payload", "baseline, us", "current, us", "speedup")
+    for cls, payload in payloads:
+        instance = cls.from_dict(payload)
+        with implementation(baseline):
+            baseline_instance = cls.from_dict(payload)
+            baseline_dict = baseline_instance.to_dict()
+            from_dict_baseline = measure(lambda: cls.from_dict(payload))
+            to_dict_baseline = measure(instance.to_dict)
+        if baseline_instance != instance or baseline_dict != instance.to_dict():
+            raise AssertionError(f"{cls.__name__} is converted differently")
+
+        from_dict_current = measure(lambda: cls.from_dict(payload))
+        to_dict_current = measure(instance.to_dict)
+        for operation, before, after in (
+            ("from_dict", from_dict_baseline, from_dict_current),
+            ("to_dict", to_dict_baseline, to_dict_current),
+        ):
+            name = f"{cls.__name__}.{operation}"
+            speedup = f"{before / after:.1f}x"
+            logger.info(row, name, f"{before:.1f}", f"{after:.1f}", speedup)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "baseline", help=f"git revision or path of previous {CONVERTIBLE_PATH}"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # module configs are validated against registered modules
+    inject.clear_and_configure(
+        lambda binder: binder.bind(ModulesManager, ModulesManager())
+    )
+    run(load_baseline(args.baseline))
+
+
+if __name__ == "__main__":
+    main()